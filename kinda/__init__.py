@@ -0,0 +1,3 @@
+# kinda/__init__.py
+
+__version__ = "0.5.1"
@@ -1,21 +1,34 @@
 # kinda/cli.py
 
-import argparse
+from __future__ import annotations
+
 import os
 import sys
-from pathlib import Path
-from typing import Union, Optional, Dict, Any
 
-# Optional chardet import for encoding detection
-try:
-    import chardet
+from kinda import __version__
+
+# Annotations here are never evaluated, so typing and pathlib are only imported
+# for type checkers; handlers import pathlib themselves. Keeping both out of
+# the module import is most of what makes `kinda --version` fast.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+# Optional chardet for encoding detection, imported on first use since it's
+# slow to import. Cleared if that import fails.
+HAS_CHARDET = True
 
-    HAS_CHARDET = True
-except ImportError:
-    HAS_CHARDET = False
 
-# Import personality system
-from kinda.personality import PersonalityContext, PERSONALITY_PROFILES, ErrorHandlingMode
+def _import_chardet() -> Any:
+    """Import chardet, or return None (and clear HAS_CHARDET) if it's not installed"""
+    global HAS_CHARDET
+    try:
+        import chardet
+    except ImportError:
+        HAS_CHARDET = False
+        return None
+    return chardet
 
 
 def safe_print(text: str) -> None:
@@ -64,7 +77,8 @@ def safe_read_file(file_path: Path) -> str:
 
         # Try encoding detection if chardet is available
         encoding = "utf-8"  # default
-        if HAS_CHARDET:
+        chardet = _import_chardet() if HAS_CHARDET else None
+        if chardet is not None:
             detected = chardet.detect(raw_data)
             encoding = detected.get("encoding") or "utf-8"
             confidence = detected.get("confidence", 0)
@@ -127,6 +141,8 @@ def validate_knda_file(file_path: Path) -> bool:
 
 def show_examples() -> None:
     """Show example kinda programs with attitude"""
+    from pathlib import Path
+
     safe_print("🎲 Here are some kinda programs to get you started:")
     print()
 
@@ -237,13 +253,11 @@ def get_transformer(lang: str) -> Any:
 
         return transformer
     elif lang == "c":
-        # C support is coming in v0.4.0 - currently incomplete
-        safe_print("[note] C support is coming in v0.4.0 with full compilation pipeline!")
-        safe_print("[info] Currently only Python is supported. Use '--lang python' or omit --lang.")
-        safe_print("[link] Follow progress at: https://github.com/kinda-lang/kinda-lang/issues/19")
-        return None
+        from kinda.langs.c import transformer_c
+
+        return transformer_c
     else:
-        raise ValueError(f"Unsupported language: {lang}. Currently only 'python' is supported.")
+        raise ValueError(f"Unsupported language: {lang}. Supported languages: 'python', 'c'.")
 
 
 def validate_chaos_level(chaos_level: int) -> int:
@@ -280,6 +294,8 @@ def setup_personality(
     error_mode: str = "warning",
 ) -> None:
     """Initialize personality system with specified mood, chaos level, seed, and error mode."""
+    from kinda.personality import PersonalityContext, PERSONALITY_PROFILES, ErrorHandlingMode
+
     if mood and mood.lower() not in PERSONALITY_PROFILES:
         available_moods = ", ".join(PERSONALITY_PROFILES.keys())
         safe_print(f"[?] Unknown mood '{mood}'. Available moods: {available_moods}")
@@ -349,38 +365,99 @@ def setup_personality(
         safe_print(f"🌱 Using random seed {resolved_seed} for reproducible chaos ({seed_source})")
 
 
+def setup_output(
+    output_buffer: Optional[str] = None,
+    diagnostics: Optional[str] = None,
+    diagnostics_sample: Optional[float] = None,
+) -> None:
+    """Apply --output-buffer/--diagnostics/--diagnostics-sample on top of the KINDA_* environment."""
+    from kinda.output import (
+        DIAGNOSTICS_DESTINATIONS,
+        configure_output,
+        configure_output_from_env,
+        parse_buffer_size,
+        parse_sample_rate,
+    )
+
+    # Start from the environment so settings never leak between invocations
+    configure_output_from_env()
+
+    buffer_size = None
+    if output_buffer is not None:
+        try:
+            buffer_size = parse_buffer_size(output_buffer)
+        except ValueError:
+            safe_print(f"[?] Invalid output buffer '{output_buffer}' - keeping the default")
+            safe_print("[tip] Use 'off', 'line', 'block' or a size in bytes")
+
+    sample_rate = None
+    if diagnostics_sample is not None:
+        try:
+            sample_rate = parse_sample_rate(str(diagnostics_sample))
+        except ValueError:
+            safe_print(f"[?] Diagnostics sample rate {diagnostics_sample} is outside 0.0 - 1.0")
+            safe_print("[tip] Keeping every diagnostic")
+
+    if diagnostics is not None and diagnostics not in DIAGNOSTICS_DESTINATIONS:
+        # Anything else is a file path; fail now rather than on the first diagnostic
+        try:
+            with open(diagnostics, "a", encoding="utf-8"):
+                pass
+        except OSError as e:
+            safe_print(f"[?] Can't write diagnostics to '{diagnostics}': {e}")
+            safe_print("[tip] Sending diagnostics to stdout instead")
+            diagnostics = None
+
+    configure_output(buffer_size, diagnostics, sample_rate)
+
+
 def detect_language(path: Path, forced: Union[str, None]) -> str:
     """
     Detect target language from file extension or --lang override.
-    Currently only Python is fully supported.
+    Defaults to Python, the most complete implementation.
     """
     if forced:
-        if forced.lower() == "c":
-            # Reject C explicitly with helpful message
-            safe_print("[note] C transpiler is planned for v0.4.0 but not ready yet!")
-            safe_print("[info] Currently only Python is supported.")
-            safe_print("[tip] Tip: Remove '--lang c' to use Python (default)")
-            safe_print(
-                "[link] Track C support progress: https://github.com/kinda-lang/kinda-lang/issues/19"
-            )
-            raise ValueError("C language not yet supported")
         return forced.lower()
 
     name = str(path)
     if name.endswith(".py.knda") or name.endswith(".py"):
         return "python"
     elif name.endswith(".c.knda") or name.endswith(".c"):
-        # C files not supported yet - reject with helpful message
-        safe_print("[note] C files detected but C transpiler isn't ready yet!")
-        safe_print("[info] C support is planned for v0.4.0 with full compilation pipeline")
-        safe_print("[tip] For now, please use .py.knda files with Python syntax")
-        safe_print("[link] Track C support: https://github.com/kinda-lang/kinda-lang/issues/19")
-        raise ValueError("C files not yet supported - use .py.knda instead")
-
-    # Default to python - it's our only complete implementation
+        return "c"
+
+    # Default to python - it's our most complete implementation
     return "python"
 
 
+def run_c_program(c_file: Path, out_dir: Path) -> int:
+    """Compile a generated C program against libkinda (cached) and run it natively."""
+    import subprocess
+
+    from kinda.langs.c.build import CBuildError, compile_program
+    from kinda.personality import PersonalityContext
+
+    try:
+        executable = compile_program(c_file, out_dir / "c-cache")
+    except CBuildError as e:
+        safe_print(f"💥 C compilation failed: {e}")
+        safe_print("[tip] Check the generated C in " + str(c_file))
+        return 1
+
+    env = os.environ.copy()
+    seed = PersonalityContext.get_instance().seed
+    if seed is not None:
+        env["KINDA_SEED"] = str(seed)
+
+    safe_print("⚙️ Running your native chaos (no Python sandbox for compiled C)...")
+    sys.stdout.flush()
+    result = subprocess.run([str(executable)], env=env)
+    if result.returncode == 0:
+        safe_print("🎉 Well, that didn't crash. Success?")
+        return 0
+    safe_print(f"💥 Your C program exited with status {result.returncode}")
+    return 1
+
+
 def handle_inject_command(args) -> int:
     """Handle Epic #127 injection commands"""
     try:
@@ -663,121 +740,150 @@ def handle_inject_examples(args) -> int:
     return 0
 
 
-def main(argv=None) -> int:
-    argv = argv or sys.argv[1:]
-    parser = argparse.ArgumentParser(
-        prog="kinda", description="A programming language for people who aren't totally sure"
-    )
-    sub = parser.add_subparsers(dest="command", required=True)
-
-    p_transform = sub.add_parser(
-        "transform", help="Turn your kinda code into actual code (how responsible of you)"
-    )
-    p_transform.add_argument("input", help="Your .knda file (yes, it needs the extension)")
-    p_transform.add_argument(
-        "--out", default="build", help="Where to dump the results (default: build)"
-    )
-    p_transform.add_argument(
-        "--lang", default=None, help="Target language (currently: 'python' only)"
-    )
-    p_transform.add_argument(
+def add_transform_arguments(parser) -> None:
+    """Arguments for kinda transform"""
+    parser.add_argument("input", help="Your .knda file (yes, it needs the extension)")
+    parser.add_argument("--out", default="build", help="Where to dump the results (default: build)")
+    parser.add_argument("--lang", default=None, help="Target language: 'python' or 'c'")
+    parser.add_argument(
         "--mood", default=None, help="Personality/chaos level: reliable, cautious, playful, chaotic"
     )
-    p_transform.add_argument(
+    parser.add_argument(
         "--chaos-level",
         type=int,
         choices=range(1, 11),
         default=5,
         help="Control randomness intensity (1=minimal, 10=maximum chaos)",
     )
-    p_transform.add_argument(
+    parser.add_argument(
         "--seed",
         type=int,
         default=None,
         help="Random seed for reproducible chaos (overrides KINDA_SEED environment variable)",
     )
-    p_transform.add_argument(
+    parser.add_argument(
         "--error-mode",
         choices=["strict", "warning", "silent"],
         default="warning",
         help="Error handling mode (strict=fail on errors, warning=log and continue, silent=silent)",
     )
+    parser.add_argument(
+        "--freeze-personality",
+        metavar="SPEC",
+        default=None,
+        help="Inline personality values for one fixed personality, e.g. 'mood=reliable,chaos=3'",
+    )
+
 
-    p_run = sub.add_parser("run", help="Transform then execute (living dangerously, I see)")
-    p_run.add_argument("input", help="The .knda file you want to run")
-    p_run.add_argument("--lang", default=None, help="Target language (currently: 'python' only)")
-    p_run.add_argument(
+def add_run_arguments(parser) -> None:
+    """Arguments for kinda run"""
+    parser.add_argument("input", help="The .knda file you want to run")
+    parser.add_argument("--lang", default=None, help="Target language: 'python' or 'c'")
+    parser.add_argument(
         "--mood", default=None, help="Personality/chaos level: reliable, cautious, playful, chaotic"
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--chaos-level",
         type=int,
         choices=range(1, 11),
         default=5,
         help="Control randomness intensity (1=minimal, 10=maximum chaos)",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--seed",
         type=int,
         default=None,
         help="Random seed for reproducible chaos (overrides KINDA_SEED environment variable)",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--security-level",
         choices=["safe", "caution", "risky"],
         default="safe",
         help="Security level for execution (safe=maximum security, risky=minimal security)",
     )
-    p_run.add_argument(
+    parser.add_argument(
         "--error-mode",
         choices=["strict", "warning", "silent"],
         default="warning",
         help="Error handling mode (strict=fail on errors, warning=log and continue, silent=silent)",
     )
-
-    p_interpret = sub.add_parser(
-        "interpret", help="Run directly in fuzzy runtime (maximum chaos mode)"
+    parser.add_argument(
+        "--output-buffer",
+        default=None,
+        help="Runtime output buffering: off/line, block, or a size in bytes "
+        "(overrides KINDA_OUTPUT_BUFFER)",
     )
-    p_interpret.add_argument("input", help="Your questionable life choices in .knda form")
-    p_interpret.add_argument(
-        "--lang", default=None, help="Target language (currently: 'python' only)"
+    parser.add_argument(
+        "--diagnostics",
+        default=None,
+        help="Where construct diagnostics go: stdout, stderr, off, or a file path "
+        "(overrides KINDA_DIAGNOSTICS)",
+    )
+    parser.add_argument(
+        "--diagnostics-sample",
+        type=float,
+        default=None,
+        help="Fraction of construct diagnostics to keep, 0.0-1.0 "
+        "(overrides KINDA_DIAGNOSTICS_SAMPLE)",
     )
-    p_interpret.add_argument(
+
+
+def add_interpret_arguments(parser) -> None:
+    """Arguments for kinda interpret"""
+    parser.add_argument("input", help="Your questionable life choices in .knda form")
+    parser.add_argument("--lang", default=None, help="Target language (currently: 'python' only)")
+    parser.add_argument(
         "--mood", default=None, help="Personality/chaos level: reliable, cautious, playful, chaotic"
     )
-    p_interpret.add_argument(
+    parser.add_argument(
         "--chaos-level",
         type=int,
         choices=range(1, 11),
         default=5,
         help="Control randomness intensity (1=minimal, 10=maximum chaos)",
     )
-    p_interpret.add_argument(
+    parser.add_argument(
         "--seed",
         type=int,
         default=None,
         help="Random seed for reproducible chaos (overrides KINDA_SEED environment variable)",
     )
-    p_interpret.add_argument(
+    parser.add_argument(
         "--security-level",
         choices=["safe", "caution", "risky"],
         default="safe",
         help="Security level for execution (safe=maximum security, risky=minimal security)",
     )
-    p_interpret.add_argument(
+    parser.add_argument(
         "--error-mode",
         choices=["strict", "warning", "silent"],
         default="warning",
         help="Error handling mode (strict=fail on errors, warning=log and continue, silent=silent)",
     )
+    parser.add_argument(
+        "--output-buffer",
+        default=None,
+        help="Runtime output buffering: off/line, block, or a size in bytes "
+        "(overrides KINDA_OUTPUT_BUFFER)",
+    )
+    parser.add_argument(
+        "--diagnostics",
+        default=None,
+        help="Where construct diagnostics go: stdout, stderr, off, or a file path "
+        "(overrides KINDA_DIAGNOSTICS)",
+    )
+    parser.add_argument(
+        "--diagnostics-sample",
+        type=float,
+        default=None,
+        help="Fraction of construct diagnostics to keep, 0.0-1.0 "
+        "(overrides KINDA_DIAGNOSTICS_SAMPLE)",
+    )
 
-    p_examples = sub.add_parser("examples", help="Show example kinda programs (for inspiration)")
-
-    p_syntax = sub.add_parser("syntax", help="Quick syntax reference (because you'll forget)")
 
-    # Record/replay commands for debugging
-    p_record = sub.add_parser("record", help="Record execution for debugging and replay")
-    record_sub = p_record.add_subparsers(dest="record_command", required=True)
+def add_record_arguments(parser) -> None:
+    """Arguments for kinda record"""
+    record_sub = parser.add_subparsers(dest="record_command", required=True)
 
     p_record_run = record_sub.add_parser("run", help="Record program execution to session file")
     p_record_run.add_argument("input", help="The .knda file to run and record")
@@ -807,36 +913,37 @@ def main(argv=None) -> int:
         help="Random seed for reproducible chaos (overrides KINDA_SEED environment variable)",
     )
 
-    # Replay command for exact execution reproduction
-    p_replay = sub.add_parser("replay", help="Replay recorded sessions for debugging")
-    p_replay.add_argument("session", help="The session.json file to replay")
-    p_replay.add_argument("program", help="The .knda file to replay (must match recorded session)")
-    p_replay.add_argument("--lang", default=None, help="Target language (currently: 'python' only)")
-    p_replay.add_argument(
+
+def add_replay_arguments(parser) -> None:
+    """Arguments for kinda replay"""
+    parser.add_argument("session", help="The session.json file to replay")
+    parser.add_argument("program", help="The .knda file to replay (must match recorded session)")
+    parser.add_argument("--lang", default=None, help="Target language (currently: 'python' only)")
+    parser.add_argument(
         "--verbose",
         "-v",
         action="store_true",
         help="Show detailed replay progress and validation info",
     )
 
-    # Analyze command for session inspection and debugging
-    p_analyze = sub.add_parser("analyze", help="Analyze recorded sessions for debugging insights")
-    p_analyze.add_argument("session", help="The session.json file to analyze")
-    p_analyze.add_argument(
+
+def add_analyze_arguments(parser) -> None:
+    """Arguments for kinda analyze"""
+    parser.add_argument("session", help="The session.json file to analyze")
+    parser.add_argument(
         "--format",
         "-f",
         choices=["summary", "detailed", "constructs", "timeline", "json"],
         default="summary",
         help="Analysis output format",
     )
-    p_analyze.add_argument("--construct", "-c", help="Focus analysis on specific construct type")
-    p_analyze.add_argument("--export", "-e", help="Export analysis to file (format: csv, json)")
+    parser.add_argument("--construct", "-c", help="Focus analysis on specific construct type")
+    parser.add_argument("--export", "-e", help="Export analysis to file (format: csv, json)")
 
-    # Epic #127: Python Injection Commands
-    p_inject = sub.add_parser(
-        "inject", help="Inject kinda-lang constructs into Python code (Epic #127)"
-    )
-    inject_sub = p_inject.add_subparsers(dest="inject_command", required=True)
+
+def add_inject_arguments(parser) -> None:
+    """Arguments for kinda inject"""
+    inject_sub = parser.add_subparsers(dest="inject_command", required=True)
 
     # inject run command
     p_inject_run = inject_sub.add_parser(
@@ -886,696 +993,817 @@ def main(argv=None) -> int:
     p_inject_examples.add_argument("--pattern", help="Show examples for specific pattern")
     p_inject_examples.add_argument("--level", help="Show examples for specific enhancement level")
 
-    args = parser.parse_args(argv)
 
-    if args.command == "transform":
-        # Setup personality for transform
-        setup_personality(
-            getattr(args, "mood", None) or "playful",
-            getattr(args, "chaos_level", 5),
-            getattr(args, "seed", None),
-            getattr(args, "error_mode", "warning"),
-        )
+def handle_transform_command(args) -> int:
+    """Transform a .knda file into target language source"""
+    from pathlib import Path
 
-        input_path = Path(args.input)
-        if not input_path.exists():
-            safe_print(f"[?] '{args.input}' doesn't exist. Are you sure you typed that right?")
-            safe_print("[tip] Tip: Check your file path and make sure the .knda file exists")
-            # Suggest similar files if possible
-            parent = input_path.parent
-            if parent.exists():
-                similar_files = list(parent.glob("*.knda"))
-                if similar_files:
-                    safe_print("📂 Found these .knda files in the same directory:")
-                    for f in similar_files[:3]:  # Show max 3 suggestions
-                        safe_print(f"   • {f.name}")
-            return 1
-        # Validate file before processing
-        if not validate_knda_file(input_path):
-            safe_print("💥 File validation failed - cannot process this file")
-            return 1
+    # Setup personality for transform
+    setup_personality(
+        getattr(args, "mood", None) or "playful",
+        getattr(args, "chaos_level", 5),
+        getattr(args, "seed", None),
+        getattr(args, "error_mode", "warning"),
+    )
 
-        out_dir = Path(args.out)
-        try:
-            lang = detect_language(input_path, args.lang)
-        except ValueError as e:
-            # Language not supported (like C)
-            return 1
+    frozen_personality = None
+    if args.freeze_personality is not None:
+        from kinda.langs.python.freeze import parse_freeze_spec
 
         try:
-            transformer = get_transformer(lang)
+            frozen_personality = parse_freeze_spec(
+                args.freeze_personality, args.mood or "playful", args.chaos_level
+            )
         except ValueError as e:
-            # Unsupported language
-            safe_print(f"[shrug] Sorry, I don't speak {lang} yet. Try Python maybe?")
-            return 1
-
-        if transformer is None:
-            safe_print(f"[shrug] Sorry, I don't speak {lang} yet. Try Python maybe?")
-            return 1
-
-        try:
-            output_paths = transformer.transform(input_path, out_dir=out_dir)
-            for path in output_paths:
-                print(f"* Transformed your chaos into: {path}")
-            print(f"* Generated {len(output_paths)} file(s). Hope they work!")
-            return 0
-        except Exception as e:
-            # Handle parsing errors gracefully
-            if "KindaParseError" in str(type(e)):
-                safe_print(str(e).strip())
-                safe_print("[tip] Fix the syntax error above and try again")
-            else:
-                safe_print(f"💥 Transform failed: {e}")
-
-                # Provide snarky but helpful suggestions based on error type
-                error_str = str(e).lower()
-                if "encoding" in error_str or "unicode" in error_str:
-                    safe_print(
-                        "[?] Your file has encoding issues. Fancy characters causing trouble?"
-                    )
-                    safe_print("   • Save as UTF-8 (like a civilized person)")
-                    safe_print("   • Those emojis might be breaking things 😅")
-                elif "permission" in error_str or "access" in error_str:
-                    safe_print("[shrug] Permission denied. The file system doesn't trust you:")
-                    safe_print(
-                        "   • Close the file if it's open elsewhere (multitasking gone wrong)"
-                    )
-                    safe_print("   • Check file permissions (maybe you don't own it?)")
-                elif "no such file" in error_str or "not found" in error_str:
-                    safe_print("[?] File not found. Did you type that path correctly?")
-                    safe_print("   • Double-check the path (typos are embarrassing)")
-                    safe_print("   • Make sure it ends with .knda (kinda important)")
-                else:
-                    safe_print("[shrug] Transform failed for mysterious reasons. Try:")
-                    safe_print("   • Fix any obvious syntax errors in your .knda file")
-                    safe_print("   • Remember: ~ before kinda constructs (seriously)")
-                    safe_print("   • Start with something simple first")
+            safe_print(f"[?] Can't freeze that personality: {e}")
+            safe_print("[tip] Try something like --freeze-personality mood=reliable,chaos=3")
             return 1
 
-    if args.command == "run":
-        # Setup personality for run
-        setup_personality(
-            getattr(args, "mood", None) or "playful",
-            getattr(args, "chaos_level", 5),
-            getattr(args, "seed", None),
-            getattr(args, "error_mode", "warning"),
-        )
+    input_path = Path(args.input)
+    if not input_path.exists():
+        safe_print(f"[?] '{args.input}' doesn't exist. Are you sure you typed that right?")
+        safe_print("[tip] Tip: Check your file path and make sure the .knda file exists")
+        # Suggest similar files if possible
+        parent = input_path.parent
+        if parent.exists():
+            similar_files = list(parent.glob("*.knda"))
+            if similar_files:
+                safe_print("📂 Found these .knda files in the same directory:")
+                for f in similar_files[:3]:  # Show max 3 suggestions
+                    safe_print(f"   • {f.name}")
+        return 1
+    # Validate file before processing
+    if not validate_knda_file(input_path):
+        safe_print("💥 File validation failed - cannot process this file")
+        return 1
 
-        input_path = Path(args.input)
-        if not input_path.exists():
-            safe_print(f"[shrug]‍♂️ Can't find '{args.input}'. Did you make that up?")
-            safe_print("[tip] Double-check your file path - it should end with .knda")
-            # Suggest similar files
-            parent = input_path.parent
-            if parent.exists():
-                similar_files = list(parent.glob("*.knda"))
-                if similar_files:
-                    safe_print("📂 Found these runnable .knda files nearby:")
-                    for f in similar_files[:3]:  # Show max 3 suggestions
-                        safe_print(f"   • {f.name}")
-            return 1
-        # Validate file before processing
-        if not validate_knda_file(input_path):
-            safe_print("💥 File validation failed - cannot run this file")
-            return 1
+    out_dir = Path(args.out)
+    try:
+        lang = detect_language(input_path, args.lang)
+    except ValueError as e:
+        # Language not supported (like C)
+        return 1
 
-        try:
-            lang = detect_language(input_path, args.lang)
-        except ValueError as e:
-            # Language not supported (like C)
-            return 1
+    try:
         transformer = get_transformer(lang)
-        if transformer is None:
-            safe_print(f"🙄 Can't run {lang} files yet. Python works though.")
-            return 1
+    except ValueError as e:
+        # Unsupported language
+        safe_print(f"[shrug] Sorry, I don't speak {lang} yet. Try Python maybe?")
+        return 1
 
-        try:
-            out_dir = Path(".kinda-build")
-            out_paths = transformer.transform(input_path, out_dir=out_dir)
-            if lang == "python":
-                # Use secure execution engine for Issue #109 protection
-                from kinda.security.execution import SecureExecutionEngine, SecurityLevel
-
-                # Map CLI security level to enum
-                security_mapping = {
-                    "safe": SecurityLevel.SAFE,
-                    "caution": SecurityLevel.CAUTION,
-                    "risky": SecurityLevel.RISKY,
-                }
-                security_level = security_mapping.get(
-                    getattr(args, "security_level", "safe"), SecurityLevel.SAFE
-                )
+    if transformer is None:
+        safe_print(f"[shrug] Sorry, I don't speak {lang} yet. Try Python maybe?")
+        return 1
 
-                safe_print("🎮 Running your questionable code with security protection...")
-                safe_print(f"🛡️ Security level: {security_level.value}")
+    try:
+        output_paths = transformer.transform(input_path, out_dir=out_dir)
+        for path in output_paths:
+            print(f"* Transformed your chaos into: {path}")
+        if frozen_personality is not None and lang == "python":
+            import warnings
 
-                # Execute with security sandbox
-                engine = SecureExecutionEngine(security_level)
-                result = engine.execute_file(out_paths[0], working_directory=out_dir)
+            from kinda.langs.python.freeze import freeze_personality
 
-                if result.success:
-                    safe_print("🎉 Well, that didn't crash. Success?")
-                    if result.stdout:
-                        print(result.stdout, end="")
-                    if result.has_security_issues:
-                        safe_print(
-                            "⚠️ Note: Some security restrictions were applied during execution"
-                        )
-                        for violation in result.security_violations:
-                            safe_print(f"   • Security: {violation}")
-                        for blocked in result.blocked_operations:
-                            safe_print(f"   • Blocked: {blocked}")
-                else:
-                    safe_print(f"💥 Runtime error: {result.stderr}")
-                    safe_print("[?] Your code transformed fine but crashed during execution")
-
-                    if result.has_security_issues:
-                        safe_print("🔒 Security violations detected:")
-                        for violation in result.security_violations:
-                            safe_print(f"   • {violation}")
-                        for blocked in result.blocked_operations:
-                            safe_print(f"   • {blocked}")
-
-                    # Provide error handling for the new result format
-                    # Provide snarky but helpful suggestions based on error type
-                    error_str = result.stderr.lower()
-                    if "invalid syntax" in error_str:
-                        safe_print(
-                            "[shrug] Well, that's syntactically questionable. Common kinda fails:"
-                        )
-                        safe_print(
-                            "   • Forgot the ~ tilde? maybe should be ~maybe (kinda important)"
-                        )
-                        safe_print("   • Mixing Python in .knda? That's... ambitious")
-                        safe_print("   • Missing semicolons? Some constructs are picky like that")
-                    elif "name" in error_str and "not defined" in error_str:
-                        safe_print("[?] That variable doesn't exist. Awkward. Try:")
-                        safe_print(
-                            "   • ~kinda int x = 42 to declare fuzzy variables (the ~ matters)"
-                        )
-                        safe_print(
-                            "   • Double-check your spelling (typos happen to the best of us)"
-                        )
-                    elif "module" in error_str and "not found" in error_str:
-                        safe_print("[?] Python can't find that module. Oops:")
-                        safe_print(
-                            "   • Don't import kinda stuff in regular Python (that won't work)"
-                        )
-                        safe_print("   • Make sure all your dependencies are installed")
-                    else:
-                        safe_print("[shrug] Something's broken. The usual suspects:")
-                        safe_print("   • Missing ~ before kinda constructs (very important)")
-                        safe_print("   • General syntax weirdness")
-                    return 1
-
-                # Return based on execution result
-                return 0 if result.success else 1
-            safe_print(f"😅 I can transform {lang} but can't run it. Try 'transform' instead?")
-            return 1
-        except Exception as e:
-            # Handle parsing errors gracefully
-            if "KindaParseError" in str(type(e)):
-                safe_print(str(e).strip())
-                safe_print("[tip] Fix the syntax error above and try again")
+            mood, chaos_level = frozen_personality
+            frozen_calls = 0
+            for path in output_paths:
+                path = Path(path)
+                with warnings.catch_warnings(record=True) as caught:
+                    warnings.simplefilter("always")
+                    code, count = freeze_personality(
+                        path.read_text(encoding="utf-8"), mood, chaos_level
+                    )
+                for warning in caught:
+                    safe_print(f"[?] {path}: {warning.message}")
+                path.write_text(code, encoding="utf-8")
+                frozen_calls += count
+            print(f"* Froze {frozen_calls} call(s) to {mood} personality, chaos {chaos_level}")
+        print(f"* Generated {len(output_paths)} file(s). Hope they work!")
+        return 0
+    except Exception as e:
+        # Handle parsing errors gracefully
+        if "KindaParseError" in str(type(e)):
+            safe_print(str(e).strip())
+            safe_print("[tip] Fix the syntax error above and try again")
+        else:
+            safe_print(f"💥 Transform failed: {e}")
+
+            # Provide snarky but helpful suggestions based on error type
+            error_str = str(e).lower()
+            if "encoding" in error_str or "unicode" in error_str:
+                safe_print("[?] Your file has encoding issues. Fancy characters causing trouble?")
+                safe_print("   • Save as UTF-8 (like a civilized person)")
+                safe_print("   • Those emojis might be breaking things 😅")
+            elif "permission" in error_str or "access" in error_str:
+                safe_print("[shrug] Permission denied. The file system doesn't trust you:")
+                safe_print("   • Close the file if it's open elsewhere (multitasking gone wrong)")
+                safe_print("   • Check file permissions (maybe you don't own it?)")
+            elif "no such file" in error_str or "not found" in error_str:
+                safe_print("[?] File not found. Did you type that path correctly?")
+                safe_print("   • Double-check the path (typos are embarrassing)")
+                safe_print("   • Make sure it ends with .knda (kinda important)")
             else:
-                safe_print(f"💥 Transform failed: {e}")
-                safe_print("[tip] Check your .knda file for syntax issues")
-            return 1
+                safe_print("[shrug] Transform failed for mysterious reasons. Try:")
+                safe_print("   • Fix any obvious syntax errors in your .knda file")
+                safe_print("   • Remember: ~ before kinda constructs (seriously)")
+                safe_print("   • Start with something simple first")
+        return 1
 
-    if args.command == "interpret":
-        # Setup personality for interpret
-        setup_personality(
-            getattr(args, "mood", None) or "playful",
-            getattr(args, "chaos_level", 5),
-            getattr(args, "seed", None),
-            getattr(args, "error_mode", "warning"),
-        )
 
-        input_path = Path(args.input)
-        if not input_path.exists():
-            safe_print(f"🙃 '{args.input}' is nowhere to be found. Try again?")
-            safe_print("[tip] Make sure your .knda file exists and the path is correct")
-            # Suggest similar files
-            parent = input_path.parent
-            if parent.exists():
-                similar_files = list(parent.glob("*.knda"))
-                if similar_files:
-                    safe_print("📂 These .knda files are available for interpretation:")
-                    for f in similar_files[:3]:  # Show max 3 suggestions
-                        safe_print(f"   • {f.name}")
-            return 1
-        # Validate file before processing
-        if not validate_knda_file(input_path):
-            safe_print("💥 File validation failed - cannot interpret this file")
-            return 1
+def handle_run_command(args) -> int:
+    """Transform a .knda file, then execute it"""
+    from pathlib import Path
 
-        try:
-            lang = detect_language(input_path, args.lang)
-        except ValueError as e:
-            # Language not supported (like C)
-            return 1
-        if lang == "python":
-            from kinda.interpreter.repl import run_interpreter
+    # Setup personality for run
+    setup_personality(
+        getattr(args, "mood", None) or "playful",
+        getattr(args, "chaos_level", 5),
+        getattr(args, "seed", None),
+        getattr(args, "error_mode", "warning"),
+    )
+    setup_output(
+        getattr(args, "output_buffer", None),
+        getattr(args, "diagnostics", None),
+        getattr(args, "diagnostics_sample", None),
+    )
 
-            safe_print("🔮 Entering the chaos dimension...")
-            run_interpreter(str(input_path), lang)
-            safe_print("🌪️ Chaos complete. Reality may have shifted slightly.")
-            return 0
-        safe_print(f"🤨 Interpret mode only works with Python. What are you even trying to do?")
+    input_path = Path(args.input)
+    if not input_path.exists():
+        safe_print(f"[shrug]‍♂️ Can't find '{args.input}'. Did you make that up?")
+        safe_print("[tip] Double-check your file path - it should end with .knda")
+        # Suggest similar files
+        parent = input_path.parent
+        if parent.exists():
+            similar_files = list(parent.glob("*.knda"))
+            if similar_files:
+                safe_print("📂 Found these runnable .knda files nearby:")
+                for f in similar_files[:3]:  # Show max 3 suggestions
+                    safe_print(f"   • {f.name}")
+        return 1
+    # Validate file before processing
+    if not validate_knda_file(input_path):
+        safe_print("💥 File validation failed - cannot run this file")
+        return 1
+
+    try:
+        lang = detect_language(input_path, args.lang)
+    except ValueError as e:
+        # Language not supported (like C)
+        return 1
+    transformer = get_transformer(lang)
+    if transformer is None:
+        safe_print(f"🙄 Can't run {lang} files yet. Python works though.")
         return 1
 
-    if args.command == "record":
-        if args.record_command == "run":
-            # Setup personality for record run
-            setup_personality(
-                getattr(args, "mood", None) or "playful",
-                getattr(args, "chaos_level", 5),
-                getattr(args, "seed", None),
+    try:
+        out_dir = Path(".kinda-build")
+        out_paths = transformer.transform(input_path, out_dir=out_dir)
+        if lang == "c":
+            return run_c_program(out_paths[0], out_dir)
+        if lang == "python":
+            # Use secure execution engine for Issue #109 protection
+            from kinda.security.execution import SecureExecutionEngine, SecurityLevel
+
+            # Map CLI security level to enum
+            security_mapping = {
+                "safe": SecurityLevel.SAFE,
+                "caution": SecurityLevel.CAUTION,
+                "risky": SecurityLevel.RISKY,
+            }
+            security_level = security_mapping.get(
+                getattr(args, "security_level", "safe"), SecurityLevel.SAFE
             )
 
-            input_path = Path(args.input)
-            if not input_path.exists():
-                safe_print(f"[?] Can't find '{args.input}' to record. Did you spell that right?")
-                safe_print("[tip] Make sure your .knda file exists and the path is correct")
-                return 1
+            safe_print("🎮 Running your questionable code with security protection...")
+            safe_print(f"🛡️ Security level: {security_level.value}")
+
+            # Execute with security sandbox
+            engine = SecureExecutionEngine(security_level)
+            result = engine.execute_file(out_paths[0], working_directory=out_dir)
+
+            if result.success:
+                safe_print("🎉 Well, that didn't crash. Success?")
+                if result.stdout:
+                    print(result.stdout, end="")
+                if result.has_security_issues:
+                    safe_print("⚠️ Note: Some security restrictions were applied during execution")
+                    for violation in result.security_violations:
+                        safe_print(f"   • Security: {violation}")
+                    for blocked in result.blocked_operations:
+                        safe_print(f"   • Blocked: {blocked}")
+            else:
+                safe_print(f"💥 Runtime error: {result.stderr}")
+                safe_print("[?] Your code transformed fine but crashed during execution")
+
+                if result.has_security_issues:
+                    safe_print("🔒 Security violations detected:")
+                    for violation in result.security_violations:
+                        safe_print(f"   • {violation}")
+                    for blocked in result.blocked_operations:
+                        safe_print(f"   • {blocked}")
 
-            # Validate file before processing
-            if not validate_knda_file(input_path):
-                safe_print("💥 File validation failed - cannot record this file")
+                # Provide error handling for the new result format
+                # Provide snarky but helpful suggestions based on error type
+                error_str = result.stderr.lower()
+                if "invalid syntax" in error_str:
+                    safe_print(
+                        "[shrug] Well, that's syntactically questionable. Common kinda fails:"
+                    )
+                    safe_print("   • Forgot the ~ tilde? maybe should be ~maybe (kinda important)")
+                    safe_print("   • Mixing Python in .knda? That's... ambitious")
+                    safe_print("   • Missing semicolons? Some constructs are picky like that")
+                elif "name" in error_str and "not defined" in error_str:
+                    safe_print("[?] That variable doesn't exist. Awkward. Try:")
+                    safe_print("   • ~kinda int x = 42 to declare fuzzy variables (the ~ matters)")
+                    safe_print("   • Double-check your spelling (typos happen to the best of us)")
+                elif "module" in error_str and "not found" in error_str:
+                    safe_print("[?] Python can't find that module. Oops:")
+                    safe_print("   • Don't import kinda stuff in regular Python (that won't work)")
+                    safe_print("   • Make sure all your dependencies are installed")
+                else:
+                    safe_print("[shrug] Something's broken. The usual suspects:")
+                    safe_print("   • Missing ~ before kinda constructs (very important)")
+                    safe_print("   • General syntax weirdness")
                 return 1
 
-            # Determine output file path
-            if args.output:
-                output_path = Path(args.output)
-            else:
-                output_path = input_path.parent / f"{input_path.stem}.session.json"
+            # Return based on execution result
+            return 0 if result.success else 1
+        safe_print(f"😅 I can transform {lang} but can't run it. Try 'transform' instead?")
+        return 1
+    except Exception as e:
+        # Handle parsing errors gracefully
+        if "KindaParseError" in str(type(e)):
+            safe_print(str(e).strip())
+            safe_print("[tip] Fix the syntax error above and try again")
+        else:
+            safe_print(f"💥 Transform failed: {e}")
+            safe_print("[tip] Check your .knda file for syntax issues")
+        return 1
 
-            try:
-                lang = detect_language(input_path, args.lang)
-            except ValueError as e:
-                # Language not supported (like C)
-                return 1
 
-            transformer = get_transformer(lang)
-            if transformer is None:
-                safe_print(f"🙄 Can't record {lang} files yet. Python works though.")
-                return 1
+def handle_interpret_command(args) -> int:
+    """Run a .knda file directly in the fuzzy runtime"""
+    from pathlib import Path
 
-            if lang == "python":
-                from kinda.record_replay import start_recording, stop_recording
-                import runpy
+    # Setup personality for interpret
+    setup_personality(
+        getattr(args, "mood", None) or "playful",
+        getattr(args, "chaos_level", 5),
+        getattr(args, "seed", None),
+        getattr(args, "error_mode", "warning"),
+    )
+    setup_output(
+        getattr(args, "output_buffer", None),
+        getattr(args, "diagnostics", None),
+        getattr(args, "diagnostics_sample", None),
+    )
 
-                try:
-                    # Start recording
-                    safe_print("🎥 Starting recording session...")
-                    command_args = sys.argv[1:]  # Store original command for session
-                    session_id = start_recording(str(input_path), command_args, output_path)
-                    safe_print(f"📼 Session ID: {session_id}")
-
-                    # Transform and execute the program
-                    out_dir = Path(".kinda-build")
-                    out_paths = transformer.transform(input_path, out_dir=out_dir)
-
-                    safe_print("🎮 Running and recording your questionable code...")
-
-                    try:
-                        # Execute the transformed file while recording
-                        runpy.run_path(str(out_paths[0]), run_name="__main__")
-                        safe_print("🎉 Execution complete! Recording captured.")
-
-                    except Exception as e:
-                        safe_print(f"💥 Runtime error during recording: {e}")
-                        safe_print("[info] Recording captured up to the point of failure")
-
-                    finally:
-                        # Always stop recording and save session
-                        session = stop_recording()
-                        safe_print(f"💾 Session saved to: {output_path}")
-                        safe_print(
-                            f"📊 Recorded {session.total_calls} RNG calls in {session.duration:.3f}s"
-                        )
+    input_path = Path(args.input)
+    if not input_path.exists():
+        safe_print(f"🙃 '{args.input}' is nowhere to be found. Try again?")
+        safe_print("[tip] Make sure your .knda file exists and the path is correct")
+        # Suggest similar files
+        parent = input_path.parent
+        if parent.exists():
+            similar_files = list(parent.glob("*.knda"))
+            if similar_files:
+                safe_print("📂 These .knda files are available for interpretation:")
+                for f in similar_files[:3]:  # Show max 3 suggestions
+                    safe_print(f"   • {f.name}")
+        return 1
+    # Validate file before processing
+    if not validate_knda_file(input_path):
+        safe_print("💥 File validation failed - cannot interpret this file")
+        return 1
 
-                        # Show summary of what was recorded
-                        if session.construct_usage:
-                            safe_print("🎯 Constructs recorded:")
-                            for construct, count in sorted(session.construct_usage.items()):
-                                safe_print(f"   • {construct}: {count} calls")
+    try:
+        lang = detect_language(input_path, args.lang)
+    except ValueError as e:
+        # Language not supported (like C)
+        return 1
+    if lang == "python":
+        from kinda.interpreter.repl import run_interpreter
 
-                        return 0
+        safe_print("🔮 Entering the chaos dimension...")
+        run_interpreter(str(input_path), lang)
+        safe_print("🌪️ Chaos complete. Reality may have shifted slightly.")
+        return 0
+    safe_print(f"🤨 Interpret mode only works with Python. What are you even trying to do?")
+    return 1
 
-                except Exception as e:
-                    safe_print(f"💥 Recording failed: {e}")
-                    safe_print("[tip] Check that your .knda file is syntactically correct")
-                    return 1
-            else:
-                safe_print(f"😅 Recording is only supported for Python programs currently")
-                return 1
 
-    if args.command == "replay":
-        # Replay recorded session
-        session_path = Path(args.session)
-        program_path = Path(args.program)
+def handle_record_command(args) -> int:
+    """Run a .knda file and record its execution"""
+    from pathlib import Path
 
-        if not session_path.exists():
-            safe_print(
-                f"[?] Can't find session file '{args.session}'. Did you record this session?"
-            )
-            safe_print("[tip] Use 'kinda record run' to create a session file first")
-            return 1
+    if args.record_command == "run":
+        # Setup personality for record run
+        setup_personality(
+            getattr(args, "mood", None) or "playful",
+            getattr(args, "chaos_level", 5),
+            getattr(args, "seed", None),
+        )
 
-        if not program_path.exists():
-            safe_print(f"[?] Can't find program file '{args.program}'. Did you move it?")
-            safe_print("[tip] Make sure the .knda file exists and matches the recorded session")
+        input_path = Path(args.input)
+        if not input_path.exists():
+            safe_print(f"[?] Can't find '{args.input}' to record. Did you spell that right?")
+            safe_print("[tip] Make sure your .knda file exists and the path is correct")
             return 1
 
         # Validate file before processing
-        if not validate_knda_file(program_path):
-            safe_print("💥 File validation failed - cannot replay this file")
+        if not validate_knda_file(input_path):
+            safe_print("💥 File validation failed - cannot record this file")
             return 1
 
+        # Determine output file path
+        if args.output:
+            output_path = Path(args.output)
+        else:
+            output_path = input_path.parent / f"{input_path.stem}.session.json"
+
         try:
-            lang = detect_language(program_path, args.lang)
+            lang = detect_language(input_path, args.lang)
         except ValueError as e:
             # Language not supported (like C)
             return 1
 
         transformer = get_transformer(lang)
         if transformer is None:
-            safe_print(f"🙄 Can't replay {lang} files yet. Python works though.")
+            safe_print(f"🙄 Can't record {lang} files yet. Python works though.")
             return 1
 
         if lang == "python":
-            from kinda.record_replay import ExecutionRecorder, start_replay, stop_replay
+            from kinda.record_replay import start_recording, stop_recording
             import runpy
 
             try:
-                # Load the recorded session
-                safe_print(f"📂 Loading session from: {session_path}")
-                session = ExecutionRecorder.load_session(session_path)
-                safe_print(f"🎭 Original session: {session.session_id}")
-                safe_print(f"📅 Recorded: {session.start_time} ({session.total_calls} RNG calls)")
-
-                # Verify session matches program
-                if session.input_file != str(program_path):
-                    safe_print(
-                        f"⚠️  Session was recorded for '{session.input_file}', replaying '{program_path}'"
-                    )
-                    safe_print("[info] This may cause replay mismatches if files differ")
-
-                # Start replay engine
-                safe_print("🔄 Starting deterministic replay...")
-                replay_session_id = start_replay(session)
+                # Start recording
+                safe_print("🎥 Starting recording session...")
+                command_args = sys.argv[1:]  # Store original command for session
+                session_id = start_recording(str(input_path), command_args, output_path)
+                safe_print(f"📼 Session ID: {session_id}")
 
                 # Transform and execute the program
                 out_dir = Path(".kinda-build")
-                out_paths = transformer.transform(program_path, out_dir=out_dir)
+                out_paths = transformer.transform(input_path, out_dir=out_dir)
 
-                safe_print("🎮 Replaying your questionable code with recorded decisions...")
+                safe_print("🎮 Running and recording your questionable code...")
 
                 try:
-                    # Execute the transformed file with replay active
+                    # Execute the transformed file while recording
                     runpy.run_path(str(out_paths[0]), run_name="__main__")
-                    safe_print("🎉 Replay complete! Execution was deterministic.")
+                    safe_print("🎉 Execution complete! Recording captured.")
 
                 except Exception as e:
-                    safe_print(f"💥 Runtime error during replay: {e}")
-                    safe_print("[info] This may indicate a difference from the original execution")
+                    safe_print(f"💥 Runtime error during recording: {e}")
+                    safe_print("[info] Recording captured up to the point of failure")
 
                 finally:
-                    # Always stop replay and show statistics
-                    replay_stats = stop_replay()
-                    safe_print(f"📊 Replay Statistics:")
-                    safe_print(f"   • Total calls: {replay_stats['total_calls']}")
-                    safe_print(f"   • Calls replayed: {replay_stats['calls_replayed']}")
-                    safe_print(f"   • Success rate: {replay_stats['success_rate']:.1f}%")
-
-                    if replay_stats["validation_issues"] > 0:
-                        safe_print(
-                            f"   ⚠️  {replay_stats['validation_issues']} validation issues detected"
-                        )
-                        if args.verbose:
-                            for i, mismatch in enumerate(
-                                replay_stats["mismatches"][:5]
-                            ):  # Show first 5
-                                safe_print(
-                                    f"      {i+1}. {mismatch['reason']} at call {mismatch['call_index']}"
-                                )
-
-                    if replay_stats["replay_complete"]:
-                        safe_print("✅ Replay completed successfully - all recorded calls matched")
-                    else:
-                        safe_print("⚠️  Replay incomplete - execution path may have diverged")
+                    # Always stop recording and save session
+                    session = stop_recording()
+                    safe_print(f"💾 Session saved to: {output_path}")
+                    safe_print(
+                        f"📊 Recorded {session.total_calls} RNG calls in {session.duration:.3f}s"
+                    )
+
+                    # Show summary of what was recorded
+                    if session.construct_usage:
+                        safe_print("🎯 Constructs recorded:")
+                        for construct, count in sorted(session.construct_usage.items()):
+                            safe_print(f"   • {construct}: {count} calls")
 
                     return 0
 
             except Exception as e:
-                safe_print(f"💥 Replay failed: {e}")
-                safe_print(
-                    "[tip] Make sure the session file is valid and the program hasn't changed"
-                )
+                safe_print(f"💥 Recording failed: {e}")
+                safe_print("[tip] Check that your .knda file is syntactically correct")
                 return 1
         else:
-            safe_print(f"😅 Replay is only supported for Python programs currently")
+            safe_print(f"😅 Recording is only supported for Python programs currently")
             return 1
 
-    if args.command == "analyze":
-        # Analyze recorded session
-        session_path = Path(args.session)
 
-        if not session_path.exists():
-            safe_print(
-                f"[?] Can't find session file '{args.session}'. Did you record this session?"
-            )
-            safe_print("[tip] Use 'kinda record run' to create a session file first")
-            return 1
+def handle_replay_command(args) -> int:
+    """Replay a recorded session"""
+    from pathlib import Path
 
-        try:
-            from kinda.record_replay import ExecutionRecorder
+    # Replay recorded session
+    session_path = Path(args.session)
+    program_path = Path(args.program)
 
-            # Load the session
-            safe_print(f"📂 Loading session from: {session_path}")
-            session = ExecutionRecorder.load_session(session_path)
+    if not session_path.exists():
+        safe_print(f"[?] Can't find session file '{args.session}'. Did you record this session?")
+        safe_print("[tip] Use 'kinda record run' to create a session file first")
+        return 1
 
-            # Generate analysis based on format
-            if args.format == "json":
-                # Output raw JSON
-                import json
+    if not program_path.exists():
+        safe_print(f"[?] Can't find program file '{args.program}'. Did you move it?")
+        safe_print("[tip] Make sure the .knda file exists and matches the recorded session")
+        return 1
 
-                session_dict = {
-                    "session_id": session.session_id,
-                    "input_file": session.input_file,
-                    "start_time": session.start_time,
-                    "duration": session.duration,
-                    "total_calls": session.total_calls,
-                    "construct_usage": session.construct_usage,
-                    "initial_personality": session.initial_personality,
-                    "rng_calls": [
-                        {
-                            "sequence_number": call.sequence_number,
-                            "method_name": call.method_name,
-                            "args": call.args,
-                            "result": call.result,
-                            "construct_type": call.construct_type,
-                            "decision_impact": call.decision_impact,
-                        }
-                        for call in session.rng_calls
-                    ],
-                }
-                print(json.dumps(session_dict, indent=2))
+    # Validate file before processing
+    if not validate_knda_file(program_path):
+        safe_print("💥 File validation failed - cannot replay this file")
+        return 1
+
+    try:
+        lang = detect_language(program_path, args.lang)
+    except ValueError as e:
+        # Language not supported (like C)
+        return 1
+
+    transformer = get_transformer(lang)
+    if transformer is None:
+        safe_print(f"🙄 Can't replay {lang} files yet. Python works though.")
+        return 1
+
+    if lang == "python":
+        from kinda.record_replay import ExecutionRecorder, start_replay, stop_replay
+        import runpy
 
-            elif args.format == "summary":
-                # Show session summary
-                safe_print(f"🎭 Session Analysis: {session.session_id}")
-                safe_print(f"📁 Program: {session.input_file}")
+        try:
+            # Load the recorded session
+            safe_print(f"📂 Loading session from: {session_path}")
+            session = ExecutionRecorder.load_session(session_path)
+            safe_print(f"🎭 Original session: {session.session_id}")
+            safe_print(f"📅 Recorded: {session.start_time} ({session.total_calls} RNG calls)")
+
+            # Verify session matches program
+            if session.input_file != str(program_path):
                 safe_print(
-                    f"⏱️  Duration: {session.duration:.3f}s ({session.total_calls} RNG calls)"
+                    f"⚠️  Session was recorded for '{session.input_file}', replaying '{program_path}'"
                 )
-                safe_print(f"🎲 Initial Personality: {session.initial_personality}")
-
-                if session.construct_usage:
-                    safe_print("\n🎯 Construct Usage:")
-                    total_calls = sum(session.construct_usage.values())
-                    for construct, count in sorted(
-                        session.construct_usage.items(), key=lambda x: x[1], reverse=True
-                    ):
-                        percentage = (count / total_calls * 100) if total_calls > 0 else 0
-                        safe_print(f"   • {construct}: {count} calls ({percentage:.1f}%)")
-
-                    # Show most impactful constructs
-                    if len(session.construct_usage) > 1:
-                        top_construct = max(session.construct_usage.items(), key=lambda x: x[1])
-                        safe_print(
-                            f"\n💫 Most Active Construct: {top_construct[0]} ({top_construct[1]} calls)"
-                        )
+                safe_print("[info] This may cause replay mismatches if files differ")
 
-            elif args.format == "detailed":
-                # Show detailed call-by-call analysis
-                safe_print(f"🔍 Detailed Session Analysis: {session.session_id}")
-                safe_print(f"📁 Program: {session.input_file}")
-                safe_print(f"⏱️  Duration: {session.duration:.3f}s")
+            # Start replay engine
+            safe_print("🔄 Starting deterministic replay...")
+            replay_session_id = start_replay(session)
 
-                safe_print(f"\n📋 RNG Call Timeline ({session.total_calls} calls):")
+            # Transform and execute the program
+            out_dir = Path(".kinda-build")
+            out_paths = transformer.transform(program_path, out_dir=out_dir)
 
-                construct_filter = args.construct
-                displayed_calls = 0
+            safe_print("🎮 Replaying your questionable code with recorded decisions...")
 
-                for i, call in enumerate(session.rng_calls[:50]):  # Limit to first 50 calls
-                    if construct_filter and call.construct_type != construct_filter:
-                        continue
+            try:
+                # Execute the transformed file with replay active
+                runpy.run_path(str(out_paths[0]), run_name="__main__")
+                safe_print("🎉 Replay complete! Execution was deterministic.")
 
+            except Exception as e:
+                safe_print(f"💥 Runtime error during replay: {e}")
+                safe_print("[info] This may indicate a difference from the original execution")
+
+            finally:
+                # Always stop replay and show statistics
+                replay_stats = stop_replay()
+                safe_print(f"📊 Replay Statistics:")
+                safe_print(f"   • Total calls: {replay_stats['total_calls']}")
+                safe_print(f"   • Calls replayed: {replay_stats['calls_replayed']}")
+                safe_print(f"   • Success rate: {replay_stats['success_rate']:.1f}%")
+
+                if replay_stats["validation_issues"] > 0:
                     safe_print(
-                        f"   {call.sequence_number:3d}. {call.method_name}({', '.join(map(str, call.args))}) → {call.result}"
+                        f"   ⚠️  {replay_stats['validation_issues']} validation issues detected"
                     )
-                    if call.construct_type:
-                        safe_print(f"        📍 {call.construct_type}: {call.decision_impact}")
-                    displayed_calls += 1
+                    if args.verbose:
+                        for i, mismatch in enumerate(
+                            replay_stats["mismatches"][:5]
+                        ):  # Show first 5
+                            safe_print(
+                                f"      {i+1}. {mismatch['reason']} at call {mismatch['call_index']}"
+                            )
 
-                if len(session.rng_calls) > 50:
-                    safe_print(f"   ... and {len(session.rng_calls) - 50} more calls")
+                if replay_stats["replay_complete"]:
+                    safe_print("✅ Replay completed successfully - all recorded calls matched")
+                else:
+                    safe_print("⚠️  Replay incomplete - execution path may have diverged")
 
-                if construct_filter:
-                    safe_print(f"\n🎯 Showing calls for construct: {construct_filter}")
-                    safe_print(f"📊 {displayed_calls} matching calls found")
+                return 0
 
-            elif args.format == "constructs":
-                # Focus on construct analysis
-                safe_print(f"🎯 Construct Analysis: {session.session_id}")
-                safe_print(f"📁 Program: {session.input_file}")
+        except Exception as e:
+            safe_print(f"💥 Replay failed: {e}")
+            safe_print("[tip] Make sure the session file is valid and the program hasn't changed")
+            return 1
+    else:
+        safe_print(f"😅 Replay is only supported for Python programs currently")
+        return 1
 
-                if not session.construct_usage:
-                    safe_print("🤔 No construct usage detected in this session")
-                    return 0
 
-                safe_print(f"\n📊 Construct Breakdown ({session.total_calls} total calls):")
+def handle_analyze_command(args) -> int:
+    """Analyze a recorded session"""
+    from pathlib import Path
+
+    # Analyze recorded session
+    session_path = Path(args.session)
 
+    if not session_path.exists():
+        safe_print(f"[?] Can't find session file '{args.session}'. Did you record this session?")
+        safe_print("[tip] Use 'kinda record run' to create a session file first")
+        return 1
+
+    try:
+        from kinda.record_replay import ExecutionRecorder
+
+        # Load the session
+        safe_print(f"📂 Loading session from: {session_path}")
+        session = ExecutionRecorder.load_session(session_path)
+
+        # Generate analysis based on format
+        if args.format == "json":
+            # Output raw JSON
+            import json
+
+            session_dict = {
+                "session_id": session.session_id,
+                "input_file": session.input_file,
+                "start_time": session.start_time,
+                "duration": session.duration,
+                "total_calls": session.total_calls,
+                "construct_usage": session.construct_usage,
+                "initial_personality": session.initial_personality,
+                "rng_calls": [
+                    {
+                        "sequence_number": call.sequence_number,
+                        "method_name": call.method_name,
+                        "args": call.args,
+                        "result": call.result,
+                        "construct_type": call.construct_type,
+                        "decision_impact": call.decision_impact,
+                    }
+                    for call in session.rng_calls
+                ],
+            }
+            print(json.dumps(session_dict, indent=2))
+
+        elif args.format == "summary":
+            # Show session summary
+            safe_print(f"🎭 Session Analysis: {session.session_id}")
+            safe_print(f"📁 Program: {session.input_file}")
+            safe_print(f"⏱️  Duration: {session.duration:.3f}s ({session.total_calls} RNG calls)")
+            safe_print(f"🎲 Initial Personality: {session.initial_personality}")
+
+            if session.construct_usage:
+                safe_print("\n🎯 Construct Usage:")
+                total_calls = sum(session.construct_usage.values())
                 for construct, count in sorted(
                     session.construct_usage.items(), key=lambda x: x[1], reverse=True
                 ):
-                    percentage = (
-                        (count / session.total_calls * 100) if session.total_calls > 0 else 0
+                    percentage = (count / total_calls * 100) if total_calls > 0 else 0
+                    safe_print(f"   • {construct}: {count} calls ({percentage:.1f}%)")
+
+                # Show most impactful constructs
+                if len(session.construct_usage) > 1:
+                    top_construct = max(session.construct_usage.items(), key=lambda x: x[1])
+                    safe_print(
+                        f"\n💫 Most Active Construct: {top_construct[0]} ({top_construct[1]} calls)"
                     )
-                    safe_print(f"\n🎲 {construct.upper()}: {count} calls ({percentage:.1f}%)")
-
-                    # Find example calls for this construct
-                    examples = [
-                        call for call in session.rng_calls if call.construct_type == construct
-                    ][:3]
-                    if examples:
-                        safe_print("   Examples:")
-                        for example in examples:
-                            safe_print(
-                                f"     • {example.method_name}({', '.join(map(str, example.args))}) → {example.result}"
-                            )
-                            if example.decision_impact:
-                                safe_print(f"       Impact: {example.decision_impact}")
 
-            elif args.format == "timeline":
-                # Show execution timeline
-                safe_print(f"📈 Execution Timeline: {session.session_id}")
-                safe_print(f"📁 Program: {session.input_file}")
+        elif args.format == "detailed":
+            # Show detailed call-by-call analysis
+            safe_print(f"🔍 Detailed Session Analysis: {session.session_id}")
+            safe_print(f"📁 Program: {session.input_file}")
+            safe_print(f"⏱️  Duration: {session.duration:.3f}s")
 
-                if not session.rng_calls:
-                    safe_print("🤔 No RNG calls recorded in this session")
-                    return 0
+            safe_print(f"\n📋 RNG Call Timeline ({session.total_calls} calls):")
 
-                # Group calls by construct type over time
-                time_buckets: Dict[float, Dict[str, int]] = {}
-                start_time = session.rng_calls[0].timestamp
+            construct_filter = args.construct
+            displayed_calls = 0
 
-                for call in session.rng_calls:
-                    elapsed = call.timestamp - start_time
-                    bucket = int(elapsed * 10) / 10  # 0.1s buckets
-                    construct = call.construct_type or "unknown"
+            for i, call in enumerate(session.rng_calls[:50]):  # Limit to first 50 calls
+                if construct_filter and call.construct_type != construct_filter:
+                    continue
 
-                    if bucket not in time_buckets:
-                        time_buckets[bucket] = {}
+                safe_print(
+                    f"   {call.sequence_number:3d}. {call.method_name}({', '.join(map(str, call.args))}) → {call.result}"
+                )
+                if call.construct_type:
+                    safe_print(f"        📍 {call.construct_type}: {call.decision_impact}")
+                displayed_calls += 1
 
-                    time_buckets[bucket][construct] = time_buckets[bucket].get(construct, 0) + 1
+            if len(session.rng_calls) > 50:
+                safe_print(f"   ... and {len(session.rng_calls) - 50} more calls")
 
-                safe_print("\n⏱️  Timeline (calls per 0.1s interval):")
-                for bucket in sorted(time_buckets.keys())[:20]:  # Show first 20 intervals
-                    calls = time_buckets[bucket]
-                    total = sum(calls.values())
-                    construct_list = ", ".join(f"{k}:{v}" for k, v in sorted(calls.items()))
-                    safe_print(f"   {bucket:4.1f}s: {total:2d} calls ({construct_list})")
+            if construct_filter:
+                safe_print(f"\n🎯 Showing calls for construct: {construct_filter}")
+                safe_print(f"📊 {displayed_calls} matching calls found")
 
-            # Export functionality
-            if args.export:
-                export_path = Path(args.export)
-                export_format = export_path.suffix.lower().lstrip(".")
+        elif args.format == "constructs":
+            # Focus on construct analysis
+            safe_print(f"🎯 Construct Analysis: {session.session_id}")
+            safe_print(f"📁 Program: {session.input_file}")
 
-                if export_format == "csv":
-                    import csv
+            if not session.construct_usage:
+                safe_print("🤔 No construct usage detected in this session")
+                return 0
 
-                    with open(export_path, "w", newline="") as csvfile:
-                        writer = csv.writer(csvfile)
+            safe_print(f"\n📊 Construct Breakdown ({session.total_calls} total calls):")
+
+            for construct, count in sorted(
+                session.construct_usage.items(), key=lambda x: x[1], reverse=True
+            ):
+                percentage = (count / session.total_calls * 100) if session.total_calls > 0 else 0
+                safe_print(f"\n🎲 {construct.upper()}: {count} calls ({percentage:.1f}%)")
+
+                # Find example calls for this construct
+                examples = [call for call in session.rng_calls if call.construct_type == construct][
+                    :3
+                ]
+                if examples:
+                    safe_print("   Examples:")
+                    for example in examples:
+                        safe_print(
+                            f"     • {example.method_name}({', '.join(map(str, example.args))}) → {example.result}"
+                        )
+                        if example.decision_impact:
+                            safe_print(f"       Impact: {example.decision_impact}")
+
+        elif args.format == "timeline":
+            # Show execution timeline
+            safe_print(f"📈 Execution Timeline: {session.session_id}")
+            safe_print(f"📁 Program: {session.input_file}")
+
+            if not session.rng_calls:
+                safe_print("🤔 No RNG calls recorded in this session")
+                return 0
+
+            # Group calls by construct type over time
+            time_buckets: Dict[float, Dict[str, int]] = {}
+            start_time = session.rng_calls[0].timestamp
+
+            for call in session.rng_calls:
+                elapsed = call.timestamp - start_time
+                bucket = int(elapsed * 10) / 10  # 0.1s buckets
+                construct = call.construct_type or "unknown"
+
+                if bucket not in time_buckets:
+                    time_buckets[bucket] = {}
+
+                time_buckets[bucket][construct] = time_buckets[bucket].get(construct, 0) + 1
+
+            safe_print("\n⏱️  Timeline (calls per 0.1s interval):")
+            for bucket in sorted(time_buckets.keys())[:20]:  # Show first 20 intervals
+                calls = time_buckets[bucket]
+                total = sum(calls.values())
+                construct_list = ", ".join(f"{k}:{v}" for k, v in sorted(calls.items()))
+                safe_print(f"   {bucket:4.1f}s: {total:2d} calls ({construct_list})")
+
+        # Export functionality
+        if args.export:
+            export_path = Path(args.export)
+            export_format = export_path.suffix.lower().lstrip(".")
+
+            if export_format == "csv":
+                import csv
+
+                with open(export_path, "w", newline="") as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(["sequence", "method", "args", "result", "construct", "impact"])
+                    for call in session.rng_calls:
                         writer.writerow(
-                            ["sequence", "method", "args", "result", "construct", "impact"]
+                            [
+                                call.sequence_number,
+                                call.method_name,
+                                str(call.args),
+                                call.result,
+                                call.construct_type or "",
+                                call.decision_impact or "",
+                            ]
                         )
-                        for call in session.rng_calls:
-                            writer.writerow(
-                                [
-                                    call.sequence_number,
-                                    call.method_name,
-                                    str(call.args),
-                                    call.result,
-                                    call.construct_type or "",
-                                    call.decision_impact or "",
-                                ]
-                            )
-                    safe_print(f"💾 Analysis exported to: {export_path}")
-
-                elif export_format == "json":
-                    import json
-
-                    analysis_data = {
-                        "session_metadata": {
-                            "session_id": session.session_id,
-                            "input_file": session.input_file,
-                            "duration": session.duration,
-                            "total_calls": session.total_calls,
-                        },
-                        "construct_usage": session.construct_usage,
-                        "rng_calls": [
-                            {
-                                "sequence": call.sequence_number,
-                                "method": call.method_name,
-                                "args": call.args,
-                                "result": call.result,
-                                "construct": call.construct_type,
-                                "impact": call.decision_impact,
-                                "timestamp": call.timestamp,
-                            }
-                            for call in session.rng_calls
-                        ],
-                    }
-                    with open(export_path, "w") as jsonfile:
-                        json.dump(analysis_data, jsonfile, indent=2)
-                    safe_print(f"💾 Analysis exported to: {export_path}")
-                else:
-                    safe_print(f"❌ Unsupported export format: {export_format}")
-                    safe_print("[tip] Use .csv or .json file extensions")
-                    return 1
+                safe_print(f"💾 Analysis exported to: {export_path}")
 
-            return 0
+            elif export_format == "json":
+                import json
 
-        except Exception as e:
-            safe_print(f"💥 Analysis failed: {e}")
-            safe_print("[tip] Make sure the session file is valid and not corrupted")
-            return 1
+                analysis_data = {
+                    "session_metadata": {
+                        "session_id": session.session_id,
+                        "input_file": session.input_file,
+                        "duration": session.duration,
+                        "total_calls": session.total_calls,
+                    },
+                    "construct_usage": session.construct_usage,
+                    "rng_calls": [
+                        {
+                            "sequence": call.sequence_number,
+                            "method": call.method_name,
+                            "args": call.args,
+                            "result": call.result,
+                            "construct": call.construct_type,
+                            "impact": call.decision_impact,
+                            "timestamp": call.timestamp,
+                        }
+                        for call in session.rng_calls
+                    ],
+                }
+                with open(export_path, "w") as jsonfile:
+                    json.dump(analysis_data, jsonfile, indent=2)
+                safe_print(f"💾 Analysis exported to: {export_path}")
+            else:
+                safe_print(f"❌ Unsupported export format: {export_format}")
+                safe_print("[tip] Use .csv or .json file extensions")
+                return 1
 
-    if args.command == "examples":
-        show_examples()
         return 0
 
-    if args.command == "syntax":
-        show_syntax_reference()
+    except Exception as e:
+        safe_print(f"💥 Analysis failed: {e}")
+        safe_print("[tip] Make sure the session file is valid and not corrupted")
+        return 1
+
+
+def handle_examples_command(args) -> int:
+    """Show example kinda programs"""
+    show_examples()
+    return 0
+
+
+def handle_syntax_command(args) -> int:
+    """Show the syntax reference"""
+    show_syntax_reference()
+    return 0
+
+
+# Subcommand name -> (help, argument builder, handler). main() only builds the
+# arguments of the subcommand being run, and handlers import what they need
+# when called, so startup doesn't pay for subcommands that aren't used.
+COMMANDS: Dict[str, Tuple[str, Optional[Callable[[Any], None]], Callable[[Any], int]]] = {
+    "transform": (
+        "Turn your kinda code into actual code (how responsible of you)",
+        add_transform_arguments,
+        handle_transform_command,
+    ),
+    "run": (
+        "Transform then execute (living dangerously, I see)",
+        add_run_arguments,
+        handle_run_command,
+    ),
+    "interpret": (
+        "Run directly in fuzzy runtime (maximum chaos mode)",
+        add_interpret_arguments,
+        handle_interpret_command,
+    ),
+    "examples": (
+        "Show example kinda programs (for inspiration)",
+        None,
+        handle_examples_command,
+    ),
+    "syntax": (
+        "Quick syntax reference (because you'll forget)",
+        None,
+        handle_syntax_command,
+    ),
+    "record": (
+        "Record execution for debugging and replay",
+        add_record_arguments,
+        handle_record_command,
+    ),
+    "replay": (
+        "Replay recorded sessions for debugging",
+        add_replay_arguments,
+        handle_replay_command,
+    ),
+    "analyze": (
+        "Analyze recorded sessions for debugging insights",
+        add_analyze_arguments,
+        handle_analyze_command,
+    ),
+    "inject": (
+        "Inject kinda-lang constructs into Python code (Epic #127)",
+        add_inject_arguments,
+        handle_inject_command,
+    ),
+}
+
+
+def main(argv=None) -> int:
+    argv = argv or sys.argv[1:]
+    if argv in (["--version"], ["-V"]):
+        # Answer the most common probe without even importing argparse
+        print(f"kinda {__version__}")
         return 0
 
-    if args.command == "inject":
-        return handle_inject_command(args)
+    import argparse
 
-    return 1
+    parser = argparse.ArgumentParser(
+        prog="kinda", description="A programming language for people who aren't totally sure"
+    )
+    parser.add_argument("-V", "--version", action="version", version=f"kinda {__version__}")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    # The top-level parser has no options that take values, so the first
+    # positional argument names the subcommand
+    selected = next((arg for arg in argv if not arg.startswith("-")), None)
+    for name, (help_text, add_arguments, _) in COMMANDS.items():
+        command_parser = sub.add_parser(name, help=help_text)
+        if name == selected and add_arguments is not None:
+            add_arguments(command_parser)
+
+    args = parser.parse_args(argv)
+    if args.command not in COMMANDS:
+        return 1
+    _, _, handle = COMMANDS[args.command]
+    return handle(args)
 
 
 if __name__ == "__main__":
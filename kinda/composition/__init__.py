@@ -19,6 +19,7 @@ from .framework import (
     CompositionStrategy,
     CompositionConfig,
     CompositionEngine,
+    CompiledComposite,
     PersonalityBridge,
     PerformanceMonitor,
     get_composition_engine,
@@ -66,6 +67,7 @@ __all__ = [
     "CompositionStrategy",
     "CompositionConfig",
     "CompositionEngine",
+    "CompiledComposite",
     "PersonalityBridge",
     "PerformanceMonitor",
     "get_composition_engine",
@@ -13,6 +13,8 @@ from typing import Any, Dict, List, Optional, Callable, Union
 from dataclasses import dataclass
 from enum import Enum
 
+from kinda.utils.streaming_stats import StreamingStats
+
 
 class CompositionStrategy(Enum):
     """Strategy patterns for construct composition."""
@@ -34,6 +36,7 @@ class CompositionConfig:
     dependency_validation: bool = True
     statistical_validation: bool = True
     debug_tracing: bool = False
+    analytic_sampling: bool = False  # Single-draw sampling of the composite outcome
 
 
 class CompositeConstruct(ABC):
@@ -45,6 +48,7 @@ class CompositeConstruct(ABC):
         self.dependencies = []
         self.composition_history = []
         self.performance_metrics = {}
+        self._compiled: Optional["CompiledComposite"] = None
 
     @abstractmethod
     def get_basic_constructs(self) -> List[str]:
@@ -61,6 +65,28 @@ class CompositeConstruct(ABC):
         """Return target probability behavior for each personality."""
         pass
 
+    def build_compiled(self, personality: Any) -> Callable[..., Any]:
+        """
+        Build a callable equivalent to compose() specialized for a personality.
+
+        Subclasses override this to resolve gates and bridge settings once; the
+        result is only rebuilt when the active personality context changes.
+        The default simply defers to compose().
+        """
+        return self.compose
+
+    def compiled(self) -> "CompiledComposite":
+        """Get this construct's compiled form from the global composition engine."""
+        if self._compiled is None:
+            self._compiled = get_composition_engine().compile(self)
+        return self._compiled
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Compiled closures are process-local; they are rebuilt on first use
+        state = self.__dict__.copy()
+        state["_compiled"] = None
+        return state
+
     def validate_dependencies(self) -> bool:
         """Validate that all required basic constructs are available."""
         from kinda.composition.validation import validate_construct_dependencies
@@ -93,22 +119,58 @@ class CompositeConstruct(ABC):
         return result
 
 
+class CompiledComposite:
+    """
+    A composite construct specialized for the active personality context.
+
+    Calling it checks (by identity) whether the personality context has been
+    replaced since the last build, which is what every mood, chaos level or
+    seed change does, and rebuilds the specialized callable only then.
+    """
+
+    __slots__ = ("composite", "_personality_cls", "_context", "_call")
+
+    def __init__(self, composite: CompositeConstruct):
+        from kinda.personality import PersonalityContext
+
+        self.composite = composite
+        self._personality_cls = PersonalityContext
+        self._context = None
+        self._call: Optional[Callable[..., Any]] = None
+
+    def __call__(self, *args, **kwargs) -> Any:
+        if self._context is None or self._personality_cls._instance is not self._context:
+            self._rebuild()
+        return self._call(*args, **kwargs)
+
+    def _rebuild(self) -> None:
+        context = self._personality_cls.get_instance()
+        self._call = self.composite.build_compiled(context)
+        self._context = context
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next call (e.g. after gates were redefined)."""
+        self._context = None
+        self._call = None
+
+
 class PerformanceMonitor:
     """Monitors and reports performance metrics for compositions."""
 
     def __init__(self):
-        self.execution_times = {}
+        # Constant-memory timing statistics per construct
+        self.execution_stats: Dict[str, StreamingStats] = {}
         self.memory_usage = {}
         self.error_rates = {}
 
     def record_execution(self, construct_name: str, execution_time: float, success: bool):
         """Record execution metrics."""
 
-        if construct_name not in self.execution_times:
-            self.execution_times[construct_name] = []
+        if construct_name not in self.execution_stats:
+            self.execution_stats[construct_name] = StreamingStats()
             self.error_rates[construct_name] = {"total": 0, "errors": 0}
 
-        self.execution_times[construct_name].append(execution_time)
+        self.execution_stats[construct_name].add(execution_time)
         self.error_rates[construct_name]["total"] += 1
 
         if not success:
@@ -117,21 +179,45 @@ class PerformanceMonitor:
     def get_performance_report(self, construct_name: str) -> Dict[str, Any]:
         """Get performance report for a construct."""
 
-        if construct_name not in self.execution_times:
+        if construct_name not in self.execution_stats:
             return {}
 
-        times = self.execution_times[construct_name]
+        stats = self.execution_stats[construct_name]
         errors = self.error_rates[construct_name]
 
         return {
             "construct": construct_name,
-            "total_executions": len(times),
-            "avg_time": sum(times) / len(times),
-            "min_time": min(times),
-            "max_time": max(times),
+            "total_executions": stats.count,
+            "avg_time": stats.mean,
+            "min_time": stats.min,
+            "max_time": stats.max,
+            "p50_time": stats.quantile(0.50),
+            "p95_time": stats.quantile(0.95),
+            "p99_time": stats.quantile(0.99),
             "error_rate": errors["errors"] / errors["total"] if errors["total"] > 0 else 0.0,
         }
 
+    def snapshot(self) -> Dict[str, Any]:
+        """Serializable copy of all metrics, for aggregating across workers."""
+        return {
+            name: {
+                "execution_stats": stats.snapshot(),
+                "error_rates": dict(self.error_rates[name]),
+            }
+            for name, stats in self.execution_stats.items()
+        }
+
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        """Fold another monitor's snapshot() into this one."""
+        for name, data in snapshot.items():
+            if name not in self.execution_stats:
+                self.execution_stats[name] = StreamingStats()
+                self.error_rates[name] = {"total": 0, "errors": 0}
+
+            self.execution_stats[name].merge(StreamingStats.from_snapshot(data["execution_stats"]))
+            self.error_rates[name]["total"] += data["error_rates"]["total"]
+            self.error_rates[name]["errors"] += data["error_rates"]["errors"]
+
 
 class CompositionEngine:
     """Core engine for executing construct compositions."""
@@ -150,6 +236,15 @@ class CompositionEngine:
         """Get a registered composite construct by name."""
         return self.construct_registry.get(name)
 
+    def compile(self, composite: CompositeConstruct) -> CompiledComposite:
+        """
+        Compile a composite into a callable with its gates resolved up front.
+
+        The strategy and personality bridge are baked into the callable, which
+        is rebuilt only when the personality context changes.
+        """
+        return CompiledComposite(composite)
+
     def _update_dependency_graph(self, construct: CompositeConstruct):
         """Update dependency graph with new construct."""
         self.dependency_graph[construct.name] = construct.get_basic_constructs()
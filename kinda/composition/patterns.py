@@ -7,7 +7,7 @@ Provides common composition patterns for building composite constructs
 from basic probabilistic primitives.
 """
 
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from kinda.composition.framework import (
     CompositeConstruct,
     CompositionStrategy,
@@ -17,14 +17,104 @@ from kinda.composition.framework import (
 )
 
 
+def _resolve_gate(construct_name: str) -> Optional[Callable]:
+    """Look up a basic construct in this module's globals, then the kinda runtime."""
+    gate_func = globals().get(construct_name)
+    if gate_func is None:
+        # Try importing from kinda runtime
+        try:
+            from kinda.langs.python.runtime import fuzzy
+
+            gate_func = getattr(fuzzy, construct_name, None)
+        except ImportError:
+            pass
+    return gate_func
+
+
+# Basic gates whose behaviour is a single Bernoulli trial at chaos_probability(name)
+ANALYTIC_GATES = frozenset({"sometimes", "maybe", "probably", "rarely"})
+
+
+def _analytic_probabilities(personality: Any, construct_names: List[str]) -> Optional[List[float]]:
+    """Pre-cascade gate probabilities, or None if any gate isn't a plain Bernoulli gate."""
+    if not construct_names:
+        return None
+    probabilities = []
+    for construct_name in construct_names:
+        base_name = construct_name.replace("_base", "")
+        if base_name not in ANALYTIC_GATES:
+            return None
+        probabilities.append(personality.get_base_chaos_probability(base_name))
+    return probabilities
+
+
+def _build_gate_sampler(
+    personality: Any, probabilities: List[float], construct_name: str
+) -> Callable[..., Tuple[int, float]]:
+    """
+    Build a sampler that plays a run of basic gates from one personality draw.
+
+    Gate outcomes are read off the draw by sequential inversion: gate i succeeds
+    when u < p_i, and u is rescaled onto [0, 1) for the next gate. Each p_i gets
+    the cascade effects current at that gate, and chaos state is updated once
+    per gate evaluated, so the outcome distribution and the instability and
+    execution count match calling the gates one by one.
+
+    The sampler returns the number of successful gates and the leftover uniform.
+    """
+    draw = personality.random
+    apply_cascade = personality.apply_cascade
+    update_instability = personality.update_instability
+    increment_execution = personality.increment_execution
+
+    def sample_gates(condition: Any, stop_on_success: bool) -> Tuple[int, float]:
+        if condition is True or condition is False:
+            condition_result = condition
+        elif condition is None:
+            condition_result = False
+        else:
+            from kinda.security import secure_condition_check
+
+            should_proceed, condition_result = secure_condition_check(condition, construct_name)
+            condition_result = bool(should_proceed and condition_result)
+
+        u = draw()
+        successes = 0
+        for base_probability in probabilities:
+            succeeded = False
+            if condition_result:
+                prob = apply_cascade(base_probability)
+                if u < prob:
+                    succeeded = True
+                    u /= prob
+                elif prob < 1.0:
+                    u = (u - prob) / (1.0 - prob)
+
+            update_instability(not succeeded)
+            increment_execution()
+            if succeeded:
+                successes += 1
+                if stop_on_success:
+                    break
+        return successes, u
+
+    return sample_gates
+
+
 class UnionComposition(CompositeConstruct):
     """Template for union-based compositions (like Task 1 sorta_print)."""
 
     def __init__(
-        self, name: str, basic_constructs: List[str], bridge_config: Dict[str, float] = None
+        self,
+        name: str,
+        basic_constructs: List[str],
+        bridge_config: Dict[str, float] = None,
+        analytic: bool = False,
     ):
         config = CompositionConfig(
-            strategy=CompositionStrategy.UNION, personality_bridges=bridge_config or {}
+            strategy=CompositionStrategy.UNION,
+            personality_bridges=bridge_config or {},
+            analytic_sampling=analytic,
         )
         super().__init__(name, config)
         self.basic_constructs = basic_constructs
@@ -34,34 +124,52 @@ class UnionComposition(CompositeConstruct):
 
     def compose(self, *args, **kwargs) -> bool:
         """Execute union composition."""
-        from kinda.composition.framework import get_composition_engine
-
-        engine = get_composition_engine()
+        return self.compiled()(*args, **kwargs)
 
-        # Get basic construct functions from global scope
+    def build_compiled(self, personality: Any) -> Callable[..., bool]:
+        """Resolve gates once and inline the OR and personality bridge."""
         gates = []
         for construct_name in self.basic_constructs:
-            gate_func = globals().get(construct_name)
+            gate_func = _resolve_gate(construct_name)
             if gate_func is None:
-                # Try importing from kinda runtime
-                try:
-                    from kinda.langs.python.runtime import fuzzy
+                raise RuntimeError(f"Basic construct '{construct_name}' not available")
+            gates.append(gate_func)
+
+        gates = tuple(gates)
+        bridge_prob = self.config.personality_bridges.get(personality.mood, 0.0)
+        if self.config.analytic_sampling:
+            probabilities = _analytic_probabilities(personality, self.basic_constructs)
+            if probabilities is not None:
+                return self._build_analytic(personality, probabilities, bridge_prob)
+        draw = personality.random
 
-                    gate_func = getattr(fuzzy, construct_name, None)
-                except ImportError:
+        def compiled_union(*args, **kwargs) -> bool:
+            for gate in gates:
+                try:
+                    if gate(*args, **kwargs):  # Short-circuit on first True
+                        return True
+                except Exception:
                     pass
+            # Personality bridge: rescue a failed union with the mood's bridge probability
+            return bridge_prob > 0 and draw() < bridge_prob
 
-            if gate_func is None:
-                raise RuntimeError(f"Basic construct '{construct_name}' not available")
-            gates.append(gate_func)
+        return compiled_union
 
-        # Execute union strategy
-        base_result = engine._execute_union(gates, *args, **kwargs)
+    def _build_analytic(
+        self, personality: Any, probabilities: List[float], bridge_prob: float
+    ) -> Callable[..., bool]:
+        """Sample the short-circuiting OR and its bridge from a single draw."""
+        sample_gates = _build_gate_sampler(personality, probabilities, self.name)
 
-        # Apply personality bridge if configured
-        return PersonalityBridge.apply_personality_bridge(
-            base_result, self.name, self.config.personality_bridges
-        )
+        def analytic_union(*args, **kwargs) -> bool:
+            condition = args[0] if args else kwargs.get("condition", True)
+            successes, u = sample_gates(condition, True)
+            if successes:
+                return True
+            # Every gate failed, so the leftover uniform is fresh for the bridge
+            return bridge_prob > 0 and u < bridge_prob
+
+        return analytic_union
 
     def get_target_probabilities(self) -> Dict[str, float]:
         """Calculate target probabilities for each personality."""
@@ -84,8 +192,18 @@ class UnionComposition(CompositeConstruct):
 class ThresholdComposition(CompositeConstruct):
     """Pattern for threshold-based compositions."""
 
-    def __init__(self, name: str, basic_constructs: List[str], threshold: float = 0.5):
-        config = CompositionConfig(strategy=CompositionStrategy.WEIGHTED, personality_bridges={})
+    def __init__(
+        self,
+        name: str,
+        basic_constructs: List[str],
+        threshold: float = 0.5,
+        analytic: bool = False,
+    ):
+        config = CompositionConfig(
+            strategy=CompositionStrategy.WEIGHTED,
+            personality_bridges={},
+            analytic_sampling=analytic,
+        )
         super().__init__(name, config)
         self.basic_constructs = basic_constructs
         self.threshold = threshold
@@ -95,21 +213,28 @@ class ThresholdComposition(CompositeConstruct):
 
     def compose(self, *args, **kwargs) -> bool:
         """Execute threshold composition."""
-        total_votes = 0
-        positive_votes = 0
-
-        for construct_name in self.basic_constructs:
-            gate_func = globals().get(construct_name)
-            if gate_func is None:
-                # Try importing from kinda runtime
-                try:
-                    from kinda.langs.python.runtime import fuzzy
-
-                    gate_func = getattr(fuzzy, construct_name, None)
-                except ImportError:
-                    pass
-
-            if gate_func:
+        return self.compiled()(*args, **kwargs)
+
+    def build_compiled(self, personality: Any) -> Callable[..., bool]:
+        """Resolve the available gates once and inline the vote."""
+        available = [
+            (construct_name, gate_func)
+            for construct_name, gate_func in zip(
+                self.basic_constructs, map(_resolve_gate, self.basic_constructs)
+            )
+            if gate_func  # Missing constructs don't vote
+        ]
+        gates = tuple(gate_func for _, gate_func in available)
+        threshold = self.threshold
+        if self.config.analytic_sampling:
+            probabilities = _analytic_probabilities(personality, [name for name, _ in available])
+            if probabilities is not None:
+                return self._build_analytic(personality, probabilities)
+
+        def compiled_threshold(*args, **kwargs) -> bool:
+            total_votes = 0
+            positive_votes = 0
+            for gate_func in gates:
                 try:
                     if gate_func(*args, **kwargs):
                         positive_votes += 1
@@ -117,11 +242,24 @@ class ThresholdComposition(CompositeConstruct):
                 except Exception:
                     pass  # Skip failed constructs
 
-        if total_votes == 0:
-            return False
+            if total_votes == 0:
+                return False
+            return positive_votes / total_votes >= threshold
 
-        vote_ratio = positive_votes / total_votes
-        return vote_ratio >= self.threshold
+        return compiled_threshold
+
+    def _build_analytic(self, personality: Any, probabilities: List[float]) -> Callable[..., bool]:
+        """Sample every gate's vote from a single draw."""
+        sample_gates = _build_gate_sampler(personality, probabilities, self.name)
+        total_votes = len(probabilities)
+        threshold = self.threshold
+
+        def analytic_threshold(*args, **kwargs) -> bool:
+            condition = args[0] if args else kwargs.get("condition", True)
+            positive_votes, _ = sample_gates(condition, False)
+            return positive_votes / total_votes >= threshold
+
+        return analytic_threshold
 
     def get_target_probabilities(self) -> Dict[str, float]:
         """Calculate target probabilities for threshold composition."""
@@ -373,17 +511,20 @@ class CompositionPatternFactory:
 
     @staticmethod
     def create_union_pattern(
-        name: str, basic_constructs: List[str], bridge_probabilities: Dict[str, float] = None
+        name: str,
+        basic_constructs: List[str],
+        bridge_probabilities: Dict[str, float] = None,
+        analytic: bool = False,
     ) -> UnionComposition:
         """Create a union composition pattern."""
-        return UnionComposition(name, basic_constructs, bridge_probabilities)
+        return UnionComposition(name, basic_constructs, bridge_probabilities, analytic)
 
     @staticmethod
     def create_threshold_pattern(
-        name: str, basic_constructs: List[str], threshold: float = 0.5
+        name: str, basic_constructs: List[str], threshold: float = 0.5, analytic: bool = False
     ) -> ThresholdComposition:
         """Create a threshold-based composition pattern."""
-        return ThresholdComposition(name, basic_constructs, threshold)
+        return ThresholdComposition(name, basic_constructs, threshold, analytic)
 
     @staticmethod
     def create_tolerance_pattern(
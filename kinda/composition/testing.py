@@ -6,18 +6,172 @@ Kinda-Lang Composition Testing Framework
 Statistical testing and validation framework for composite constructs.
 """
 
+import hashlib
+import math
+import os
+import pickle
 import time
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from kinda.composition.framework import CompositeConstruct
 
+# Samples per RNG substream; fixed so seeded results do not depend on worker count
+MONTE_CARLO_CHUNK_SIZE = 250
+
+# z-scores for the confidence levels used by composition validation
+_Z_SCORES = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
+
+
+def _chunk_seed(seed: int, personality: str, index: int) -> int:
+    """Derive an independent, reproducible RNG seed for one sample chunk."""
+    digest = hashlib.sha256(f"{seed}:{personality}:{index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _sample_chunk(
+    composite: CompositeConstruct,
+    personality: str,
+    chaos_level: int,
+    seed: int,
+    samples: int,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> int:
+    """
+    Count successes for one chunk under its own seeded personality context.
+
+    Runs in pool workers as well as in-process, so the active context is
+    swapped out and restored rather than reconfigured in place.
+    """
+    from kinda.personality import PersonalityContext
+
+    previous = PersonalityContext._instance
+    PersonalityContext._instance = PersonalityContext(personality, chaos_level, seed)
+    try:
+        successes = 0
+        for _ in range(samples):
+            try:
+                if composite.compose(*args, **kwargs):
+                    successes += 1
+            except Exception:
+                # Count exceptions as failures for probability calculation
+                pass
+        return successes
+    finally:
+        PersonalityContext._instance = previous
+
+
+def _wilson_interval(successes: int, trials: int, confidence: float) -> Tuple[float, float]:
+    """Wilson score interval for a pooled success count."""
+    if trials == 0:
+        return 0.0, 1.0
+    z = _Z_SCORES.get(round(confidence, 2), 1.96)
+    p_hat = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p_hat + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt((p_hat * (1 - p_hat) + z * z / (4 * trials)) / trials) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
 
 class CompositionTestFramework:
-    """Statistical testing framework for composite constructs."""
+    """
+    Statistical testing framework for composite constructs.
 
-    def __init__(self, samples: int = 1000, confidence: float = 0.95):
+    By default samples are drawn serially from the active personality context.
+    With ``workers`` > 1 (or ``None`` for one per CPU) or an explicit ``seed``,
+    the sample budget is split into fixed-size chunks, each with its own seeded
+    RNG substream. The chunks are farmed out to a process pool and their counts
+    are merged, so a seeded run gives the same result for any number of workers.
+    """
+
+    def __init__(
+        self,
+        samples: int = 1000,
+        confidence: float = 0.95,
+        workers: Optional[int] = 1,
+        seed: Optional[int] = None,
+    ):
         self.samples = samples
         self.confidence = confidence
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.seed = seed
         self.test_results = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "CompositionTestFramework":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the sampling process pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Lazily start the process pool so it is reused across validations."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _count_successes(
+        self,
+        composite: CompositeConstruct,
+        personality: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[int, int]:
+        """Draw the sample budget and return (successes, workers actually used)."""
+        if self.workers <= 1 and self.seed is None:
+            successes = 0
+            for _ in range(self.samples):
+                try:
+                    if composite.compose(*args, **kwargs):
+                        successes += 1
+                except Exception:
+                    # Count exceptions as failures for probability calculation
+                    pass
+            return successes, 1
+
+        from kinda.personality import get_personality
+
+        chaos_level = get_personality().chaos_level
+        seed = self.seed if self.seed is not None else int.from_bytes(os.urandom(8), "big")
+        chunks = [
+            (_chunk_seed(seed, personality, index), min(MONTE_CARLO_CHUNK_SIZE, remaining))
+            for index, remaining in enumerate(range(self.samples, 0, -MONTE_CARLO_CHUNK_SIZE))
+        ]
+
+        if self.workers > 1 and len(chunks) > 1:
+            try:
+                # Composites built from local classes or closures can't cross processes
+                pickle.dumps((composite, args, kwargs))
+            except Exception:
+                pass
+            else:
+                executor = self._get_executor()
+                futures = [
+                    executor.submit(
+                        _sample_chunk,
+                        composite,
+                        personality,
+                        chaos_level,
+                        chunk_seed,
+                        size,
+                        args,
+                        kwargs,
+                    )
+                    for chunk_seed, size in chunks
+                ]
+                return sum(f.result() for f in futures), min(self.workers, len(chunks))
+
+        successes = sum(
+            _sample_chunk(composite, personality, chaos_level, chunk_seed, size, args, kwargs)
+            for chunk_seed, size in chunks
+        )
+        return successes, 1
 
     def validate_composition_probability(
         self,
@@ -36,17 +190,11 @@ class CompositionTestFramework:
         PersonalityContext.set_mood(personality)
 
         try:
-            successes = 0
-            for _ in range(self.samples):
-                try:
-                    if composite.compose(*args, **kwargs):
-                        successes += 1
-                except Exception:
-                    # Count exceptions as failures for probability calculation
-                    pass
+            successes, workers_used = self._count_successes(composite, personality, args, kwargs)
 
             actual_prob = successes / self.samples
             within_tolerance = abs(actual_prob - expected_prob) <= tolerance
+            ci_lower, ci_upper = _wilson_interval(successes, self.samples, self.confidence)
 
             test_result = {
                 "construct": composite.name,
@@ -55,6 +203,9 @@ class CompositionTestFramework:
                 "actual": actual_prob,
                 "tolerance": tolerance,
                 "samples": self.samples,
+                "successes": successes,
+                "confidence_interval": (ci_lower, ci_upper),
+                "workers": workers_used,
                 "passed": within_tolerance,
             }
 
@@ -146,6 +297,9 @@ class CompositionTestFramework:
                 report += f"{test_name}: {status}\n"
                 report += f"  Expected: {result['expected']:.3f} ± {result['tolerance']:.3f}\n"
                 report += f"  Actual:   {result['actual']:.3f}\n"
+                if "confidence_interval" in result:
+                    ci_lower, ci_upper = result["confidence_interval"]
+                    report += f"  {self.confidence:.0%} CI:  [{ci_lower:.3f}, {ci_upper:.3f}]\n"
                 report += f"  Samples:  {result['samples']}\n\n"
 
         # Performance tests
@@ -5,6 +5,7 @@ Epic #127: Enhanced probability control - Dynamic adjustment of probabilities
 based on runtime feedback, learning, and adaptive behavior.
 """
 
+import math
 import threading
 import time
 from abc import ABC, abstractmethod
@@ -14,6 +15,10 @@ from typing import Dict, List, Optional, Callable, Any, Tuple
 from collections import defaultdict, deque
 
 from .context import ProbabilityContext, ProbabilityProfile, ProbabilityMode
+from kinda.utils.streaming_stats import StreamingStats
+
+# Default number of probability adjustments kept in the rolling history
+DEFAULT_HISTORY_LIMIT = 1000
 
 
 class RuleCondition(Enum):
@@ -36,6 +41,23 @@ class AdjustmentType(Enum):
     EXPONENTIAL = "exponential"  # Exponential decay/growth
 
 
+def _calls_before_crossing(hits: int, calls: int, threshold: float) -> float:
+    """Fewest further calls after which hits / calls could reach the other side of threshold"""
+    if calls == 0:
+        return 1
+    if hits / calls >= threshold:
+        # Only misses lower the rate: hits / (calls + k) < threshold
+        if threshold <= 0:
+            return math.inf
+        remaining = hits / threshold - calls
+    else:
+        # Only hits raise the rate: (hits + k) / (calls + k) >= threshold
+        if threshold >= 1:
+            return math.inf
+        remaining = (threshold * calls - hits) / (1 - threshold)
+    return max(1, math.floor(remaining))
+
+
 @dataclass
 class ProbabilityRule:
     """Rule for dynamic probability adjustment"""
@@ -78,6 +100,32 @@ class ProbabilityRule:
 
         return False
 
+    def stable_calls(self, metrics: "PerformanceMetrics") -> float:
+        """
+        Recorded calls after which evaluate() could first change its answer.
+
+        Each recorded call adds one to call_count and one to either the
+        success or the error count, which bounds how fast a rate can move
+        towards the threshold. Time-based rules are handled with deadlines
+        and never change with calls.
+        """
+        if not self.enabled or self.condition in (RuleCondition.TIME_BASED, RuleCondition.CUSTOM):
+            return math.inf
+
+        if self.condition == RuleCondition.CALL_COUNT:
+            if metrics.call_count >= self.threshold:
+                return math.inf
+            return max(1, math.ceil(self.threshold - metrics.call_count))
+
+        if self.condition == RuleCondition.SUCCESS_RATE:
+            return _calls_before_crossing(metrics.success_count, metrics.call_count, self.threshold)
+
+        if self.condition == RuleCondition.ERROR_RATE:
+            return _calls_before_crossing(metrics.error_count, metrics.call_count, self.threshold)
+
+        # A single slow call can move the average execution time anywhere
+        return 1
+
     def apply_adjustment(self, current_probability: float) -> float:
         """Apply adjustment to current probability"""
         if self.adjustment_type == AdjustmentType.ABSOLUTE:
@@ -116,6 +164,7 @@ class PerformanceMetrics:
     last_call_time: Optional[float] = None
     probability_history: deque = field(default_factory=lambda: deque(maxlen=100))
     recent_adjustments: List[Tuple[float, str]] = field(default_factory=list)
+    execution_time_stats: StreamingStats = field(default_factory=StreamingStats)
 
     @property
     def success_rate(self) -> float:
@@ -142,6 +191,7 @@ class PerformanceMetrics:
         """Record a construct call"""
         self.call_count += 1
         self.total_execution_time += execution_time
+        self.execution_time_stats.add(execution_time)
         self.last_call_time = time.time()
 
         if success:
@@ -161,6 +211,43 @@ class PerformanceMetrics:
             "elapsed_time": elapsed_time,
         }
 
+    def merge(self, other: "PerformanceMetrics"):
+        """Fold another worker's metrics for the same construct into these"""
+        self.call_count += other.call_count
+        self.success_count += other.success_count
+        self.error_count += other.error_count
+        self.total_execution_time += other.total_execution_time
+        if other.last_call_time is not None:
+            self.last_call_time = max(self.last_call_time or 0.0, other.last_call_time)
+        self.probability_history.extend(other.probability_history)
+        self.execution_time_stats.merge(other.execution_time_stats)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable snapshot of these metrics"""
+        return {
+            "call_count": self.call_count,
+            "success_count": self.success_count,
+            "error_count": self.error_count,
+            "total_execution_time": self.total_execution_time,
+            "probability_history": list(self.probability_history),
+            "execution_time_stats": self.execution_time_stats.snapshot(),
+        }
+
+    @classmethod
+    def from_dict(cls, construct_name: str, data: Dict[str, Any]) -> "PerformanceMetrics":
+        """Rebuild metrics from to_dict()"""
+        metrics = cls(construct_name)
+        metrics.call_count = data.get("call_count", 0)
+        metrics.success_count = data.get("success_count", 0)
+        metrics.error_count = data.get("error_count", 0)
+        metrics.total_execution_time = data.get("total_execution_time", 0.0)
+        metrics.probability_history = deque(data.get("probability_history", []), maxlen=100)
+        if "execution_time_stats" in data:
+            metrics.execution_time_stats = StreamingStats.from_snapshot(
+                data["execution_time_stats"]
+            )
+        return metrics
+
 
 class FeedbackCollector:
     """Collects feedback for probability adjustments"""
@@ -182,22 +269,60 @@ class FeedbackCollector:
                 pass
 
 
+class _ConstructShard:
+    """Per-construct lock, adjustment count and cached rule evaluation"""
+
+    __slots__ = (
+        "lock",
+        "adjustment_count",
+        "cache_metrics",
+        "cache_version",
+        "cache_calls",
+        "cache_valid_until",
+        "candidates",
+    )
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.adjustment_count = 0
+        self.cache_metrics: Optional[PerformanceMetrics] = None
+        self.cache_version: Optional[Tuple[int, float]] = None
+        # The evaluation holds for call counts in [cache_calls, cache_valid_until)
+        self.cache_calls = 0
+        self.cache_valid_until: float = 0
+        # (rule, deadline) pairs; a deadline is set for time-based rules only
+        self.candidates: Tuple[Tuple[ProbabilityRule, Optional[float]], ...] = ()
+
+
 class DynamicProbabilityManager:
     """
     Manager for dynamic probability adjustments based on runtime feedback.
 
     This class provides adaptive probability control that can learn from
     execution patterns and adjust probabilities to optimize behavior.
+
+    Rules are indexed by construct name and each construct has its own lock,
+    so calls for different constructs never contend. Rule evaluation is cached
+    per construct and only redone when the rule set changes or enough calls
+    have been recorded that a metric could cross a rule's threshold;
+    time-based rules are cached as a deadline. Toggle rules through
+    enable_rule/disable_rule so cached evaluations are refreshed.
     """
 
-    def __init__(self):
+    def __init__(self, history_limit: int = DEFAULT_HISTORY_LIMIT):
         self.rules: List[ProbabilityRule] = []
         self.metrics: Dict[str, PerformanceMetrics] = {}
         self.start_time = time.time()
         self.enabled = True
-        self.adjustment_history: List[Tuple[float, str, str, float, float]] = []
+        # Rolling window of the most recent adjustments; the total is counted separately
+        self.adjustment_history: deque = deque(maxlen=history_limit)
         self.feedback_collector = FeedbackCollector()
+        # Guards the rule set and shard creation; per-construct work uses shard locks
         self._lock = threading.Lock()
+        self._rule_index: Dict[str, Tuple[ProbabilityRule, ...]] = {}
+        self._rules_version = 0
+        self._shards: Dict[str, _ConstructShard] = {}
+        self._adjustment_offset = 0
 
         # Initialize with some default rules
         self._initialize_default_rules()
@@ -245,10 +370,31 @@ class DynamicProbabilityManager:
             )
         )
 
+    @property
+    def total_adjustments(self) -> int:
+        """Total adjustments made, including ones that left the rolling history"""
+        shards = list(self._shards.values())
+        return self._adjustment_offset + sum(shard.adjustment_count for shard in shards)
+
+    @total_adjustments.setter
+    def total_adjustments(self, value: int):
+        shards = list(self._shards.values())
+        self._adjustment_offset = value - sum(shard.adjustment_count for shard in shards)
+
+    def _reindex_rules(self):
+        """Rebuild the per-construct rule index (caller holds self._lock)"""
+        index: Dict[str, List[ProbabilityRule]] = defaultdict(list)
+        for rule in self.rules:
+            index[rule.construct_name].append(rule)
+        # Readers only ever see a complete index
+        self._rule_index = {name: tuple(rules) for name, rules in index.items()}
+        self._rules_version += 1
+
     def add_rule(self, rule: ProbabilityRule):
         """Add a dynamic adjustment rule"""
         with self._lock:
             self.rules.append(rule)
+            self._reindex_rules()
 
     def remove_rule(self, rule_name: str) -> bool:
         """Remove a rule by name"""
@@ -256,6 +402,7 @@ class DynamicProbabilityManager:
             for i, rule in enumerate(self.rules):
                 if rule.name == rule_name:
                     del self.rules[i]
+                    self._reindex_rules()
                     return True
         return False
 
@@ -265,6 +412,7 @@ class DynamicProbabilityManager:
             for rule in self.rules:
                 if rule.name == rule_name:
                     rule.enabled = True
+                    self._rules_version += 1
                     return True
         return False
 
@@ -274,9 +422,71 @@ class DynamicProbabilityManager:
             for rule in self.rules:
                 if rule.name == rule_name:
                     rule.enabled = False
+                    self._rules_version += 1
                     return True
         return False
 
+    def _get_shard(self, construct_name: str) -> Tuple[PerformanceMetrics, _ConstructShard]:
+        """Get a construct's metrics and shard, creating them on first use"""
+        metrics = self.metrics.get(construct_name)
+        shard = self._shards.get(construct_name)
+        if metrics is None or shard is None:
+            with self._lock:
+                metrics = self.metrics.get(construct_name)
+                if metrics is None:
+                    metrics = self.metrics[construct_name] = PerformanceMetrics(construct_name)
+                shard = self._shards.get(construct_name)
+                if shard is None:
+                    shard = self._shards[construct_name] = _ConstructShard()
+        return metrics, shard
+
+    def _evaluate_rules(
+        self,
+        construct_name: str,
+        metrics: PerformanceMetrics,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Tuple[ProbabilityRule, Optional[float]], ...]:
+        """Find the rules that apply to a construct given its current metrics"""
+        rules = self._rule_index.get(construct_name, ())
+        if not rules:
+            return ()
+
+        current_metrics = metrics.get_metrics_dict(time.time() - self.start_time)
+        if context:
+            # Context may override any metric, so evaluate everything now
+            current_metrics.update(context)
+            return tuple((rule, None) for rule in rules if rule.evaluate(current_metrics))
+
+        candidates = []
+        for rule in rules:
+            if rule.condition == RuleCondition.TIME_BASED:
+                if rule.enabled:
+                    candidates.append((rule, self.start_time + rule.threshold))
+            elif rule.evaluate(current_metrics):
+                candidates.append((rule, None))
+        return tuple(candidates)
+
+    def _cached_rules(
+        self, construct_name: str, metrics: PerformanceMetrics, shard: _ConstructShard
+    ) -> Tuple[Tuple[ProbabilityRule, Optional[float]], ...]:
+        """Get the applicable rules, re-evaluating only when a threshold could be crossed"""
+        # Time-based deadlines are computed from start_time
+        version = (self._rules_version, self.start_time)
+        if (
+            shard.cache_metrics is not metrics
+            or shard.cache_version != version
+            or not shard.cache_calls <= metrics.call_count < shard.cache_valid_until
+        ):
+            rules = self._rule_index.get(construct_name, ())
+            shard.candidates = self._evaluate_rules(construct_name, metrics)
+            shard.cache_metrics = metrics
+            shard.cache_version = version
+            shard.cache_calls = metrics.call_count
+            shard.cache_valid_until = metrics.call_count + min(
+                (rule.stable_calls(metrics) for rule in rules), default=math.inf
+            )
+        return shard.candidates
+
     def get_dynamic_probability(
         self, construct_name: str, base_probability: float, context: Optional[Dict[str, Any]] = None
     ) -> float:
@@ -294,40 +504,40 @@ class DynamicProbabilityManager:
         if not self.enabled:
             return base_probability
 
-        with self._lock:
-            # Ensure metrics exist for this construct
-            if construct_name not in self.metrics:
-                self.metrics[construct_name] = PerformanceMetrics(construct_name)
-
-            metrics = self.metrics[construct_name]
-            elapsed_time = time.time() - self.start_time
+        metrics, shard = self._get_shard(construct_name)
 
-            # Get current metrics for rule evaluation
-            current_metrics = metrics.get_metrics_dict(elapsed_time)
+        with shard.lock:
             if context:
-                current_metrics.update(context)
+                candidates = self._evaluate_rules(construct_name, metrics, context)
+            else:
+                candidates = self._cached_rules(construct_name, metrics, shard)
 
             # Apply rules
             adjusted_probability = base_probability
-            applied_rules = []
-
-            for rule in self.rules:
-                if rule.construct_name == construct_name and rule.evaluate(current_metrics):
-                    old_probability = adjusted_probability
-                    adjusted_probability = rule.apply_adjustment(adjusted_probability)
-
-                    # Record the adjustment
-                    if old_probability != adjusted_probability:
-                        applied_rules.append(rule.name)
-                        self.adjustment_history.append(
-                            (
-                                time.time(),
-                                rule.name,
-                                construct_name,
-                                old_probability,
-                                adjusted_probability,
-                            )
+            now = None
+
+            for rule, deadline in candidates:
+                if deadline is not None:
+                    if now is None:
+                        now = time.time()
+                    if now < deadline:
+                        continue
+
+                old_probability = adjusted_probability
+                adjusted_probability = rule.apply_adjustment(adjusted_probability)
+
+                # Record the adjustment
+                if old_probability != adjusted_probability:
+                    shard.adjustment_count += 1
+                    self.adjustment_history.append(
+                        (
+                            time.time(),
+                            rule.name,
+                            construct_name,
+                            old_probability,
+                            adjusted_probability,
                         )
+                    )
 
             # Record the probability in history
             metrics.probability_history.append(adjusted_probability)
@@ -352,24 +562,27 @@ class DynamicProbabilityManager:
             probability_used: Probability value that was used
             context: Additional context about the execution
         """
-        with self._lock:
-            if construct_name not in self.metrics:
-                self.metrics[construct_name] = PerformanceMetrics(construct_name)
+        metrics, shard = self._get_shard(construct_name)
 
-            metrics = self.metrics[construct_name]
+        with shard.lock:
             metrics.record_call(execution_time, success, probability_used)
 
-            # Collect feedback
-            feedback_context = {
-                "execution_time": execution_time,
-                "success": success,
-                "probability_used": probability_used,
-                "metrics": metrics.get_metrics_dict(),
-            }
-            if context:
-                feedback_context.update(context)
+            # Only build feedback when someone is listening
+            if not self.feedback_collector.feedback_callbacks:
+                return
+            metrics_snapshot = metrics.get_metrics_dict()
+
+        # Collect feedback
+        feedback_context = {
+            "execution_time": execution_time,
+            "success": success,
+            "probability_used": probability_used,
+            "metrics": metrics_snapshot,
+        }
+        if context:
+            feedback_context.update(context)
 
-            self.feedback_collector.collect_feedback(construct_name, feedback_context)
+        self.feedback_collector.collect_feedback(construct_name, feedback_context)
 
     def get_construct_metrics(self, construct_name: str) -> Optional[PerformanceMetrics]:
         """Get performance metrics for a construct"""
@@ -390,9 +603,10 @@ class DynamicProbabilityManager:
             limit: Limit number of results (None for all)
 
         Returns:
-            List of (timestamp, rule_name, construct_name, old_prob, new_prob)
+            List of (timestamp, rule_name, construct_name, old_prob, new_prob),
+            limited to the manager's rolling history window
         """
-        history = self.adjustment_history
+        history = list(self.adjustment_history)
 
         if construct_name:
             history = [h for h in history if h[2] == construct_name]
@@ -447,13 +661,15 @@ class DynamicProbabilityManager:
                     self.metrics[construct_name] = PerformanceMetrics(construct_name)
             else:
                 self.metrics.clear()
+                self._shards.clear()
                 self.adjustment_history.clear()
+                self._adjustment_offset = 0
 
     def get_summary_report(self) -> Dict[str, Any]:
         """Get a summary report of dynamic behavior"""
         with self._lock:
             total_calls = sum(m.call_count for m in self.metrics.values())
-            total_adjustments = len(self.adjustment_history)
+            total_adjustments = self.total_adjustments
 
             construct_summaries = {}
             for name, metrics in self.metrics.items():
@@ -462,6 +678,9 @@ class DynamicProbabilityManager:
                     "success_rate": metrics.success_rate,
                     "error_rate": metrics.error_rate,
                     "avg_execution_time": metrics.average_execution_time,
+                    "p50_execution_time": metrics.execution_time_stats.quantile(0.50),
+                    "p95_execution_time": metrics.execution_time_stats.quantile(0.95),
+                    "p99_execution_time": metrics.execution_time_stats.quantile(0.99),
                     "current_probability": (
                         list(metrics.probability_history)[-1]
                         if metrics.probability_history
@@ -482,17 +701,9 @@ class DynamicProbabilityManager:
     def export_learning_data(self) -> Dict[str, Any]:
         """Export learning data for analysis or persistence"""
         return {
-            "metrics": {
-                name: {
-                    "call_count": m.call_count,
-                    "success_count": m.success_count,
-                    "error_count": m.error_count,
-                    "total_execution_time": m.total_execution_time,
-                    "probability_history": list(m.probability_history),
-                }
-                for name, m in self.metrics.items()
-            },
-            "adjustment_history": self.adjustment_history,
+            "metrics": {name: m.to_dict() for name, m in self.metrics.items()},
+            "adjustment_history": list(self.adjustment_history),
+            "total_adjustments": self.total_adjustments,
             "rules": [
                 {
                     "name": r.name,
@@ -513,20 +724,28 @@ class DynamicProbabilityManager:
             # Import metrics
             if "metrics" in data:
                 for name, metric_data in data["metrics"].items():
-                    metrics = PerformanceMetrics(name)
-                    metrics.call_count = metric_data.get("call_count", 0)
-                    metrics.success_count = metric_data.get("success_count", 0)
-                    metrics.error_count = metric_data.get("error_count", 0)
-                    metrics.total_execution_time = metric_data.get("total_execution_time", 0.0)
-
-                    prob_history = metric_data.get("probability_history", [])
-                    metrics.probability_history = deque(prob_history, maxlen=100)
-
-                    self.metrics[name] = metrics
+                    self.metrics[name] = PerformanceMetrics.from_dict(name, metric_data)
 
             # Import adjustment history
             if "adjustment_history" in data:
-                self.adjustment_history = data["adjustment_history"]
+                history = data["adjustment_history"]
+                self.adjustment_history = deque(history, maxlen=self.adjustment_history.maxlen)
+                self.total_adjustments = data.get("total_adjustments", len(history))
+
+    def merge_learning_data(self, data: Dict[str, Any]):
+        """Aggregate learning data exported by another manager (e.g. another worker)"""
+        with self._lock:
+            for name, metric_data in data.get("metrics", {}).items():
+                incoming = PerformanceMetrics.from_dict(name, metric_data)
+                if name in self.metrics:
+                    self.metrics[name].merge(incoming)
+                else:
+                    self.metrics[name] = incoming
+
+            history = data.get("adjustment_history", [])
+            merged = sorted(list(self.adjustment_history) + list(history), key=lambda h: h[0])
+            self.adjustment_history = deque(merged, maxlen=self.adjustment_history.maxlen)
+            self.total_adjustments += data.get("total_adjustments", len(history))
 
 
 # Global dynamic manager instance
@@ -5,27 +5,27 @@ import re
 KindaCConstructs = {
     "kinda_int": {
         "type": "declaration",
-        "pattern": re.compile(r"kinda int (\w+)\s*=\s*(.+?);"),
+        "pattern": re.compile(r"~?kinda int (\w+)\s*~?=\s*(.+?);"),
         "description": "Fuzzy integer declaration with noise",
     },
     "kinda_int_decl": {
         "type": "declaration",
-        "pattern": re.compile(r"(\w+):\s*kinda int\s*=\s*(.+?);"),
+        "pattern": re.compile(r"(\w+):\s*~?kinda int\s*~?=\s*(.+?);"),
         "description": "Fuzzy integer declaration with type annotation",
     },
     "sorta_print": {
         "type": "print",
-        "pattern": re.compile(r"sorta print\s*\((.*)\)\s*;?"),
+        "pattern": re.compile(r"~?sorta print\s*\((.*)\)\s*;?"),
         "description": "Print with ~80% probability",
     },
     "sometimes": {
         "type": "conditional",
-        "pattern": re.compile(r"sometimes\s*\(([^)]*)\)\s*\{"),
+        "pattern": re.compile(r"~?sometimes\s*\(([^)]*)\)\s*\{"),
         "description": "Fuzzy conditional trigger (50% chance)",
     },
     "maybe": {
         "type": "conditional",
-        "pattern": re.compile(r"maybe\s*\(([^)]*)\)\s*\{"),
+        "pattern": re.compile(r"~?maybe\s*\(([^)]*)\)\s*\{"),
         "description": "Fuzzy conditional trigger (60% chance)",
     },
     "fuzzy_reassign": {
@@ -35,7 +35,7 @@ KindaCConstructs = {
     },
     "kinda_binary": {
         "type": "declaration",
-        "pattern": re.compile(r"kinda\s+binary\s+(\w+)(?:\s*~\s*probabilities\s*\(([^)]+)\))?;?"),
+        "pattern": re.compile(r"~?kinda\s+binary\s+(\w+)(?:\s*~\s*probabilities\s*\(([^)]+)\))?;?"),
         "description": "Three-state binary: positive (1), negative (-1), or neutral (0)",
     },
 }
@@ -9,9 +9,10 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         "pattern": re.compile(r"~kinda int (\w+)\s*[~=]+\s*([^#;]+?)(?:\s*#.*)?(?:;|$)"),
         "description": "Fuzzy integer declaration with personality-adjusted noise",
         "body": (
-            "def kinda_int(val):\n"
+            "def kinda_int(val, fuzz_range=None):\n"
             '    """Fuzzy integer with personality-adjusted fuzz and chaos tracking"""\n'
             "    from kinda.personality import chaos_fuzz_range, update_chaos_state, chaos_randint, record_construct_error\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Check if value is numeric\n"
             "        if not isinstance(val, (int, float)):\n"
@@ -20,12 +21,12 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            except (ValueError, TypeError):\n"
             "                error_msg = f'Expected a number but got {type(val).__name__}'\n"
             "                record_construct_error('kinda_int', error_msg, f'value={repr(val)}', recovered=True)\n"
-            '                print(f"[?] kinda int got something weird: {repr(val)}")\n'
-            '                print(f"[tip] {error_msg}")\n'
+            '                diagnostic(f"[?] kinda int got something weird: {repr(val)}")\n'
+            '                diagnostic(f"[tip] {error_msg}")\n'
             "                update_chaos_state(failed=True)\n"
             "                return chaos_randint(0, 10)\n"
             "        \n"
-            "        fuzz_min, fuzz_max = chaos_fuzz_range('int')\n"
+            "        fuzz_min, fuzz_max = fuzz_range if fuzz_range is not None else chaos_fuzz_range('int')\n"
             "        fuzz = chaos_randint(fuzz_min, fuzz_max)\n"
             "        result = int(val + fuzz)\n"
             "        update_chaos_state(failed=False)\n"
@@ -33,8 +34,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "    except Exception as e:\n"
             "        error_msg = f'Unexpected error: {e}'\n"
             "        record_construct_error('kinda_int', error_msg, f'value={repr(val)}', recovered=True)\n"
-            '        print(f"[shrug] Kinda int got kinda confused: {e}")\n'
-            '        print(f"[tip] Just picking a random number instead")\n'
+            '        diagnostic(f"[shrug] Kinda int got kinda confused: {e}")\n'
+            '        diagnostic(f"[tip] Just picking a random number instead")\n'
             "        update_chaos_state(failed=True)\n"
             "        return chaos_randint(0, 10)"
         ),
@@ -44,9 +45,10 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         "pattern": re.compile(r"~kinda float (\w+)\s*[~=]+\s*([^#;]+?)(?:\s*#.*)?(?:;|$)"),
         "description": "Fuzzy floating-point declaration with personality-adjusted drift",
         "body": (
-            "def kinda_float(val):\n"
+            "def kinda_float(val, drift_range=None):\n"
             '    """Fuzzy floating-point with personality-adjusted drift and chaos tracking"""\n'
             "    from kinda.personality import chaos_float_drift_range, update_chaos_state, chaos_uniform, record_construct_error\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Check if value is numeric\n"
             "        if not isinstance(val, (int, float)):\n"
@@ -55,8 +57,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            except (ValueError, TypeError):\n"
             "                error_msg = f'Expected a number but got {type(val).__name__}'\n"
             "                record_construct_error('kinda_float', error_msg, f'value={repr(val)}', recovered=True)\n"
-            '                print(f"[?] kinda float got something weird: {repr(val)}")\n'
-            '                print(f"[tip] {error_msg}")\n'
+            '                diagnostic(f"[?] kinda float got something weird: {repr(val)}")\n'
+            '                diagnostic(f"[tip] {error_msg}")\n'
             "                update_chaos_state(failed=True)\n"
             "                return chaos_uniform(0.0, 10.0)\n"
             "        \n"
@@ -64,7 +66,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        base_val = float(val)\n"
             "        \n"
             "        # Apply personality-adjusted drift\n"
-            "        drift_min, drift_max = chaos_float_drift_range()\n"
+            "        drift_min, drift_max = drift_range if drift_range is not None else chaos_float_drift_range()\n"
             "        drift = chaos_uniform(drift_min, drift_max)\n"
             "        result = base_val + drift\n"
             "        update_chaos_state(failed=False)\n"
@@ -72,8 +74,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "    except Exception as e:\n"
             "        error_msg = f'Unexpected error: {e}'\n"
             "        record_construct_error('kinda_float', error_msg, f'value={repr(val)}', recovered=True)\n"
-            '        print(f"[shrug] Kinda float got kinda confused: {e}")\n'
-            '        print(f"[tip] Just picking a random float instead")\n'
+            '        diagnostic(f"[shrug] Kinda float got kinda confused: {e}")\n'
+            '        diagnostic(f"[tip] Just picking a random float instead")\n'
             "        update_chaos_state(failed=True)\n"
             "        return chaos_uniform(0.0, 10.0)"
         ),
@@ -86,11 +88,12 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def kinda_bool(val):\n"
             '    """Fuzzy boolean with personality-adjusted uncertainty and chaos tracking"""\n'
             "    from kinda.personality import chaos_bool_uncertainty, update_chaos_state, chaos_random, chaos_choice\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Handle None case\n"
             "        if val is None:\n"
-            '            print(f"[?] kinda bool got None - that\'s kinda ambiguous")\n'
-            '            print(f"[tip] Choosing randomly between True and False")\n'
+            '            diagnostic(f"[?] kinda bool got None - that\'s kinda ambiguous")\n'
+            '            diagnostic(f"[tip] Choosing randomly between True and False")\n'
             "            update_chaos_state(failed=True)\n"
             "            return chaos_choice([True, False])\n"
             "        \n"
@@ -102,8 +105,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            elif val_lower in ('false', '0', 'no', 'off', 'n'):\n"
             "                base_bool = False\n"
             "            else:\n"
-            '                print(f"[?] kinda bool got ambiguous string: {repr(val)}")\n'
-            '                print(f"[tip] Treating non-empty string as truthy")\n'
+            '                diagnostic(f"[?] kinda bool got ambiguous string: {repr(val)}")\n'
+            '                diagnostic(f"[tip] Treating non-empty string as truthy")\n'
             "                base_bool = bool(val)\n"
             "        else:\n"
             "            base_bool = bool(val)\n"
@@ -113,7 +116,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        if chaos_random() < uncertainty:\n"
             "            # Introduce fuzzy uncertainty - flip the boolean sometimes\n"
             "            result = not base_bool\n"
-            '            print(f"[fuzzy] kinda bool feeling uncertain, flipped to {result}")\n'
+            '            diagnostic(f"[fuzzy] kinda bool feeling uncertain, flipped to {result}")\n'
             "            update_chaos_state(failed=True)\n"
             "        else:\n"
             "            result = base_bool\n"
@@ -121,8 +124,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        \n"
             "        return result\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Kinda bool got kinda confused: {e}")\n'
-            '        print(f"[tip] Just flipping a coin instead")\n'
+            '        diagnostic(f"[shrug] Kinda bool got kinda confused: {e}")\n'
+            '        diagnostic(f"[tip] Just flipping a coin instead")\n'
             "        update_chaos_state(failed=True)\n"
             "        return chaos_choice([True, False])"
         ),
@@ -132,47 +135,54 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         "pattern": re.compile(r"~sorta print\s*\((.*)\)\s*(?:;|$)"),
         "description": "Print with composition of ~sometimes and ~maybe constructs",
         "body": (
-            "def sorta_print(*args):\n"
+            "def sorta_print(*args, base_prob=None):\n"
             '    """Sorta prints using composition of basic probabilistic constructs"""\n'
             "    from kinda.personality import update_chaos_state, get_personality, chaos_random, chaos_choice, chaos_probability\n"
+            "    from kinda.output import emit, diagnostic\n"
             "    \n"
             "    # Validate basic constructs are available for composition\n"
             "    if 'sometimes' not in globals():\n"
-            "        print('[error] Basic construct \\'sometimes\\' not available - check loading order')\n"
-            "        print('[fallback]', *args)\n"
+            "        diagnostic('[error] Basic construct \\'sometimes\\' not available - check loading order')\n"
+            "        emit('[fallback]', *args)\n"
             "        update_chaos_state(failed=True)\n"
             "        return\n"
             "    if 'maybe' not in globals():\n"
-            "        print('[error] Basic construct \\'maybe\\' not available - check loading order')\n"
-            "        print('[fallback]', *args)\n"
+            "        diagnostic('[error] Basic construct \\'maybe\\' not available - check loading order')\n"
+            "        emit('[fallback]', *args)\n"
             "        update_chaos_state(failed=True)\n"
             "        return\n"
             "    \n"
             "    try:\n"
             "        if not args:\n"
             "            # Use personality-aware probability for sorta_print (~80%)\n"
-            "            prob = chaos_probability('sorta_print')\n"
+            "            if base_prob is not None:\n"
+            "                prob = get_personality().apply_cascade(base_prob)\n"
+            "            else:\n"
+            "                prob = chaos_probability('sorta_print')\n"
             "            should_execute = chaos_random() < prob\n"
             "            \n"
             "            if should_execute:\n"
-            "                print('[shrug] Nothing to print, I guess?')\n"
+            "                emit('[shrug] Nothing to print, I guess?')\n"
             "            # Don't print anything when should_execute is False - respect the ~20% failure rate\n"
             "            update_chaos_state(failed=not should_execute)\n"
             "            return\n"
             "        \n"
             "        # Main execution path - use personality-aware probability for sorta_print (~80%)\n"
-            "        prob = chaos_probability('sorta_print')\n"
+            "        if base_prob is not None:\n"
+            "            prob = get_personality().apply_cascade(base_prob)\n"
+            "        else:\n"
+            "            prob = chaos_probability('sorta_print')\n"
             "        should_execute = chaos_random() < prob\n"
             "        \n"
             "        if should_execute:\n"
-            "            print('[print]', *args)\n"
+            "            emit('[print]', *args)\n"
             "            update_chaos_state(failed=False)\n"
             "        else:\n"
             "            # Don't print - respect the ~20% failure rate for true probabilistic behavior\n"
             "            update_chaos_state(failed=True)\n"
             "    except Exception as e:\n"
-            "        print(f'[error] Sorta print kinda broke: {e}')\n"
-            "        print('[fallback]', *args)\n"
+            "        diagnostic(f'[error] Sorta print kinda broke: {e}')\n"
+            "        emit('[fallback]', *args)\n"
             "        update_chaos_state(failed=True)"
         ),
     },
@@ -181,12 +191,13 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         "pattern": re.compile(r"~sometimes\s*\(([^)]*)\)\s*\{?"),
         "description": "Fuzzy conditional trigger with personality-adjusted probability",
         "body": (
-            "def sometimes(condition=True):\n"
+            "def sometimes(condition=True, base_prob=None):\n"
             '    """Sometimes evaluates a condition with personality-adjusted probability"""\n'
-            "    from kinda.personality import chaos_probability, update_chaos_state, chaos_random, chaos_choice\n"
+            "    from kinda.personality import chaos_probability, update_chaos_state, chaos_random, chaos_choice, get_personality\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        if condition is None:\n"
-            '            print("[?] Sometimes got None as condition - treating as False")\n'
+            '            diagnostic("[?] Sometimes got None as condition - treating as False")\n'
             "            update_chaos_state(failed=True)\n"
             "            return False\n"
             "        \n"
@@ -197,13 +208,16 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            update_chaos_state(failed=True)\n"
             "            return False\n"
             "        \n"
-            "        prob = chaos_probability('sometimes')\n"
+            "        if base_prob is not None:\n"
+            "            prob = get_personality().apply_cascade(base_prob)\n"
+            "        else:\n"
+            "            prob = chaos_probability('sometimes')\n"
             "        result = chaos_random() < prob and condition_result\n"
             "        update_chaos_state(failed=not result)\n"
             "        return result\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Sometimes got confused: {e}")\n'
-            '        print("[tip] Flipping a coin instead")\n'
+            '        diagnostic(f"[shrug] Sometimes got confused: {e}")\n'
+            '        diagnostic("[tip] Flipping a coin instead")\n'
             "        update_chaos_state(failed=True)\n"
             "        return chaos_choice([True, False])"
         ),
@@ -213,12 +227,13 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         "pattern": re.compile(r"~maybe\s*\(([^)]*)\)\s*\{?"),
         "description": "Fuzzy conditional trigger with personality-adjusted probability",
         "body": (
-            "def maybe(condition=True):\n"
+            "def maybe(condition=True, base_prob=None):\n"
             '    """Maybe evaluates a condition with personality-adjusted probability"""\n'
-            "    from kinda.personality import chaos_probability, update_chaos_state, chaos_random, chaos_choice\n"
+            "    from kinda.personality import chaos_probability, update_chaos_state, chaos_random, chaos_choice, get_personality\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        if condition is None:\n"
-            '            print("[?] Maybe got None as condition - treating as False")\n'
+            '            diagnostic("[?] Maybe got None as condition - treating as False")\n'
             "            update_chaos_state(failed=True)\n"
             "            return False\n"
             "        \n"
@@ -229,13 +244,16 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            update_chaos_state(failed=True)\n"
             "            return False\n"
             "        \n"
-            "        prob = chaos_probability('maybe')\n"
+            "        if base_prob is not None:\n"
+            "            prob = get_personality().apply_cascade(base_prob)\n"
+            "        else:\n"
+            "            prob = chaos_probability('maybe')\n"
             "        result = chaos_random() < prob and condition_result\n"
             "        update_chaos_state(failed=not result)\n"
             "        return result\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Maybe couldn\'t decide: {e}")\n'
-            '        print("[tip] Defaulting to random choice")\n'
+            '        diagnostic(f"[shrug] Maybe couldn\'t decide: {e}")\n'
+            '        diagnostic("[tip] Defaulting to random choice")\n'
             "        update_chaos_state(failed=True)\n"
             "        return chaos_choice([True, False])"
         ),
@@ -245,12 +263,13 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         "pattern": re.compile(r"~probably\s*\(([^)]*)\)\s*\{?"),
         "description": "Fuzzy conditional trigger with 70% base probability and personality adjustment",
         "body": (
-            "def probably(condition=True):\n"
+            "def probably(condition=True, base_prob=None):\n"
             '    """Probably evaluates a condition with 70% base probability and personality adjustment"""\n'
-            "    from kinda.personality import chaos_probability, update_chaos_state, chaos_random, chaos_choice\n"
+            "    from kinda.personality import chaos_probability, update_chaos_state, chaos_random, chaos_choice, get_personality\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        if condition is None:\n"
-            '            print("[?] Probably got None as condition - treating as False")\n'
+            '            diagnostic("[?] Probably got None as condition - treating as False")\n'
             "            update_chaos_state(failed=True)\n"
             "            return False\n"
             "        \n"
@@ -261,13 +280,16 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            update_chaos_state(failed=True)\n"
             "            return False\n"
             "        \n"
-            "        prob = chaos_probability('probably')\n"
+            "        if base_prob is not None:\n"
+            "            prob = get_personality().apply_cascade(base_prob)\n"
+            "        else:\n"
+            "            prob = chaos_probability('probably')\n"
             "        result = chaos_random() < prob and condition_result\n"
             "        update_chaos_state(failed=not result)\n"
             "        return result\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Probably got confused: {e}")\n'
-            '        print("[tip] Defaulting to random choice")\n'
+            '        diagnostic(f"[shrug] Probably got confused: {e}")\n'
+            '        diagnostic("[tip] Defaulting to random choice")\n'
             "        update_chaos_state(failed=True)\n"
             "        return chaos_choice([True, False])"
         ),
@@ -277,12 +299,13 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         "pattern": re.compile(r"~rarely\s*\(([^)]*)\)\s*\{?"),
         "description": "Fuzzy conditional trigger with 15% base probability and personality adjustment",
         "body": (
-            "def rarely(condition=True):\n"
+            "def rarely(condition=True, base_prob=None):\n"
             '    """Rarely evaluates a condition with 15% base probability and personality adjustment"""\n'
-            "    from kinda.personality import chaos_probability, update_chaos_state, chaos_random, chaos_choice\n"
+            "    from kinda.personality import chaos_probability, update_chaos_state, chaos_random, chaos_choice, get_personality\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        if condition is None:\n"
-            '            print("[?] Rarely got None as condition - treating as False")\n'
+            '            diagnostic("[?] Rarely got None as condition - treating as False")\n'
             "            update_chaos_state(failed=True)\n"
             "            return False\n"
             "        \n"
@@ -293,13 +316,16 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            update_chaos_state(failed=True)\n"
             "            return False\n"
             "        \n"
-            "        prob = chaos_probability('rarely')\n"
+            "        if base_prob is not None:\n"
+            "            prob = get_personality().apply_cascade(base_prob)\n"
+            "        else:\n"
+            "            prob = chaos_probability('rarely')\n"
             "        result = chaos_random() < prob and condition_result\n"
             "        update_chaos_state(failed=not result)\n"
             "        return result\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Rarely got confused: {e}")\n'
-            '        print("[tip] Defaulting to random choice")\n'
+            '        diagnostic(f"[shrug] Rarely got confused: {e}")\n'
+            '        diagnostic("[tip] Defaulting to random choice")\n'
             "        update_chaos_state(failed=True)\n"
             "        return chaos_choice([True, False])"
         ),
@@ -312,14 +338,15 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def fuzzy_assign(var_name, value):\n"
             '    """Fuzzy assignment with personality-adjusted fuzz and chaos tracking"""\n'
             "    from kinda.personality import chaos_fuzz_range, update_chaos_state, chaos_randint\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Check if value is numeric\n"
             "        if not isinstance(value, (int, float)):\n"
             "            try:\n"
             "                value = float(value)\n"
             "            except (ValueError, TypeError):\n"
-            '                print(f"[?] fuzzy assignment got something weird: {repr(value)}")\n'
-            '                print(f"[tip] Expected a number but got {type(value).__name__}")\n'
+            '                diagnostic(f"[?] fuzzy assignment got something weird: {repr(value)}")\n'
+            '                diagnostic(f"[tip] Expected a number but got {type(value).__name__}")\n'
             "                update_chaos_state(failed=True)\n"
             "                return chaos_randint(0, 10)\n"
             "        \n"
@@ -329,8 +356,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        update_chaos_state(failed=False)\n"
             "        return result\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Fuzzy assignment kinda failed: {e}")\n'
-            '        print(f"[tip] Returning a random number because why not?")\n'
+            '        diagnostic(f"[shrug] Fuzzy assignment kinda failed: {e}")\n'
+            '        diagnostic(f"[tip] Returning a random number because why not?")\n'
             "        update_chaos_state(failed=True)\n"
             "        return chaos_randint(0, 10)"
         ),
@@ -345,6 +372,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def kinda_binary(pos_prob=None, neg_prob=None, neutral_prob=None):\n"
             '    """Returns 1 (positive), -1 (negative), or 0 (neutral) with personality-adjusted probabilities."""\n'
             "    from kinda.personality import chaos_binary_probabilities, update_chaos_state, chaos_random, chaos_choice\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Use personality-adjusted probabilities if not specified\n"
             "        if pos_prob is None or neg_prob is None or neutral_prob is None:\n"
@@ -353,8 +381,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        # Validate probabilities\n"
             "        total_prob = pos_prob + neg_prob + neutral_prob\n"
             "        if abs(total_prob - 1.0) > 0.01:  # Allow small floating point errors\n"
-            '            print(f"[?] Binary probabilities don\'t add up to 1.0 (got {total_prob:.3f})")\n'
-            '            print(f"[tip] Normalizing: pos={pos_prob:.3f}, neg={neg_prob:.3f}, neutral={neutral_prob:.3f}")\n'
+            '            diagnostic(f"[?] Binary probabilities don\'t add up to 1.0 (got {total_prob:.3f})")\n'
+            '            diagnostic(f"[tip] Normalizing: pos={pos_prob:.3f}, neg={neg_prob:.3f}, neutral={neutral_prob:.3f}")\n'
             "            # Normalize probabilities\n"
             "            pos_prob /= total_prob\n"
             "            neg_prob /= total_prob\n"
@@ -371,8 +399,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        update_chaos_state(failed=False)\n"
             "        return result\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Binary choice kinda broke: {e}")\n'
-            '        print(f"[tip] Defaulting to random choice between -1, 0, 1")\n'
+            '        diagnostic(f"[shrug] Binary choice kinda broke: {e}")\n'
+            '        diagnostic(f"[tip] Defaulting to random choice between -1, 0, 1")\n'
             "        update_chaos_state(failed=True)\n"
             "        return chaos_choice([-1, 0, 1])"
         ),
@@ -382,24 +410,25 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         "pattern": re.compile(r"(\d+(?:\.\d+)?)~ish"),
         "description": "Epic #124 Task 3: Fuzzy value using ~kinda float + variance composition",
         "body": (
-            "def ish_value(val, target_val=None):\n"
+            "def ish_value(val, target_val=None, variance=None):\n"
             '    """Epic #124 Task 3: ~ish variable modification using composed constructs"""\n'
             "    from kinda.personality import chaos_variance, update_chaos_state\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Convert val to numeric\n"
             "        if not isinstance(val, (int, float)):\n"
             "            try:\n"
             "                val = float(val)\n"
             "            except (ValueError, TypeError):\n"
-            '                print(f"[?] ish value got weird value: {repr(val)}")\n'
-            '                print(f"[tip] Expected a number but got {type(val).__name__}")\n'
+            '                diagnostic(f"[?] ish value got weird value: {repr(val)}")\n'
+            '                diagnostic(f"[tip] Expected a number but got {type(val).__name__}")\n'
             "                update_chaos_state(failed=True)\n"
             "                return kinda_float(0)\n"
             "        \n"
             "        # Epic #124 Task 3: Handle both standalone (5~ish) and assignment (var ~ish target) cases\n"
             "        if target_val is None:\n"
             "            # Standalone case: 5~ish → create fuzzy value using ~kinda float + variance\n"
-            "            variance_base = chaos_variance()\n"
+            "            variance_base = variance if variance is not None else chaos_variance()\n"
             "            fuzzy_variance = kinda_float(variance_base)\n"
             "            result = val + fuzzy_variance\n"
             "        else:\n"
@@ -408,8 +437,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "                try:\n"
             "                    target_val = float(target_val)\n"
             "                except (ValueError, TypeError):\n"
-            '                    print(f"[?] ish value got weird target: {repr(target_val)}")\n'
-            '                    print(f"[tip] Expected a number but got {type(target_val).__name__}")\n'
+            '                    diagnostic(f"[?] ish value got weird target: {repr(target_val)}")\n'
+            '                    diagnostic(f"[tip] Expected a number but got {type(target_val).__name__}")\n'
             "                    update_chaos_state(failed=True)\n"
             "                    return kinda_float(val)\n"
             "            \n"
@@ -423,7 +452,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "                result = val + (difference * adjustment_factor)\n"
             "            else:\n"
             "                # Apply direct fuzzy variance (fallback behavior)\n"
-            "                variance_base = chaos_variance()\n"
+            "                variance_base = variance if variance is not None else chaos_variance()\n"
             "                fuzzy_variance = kinda_float(variance_base)\n"
             "                result = val + fuzzy_variance\n"
             "        \n"
@@ -435,8 +464,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        else:\n"
             "            return kinda_float(result)\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Composed ish value got confused: {e}")\n'
-            '        print(f"[tip] Falling back to basic fuzzy adjustment")\n'
+            '        diagnostic(f"[shrug] Composed ish value got confused: {e}")\n'
+            '        diagnostic(f"[tip] Falling back to basic fuzzy adjustment")\n'
             "        update_chaos_state(failed=True)\n"
             "        return val if val is not None else target_val if target_val is not None else 0"
         ),
@@ -449,6 +478,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def ish_comparison(left_val, right_val, tolerance_base=None):\n"
             '    """Epic #124 Task 3: ~ish comparison built from ~kinda float + tolerance logic"""\n'
             "    from kinda.personality import chaos_tolerance, update_chaos_state, chaos_probability\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Use personality-adjusted tolerance base if not specified\n"
             "        if tolerance_base is None:\n"
@@ -459,8 +489,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            try:\n"
             "                left_val = float(left_val)\n"
             "            except (ValueError, TypeError):\n"
-            '                print(f"[?] ish comparison got weird left value: {repr(left_val)}")\n'
-            '                print(f"[tip] Expected a number but got {type(left_val).__name__}")\n'
+            '                diagnostic(f"[?] ish comparison got weird left value: {repr(left_val)}")\n'
+            '                diagnostic(f"[tip] Expected a number but got {type(left_val).__name__}")\n'
             "                update_chaos_state(failed=True)\n"
             "                return probably(False)\n"
             "        \n"
@@ -468,8 +498,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            try:\n"
             "                right_val = float(right_val)\n"
             "            except (ValueError, TypeError):\n"
-            '                print(f"[?] ish comparison got weird right value: {repr(right_val)}")\n'
-            '                print(f"[tip] Expected a number but got {type(right_val).__name__}")\n'
+            '                diagnostic(f"[?] ish comparison got weird right value: {repr(right_val)}")\n'
+            '                diagnostic(f"[tip] Expected a number but got {type(right_val).__name__}")\n'
             "                update_chaos_state(failed=True)\n"
             "                return probably(False)\n"
             "        \n"
@@ -484,8 +514,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        update_chaos_state(failed=False)\n"
             "        return result\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Composed ish comparison kinda broke: {e}")\n'
-            '        print(f"[tip] Falling back to basic fuzzy choice")\n'
+            '        diagnostic(f"[shrug] Composed ish comparison kinda broke: {e}")\n'
+            '        diagnostic(f"[tip] Falling back to basic fuzzy choice")\n'
             "        update_chaos_state(failed=True)\n"
             "        return maybe(False)"
         ),
@@ -498,6 +528,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def welp_fallback(primary_expr, fallback_value):\n"
             '    """Execute primary expression with graceful fallback and chaos tracking"""\n'
             "    from kinda.personality import update_chaos_state, get_personality\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # If primary_expr is a callable, call it\n"
             "        if callable(primary_expr):\n"
@@ -512,13 +543,13 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            style = personality.get_error_message_style()\n"
             "            \n"
             "            if style == 'professional':\n"
-            '                print(f"[welp] Expression returned None, using fallback: {repr(fallback_value)}")\n'
+            '                diagnostic(f"[welp] Expression returned None, using fallback: {repr(fallback_value)}")\n'
             "            elif style == 'friendly':\n"
-            '                print(f"[welp] Got nothing there, trying fallback: {repr(fallback_value)}")\n'
+            '                diagnostic(f"[welp] Got nothing there, trying fallback: {repr(fallback_value)}")\n'
             "            elif style == 'snarky':\n"
-            '                print(f"[welp] Well that was useless, falling back to: {repr(fallback_value)}")\n'
+            '                diagnostic(f"[welp] Well that was useless, falling back to: {repr(fallback_value)}")\n'
             "            else:  # chaotic\n"
-            '                print(f"[welp] *shrugs* That didn\'t work, whatever: {repr(fallback_value)}")\n'
+            '                diagnostic(f"[welp] *shrugs* That didn\'t work, whatever: {repr(fallback_value)}")\n'
             "            \n"
             "            update_chaos_state(failed=True)\n"
             "            return fallback_value\n"
@@ -531,13 +562,13 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        style = personality.get_error_message_style()\n"
             "        \n"
             "        if style == 'professional':\n"
-            '            print(f"[welp] Operation failed ({type(e).__name__}: {e}), using fallback: {repr(fallback_value)}")\n'
+            '            diagnostic(f"[welp] Operation failed ({type(e).__name__}: {e}), using fallback: {repr(fallback_value)}")\n'
             "        elif style == 'friendly':\n"
-            '            print(f"[welp] Oops, that didn\'t work ({e}), trying: {repr(fallback_value)}")\n'
+            '            diagnostic(f"[welp] Oops, that didn\'t work ({e}), trying: {repr(fallback_value)}")\n'
             "        elif style == 'snarky':\n"
-            '            print(f"[welp] Predictably failed with {type(e).__name__}, fine: {repr(fallback_value)}")\n'
+            '            diagnostic(f"[welp] Predictably failed with {type(e).__name__}, fine: {repr(fallback_value)}")\n'
             "        else:  # chaotic\n"
-            '            print(f"[welp] BOOM! {e} *CRASH* Whatever, here\'s: {repr(fallback_value)}")\n'
+            '            diagnostic(f"[welp] BOOM! {e} *CRASH* Whatever, here\'s: {repr(fallback_value)}")\n'
             "        \n"
             "        update_chaos_state(failed=True)\n"
             "        return fallback_value"
@@ -557,14 +588,15 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def time_drift_float(var_name, initial_value):\n"
             '    """Create a floating-point variable that drifts over time and usage"""\n'
             "    from kinda.personality import register_time_variable, get_time_drift, update_chaos_state, chaos_uniform\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Convert initial value to float\n"
             "        if not isinstance(initial_value, (int, float)):\n"
             "            try:\n"
             "                initial_value = float(initial_value)\n"
             "            except (ValueError, TypeError):\n"
-            '                print(f"[?] time drift float got something weird: {repr(initial_value)}")\n'
-            '                print(f"[tip] Expected a number but got {type(initial_value).__name__}")\n'
+            '                diagnostic(f"[?] time drift float got something weird: {repr(initial_value)}")\n'
+            '                diagnostic(f"[tip] Expected a number but got {type(initial_value).__name__}")\n'
             "                update_chaos_state(failed=True)\n"
             "                initial_value = chaos_uniform(0.0, 10.0)\n"
             "        \n"
@@ -580,8 +612,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        update_chaos_state(failed=False)\n"
             "        return result\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Time drift float got confused: {e}")\n'
-            '        print(f"[tip] Just picking a random float instead")\n'
+            '        diagnostic(f"[shrug] Time drift float got confused: {e}")\n'
+            '        diagnostic(f"[tip] Just picking a random float instead")\n'
             "        update_chaos_state(failed=True)\n"
             "        return chaos_uniform(0.0, 10.0)"
         ),
@@ -594,14 +626,15 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def time_drift_int(var_name, initial_value):\n"
             '    """Create an integer variable that drifts over time and usage"""\n'
             "    from kinda.personality import register_time_variable, get_time_drift, update_chaos_state, chaos_randint, chaos_choice\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Convert initial value to int\n"
             "        if not isinstance(initial_value, (int, float)):\n"
             "            try:\n"
             "                initial_value = float(initial_value)\n"
             "            except (ValueError, TypeError):\n"
-            '                print(f"[?] time drift int got something weird: {repr(initial_value)}")\n'
-            '                print(f"[tip] Expected a number but got {type(initial_value).__name__}")\n'
+            '                diagnostic(f"[?] time drift int got something weird: {repr(initial_value)}")\n'
+            '                diagnostic(f"[tip] Expected a number but got {type(initial_value).__name__}")\n'
             "                update_chaos_state(failed=True)\n"
             "                initial_value = chaos_randint(0, 10)\n"
             "        \n"
@@ -617,8 +650,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        update_chaos_state(failed=False)\n"
             "        return result\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Time drift int got confused: {e}")\n'
-            '        print(f"[tip] Just picking a random integer instead")\n'
+            '        diagnostic(f"[shrug] Time drift int got confused: {e}")\n'
+            '        diagnostic(f"[tip] Just picking a random integer instead")\n'
             "        update_chaos_state(failed=True)\n"
             "        return chaos_randint(0, 10)"
         ),
@@ -631,6 +664,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def drift_access(var_name, current_value):\n"
             '    """Access a variable with time-based drift applied"""\n'
             "    from kinda.personality import get_time_drift, update_chaos_state\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Calculate time-based drift\n"
             "        drift = get_time_drift(var_name, current_value)\n"
@@ -643,8 +677,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "                result = int(round(result))\n"
             "        elif current_value is None:\n"
             "            # Handle None values specially\n"
-            '            print(f"[?] drift_access got None value for {var_name}")\n'
-            '            print(f"[tip] Returning 0 as default for None values")\n'
+            '            diagnostic(f"[?] drift_access got None value for {var_name}")\n'
+            '            diagnostic(f"[tip] Returning 0 as default for None values")\n'
             "            result = 0\n"
             "        else:\n"
             "            result = current_value  # Non-numeric values don't drift\n"
@@ -652,8 +686,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        update_chaos_state(failed=False)\n"
             "        return result\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Drift access failed: {e}")\n'
-            '        print(f"[tip] Returning original value")\n'
+            '        diagnostic(f"[shrug] Drift access failed: {e}")\n'
+            '        diagnostic(f"[tip] Returning original value")\n'
             "        update_chaos_state(failed=True)\n"
             "        return current_value if current_value is not None else 0"
         ),
@@ -665,33 +699,55 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         ),
         "description": "Statistical assertion that waits for probabilistic condition to become true",
         "body": (
-            "def assert_eventually(condition, timeout=5.0, confidence=0.95):\n"
-            '    """Wait for probabilistic condition to become true with statistical confidence"""\n'
+            "def assert_eventually(condition, timeout=5.0, confidence=0.95, time_dependent=False):\n"
+            '    """Wait for probabilistic condition to become true with statistical confidence.\n'
+            "\n"
+            "    Pure conditions are evaluated back-to-back and stop early once the Wilson\n"
+            "    bound settles either way. Pass time_dependent=True for conditions that wait\n"
+            "    on something external; those are polled with exponential backoff until timeout.\n"
+            '    """\n'
+            "    import math\n"
             "    import time\n"
             "    from kinda.personality import update_chaos_state, get_personality\n"
+            "    from kinda.output import diagnostic\n"
             "    from kinda.security import secure_condition_check\n"
             "    try:\n"
             "        # Validate parameters\n"
             "        if not isinstance(timeout, (int, float)) or timeout <= 0:\n"
-            '            print(f"[?] assert_eventually got weird timeout: {timeout}")\n'
-            '            print(f"[tip] Using default timeout of 5.0 seconds")\n'
+            '            diagnostic(f"[?] assert_eventually got weird timeout: {timeout}")\n'
+            '            diagnostic(f"[tip] Using default timeout of 5.0 seconds")\n'
             "            timeout = 5.0\n"
             "        \n"
             "        if not isinstance(confidence, (int, float)) or not (0 < confidence < 1):\n"
-            '            print(f"[?] assert_eventually got weird confidence: {confidence}")\n'
-            '            print(f"[tip] Using default confidence of 0.95")\n'
+            '            diagnostic(f"[?] assert_eventually got weird confidence: {confidence}")\n'
+            '            diagnostic(f"[tip] Using default confidence of 0.95")\n'
             "            confidence = 0.95\n"
             "        \n"
             "        start_time = time.time()\n"
+            "        deadline = start_time + timeout\n"
             "        attempts = 0\n"
             "        successes = 0\n"
             "        min_attempts = max(10, int(1 / (1 - confidence) * 3))  # Statistical minimum\n"
             "        \n"
+            "        # Wilson score z for the requested confidence (computed once)\n"
+            "        z = 1.96  # 95% confidence\n"
+            "        if confidence > 0.99:\n"
+            "            z = 2.576  # 99% confidence\n"
+            "        elif confidence > 0.975:\n"
+            "            z = 2.326  # 97.5% confidence\n"
+            "        elif confidence > 0.9:\n"
+            "            z = 1.645  # 90% confidence\n"
+            "        z2 = z * z\n"
+            "        \n"
+            "        # Backoff between polls of time-dependent conditions\n"
+            "        delay = 0.001\n"
+            "        max_delay = 0.05\n"
+            "        \n"
             "        # Get personality for error messages\n"
             "        personality = get_personality()\n"
             "        style = personality.get_error_message_style()\n"
             "        \n"
-            "        while time.time() - start_time < timeout:\n"
+            "        while time.time() < deadline:\n"
             "            attempts += 1\n"
             "            \n"
             "            # Security check for condition\n"
@@ -707,49 +763,45 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            if attempts >= min_attempts:\n"
             "                observed_rate = successes / attempts\n"
             "                # Use Wilson score interval for confidence bounds\n"
-            "                import math\n"
-            "                z = 1.96  # 95% confidence\n"
-            "                if confidence > 0.99:\n"
-            "                    z = 2.576  # 99% confidence\n"
-            "                elif confidence > 0.975:\n"
-            "                    z = 2.326  # 97.5% confidence\n"
-            "                elif confidence > 0.9:\n"
-            "                    z = 1.645  # 90% confidence\n"
-            "                \n"
             "                n = attempts\n"
-            "                p_hat = observed_rate\n"
-            "                denominator = 1 + z*z/n\n"
-            "                center = (p_hat + z*z/(2*n)) / denominator\n"
-            "                margin = z * math.sqrt((p_hat*(1-p_hat) + z*z/(4*n))/n) / denominator\n"
-            "                lower_bound = center - margin\n"
+            "                denominator = 1 + z2 / n\n"
+            "                center = (observed_rate + z2 / (2 * n)) / denominator\n"
+            "                margin = z * math.sqrt((observed_rate * (1 - observed_rate) + z2 / (4 * n)) / n) / denominator\n"
             "                \n"
             "                # If lower confidence bound > 0.5, condition is statistically true\n"
-            "                if lower_bound > 0.5:\n"
-            '                    print(f"[stat] assert_eventually succeeded: {successes}/{attempts} = {observed_rate:.3f} (confidence: {confidence:.3f})")\n'
+            "                if center - margin > 0.5:\n"
+            '                    diagnostic(f"[stat] assert_eventually succeeded: {successes}/{attempts} = {observed_rate:.3f} (confidence: {confidence:.3f})")\n'
             "                    update_chaos_state(failed=False)\n"
             "                    return True\n"
+            "                \n"
+            "                # A pure condition whose upper bound is at most 0.5 will not recover\n"
+            "                if not time_dependent and center + margin <= 0.5:\n"
+            "                    break\n"
             "            \n"
-            "            time.sleep(0.05)  # Small delay between attempts\n"
+            "            if time_dependent:\n"
+            "                time.sleep(min(delay, max(0.0, deadline - time.time())))\n"
+            "                delay = min(delay * 2, max_delay)\n"
             "        \n"
-            "        # Timeout reached - statistical failure\n"
+            "        # Timeout or early termination - statistical failure\n"
             "        final_rate = successes / attempts if attempts > 0 else 0\n"
+            "        elapsed = time.time() - start_time\n"
             "        \n"
             "        if style == 'professional':\n"
-            "            error_msg = f'Statistical assertion failed: condition was true in {successes}/{attempts} attempts ({final_rate:.3f}), below confidence threshold {confidence:.3f} within {timeout}s'\n"
+            "            error_msg = f'Statistical assertion failed: condition was true in {successes}/{attempts} attempts ({final_rate:.3f}), below confidence threshold {confidence:.3f} within {elapsed:.2f}s'\n"
             "        elif style == 'friendly':\n"
-            "            error_msg = f'Hmm, that condition only happened {successes}/{attempts} times ({final_rate:.3f}) in {timeout}s - not confident enough!'\n"
+            "            error_msg = f'Hmm, that condition only happened {successes}/{attempts} times ({final_rate:.3f}) in {elapsed:.2f}s - not confident enough!'\n"
             "        elif style == 'snarky':\n"
-            "            error_msg = f'Surprise! Your \"eventually\" condition was kinda flaky: {successes}/{attempts} ({final_rate:.3f}) in {timeout}s. Try lowering your standards.'\n"
+            "            error_msg = f'Surprise! Your \"eventually\" condition was kinda flaky: {successes}/{attempts} ({final_rate:.3f}) in {elapsed:.2f}s. Try lowering your standards.'\n"
             "        else:  # chaotic\n"
-            "            error_msg = f'NOPE! *BOOM* Condition flopped {attempts-successes}/{attempts} times in {timeout}s. Maybe try \"~assert_never\" instead? *wink*'\n"
+            "            error_msg = f'NOPE! *BOOM* Condition flopped {attempts-successes}/{attempts} times in {elapsed:.2f}s. Maybe try \"~assert_never\" instead? *wink*'\n"
             "        \n"
             "        update_chaos_state(failed=True)\n"
             "        raise AssertionError(error_msg)\n"
             "    except AssertionError:\n"
             "        raise  # Re-raise assertion errors\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] assert_eventually got confused: {e}")\n'
-            '        print(f"[tip] Maybe check your condition syntax?")\n'
+            '        diagnostic(f"[shrug] assert_eventually got confused: {e}")\n'
+            '        diagnostic(f"[tip] Maybe check your condition syntax?")\n'
             "        update_chaos_state(failed=True)\n"
             "        raise AssertionError(f'assert_eventually failed with error: {e}')"
         ),
@@ -761,35 +813,41 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         ),
         "description": "Statistical assertion for validating probability distributions",
         "body": (
-            "def assert_probability(event, expected_prob=0.5, tolerance=0.1, samples=1000):\n"
-            '    """Validate probability distributions with statistical testing"""\n'
+            "def assert_probability(event, expected_prob=0.5, tolerance=0.1, samples=1000, sequential=False):\n"
+            '    """Validate probability distributions with statistical testing.\n'
+            "\n"
+            "    With sequential=True sampling stops as soon as Wald's sequential probability\n"
+            "    ratio test (kinda.testing.SequentialProbabilityRatioTest) decides; `samples`\n"
+            "    is then only the budget.\n"
+            '    """\n'
             "    from kinda.personality import update_chaos_state, get_personality\n"
+            "    from kinda.output import diagnostic\n"
             "    from kinda.security import secure_condition_check\n"
             "    import math\n"
             "    try:\n"
             "        # Validate parameters\n"
             "        params_corrected = False\n"
             "        if not isinstance(expected_prob, (int, float)) or not (0 <= expected_prob <= 1):\n"
-            '            print(f"[?] assert_probability got weird expected_prob: {expected_prob}")\n'
-            '            print(f"[tip] Using default expected_prob of 0.5")\n'
+            '            diagnostic(f"[?] assert_probability got weird expected_prob: {expected_prob}")\n'
+            '            diagnostic(f"[tip] Using default expected_prob of 0.5")\n'
             "            expected_prob = 0.5\n"
             "            params_corrected = True\n"
             "        \n"
             "        if not isinstance(tolerance, (int, float)) or tolerance <= 0:\n"
-            '            print(f"[?] assert_probability got weird tolerance: {tolerance}")\n'
-            '            print(f"[tip] Using default tolerance of 0.1")\n'
+            '            diagnostic(f"[?] assert_probability got weird tolerance: {tolerance}")\n'
+            '            diagnostic(f"[tip] Using default tolerance of 0.1")\n'
             "            tolerance = 0.1\n"
             "            params_corrected = True\n"
             "        \n"
             "        if not isinstance(samples, int) or samples <= 0:\n"
-            '            print(f"[?] assert_probability got weird samples: {samples}")\n'
-            '            print(f"[tip] Using default samples of 1000")\n'
+            '            diagnostic(f"[?] assert_probability got weird samples: {samples}")\n'
+            '            diagnostic(f"[tip] Using default samples of 1000")\n'
             "            samples = 1000\n"
             "            params_corrected = True\n"
             "        \n"
             "        # Limit samples for performance and security\n"
             "        if samples > 10000:\n"
-            '            print(f"[?] Limiting samples to 10000 for performance (requested {samples})")\n'
+            '            diagnostic(f"[?] Limiting samples to 10000 for performance (requested {samples})")\n'
             "            samples = 10000\n"
             "            params_corrected = True  # Treat sample limiting as parameter correction\n"
             "        \n"
@@ -797,38 +855,53 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        if params_corrected:\n"
             "            tolerance = max(tolerance, 0.6)  # Be very lenient when params were invalid\n"
             "        \n"
+            "        # Sequential test with 1% error rates, shared with kinda.testing\n"
+            "        sprt = None\n"
+            "        if sequential:\n"
+            "            from kinda.testing.assertions import SequentialProbabilityRatioTest\n"
+            "            sprt = SequentialProbabilityRatioTest(expected_prob, tolerance, alpha=0.01, beta=0.01)\n"
+            "        \n"
             "        # Run statistical sampling\n"
             "        successes = 0\n"
-            "        for i in range(samples):\n"
+            "        samples_used = 0\n"
+            "        decision = None\n"
+            "        while samples_used < samples and decision is None:\n"
             "            # Security check for event condition\n"
             "            should_proceed, event_result = secure_condition_check(event, 'assert_probability')\n"
             "            if not should_proceed:\n"
             "                update_chaos_state(failed=True)\n"
             "                raise AssertionError(f'Unsafe event condition in assert_probability')\n"
             "            \n"
+            "            samples_used += 1\n"
             "            if event_result:\n"
             "                successes += 1\n"
+            "            \n"
+            "            if sprt is not None:\n"
+            "                decision = sprt.update(bool(event_result))\n"
             "        \n"
-            "        observed_prob = successes / samples\n"
+            "        observed_prob = successes / samples_used\n"
             "        difference = abs(observed_prob - expected_prob)\n"
+            "        if decision is None:\n"
+            "            # Budget exhausted (or fixed-sample mode): plain tolerance check\n"
+            "            decision = 'accept' if difference <= tolerance else 'reject'\n"
             "        \n"
             "        # Calculate statistical significance (binomial test approximation)\n"
             "        # Standard error for binomial proportion\n"
-            "        se = math.sqrt(expected_prob * (1 - expected_prob) / samples)\n"
+            "        se = math.sqrt(expected_prob * (1 - expected_prob) / samples_used)\n"
             "        z_score = abs(observed_prob - expected_prob) / se if se > 0 else 0\n"
             "        \n"
             "        # Get personality for error messages\n"
             "        personality = get_personality()\n"
             "        style = personality.get_error_message_style()\n"
             "        \n"
-            "        if difference <= tolerance:\n"
-            '            print(f"[stat] assert_probability passed: {observed_prob:.3f} vs expected {expected_prob:.3f} (diff: {difference:.3f}, tolerance: {tolerance:.3f})")\n'
+            "        if decision == 'accept':\n"
+            '            diagnostic(f"[stat] assert_probability passed: {observed_prob:.3f} vs expected {expected_prob:.3f} (diff: {difference:.3f}, tolerance: {tolerance:.3f}, samples: {samples_used}/{samples})")\n'
             "            update_chaos_state(failed=False)\n"
             "            return True\n"
             "        else:\n"
             "            # Statistical failure\n"
             "            if style == 'professional':\n"
-            "                error_msg = f'Probability assertion failed: observed {observed_prob:.3f}, expected {expected_prob:.3f} ± {tolerance:.3f} (difference: {difference:.3f}, z-score: {z_score:.2f})'\n"
+            "                error_msg = f'Probability assertion failed: observed {observed_prob:.3f}, expected {expected_prob:.3f} ± {tolerance:.3f} (difference: {difference:.3f}, z-score: {z_score:.2f}, samples: {samples_used})'\n"
             "            elif style == 'friendly':\n"
             "                error_msg = f'Oops! Got probability {observed_prob:.3f} but expected around {expected_prob:.3f} ± {tolerance:.3f} (off by {difference:.3f})'\n"
             "            elif style == 'snarky':\n"
@@ -841,8 +914,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "    except AssertionError:\n"
             "        raise  # Re-raise assertion errors\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] assert_probability got confused: {e}")\n'
-            '        print(f"[tip] Maybe check your event condition or parameters?")\n'
+            '        diagnostic(f"[shrug] assert_probability got confused: {e}")\n'
+            '        diagnostic(f"[tip] Maybe check your event condition or parameters?")\n'
             "        update_chaos_state(failed=True)\n"
             "        raise AssertionError(f'assert_probability failed with error: {e}')"
         ),
@@ -855,6 +928,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def sometimes_while(condition, body_func=None, max_iterations=10000):\n"
             '    """Sometimes while loop - executes while condition is true with personality-adjusted probability"""\n'
             "    from kinda.personality import get_personality, chaos_probability, update_chaos_state, chaos_random\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        personality = get_personality()\n"
             "\n"
@@ -887,7 +961,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "                except StopIteration:\n"
             "                    break\n"
             "                except Exception as e:\n"
-            '                    print(f"[loop-chaos] Sometimes while body failed: {e}")\n'
+            '                    diagnostic(f"[loop-chaos] Sometimes while body failed: {e}")\n'
             "                    update_chaos_state(failed=True)\n"
             "                    break\n"
             "\n"
@@ -897,7 +971,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        return iterations\n"
             "\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Sometimes while loop got confused: {e}")\n'
+            '        diagnostic(f"[shrug] Sometimes while loop got confused: {e}")\n'
             "        update_chaos_state(failed=True)\n"
             "        return 0"
         ),
@@ -910,6 +984,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def maybe_for(iterable, body_func=None):\n"
             '    """Maybe for loop - executes for each item with personality-adjusted probability"""\n'
             "    from kinda.personality import get_personality, chaos_probability, update_chaos_state\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        personality = get_personality()\n"
             "\n"
@@ -924,7 +999,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "\n"
             "        # SECURITY: Validate iterable\n"
             "        if not hasattr(iterable, '__iter__'):\n"
-            '            print(f"[welp] Maybe for got non-iterable: {type(iterable)}")\n'
+            '            diagnostic(f"[welp] Maybe for got non-iterable: {type(iterable)}")\n'
             "            update_chaos_state(failed=True)\n"
             "            return 0\n"
             "\n"
@@ -939,20 +1014,20 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "                        except StopIteration:\n"
             "                            break\n"
             "                        except Exception as e:\n"
-            '                            print(f"[loop-chaos] Maybe for body failed for {item}: {e}")\n'
+            '                            diagnostic(f"[loop-chaos] Maybe for body failed for {item}: {e}")\n'
             "                            update_chaos_state(failed=True)\n"
             "                            break\n"
             "                    else:\n"
             "                        executed_count += 1\n"
             "        except Exception as e:\n"
-            '            print(f"[welp] Maybe for iteration failed: {e}")\n'
+            '            diagnostic(f"[welp] Maybe for iteration failed: {e}")\n'
             "            update_chaos_state(failed=True)\n"
             "\n"
             "        update_chaos_state(failed=False)\n"
             "        return executed_count\n"
             "\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Maybe for loop got confused: {e}")\n'
+            '        diagnostic(f"[shrug] Maybe for loop got confused: {e}")\n'
             "        update_chaos_state(failed=True)\n"
             "        return 0"
         ),
@@ -965,6 +1040,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def kinda_repeat(n, body_func=None):\n"
             '    """Kinda repeat - repeats approximately n times with personality-adjusted variance"""\n'
             "    from kinda.personality import get_personality, chaos_gauss, update_chaos_state\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        personality = get_personality()\n"
             "\n"
@@ -980,7 +1056,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        if isinstance(n, (int, float)) and n > 0:\n"
             "            actual_n = max(0, int(chaos_gauss(n, n * variance)))\n"
             "        else:\n"
-            '            print(f"[welp] Kinda repeat got invalid count: {n}")\n'
+            '            diagnostic(f"[welp] Kinda repeat got invalid count: {n}")\n'
             "            update_chaos_state(failed=True)\n"
             "            return 0\n"
             "\n"
@@ -997,7 +1073,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "                except StopIteration:\n"
             "                    break\n"
             "                except Exception as e:\n"
-            '                    print(f"[loop-chaos] Kinda repeat body failed at iteration {i}: {e}")\n'
+            '                    diagnostic(f"[loop-chaos] Kinda repeat body failed at iteration {i}: {e}")\n'
             "                    update_chaos_state(failed=True)\n"
             "                    break\n"
             "            else:\n"
@@ -1007,7 +1083,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        return executed_count\n"
             "\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Kinda repeat got confused: {e}")\n'
+            '        diagnostic(f"[shrug] Kinda repeat got confused: {e}")\n'
             "        update_chaos_state(failed=True)\n"
             "        return 0"
         ),
@@ -1020,6 +1096,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def eventually_until(condition, body_func=None, context_id='default', max_iterations=10000):\n"
             '    """Eventually until - executes until condition becomes consistently true"""\n'
             "    from kinda.personality import get_eventually_until_evaluator, update_chaos_state\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Get memory-optimized evaluator (Epic #125 Task 3)\n"
             "        evaluator = get_eventually_until_evaluator(context_id)\n"
@@ -1050,7 +1127,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "                except StopIteration:\n"
             "                    break\n"
             "                except Exception as e:\n"
-            '                    print(f"[loop-chaos] Eventually until body failed: {e}")\n'
+            '                    diagnostic(f"[loop-chaos] Eventually until body failed: {e}")\n'
             "                    update_chaos_state(failed=True)\n"
             "                    break\n"
             "\n"
@@ -1067,7 +1144,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        }\n"
             "\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] Eventually until got confused: {e}")\n'
+            '        diagnostic(f"[shrug] Eventually until got confused: {e}")\n'
             "        update_chaos_state(failed=True)\n"
             "        return {'iterations': 0, 'converged': False, 'stats': {}}"
         ),
@@ -1080,6 +1157,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def kinda_mood(mood):\n"
             '    """Set the personality mood for controlling probabilistic behavior."""\n'
             "    from kinda.personality import PersonalityContext, update_chaos_state\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Validate mood is a string\n"
             "        if not isinstance(mood, str):\n"
@@ -1092,8 +1170,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        # Return None (this is a control construct, not a value)\n"
             "        return None\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] kinda mood setting failed: {e}")\n'
-            '        print(f"[tip] Using default mood instead")\n'
+            '        diagnostic(f"[shrug] kinda mood setting failed: {e}")\n'
+            '        diagnostic(f"[tip] Using default mood instead")\n'
             "        update_chaos_state(failed=True)\n"
             "        try:\n"
             '            PersonalityContext.set_mood("playful")\n'
@@ -1108,9 +1186,14 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         "type": "helper",
         "description": "Wrapper function for sometimes_while loop condition checking",
         "body": (
-            "def sometimes_while_condition(condition):\n"
-            '    """Check if sometimes_while loop should continue with probabilistic decision."""\n'
-            "    from kinda.personality import chaos_probability, update_chaos_state, chaos_random\n"
+            "def sometimes_while_condition(condition, base_prob=None):\n"
+            '    """Check if sometimes_while loop should continue with probabilistic decision.\n'
+            "\n"
+            "    base_prob is the construct's probability before cascade effects, computed\n"
+            "    once before the loop by the transpiler's hoisting optimization.\n"
+            '    """\n'
+            "    from kinda.personality import chaos_probability, update_chaos_state, chaos_random, get_personality\n"
+            "    from kinda.output import diagnostic\n"
             "    from kinda.security import secure_condition_check\n"
             "    try:\n"
             "        # First check the actual condition using secure checking\n"
@@ -1125,13 +1208,16 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            return False\n"
             "\n"
             "        # Condition is true, now apply personality-based probability\n"
-            "        prob = chaos_probability('sometimes_while')\n"
+            "        if base_prob is not None:\n"
+            "            prob = get_personality().apply_cascade(base_prob)\n"
+            "        else:\n"
+            "            prob = chaos_probability('sometimes_while')\n"
             "        should_continue = chaos_random() < prob\n"
             "        update_chaos_state(failed=not should_continue)\n"
             "        return should_continue\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] sometimes_while condition check failed: {e}")\n'
-            '        print(f"[tip] Defaulting to False for safety")\n'
+            '        diagnostic(f"[shrug] sometimes_while condition check failed: {e}")\n'
+            '        diagnostic(f"[tip] Defaulting to False for safety")\n'
             "        update_chaos_state(failed=True)\n"
             "        return False\n"
             "\n"
@@ -1142,18 +1228,26 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         "type": "helper",
         "description": "Wrapper function for maybe_for item execution checking",
         "body": (
-            "def maybe_for_item_execute():\n"
-            '    """Check if maybe_for should execute current iteration with probabilistic decision."""\n'
-            "    from kinda.personality import chaos_probability, update_chaos_state, chaos_random\n"
+            "def maybe_for_item_execute(base_prob=None):\n"
+            '    """Check if maybe_for should execute current iteration with probabilistic decision.\n'
+            "\n"
+            "    base_prob is the construct's probability before cascade effects, computed\n"
+            "    once before the loop by the transpiler's hoisting optimization.\n"
+            '    """\n'
+            "    from kinda.personality import chaos_probability, update_chaos_state, chaos_random, get_personality\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Apply personality-based probability for this iteration\n"
-            "        prob = chaos_probability('maybe_for')\n"
+            "        if base_prob is not None:\n"
+            "            prob = get_personality().apply_cascade(base_prob)\n"
+            "        else:\n"
+            "            prob = chaos_probability('maybe_for')\n"
             "        should_execute = chaos_random() < prob\n"
             "        update_chaos_state(failed=not should_execute)\n"
             "        return should_execute\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] maybe_for execution check failed: {e}")\n'
-            '        print(f"[tip] Defaulting to True for safety")\n'
+            '        diagnostic(f"[shrug] maybe_for execution check failed: {e}")\n'
+            '        diagnostic(f"[tip] Defaulting to True for safety")\n'
             "        update_chaos_state(failed=True)\n"
             "        return True\n"
             "\n"
@@ -1164,17 +1258,18 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
         "type": "helper",
         "description": "Wrapper function for kinda_repeat count calculation",
         "body": (
-            "def kinda_repeat_count(n):\n"
+            "def kinda_repeat_count(n, variance=None):\n"
             '    """Calculate fuzzy repetition count with personality-based variance."""\n'
             "    from kinda.personality import get_kinda_repeat_variance, update_chaos_state, chaos_gauss\n"
+            "    from kinda.output import diagnostic\n"
             "    try:\n"
             "        # Convert n to integer\n"
             "        if not isinstance(n, (int, float)):\n"
             "            try:\n"
             "                n = int(float(n))\n"
             "            except (ValueError, TypeError):\n"
-            '                print(f"[?] kinda_repeat got weird count: {repr(n)}")\n'
-            '                print(f"[tip] Expected a number but got {type(n).__name__}, using 1")\n'
+            '                diagnostic(f"[?] kinda_repeat got weird count: {repr(n)}")\n'
+            '                diagnostic(f"[tip] Expected a number but got {type(n).__name__}, using 1")\n'
             "                update_chaos_state(failed=True)\n"
             "                return 1\n"
             "\n"
@@ -1186,7 +1281,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "            return max(0, base_n)  # Return 0 for n=0, but ensure no negative\n"
             "\n"
             "        # Get personality-based variance (as fraction of n)\n"
-            "        variance_fraction = get_kinda_repeat_variance()\n"
+            "        variance_fraction = variance if variance is not None else get_kinda_repeat_variance()\n"
             "        sigma = base_n * variance_fraction\n"
             "\n"
             "        # Generate count using normal distribution centered on n\n"
@@ -1196,8 +1291,8 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        update_chaos_state(failed=False)\n"
             "        return result_count\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] kinda_repeat count calculation failed: {e}")\n'
-            '        print(f"[tip] Falling back to original count or 1")\n'
+            '        diagnostic(f"[shrug] kinda_repeat count calculation failed: {e}")\n'
+            '        diagnostic(f"[tip] Falling back to original count or 1")\n'
             "        update_chaos_state(failed=True)\n"
             "        return max(1, int(n) if isinstance(n, (int, float)) else 1)\n"
             "\n"
@@ -1211,6 +1306,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def eventually_until_condition(condition):\n"
             '    """Check eventually_until condition with statistical confidence."""\n'
             "    from kinda.personality import get_eventually_until_confidence, update_chaos_state\n"
+            "    from kinda.output import diagnostic\n"
             "    from kinda.security import secure_condition_check\n"
             "\n"
             "    # Create evaluator if it doesn't exist in globals\n"
@@ -1261,7 +1357,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "        return not should_terminate  # Continue while not terminated\n"
             "\n"
             "    except Exception as e:\n"
-            '        print(f"[shrug] eventually_until condition check failed: {e}")\n'
+            '        diagnostic(f"[shrug] eventually_until condition check failed: {e}")\n'
             "        update_chaos_state(failed=True)\n"
             "        return False  # Terminate on errors for safety\n"
             "\n"
@@ -1275,6 +1371,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def ish_comparison_composed(left_val, right_val, tolerance_base=None):\n"
             '    """Epic #126 Task 3: ~ish comparison using composition framework."""\n'
             "    from kinda.personality import update_chaos_state\n"
+            "    from kinda.output import diagnostic\n"
             "\n"
             "    try:\n"
             "        # Initialize composition framework if needed\n"
@@ -1302,7 +1399,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "\n"
             "    except Exception as e:\n"
             "        # Robust fallback to legacy implementation\n"
-            '        print(f"[composition] ~ish comparison fell back to legacy: {e}")\n'
+            '        diagnostic(f"[composition] ~ish comparison fell back to legacy: {e}")\n'
             "        update_chaos_state(failed=True)\n"
             "        return ish_comparison(left_val, right_val, tolerance_base)"
         ),
@@ -1314,6 +1411,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "def ish_value_composed(val, target_val=None):\n"
             '    """Epic #126 Task 3: ~ish value modification using composition framework."""\n'
             "    from kinda.personality import update_chaos_state\n"
+            "    from kinda.output import diagnostic\n"
             "\n"
             "    try:\n"
             "        # Initialize composition framework if needed\n"
@@ -1341,7 +1439,7 @@ KindaPythonConstructs: Dict[str, Dict[str, Any]] = {
             "\n"
             "    except Exception as e:\n"
             "        # Robust fallback to legacy implementation\n"
-            '        print(f"[composition] ~ish value fell back to legacy: {e}")\n'
+            '        diagnostic(f"[composition] ~ish value fell back to legacy: {e}")\n'
             "        update_chaos_state(failed=True)\n"
             "        return ish_value(val, target_val)"
         ),
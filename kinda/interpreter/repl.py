@@ -7,6 +7,7 @@ from kinda.grammar.python import matchers
 from kinda.grammar.python.constructs import KindaPythonConstructs as constructs
 from kinda.langs.python import runtime_gen
 from kinda.langs.python.transformer import transform_line
+from kinda.output import channel_stdout, flush_output
 from pathlib import Path
 
 LANG_DISPATCH = {
@@ -62,7 +63,11 @@ def run_interpreter(filepath: str, lang: str = "python") -> None:
     fuzzy.env.update(exec_context)
 
     try:
-        exec(code, fuzzy.env, fuzzy.env)
+        with channel_stdout():
+            exec(code, fuzzy.env, fuzzy.env)
+            flush_output()
     except Exception as e:
+        # Program output comes before the complaint about it
+        flush_output()
         print(f"💥 Well, that went sideways: {e}")
         print(f"[shrug] Your code was... creative. Maybe too creative.")
@@ -0,0 +1,97 @@
+# kinda/langs/c/build.py
+
+"""
+Compile generated C programs against libkinda with the system C compiler.
+
+Both libkinda (runtime/fuzzy.c) and each program are cached by a hash of
+everything that goes into them (sources, compiler, flags), so running the
+same program again skips the compiler entirely.
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import List, Optional
+
+RUNTIME_DIR = Path(__file__).parent / "runtime"
+CFLAGS = ["-O2", "-std=c99"]
+LDFLAGS = ["-lm"]
+
+
+class CBuildError(RuntimeError):
+    """Raised when a C program can't be compiled."""
+
+
+def find_compiler() -> Optional[str]:
+    """The C compiler to use: $CC, or the first of cc, gcc and clang found."""
+    candidates = [os.environ["CC"]] if os.environ.get("CC") else ["cc", "gcc", "clang"]
+    for candidate in candidates:
+        found = shutil.which(candidate)
+        if found:
+            return found
+    return None
+
+
+def _digest(*parts: bytes) -> str:
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(len(part).to_bytes(8, "little"))
+        hasher.update(part)
+    return hasher.hexdigest()[:16]
+
+
+def _run_compiler(command: List[str]) -> None:
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise CBuildError(result.stderr.strip() or f"{command[0]} exited with {result.returncode}")
+
+
+def build_libkinda(cache_dir: Path, compiler: str) -> Path:
+    """Compile libkinda into an object file in cache_dir, unless already there."""
+    source = (RUNTIME_DIR / "fuzzy.c").read_bytes()
+    header = (RUNTIME_DIR / "fuzzy.h").read_bytes()
+    key = _digest(source, header, compiler.encode(), " ".join(CFLAGS).encode())
+    library = cache_dir / f"libkinda-{key}.o"
+    if library.exists():
+        return library
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    partial = library.with_suffix(f".{os.getpid()}.tmp")
+    _run_compiler(
+        [compiler, *CFLAGS, "-c", str(RUNTIME_DIR / "fuzzy.c"), "-I", str(RUNTIME_DIR)]
+        + ["-o", str(partial)]
+    )
+    os.replace(partial, library)
+    return library
+
+
+def compile_program(
+    c_file: Path, cache_dir: Path = Path(".kinda-build") / "c-cache", compiler: Optional[str] = None
+) -> Path:
+    """
+    Compile a generated C file and link it against libkinda.
+
+    Returns the path of the cached executable. Raises CBuildError if no
+    compiler is available or compilation fails.
+    """
+    compiler = compiler or find_compiler()
+    if compiler is None:
+        raise CBuildError("No C compiler found (install cc/gcc/clang or set CC)")
+
+    library = build_libkinda(cache_dir, compiler)
+    key = _digest(
+        c_file.read_bytes(), library.name.encode(), compiler.encode(), " ".join(LDFLAGS).encode()
+    )
+    executable = cache_dir / (f"{c_file.stem}-{key}" + (".exe" if os.name == "nt" else ""))
+    if executable.exists():
+        return executable
+
+    partial = cache_dir / f"{executable.name}.{os.getpid()}.tmp"
+    _run_compiler(
+        [compiler, *CFLAGS, str(c_file), str(library), "-I", str(RUNTIME_DIR)]
+        + ["-o", str(partial), *LDFLAGS]
+    )
+    os.replace(partial, executable)
+    return executable
@@ -0,0 +1,140 @@
+/*
+ * kinda/langs/c/runtime/fuzzy.c
+ *
+ * libkinda implementation. See fuzzy.h.
+ */
+
+#include "fuzzy.h"
+
+#include <stdarg.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#if defined(_WIN32)
+#include <process.h>
+#define kinda_getpid _getpid
+#else
+#include <unistd.h>
+#define kinda_getpid getpid
+#endif
+
+/* Defaults match the playful mood at chaos level 5 */
+static kinda_personality current = {0.5, 0.6, 0.8, -1, 1, 0.4, 0.4};
+
+static uint64_t state[4] = {
+    0x9e3779b97f4a7c15ULL, 0xbf58476d1ce4e5b9ULL, 0x94d049bb133111ebULL, 0x2545f4914f6cdd1dULL};
+
+static uint64_t splitmix64(uint64_t *x) {
+    uint64_t z = (*x += 0x9e3779b97f4a7c15ULL);
+    z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL;
+    return z ^ (z >> 31);
+}
+
+static uint64_t rotl(uint64_t x, int k) {
+    return (x << k) | (x >> (64 - k));
+}
+
+/* xoshiro256** */
+static uint64_t next(void) {
+    uint64_t result = rotl(state[1] * 5, 7) * 9;
+    uint64_t t = state[1] << 17;
+
+    state[2] ^= state[0];
+    state[3] ^= state[1];
+    state[1] ^= state[2];
+    state[0] ^= state[3];
+    state[2] ^= t;
+    state[3] = rotl(state[3], 45);
+    return result;
+}
+
+void kinda_seed(uint64_t seed) {
+    int i;
+    for (i = 0; i < 4; i++) {
+        state[i] = splitmix64(&seed);
+    }
+}
+
+void kinda_init(const kinda_personality *personality) {
+    const char *env_seed = getenv("KINDA_SEED");
+
+    if (personality != NULL) {
+        current = *personality;
+    }
+    if (env_seed != NULL && *env_seed != '\0') {
+        kinda_seed((uint64_t)strtoull(env_seed, NULL, 10));
+    } else {
+        kinda_seed((uint64_t)time(NULL) ^ ((uint64_t)kinda_getpid() << 32) ^
+                   (uint64_t)(uintptr_t)&current);
+    }
+}
+
+double kinda_random(void) {
+    return (double)(next() >> 11) * (1.0 / 9007199254740992.0);
+}
+
+int kinda_randint(int lo, int hi) {
+    if (hi <= lo) {
+        return lo;
+    }
+    return lo + (int)(kinda_random() * ((double)hi - (double)lo + 1.0));
+}
+
+int kinda_int(int val) {
+    return val + kinda_randint(current.int_fuzz_min, current.int_fuzz_max);
+}
+
+int fuzzy_assign(int val) {
+    return kinda_int(val);
+}
+
+/* Draw first so the random stream doesn't depend on the condition */
+int sometimes(int cond) {
+    return kinda_random() < current.sometimes && cond;
+}
+
+int maybe(int cond) {
+    return kinda_random() < current.maybe && cond;
+}
+
+int sometimes_random(void) {
+    return sometimes(1);
+}
+
+int maybe_random(void) {
+    return maybe(1);
+}
+
+void sorta_print(const char *format, ...) {
+    va_list args;
+
+    if (kinda_random() >= current.sorta_print) {
+        return;
+    }
+    fputs("[print] ", stdout);
+    va_start(args, format);
+    vprintf(format, args);
+    va_end(args);
+    fputc('\n', stdout);
+}
+
+static int binary_outcome(double positive, double negative) {
+    double roll = kinda_random();
+    if (roll < positive) {
+        return 1;
+    }
+    if (roll < positive + negative) {
+        return -1;
+    }
+    return 0;
+}
+
+int kinda_binary(void) {
+    return binary_outcome(current.binary_positive, current.binary_negative);
+}
+
+int kinda_binary_custom(int positive_percent, int negative_percent) {
+    return binary_outcome(positive_percent / 100.0, negative_percent / 100.0);
+}
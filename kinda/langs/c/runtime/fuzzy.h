@@ -0,0 +1,61 @@
+/*
+ * kinda/langs/c/runtime/fuzzy.h
+ *
+ * libkinda: native fuzzy runtime for C programs generated by kinda-lang.
+ *
+ * Generated programs call kinda_init() once with the personality they were
+ * transformed under. Randomness comes from a xoshiro256** generator seeded
+ * from the KINDA_SEED environment variable when it is set, so runs are
+ * reproducible, and from the clock and process id otherwise.
+ */
+
+#ifndef KINDA_FUZZY_H
+#define KINDA_FUZZY_H
+
+#include <stdint.h>
+
+/* Personality parameters, computed from a kinda-lang mood and chaos level */
+typedef struct {
+    double sometimes;       /* probability a ~sometimes block runs */
+    double maybe;           /* probability a ~maybe block runs */
+    double sorta_print;     /* probability ~sorta print prints */
+    int int_fuzz_min;       /* kinda int noise range, inclusive */
+    int int_fuzz_max;
+    double binary_positive; /* kinda binary outcome probabilities; */
+    double binary_negative; /* the remainder is neutral */
+} kinda_personality;
+
+/* Set the personality and seed the generator from KINDA_SEED or entropy */
+void kinda_init(const kinda_personality *personality);
+
+/* Reseed the generator explicitly */
+void kinda_seed(uint64_t seed);
+
+/* Uniform double in [0, 1) */
+double kinda_random(void);
+
+/* Uniform integer in [lo, hi] */
+int kinda_randint(int lo, int hi);
+
+/* Fuzzy integer: val plus personality noise */
+int kinda_int(int val);
+
+/* Fuzzy reassignment: same noise as kinda_int */
+int fuzzy_assign(int val);
+
+/* Fuzzy conditionals: cond holds and the personality lets it through */
+int sometimes(int cond);
+int maybe(int cond);
+int sometimes_random(void);
+int maybe_random(void);
+
+/* printf-style print that only sometimes happens, prefixed like ~sorta print */
+void sorta_print(const char *format, ...);
+
+/* Three-state value: 1, -1 or 0 */
+int kinda_binary(void);
+
+/* kinda binary with explicit positive/negative percentages */
+int kinda_binary_custom(int positive_percent, int negative_percent);
+
+#endif /* KINDA_FUZZY_H */
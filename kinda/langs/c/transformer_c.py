@@ -6,18 +6,138 @@ Transforms .knda files to native C code with fuzzy logic support.
 """
 
 import re
+import shutil
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Optional
 from typing import List, Set
+from kinda.exceptions import KindaParseError
 from kinda.grammar.c.matchers_c import match_c_construct
 from kinda.grammar.c.constructs_c import KindaCConstructs
 
 used_helpers: Set[str] = set()
 
+# printf specifier of each variable declared so far, for sorta print
+declared_specifiers: Dict[str, str] = {}
+
+# Plain C declarations whose type sorta print can format
+C_DECLARATION = re.compile(
+    r"(?:const\s+)?(int|long|float|double|char)\s*(\*?)\s*(\w+)\s*(\[[^\]]*\])?\s*[=;]"
+)
+C_TYPE_SPECIFIERS = {"int": "%d", "long": "%ld", "float": "%f", "double": "%f", "char": "%c"}
+
+RUNTIME_DIR = Path(__file__).parent / "runtime"
+RUNTIME_FILES = ("fuzzy.h", "fuzzy.c")
+
+
+def personality_initializer(mood: Optional[str] = None, chaos_level: Optional[int] = None) -> str:
+    """
+    C initializer for libkinda's kinda_personality struct.
+
+    Defaults to the active personality's mood and chaos level.
+    """
+    from kinda.personality import frozen_personality_values, get_personality
+
+    if mood is None or chaos_level is None:
+        active = get_personality()
+        mood = mood or active.mood
+        chaos_level = chaos_level or active.chaos_level
+
+    values = frozen_personality_values(mood, chaos_level)
+    fuzz_min, fuzz_max = values["int_fuzz_range"]
+    positive, negative, _ = values["binary_probabilities"]
+    fields = [
+        f".sometimes = {values['sometimes']!r}",
+        f".maybe = {values['maybe']!r}",
+        f".sorta_print = {values['sorta_print']!r}",
+        f".int_fuzz_min = {fuzz_min}",
+        f".int_fuzz_max = {fuzz_max}",
+        f".binary_positive = {positive!r}",
+        f".binary_negative = {negative!r}",
+    ]
+    return "{\n    " + ",\n    ".join(fields) + ",\n}"
+
+
+def _split_arguments(expr: str) -> List[str]:
+    """Split a call's argument list on top-level commas, respecting strings and parens."""
+    parts: List[str] = []
+    current = []
+    depth = 0
+    quote = None
+    escaped = False
+    for char in expr:
+        if quote:
+            escaped = char == "\\" and not escaped
+            if char == quote and not escaped:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current).strip())
+    return [part for part in parts if part]
+
+
+def _record_declaration(stripped: str) -> None:
+    """Remember the printf specifier of a plain C variable declaration."""
+    match = C_DECLARATION.match(stripped)
+    if not match:
+        return
+    type_name, pointer, name, array = match.groups()
+    if type_name == "char" and (pointer or array):
+        declared_specifiers[name] = "%s"
+    elif not pointer and not array:
+        declared_specifiers[name] = C_TYPE_SPECIFIERS[type_name]
+
+
+def _print_specifier(argument: str) -> str:
+    """printf specifier for a sorta print argument, from its literal form or declaration."""
+    if argument.startswith('"'):
+        return "%s"
+    if argument.startswith("'"):
+        return "%c"
+    if re.fullmatch(r"-?\d+", argument):
+        return "%d"
+    if re.fullmatch(r"-?(\d+\.\d*|\.\d+)([eE][-+]?\d+)?", argument):
+        return "%f"
+    if argument in declared_specifiers:
+        return declared_specifiers[argument]
+    raise ValueError(
+        f"sorta print can't tell the type of '{argument}'. Print literals or declared "
+        "variables, e.g. assign the expression to a kinda int first"
+    )
+
+
+def _print_call(expr: str) -> str:
+    """sorta_print call printing each argument, space separated, like ~sorta print in Python."""
+    arguments = _split_arguments(expr)
+    if not arguments:
+        return 'sorta_print("");'
+    specifiers = " ".join(_print_specifier(arg) for arg in arguments)
+    return f'sorta_print("{specifiers}", {", ".join(arguments)});'
+
+
+def _transform_source_line(lines: List[str], index: int, file_path: Optional[str]) -> List[str]:
+    """transform_line, reporting errors with the line they came from."""
+    try:
+        return transform_line(lines[index])
+    except ValueError as e:
+        raise KindaParseError(str(e), index + 1, lines[index], file_path)
+
 
 def _process_conditional_block(
-    lines: List[str], start_index: int, output_lines: List[str], indent: str
+    lines: List[str],
+    start_index: int,
+    output_lines: List[str],
+    indent: str,
+    file_path: Optional[str] = None,
 ) -> int:
     """
     Process a conditional block (sometimes or maybe) with proper nesting support.
@@ -44,15 +164,15 @@ def _process_conditional_block(
             continue
 
         # Handle nested conditional constructs
-        if stripped.startswith("sometimes") or stripped.startswith("maybe"):
-            transformed_nested = transform_line(line)
+        if stripped.lstrip("~").startswith(("sometimes", "maybe")):
+            transformed_nested = _transform_source_line(lines, i, file_path)
             output_lines.extend([indent + l for l in transformed_nested])
             i += 1
             # Recursively process nested block with increased indentation
-            i = _process_conditional_block(lines, i, output_lines, indent + "    ")
+            i = _process_conditional_block(lines, i, output_lines, indent + "    ", file_path)
         else:
             # Regular kinda constructs or normal C code
-            transformed_block = transform_line(line)
+            transformed_block = _transform_source_line(lines, i, file_path)
             output_lines.extend([indent + l for l in transformed_block])
             i += 1
 
@@ -71,19 +191,23 @@ def transform_line(line: str) -> List[str]:
 
     key, groups = match_c_construct(stripped)
     if not key or groups is None:
+        _record_declaration(stripped)
         return [original_line]
 
     if key == "kinda_int":
         var, val = groups
         used_helpers.add("kinda_int")
+        declared_specifiers[var] = "%d"
         transformed_code = f"int {var} = kinda_int({val});"
 
     elif key == "kinda_int_decl":
         var, val = groups
         used_helpers.add("kinda_int")
+        declared_specifiers[var] = "%d"
         transformed_code = f"int {var} = kinda_int({val});"
 
     elif key == "kinda_binary":
+        declared_specifiers[groups[0]] = "%d"
         if len(groups) == 2 and groups[1]:  # Custom probabilities provided
             var, probs = groups
             used_helpers.add("kinda_binary_custom")
@@ -101,27 +225,8 @@ def transform_line(line: str) -> List[str]:
             transformed_code = f"int {var} = kinda_binary();"
 
     elif key == "sorta_print":
-        expr = groups[0]
         used_helpers.add("sorta_print")
-        # Parse the expression to handle format strings
-        if "," in expr:
-            # Split on comma and format properly
-            parts = [p.strip() for p in expr.split(",")]
-            if len(parts) >= 2:
-                # Assume first part is string literal, rest are variables
-                fmt_str = parts[0]
-                vars_str = ", ".join(parts[1:])
-                # Convert string literal to format string by adding %d for integers
-                if fmt_str.startswith('"') and fmt_str.endswith('"'):
-                    fmt_content = fmt_str[1:-1]  # Remove quotes
-                    fmt_content = fmt_content + " %d"  # Add format specifier
-                    transformed_code = f'sorta_print("{fmt_content}", {vars_str});'
-                else:
-                    transformed_code = f"sorta_print({expr});"
-            else:
-                transformed_code = f"sorta_print({expr});"
-        else:
-            transformed_code = f"sorta_print({expr});"
+        transformed_code = _print_call(groups[0])
 
     elif key == "sometimes":
         used_helpers.add("sometimes")
@@ -150,10 +255,20 @@ def transform_line(line: str) -> List[str]:
     return [original_line.replace(stripped, transformed_code)]
 
 
-def transform_file(path: Path, target_language: str = "c") -> str:
-    """Transform a .knda file to C code."""
+def transform_file(
+    path: Path, target_language: str = "c", personality: Optional[str] = None
+) -> str:
+    """
+    Transform a .knda file to C code.
+
+    personality is the kinda_personality initializer passed to kinda_init();
+    by default it is computed from the active personality.
+    """
+    declared_specifiers.clear()
     lines = path.read_text().splitlines()
     output_lines = []
+    if personality is None:
+        personality = personality_initializer()
 
     # Add includes at the top
     header_lines = [
@@ -161,7 +276,10 @@ def transform_file(path: Path, target_language: str = "c") -> str:
         "#include <stdlib.h>",
         '#include "fuzzy.h"',
         "",
+        f"static const kinda_personality kinda_profile = {personality};",
+        "",
         "int main() {",
+        "    kinda_init(&kinda_profile);",
     ]
 
     i = 0
@@ -169,13 +287,13 @@ def transform_file(path: Path, target_language: str = "c") -> str:
         line = lines[i]
         stripped = line.strip()
 
-        if stripped.startswith("sometimes") or stripped.startswith("maybe"):
-            output_lines.extend(transform_line(line))
+        if stripped.lstrip("~").startswith(("sometimes", "maybe")):
+            output_lines.extend(_transform_source_line(lines, i, str(path)))
             i += 1
             # Process block with proper nesting support
-            i = _process_conditional_block(lines, i, output_lines, "    ")
+            i = _process_conditional_block(lines, i, output_lines, "    ", str(path))
         else:
-            output_lines.extend(transform_line(line))
+            output_lines.extend(_transform_source_line(lines, i, str(path)))
             i += 1
 
     # Add proper indentation for main function body
@@ -199,17 +317,16 @@ def transform(input_path: Path, out_dir: Path) -> List[Path]:
     """
     out_dir.mkdir(parents=True, exist_ok=True)
     output_paths = []
+    personality = personality_initializer()
 
-    # Copy fuzzy.h header to output directory
-    fuzzy_header_src = Path(__file__).parent / "runtime" / "fuzzy.h"
-    fuzzy_header_dst = out_dir / "fuzzy.h"
-    if fuzzy_header_src.exists():
-        fuzzy_header_dst.write_text(fuzzy_header_src.read_text())
+    # Copy libkinda next to the output so it builds with `cc *.c`
+    for name in RUNTIME_FILES:
+        shutil.copyfile(RUNTIME_DIR / name, out_dir / name)
 
     if input_path.is_dir():
         for file in input_path.glob("**/*.knda"):
             if file.name.endswith(".c.knda"):
-                output_code = transform_file(file)
+                output_code = transform_file(file, personality=personality)
                 relative_path = file.relative_to(input_path)
                 new_name = file.name.replace(".c.knda", ".c")
                 output_file_path = out_dir / relative_path.with_name(new_name)
@@ -217,7 +334,7 @@ def transform(input_path: Path, out_dir: Path) -> List[Path]:
                 output_file_path.write_text(output_code, encoding="utf-8")
                 output_paths.append(output_file_path)
     else:
-        output_code = transform_file(input_path)
+        output_code = transform_file(input_path, personality=personality)
         if input_path.name.endswith(".c.knda"):
             new_name = input_path.name.replace(".c.knda", ".c")
         else:
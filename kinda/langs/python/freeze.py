@@ -0,0 +1,199 @@
+# kinda/langs/python/freeze.py
+
+"""
+Personality-specialized ("frozen") code generation
+
+With ``kinda transform --freeze-personality mood=reliable,chaos=3`` the
+values a construct would otherwise derive from PersonalityContext on every
+call (base probabilities, fuzz and drift ranges, ~ish variance and
+tolerance, repeat variance) are computed once at transform time and passed
+to the runtime helpers as literals:
+
+    n = kinda_int(5, fuzz_range=(0, 0) if _kinda_frozen() else None)
+
+``_kinda_frozen`` is a FrozenPersonalityGuard created at the top of the
+module. It only answers True while the active personality has the frozen
+mood and chaos level, so if the program (or whoever imports it) switches
+personality the helpers fall back to looking the values up as usual.
+Cascade effects are still applied at runtime on top of frozen probabilities.
+
+The rewrite inserts keyword arguments into the generated text rather than
+regenerating it from the AST, so comments and layout are kept.
+"""
+
+import ast
+import io
+import tokenize
+import warnings
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from kinda.personality import PERSONALITY_PROFILES, frozen_personality_values
+
+GUARD_NAME = "_kinda_frozen"
+GUARD_CLASS = "FrozenPersonalityGuard"
+
+# helper -> (keyword it accepts, frozen value it gets, most positional arguments)
+FROZEN_PARAMETERS: Dict[str, Tuple[str, str, Optional[int]]] = {
+    "sometimes": ("base_prob", "sometimes", 1),
+    "maybe": ("base_prob", "maybe", 1),
+    "probably": ("base_prob", "probably", 1),
+    "rarely": ("base_prob", "rarely", 1),
+    "sometimes_while_condition": ("base_prob", "sometimes_while", 1),
+    "maybe_for_item_execute": ("base_prob", "maybe_for", 0),
+    "sorta_print": ("base_prob", "sorta_print", None),
+    "kinda_int": ("fuzz_range", "int_fuzz_range", 1),
+    "kinda_float": ("drift_range", "float_drift_range", 1),
+    "kinda_repeat_count": ("variance", "kinda_repeat_variance", 1),
+    "ish_value": ("variance", "ish_variance", 2),
+    "ish_comparison": ("tolerance_base", "ish_tolerance", 2),
+}
+
+
+def parse_freeze_spec(spec: str, mood: str = "playful", chaos_level: int = 5) -> Tuple[str, int]:
+    """
+    Parse "mood=reliable,chaos=3" into (mood, chaos_level).
+
+    Either part may be left out, in which case the given defaults are used.
+    Raises ValueError for unknown keys, moods or chaos levels.
+    """
+    for part in filter(None, (item.strip() for item in spec.split(","))):
+        key, _, value = part.partition("=")
+        key, value = key.strip().lower(), value.strip()
+        if key == "mood":
+            mood = value.lower()
+        elif key in ("chaos", "chaos_level", "chaos-level"):
+            try:
+                chaos_level = int(value)
+            except ValueError:
+                raise ValueError(f"Chaos level must be a number, got {value!r}")
+        else:
+            raise ValueError(f"Unknown freeze setting {key!r} (expected mood and chaos)")
+
+    if mood not in PERSONALITY_PROFILES:
+        raise ValueError(
+            f"Unknown mood {mood!r} (expected one of: {', '.join(PERSONALITY_PROFILES)})"
+        )
+    if not 1 <= chaos_level <= 10:
+        raise ValueError(f"Chaos level must be between 1 and 10, got {chaos_level}")
+    return mood, chaos_level
+
+
+def _freezable(call: ast.Call) -> Optional[Tuple[str, str]]:
+    """(keyword, value key) to add to a helper call, if it can take one."""
+    if not isinstance(call.func, ast.Name) or call.func.id not in FROZEN_PARAMETERS:
+        return None
+    keyword, value_key, most_positional = FROZEN_PARAMETERS[call.func.id]
+    if any(kw.arg in (keyword, None) for kw in call.keywords):
+        return None
+    if most_positional is not None and (
+        len(call.args) > most_positional or any(isinstance(a, ast.Starred) for a in call.args)
+    ):
+        return None
+    return keyword, value_key
+
+
+def _char_offset(line: str, byte_offset: int) -> int:
+    """ast column offsets count UTF-8 bytes; convert to a str index."""
+    return len(line.encode("utf-8")[:byte_offset].decode("utf-8", "replace"))
+
+
+def freeze_personality(code: str, mood: str, chaos_level: int) -> Tuple[str, int]:
+    """
+    Specialize generated code for one personality.
+
+    Returns the rewritten code and the number of calls that were frozen.
+    Code that doesn't parse is returned unchanged. If the rewrite itself
+    would not parse, a warning is issued and the code is returned unfrozen.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return code, 0
+
+    values = frozen_personality_values(mood, chaos_level)
+    lines = code.splitlines(keepends=True)
+    tokens = _significant_tokens(code)
+    token_starts = [start for start, _ in tokens]
+
+    insertions: List[Tuple[int, int, str]] = []
+    for call in ast.walk(tree):
+        if not isinstance(call, ast.Call):
+            continue
+        frozen = _freezable(call)
+        if frozen is None:
+            continue
+        keyword, value_key = frozen
+
+        line_index = call.end_lineno - 1
+        close = _char_offset(lines[line_index], call.end_col_offset) - 1
+        previous = _previous_token(tokens, token_starts, line_index + 1, close)
+        separator = "" if previous in ("(", ",") else ", "
+        text = f"{separator}{keyword}={values[value_key]!r} if {GUARD_NAME}() else None"
+        insertions.append((line_index, close, text))
+
+    if not insertions:
+        return code, 0
+
+    # Apply from the end so earlier offsets stay valid
+    for line_index, column, text in sorted(insertions, reverse=True):
+        line = lines[line_index]
+        lines[line_index] = line[:column] + text + line[column:]
+
+    guard = (
+        f"from kinda.personality import {GUARD_CLASS}\n"
+        f"{GUARD_NAME} = {GUARD_CLASS}({mood!r}, {chaos_level})\n"
+    )
+    lines.insert(_guard_position(tree), guard)
+    frozen_code = "".join(lines)
+    try:
+        ast.parse(frozen_code)
+    except SyntaxError as e:
+        # Layout the insertion didn't anticipate; better unfrozen than broken
+        warnings.warn(f"Left the code unfrozen: freezing it would break line {e.lineno}")
+        return code, 0
+    return frozen_code, len(insertions)
+
+
+def _significant_tokens(code: str) -> List[Tuple[Tuple[int, int], str]]:
+    """(start, text) of every token except comments, newlines and indentation."""
+    skipped = (
+        tokenize.COMMENT,
+        tokenize.NL,
+        tokenize.NEWLINE,
+        tokenize.INDENT,
+        tokenize.DEDENT,
+        tokenize.ENDMARKER,
+    )
+    return [
+        (token.start, token.string)
+        for token in tokenize.generate_tokens(io.StringIO(code).readline)
+        if token.type not in skipped
+    ]
+
+
+def _previous_token(
+    tokens: List[Tuple[Tuple[int, int], str]],
+    token_starts: List[Tuple[int, int]],
+    lineno: int,
+    column: int,
+) -> str:
+    """Text of the last token before a position, so comments in between are skipped."""
+    index = bisect_left(token_starts, (lineno, column))
+    return tokens[index - 1][1] if index else ""
+
+
+def _guard_position(tree: ast.Module) -> int:
+    """Line index after the module's leading imports, where the guard goes."""
+    position = 0
+    for statement in tree.body:
+        if isinstance(statement, (ast.Import, ast.ImportFrom)) or (
+            isinstance(statement, ast.Expr)
+            and isinstance(statement.value, ast.Constant)
+            and isinstance(statement.value.value, str)
+            and position == 0
+        ):
+            position = statement.end_lineno
+        else:
+            break
+    return position
@@ -82,10 +82,11 @@ def generate_runtime(output_dir: Path) -> None:
         lines.append(
             "def sorta_print(*args):\n"
             "    from kinda.personality import chaos_random\n"
+            "    from kinda.output import emit\n"
             "    if chaos_random() < 0.8:\n"
-            "        print('[print]', *args)\n"
+            "        emit('[print]', *args)\n"
             "    else:\n"
-            "        print('[shrug]', *args)\n"
+            "        emit('[shrug]', *args)\n"
         )
         lines.append("env['sorta_print'] = sorta_print\n\n")
     if "sometimes" not in already_added:
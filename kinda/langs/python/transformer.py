@@ -1,3 +1,5 @@
+import contextlib
+import io
 import re
 import os
 from pathlib import Path
@@ -1146,6 +1148,48 @@ def transform_file(path: Path, target_language="python") -> str:
     global used_helpers
     used_helpers = set()
 
+    lines = _read_source_lines(path)
+    output_lines = _transform_lines(lines, str(path))
+
+    header = ""
+    if used_helpers:
+        helpers = ", ".join(sorted(used_helpers))
+        header = f"from kinda.langs.{target_language}.runtime.fuzzy import {helpers}\n\n"
+    else:
+        # Always include a minimal header for consistency and test compliance
+        # Even empty files should have runtime import to ensure valid Python module structure
+        # Import a basic function that's always available in the runtime
+        header = f"from kinda.langs.{target_language}.runtime.fuzzy import env\n\n"
+
+    return header + "\n".join(output_lines)
+
+
+def check_file(path: Path) -> List[KindaParseError]:
+    """
+    Check a .knda file without generating any output, returning every error.
+
+    Where transform_file stops at the first error, check mode records it, skips
+    the failing construct (and the block it opens) and keeps going, so a single
+    pass reports all broken lines. Advisory warnings are not printed.
+    """
+    global used_helpers
+    used_helpers = set()
+
+    try:
+        lines = _read_source_lines(path)
+    except KindaSizeError as e:
+        return [KindaParseError(e.args[0], 0, "", str(path))]
+    except KindaParseError as e:
+        return [e]
+
+    errors: List[KindaParseError] = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        _transform_lines(lines, str(path), errors)
+    return errors
+
+
+def _read_source_lines(path: Path) -> List[str]:
+    """Read a .knda file as lines, enforcing the file size limit"""
     # Layer 1: File size validation (DoS protection - Issue #110)
     try:
         file_size = os.path.getsize(path)
@@ -1163,13 +1207,23 @@ def transform_file(path: Path, target_language="python") -> str:
     try:
         # Use safe encoding-aware file reading for Windows compatibility
         content = safe_read_file(path)
-        lines = content.splitlines()
+        return content.splitlines()
     except UnicodeDecodeError as e:
         raise KindaParseError(f"File encoding issue - try saving as UTF-8: {e}", 0, "", str(path))
     except OSError as e:
         raise KindaParseError(f"Cannot read file: {e}", 0, "", str(path))
 
-    output_lines = []
+
+def _transform_lines(
+    lines: List[str], file_path: str, errors: Optional[List[KindaParseError]] = None
+) -> List[str]:
+    """
+    Transform source lines into Python lines.
+
+    Errors are raised unless an errors list is given (check mode), in which case
+    they are appended to it and transformation resumes after the failing construct.
+    """
+    output_lines: List[str] = []
     i = 0
 
     while i < len(lines):
@@ -1177,10 +1231,10 @@ def transform_file(path: Path, target_language="python") -> str:
         stripped = line.strip()
         line_number = i + 1  # 1-based line numbers
 
-        # Layer 2: Line length validation (DoS protection - Issue #110)
-        validate_line_length(line, line_number, str(path))
-
         try:
+            # Layer 2: Line length validation (DoS protection - Issue #110)
+            validate_line_length(line, line_number, file_path)
+
             if (
                 stripped.startswith("~sometimes")
                 or stripped.startswith("~maybe")
@@ -1192,7 +1246,7 @@ def transform_file(path: Path, target_language="python") -> str:
                 or stripped.startswith("~eventually_until")
             ):
                 # Validate conditional syntax
-                if not _validate_conditional_syntax(stripped, line_number, str(path)):
+                if not _validate_conditional_syntax(stripped, line_number, file_path):
                     i += 1
                     continue
 
@@ -1209,34 +1263,57 @@ def transform_file(path: Path, target_language="python") -> str:
                     block_indent = last_line_indent + "    "
 
                     # Process block with proper nesting support and error handling
-                    i = _process_conditional_block(lines, i, output_lines, block_indent, str(path))
+                    i = _process_conditional_block(lines, i, output_lines, block_indent, file_path)
                 else:
                     # Python-style indented block - process indented lines
-                    i = _process_python_indented_block(lines, i, output_lines, line, str(path))
+                    i = _process_python_indented_block(lines, i, output_lines, line, file_path)
             else:
                 transformed = transform_line(line)
                 if not transformed:  # Empty result might indicate parse failure
-                    _warn_about_line(stripped, line_number, str(path))
+                    _warn_about_line(stripped, line_number, file_path)
                 output_lines.extend(transformed)
                 i += 1
 
-        except KindaSizeError:
+        except KindaSizeError as e:
             # Re-raise KindaSizeError to preserve DoS protection
-            raise
+            if errors is None:
+                raise
+            errors.append(KindaParseError(e.args[0], line_number, "", file_path))
+            i = line_number
         except Exception as e:
-            raise KindaParseError(f"Transform failed: {str(e)}", line_number, line, str(path))
-
-    header = ""
-    if used_helpers:
-        helpers = ", ".join(sorted(used_helpers))
-        header = f"from kinda.langs.{target_language}.runtime.fuzzy import {helpers}\n\n"
-    else:
-        # Always include a minimal header for consistency and test compliance
-        # Even empty files should have runtime import to ensure valid Python module structure
-        # Import a basic function that's always available in the runtime
-        header = f"from kinda.langs.{target_language}.runtime.fuzzy import env\n\n"
-
-    return header + "\n".join(output_lines)
+            if errors is None:
+                raise KindaParseError(f"Transform failed: {str(e)}", line_number, line, file_path)
+            # Keep the line of errors raised inside blocks
+            if not isinstance(e, KindaParseError):
+                e = KindaParseError(f"Transform failed: {str(e)}", line_number, line, file_path)
+            errors.append(e)
+            i = _skip_failed_construct(lines, line_number - 1)
+
+    return output_lines
+
+
+def _skip_failed_construct(lines: List[str], index: int) -> int:
+    """Index of the first line after lines[index] and the block it opens, if any"""
+    stripped = lines[index].strip()
+
+    if stripped.endswith("{"):
+        depth = 0
+        for j in range(index, len(lines)):
+            depth += lines[j].count("{") - lines[j].count("}")
+            if depth <= 0:
+                return j + 1
+        return len(lines)
+
+    if stripped.endswith(":"):
+        base_indent = len(lines[index]) - len(lines[index].lstrip())
+        j = index + 1
+        while j < len(lines) and (
+            not lines[j].strip() or len(lines[j]) - len(lines[j].lstrip()) > base_indent
+        ):
+            j += 1
+        return j
+
+    return index + 1
 
 
 def _validate_conditional_syntax(line: str, line_number: int, file_path: str) -> bool:
@@ -5,7 +5,7 @@ Epic #127: Python Enhancement Bridge - Gradual migration utilities that enable
 incremental adoption of kinda-lang constructs in Python projects.
 """
 
-from .decorators import enhance, enhance_class, kinda_migrate
+from .decorators import enhance, enhance_class, kinda_migrate, get_lazy_enhancement_stats
 from .strategy import MigrationStrategy, FourPhaseStrategy
 from .utilities import MigrationUtilities
 
@@ -13,6 +13,7 @@ __all__ = [
     "enhance",
     "enhance_class",
     "kinda_migrate",
+    "get_lazy_enhancement_stats",
     "MigrationStrategy",
     "FourPhaseStrategy",
     "MigrationUtilities",
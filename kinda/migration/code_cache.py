@@ -0,0 +1,200 @@
+"""
+Compiled Code Cache for Enhanced Functions
+
+Epic #127: Python Enhancement Bridge - Persists the code objects produced for
+@enhance / @kinda_migrate decorated functions so that source analysis and
+injection only happen once per (source, configuration) pair, even across
+processes.
+"""
+
+import functools
+import hashlib
+import importlib.util
+import marshal
+import os
+import tempfile
+import threading
+from pathlib import Path
+from types import CodeType
+from typing import Dict, Iterable, Optional
+
+from ..injection import __version__ as INJECTION_VERSION
+
+# Bump when the layout of cached code objects changes
+CACHE_FORMAT_VERSION = 1
+
+# Environment variable overriding the on-disk cache location
+CACHE_DIR_ENV = "KINDA_CACHE_DIR"
+
+# Environment variable disabling the on-disk cache ("0", "false", "off")
+CACHE_ENABLED_ENV = "KINDA_ENHANCE_CACHE"
+
+# Modules whose source decides the compiled code
+ENGINE_MODULES = (
+    "injection/ast_analyzer.py",
+    "injection/injection_engine.py",
+    "injection/patterns.py",
+    "injection/security.py",
+    "migration/decorators.py",
+)
+
+
+def default_cache_dir() -> Path:
+    """Get the default on-disk location for compiled enhanced functions"""
+    base = os.environ.get(CACHE_DIR_ENV)
+    if base:
+        return Path(base) / "enhanced"
+    return Path.home() / ".cache" / "kinda" / "enhanced"
+
+
+@functools.lru_cache(maxsize=None)
+def engine_fingerprint() -> str:
+    """Hash of the injection engine sources, so engine fixes invalidate cached code"""
+    digest = hashlib.sha256(INJECTION_VERSION.encode("utf-8"))
+    package_dir = Path(__file__).parent.parent
+    for module in ENGINE_MODULES:
+        try:
+            digest.update((package_dir / module).read_bytes())
+        except OSError:
+            digest.update(module.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class EnhancedCodeCache:
+    """
+    Two-level (memory + disk) cache of compiled enhancement code objects.
+
+    Entries are keyed by a hash of the function source, the enhancement
+    configuration, the interpreter version and the injection engine sources.
+    Disk entries use the interpreter's bytecode magic number as a header, like
+    ``.pyc`` files, and are written atomically so concurrent processes never
+    observe partial files.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, persistent: Optional[bool] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        if persistent is None:
+            persistent = os.environ.get(CACHE_ENABLED_ENV, "1").lower() not in ("0", "false", "off")
+        self.persistent = persistent
+        self._memory: Dict[str, CodeType] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(source: str, config_key: str, extra: Iterable[str] = ()) -> str:
+        """Build a cache key for a function source and configuration fingerprint"""
+        digest = hashlib.sha256()
+        for part in (
+            str(CACHE_FORMAT_VERSION),
+            engine_fingerprint(),
+            importlib.util.MAGIC_NUMBER.hex(),
+            config_key,
+            *extra,
+            source,
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CodeType]:
+        """Look up a compiled code object, checking memory before disk"""
+        code = self._memory.get(key)
+        if code is not None:
+            self.hits += 1
+            return code
+
+        code = self._load(key)
+        if code is not None:
+            with self._lock:
+                self._memory[key] = code
+            self.disk_hits += 1
+            return code
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, code: CodeType) -> None:
+        """Store a compiled code object in memory and (best effort) on disk"""
+        with self._lock:
+            self._memory[key] = code
+        self._store(key, code)
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop cached entries from memory and optionally from disk"""
+        with self._lock:
+            self._memory.clear()
+        if disk and self.cache_dir.exists():
+            for entry in self.cache_dir.glob("*.kcode"):
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache hit/miss counters"""
+        return {
+            "entries": len(self._memory),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.kcode"
+
+    def _load(self, key: str) -> Optional[CodeType]:
+        if not self.persistent:
+            return None
+        try:
+            data = self._path_for(key).read_bytes()
+        except OSError:
+            return None
+
+        magic = importlib.util.MAGIC_NUMBER
+        if not data.startswith(magic):
+            return None
+        try:
+            code = marshal.loads(data[len(magic) :])
+        except (EOFError, ValueError, TypeError):
+            return None
+        return code if isinstance(code, CodeType) else None
+
+    def _store(self, key: str, code: CodeType) -> None:
+        if not self.persistent:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(importlib.util.MAGIC_NUMBER)
+                    f.write(marshal.dumps(code))
+                os.replace(tmp_name, self._path_for(key))
+            except BaseException:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            # The cache is an optimization only - unwritable locations are ignored
+            pass
+
+
+_code_cache: Optional[EnhancedCodeCache] = None
+
+
+def get_code_cache() -> EnhancedCodeCache:
+    """Get the process-wide enhanced code cache"""
+    global _code_cache
+    if _code_cache is None:
+        _code_cache = EnhancedCodeCache()
+    return _code_cache
+
+
+def set_code_cache(cache: Optional[EnhancedCodeCache]) -> None:
+    """Replace the process-wide enhanced code cache (None resets to default)"""
+    global _code_cache
+    _code_cache = cache
@@ -8,12 +8,20 @@ seamless integration of kinda-lang constructs into existing Python functions.
 import ast
 import inspect
 import functools
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+import textwrap
+import threading
+import types
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from ..injection.injection_engine import InjectionEngine, InjectionConfig
 from ..injection.ast_analyzer import PatternType
 from ..personality import PersonalityContext
 from ..control.context import ProbabilityContext
+from .code_cache import get_code_cache
+
+# Name of the synthetic function used to give enhanced code its closure cells
+_FACTORY_NAME = "__kinda_enhanced_factory__"
 
 
 class EnhancementConfig:
@@ -37,6 +45,12 @@ class EnhancementConfig:
         self.preserve_signature = preserve_signature
         self.enable_monitoring = enable_monitoring
 
+    def cache_key(self) -> str:
+        """Stable fingerprint of the settings that affect generated code"""
+        patterns = ",".join(sorted(p.value for p in self.patterns))
+        overrides = ",".join(f"{k}={v!r}" for k, v in sorted(self.probability_overrides.items()))
+        return f"{patterns}|{overrides}|{self.safety_level}"
+
 
 def enhance(
     patterns: Optional[Union[List[str], Set[PatternType]]] = None,
@@ -85,6 +99,7 @@ def enhance(
 def enhance_class(
     patterns: Optional[Union[List[str], Set[PatternType]]] = None,
     method_filter: Optional[Callable[[str], bool]] = None,
+    lazy: bool = False,
     **kwargs,
 ) -> Callable:
     """
@@ -93,6 +108,7 @@ def enhance_class(
     Args:
         patterns: Patterns to enable for all methods
         method_filter: Function to filter which methods to enhance
+        lazy: Defer source analysis of each method until it is first called
         **kwargs: Additional configuration passed to enhance decorator
 
     Example:
@@ -103,6 +119,11 @@ def enhance_class(
 
             def multiply(self, a: int, b: int) -> int:
                 return a * b
+
+    With ``lazy=True`` each method is replaced by a LazyEnhancedMethod
+    descriptor that enhances the method on first invocation and then swaps
+    the compiled function into the class. Use get_lazy_enhancement_stats(cls)
+    to see how many methods were actually materialized.
     """
 
     def decorator(cls: type) -> type:
@@ -123,14 +144,109 @@ def enhance_class(
         # Enhance each selected method
         for method_name in methods_to_enhance:
             original_method = getattr(cls, method_name)
-            enhanced_method = enhance(patterns=patterns, **kwargs)(original_method)
+            if lazy:
+                enhanced_method = LazyEnhancedMethod(
+                    cls, method_name, original_method, patterns, kwargs
+                )
+            else:
+                enhanced_method = enhance(patterns=patterns, **kwargs)(original_method)
             setattr(cls, method_name, enhanced_method)
 
+        if lazy:
+            cls.__kinda_lazy_methods__ = list(methods_to_enhance)
+
         return cls
 
     return decorator
 
 
+class LazyEnhancedMethod:
+    """
+    Descriptor that defers method enhancement until the first call.
+
+    Until then the class only holds this lightweight placeholder: no source is
+    read and no injection analysis runs. The first invocation enhances the
+    original function, installs the result on the owning class (so later
+    lookups never touch the descriptor again) and forwards the call.
+    """
+
+    def __init__(
+        self,
+        owner: type,
+        name: str,
+        func: Callable,
+        patterns: Optional[Union[List[str], Set[PatternType]]],
+        enhance_kwargs: Dict[str, Any],
+    ):
+        self.owner = owner
+        self.name = name
+        self.func = func
+        self.patterns = patterns
+        self.enhance_kwargs = enhance_kwargs
+        self.materialized: Optional[Callable] = None
+        self._lock = threading.Lock()
+        functools.update_wrapper(self, func)
+        self.__kinda_enhanced__ = True
+        self.__kinda_lazy__ = True
+        self.__kinda_original__ = func
+
+    def materialize(self) -> Callable:
+        """Enhance the method now (if not done yet) and install it on the owner"""
+        if self.materialized is None:
+            with self._lock:
+                if self.materialized is None:
+                    try:
+                        enhanced = enhance(patterns=self.patterns, **self.enhance_kwargs)(self.func)
+                    except TypeError:
+                        # Source unavailable - fall back to the original method
+                        enhanced = self.func
+                    setattr(self.owner, self.name, enhanced)
+                    self.materialized = enhanced
+                    _lazy_stats["materialized"] += 1
+        return self.materialized
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if self.materialized is not None:
+            return self.materialized.__get__(instance, owner)
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.materialize()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "materialized" if self.materialized is not None else "pending"
+        return f"<LazyEnhancedMethod {self.owner.__qualname__}.{self.name} ({state})>"
+
+
+# Process-wide counters for lazily enhanced methods
+_lazy_stats: Dict[str, int] = {"materialized": 0}
+
+
+def get_lazy_enhancement_stats(cls: Optional[type] = None) -> Dict[str, Any]:
+    """
+    Get materialization statistics for lazily enhanced methods.
+
+    Args:
+        cls: Class decorated with enhance_class(lazy=True); if omitted,
+            process-wide counters are returned
+
+    Returns:
+        Dictionary with total, materialized and pending method counts
+    """
+    if cls is None:
+        return {"materialized": _lazy_stats["materialized"]}
+
+    names = getattr(cls, "__kinda_lazy_methods__", [])
+    pending = [name for name in names if isinstance(cls.__dict__.get(name), LazyEnhancedMethod)]
+    return {
+        "total": len(names),
+        "materialized": len(names) - len(pending),
+        "pending": pending,
+    }
+
+
 def kinda_migrate(
     migration_phase: int = 1,
     target_patterns: Optional[Set[str]] = None,
@@ -220,38 +336,85 @@ def _create_enhanced_function(func: Callable, config: EnhancementConfig) -> Call
 
     # Get function source code
     try:
-        source = inspect.getsource(func)
-        source_lines = source.split("\n")
-
-        # Remove decorator lines and fix indentation
-        filtered_lines = []
-        min_indent = float("inf")
-
-        for line in source_lines:
-            stripped = line.strip()
-            if not stripped.startswith("@") and stripped:  # Skip decorators and empty lines
-                filtered_lines.append(line)
-                # Find minimum indentation level
-                if line.strip():
-                    indent = len(line) - len(line.lstrip())
-                    min_indent = min(min_indent, indent)
-
-        # Remove common indentation to create valid top-level code
-        if min_indent != float("inf") and min_indent > 0:
-            dedented_lines = []
-            for line in filtered_lines:
-                if line.strip():  # Non-empty line
-                    dedented_lines.append(line[min_indent:])
-                else:
-                    dedented_lines.append(line)
-            clean_source = "\n".join(dedented_lines)
-        else:
-            clean_source = "\n".join(filtered_lines)
-
-    except (OSError, IOError):
+        clean_source = _get_clean_source(func)
+    except (OSError, IOError, SyntaxError):
         # Can't get source - raise appropriate error instead of warning
         raise TypeError(f"Could not enhance function {func.__name__}: source unavailable")
 
+    code = _compile_enhanced_code(func, clean_source, config)
+    if code is None:
+        return func
+
+    enhanced = _bind_enhanced_code(func, code)
+    if enhanced is None:
+        # Freevars of the transformed code don't line up with the original
+        # closure - keep the original implementation
+        enhanced = func
+        compiled = False
+    else:
+        compiled = True
+
+    if config.probability_overrides:
+        target = enhanced
+
+        # Create enhanced wrapper
+        @functools.wraps(func)
+        def enhanced_wrapper(*args, **kwargs):
+            # Set up probability context for the configured overrides
+            with ProbabilityContext(overrides=config.probability_overrides):
+                return target(*args, **kwargs)
+
+    elif compiled:
+        # The compiled function is used directly - no per-call wrapper overhead
+        enhanced_wrapper = enhanced
+    else:
+
+        @functools.wraps(func)
+        def enhanced_wrapper(*args, **kwargs):
+            return func(*args, **kwargs)
+
+    # Add metadata to the enhanced function
+    enhanced_wrapper.__kinda_enhanced__ = True
+    enhanced_wrapper.__kinda_compiled__ = compiled
+    enhanced_wrapper.__kinda_patterns__ = list(config.patterns)
+    enhanced_wrapper.__kinda_config__ = config
+    enhanced_wrapper.__kinda_original__ = func
+
+    return enhanced_wrapper
+
+
+def _get_clean_source(func: Callable) -> str:
+    """Get the dedented source of a function with its decorators removed"""
+    source = textwrap.dedent(inspect.getsource(func))
+    tree = ast.parse(source)
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            # node.lineno points at the def line, skipping (multi-line) decorators
+            return "\n".join(source.split("\n")[node.lineno - 1 :])
+
+    raise SyntaxError(f"No function definition found in source of {func.__name__}")
+
+
+def _compile_enhanced_code(
+    func: Callable, clean_source: str, config: EnhancementConfig
+) -> Optional[types.CodeType]:
+    """
+    Get the compiled code object for the enhanced function.
+
+    The injection engine output is compiled once per (source, config) pair and
+    cached in memory and on disk, so repeated decoration (including in other
+    processes) skips source analysis entirely.
+    """
+    cache = get_code_cache()
+    freevars = func.__code__.co_freevars
+    class_name = _get_owner_class_name(func)
+    key = cache.make_key(clean_source, config.cache_key(), (class_name or "",) + freevars)
+
+    code = cache.get(key)
+    if code is not None:
+        return code
+
     # Create injection configuration
     injection_config = InjectionConfig(
         enabled_patterns=config.patterns,
@@ -267,27 +430,117 @@ def _create_enhanced_function(func: Callable, config: EnhancementConfig) -> Call
 
     if not result.success:
         # If injection fails, return original function with warning
-        import warnings
-
         warnings.warn(f"Enhancement failed for {func.__name__}: {', '.join(result.errors)}")
-        return func
+        return None
 
-    # Create enhanced wrapper
-    @functools.wraps(func)
-    def enhanced_wrapper(*args, **kwargs):
-        # Set up probability context if needed
-        with ProbabilityContext(overrides=config.probability_overrides):
-            # For now, just call the original function
-            # In a complete implementation, we would execute the transformed code
-            return func(*args, **kwargs)
+    try:
+        module = _build_factory_module(result.transformed_code, func.__name__, freevars, class_name)
+        code = compile(module, f"<enhanced_{func.__name__}>", "exec")
+    except (SyntaxError, ValueError) as e:
+        warnings.warn(f"Enhancement failed for {func.__name__}: could not compile ({e})")
+        return None
+
+    cache.put(key, code)
+    return code
+
+
+def _get_owner_class_name(func: Callable) -> Optional[str]:
+    """Get the name of the class a function was defined in, if any"""
+    parts = func.__qualname__.split(".")
+    if len(parts) >= 2 and parts[-2] != "<locals>":
+        return parts[-2]
+    return None
+
+
+def _build_factory_module(
+    transformed_code: str,
+    name: str,
+    freevars: Tuple[str, ...],
+    class_name: Optional[str] = None,
+) -> ast.Module:
+    """
+    Wrap the transformed function in a factory so it compiles as a closure.
 
-    # Add metadata to the enhanced function
-    enhanced_wrapper.__kinda_enhanced__ = True
-    enhanced_wrapper.__kinda_patterns__ = list(config.patterns)
-    enhanced_wrapper.__kinda_config__ = config
-    enhanced_wrapper.__kinda_original__ = func
+    Runtime helpers imported by the injected code and the original function's
+    free variables become parameters of the factory, which turns every
+    reference to them inside the function into a closure cell lookup. Methods
+    are compiled inside a class of the same name so private names are mangled
+    exactly as in the original definition.
+    """
+    tree = ast.parse(transformed_code)
+
+    imports: List[ast.stmt] = []
+    helper_names: List[str] = []
+    function_def = None
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.append(node)
+            for alias in node.names:
+                helper_names.append((alias.asname or alias.name).split(".")[0])
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == name:
+            function_def = node
+
+    if function_def is None:
+        raise ValueError(f"transformed source does not define {name}")
+    function_def.decorator_list = []
+
+    params = list(dict.fromkeys(helper_names + [v for v in freevars if v not in helper_names]))
+    template = f"def {_FACTORY_NAME}({', '.join(params)}):\n    pass\n"
+    if class_name:
+        template = f"class {class_name}:\n" + textwrap.indent(template, "    ")
+
+    wrapper = ast.parse(template).body[0]
+    factory = wrapper.body[0] if class_name else wrapper
+    factory.body = [function_def, ast.Return(value=ast.Name(id=name, ctx=ast.Load()))]
+
+    module = ast.Module(body=imports + [wrapper], type_ignores=[])
+    return ast.fix_missing_locations(module)
+
+
+def _find_code(code: types.CodeType, name: str) -> Optional[types.CodeType]:
+    """Find a nested code object by name (depth-first through constants)"""
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            if const.co_name == name:
+                return const
+            found = _find_code(const, name)
+            if found is not None:
+                return found
+    return None
+
+
+def _bind_enhanced_code(func: Callable, code: types.CodeType) -> Optional[Callable]:
+    """Bind cached enhanced code to the original function's globals and closure"""
+    # Running the module only performs the helper imports and defines the factory
+    namespace: Dict[str, Any] = {"__name__": func.__module__}
+    try:
+        exec(code, namespace)
+    except ImportError as e:
+        warnings.warn(f"Enhancement runtime unavailable for {func.__name__}: {e}")
+        return None
+
+    factory_code = _find_code(code, _FACTORY_NAME)
+    inner_code = _find_code(factory_code, func.__name__) if factory_code else None
+    if inner_code is None:
+        return None
+
+    original_cells = dict(zip(func.__code__.co_freevars, func.__closure__ or ()))
+    closure = []
+    for var in inner_code.co_freevars:
+        if var in original_cells:
+            # Share the original cell so nonlocal updates stay visible
+            closure.append(original_cells[var])
+        elif var in namespace:
+            closure.append(types.CellType(namespace[var]))
+        else:
+            return None
 
-    return enhanced_wrapper
+    enhanced = types.FunctionType(
+        inner_code, func.__globals__, func.__name__, func.__defaults__, tuple(closure) or None
+    )
+    enhanced.__kwdefaults__ = func.__kwdefaults__
+    functools.update_wrapper(enhanced, func)
+    return enhanced
 
 
 def _create_migration_wrapper(
@@ -295,34 +548,36 @@ def _create_migration_wrapper(
 ) -> Callable:
     """Create migration wrapper for phase-based enhancement"""
 
-    @functools.wraps(func)
-    def migration_wrapper(*args, **kwargs):
-        # Phase-specific behavior
-        if phase == 1:
-            # Function-level enhancement - basic patterns only
-            safe_patterns = {
-                PatternType.KINDA_INT,
-                PatternType.KINDA_FLOAT,
-                PatternType.SORTA_PRINT,
-            }
-            active_patterns = patterns & safe_patterns
-        elif phase == 2:
-            # Class-level enhancement - add control flow
-            active_patterns = patterns
-        elif phase == 3:
-            # Module-level integration - full pattern set
-            active_patterns = patterns
-        else:
-            # Project-wide integration - all patterns
-            active_patterns = patterns
+    # Phase-specific behavior
+    if phase == 1:
+        # Function-level enhancement - basic patterns only
+        safe_patterns = {
+            PatternType.KINDA_INT,
+            PatternType.KINDA_FLOAT,
+            PatternType.SORTA_PRINT,
+        }
+        active_patterns = patterns & safe_patterns
+    else:
+        # Class-level (2), module-level (3) and project-wide (4) integration
+        active_patterns = patterns
+
+    # Apply enhancement based on active patterns
+    config = EnhancementConfig(
+        patterns=active_patterns, safety_level="caution" if phase > 2 else "safe"
+    )
 
-        # Apply enhancement based on active patterns
-        config = EnhancementConfig(
-            patterns=active_patterns, safety_level="caution" if phase > 2 else "safe"
-        )
+    target = func
+    if active_patterns:
+        try:
+            target = _create_enhanced_function(func, config)
+        except TypeError:
+            # Source unavailable - migrate without enhancement
+            target = func
 
+    @functools.wraps(func)
+    def migration_wrapper(*args, **kwargs):
         with ProbabilityContext():
-            return func(*args, **kwargs)
+            return target(*args, **kwargs)
 
     # Add migration metadata
     migration_wrapper.__kinda_migration_phase__ = phase
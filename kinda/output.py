@@ -0,0 +1,337 @@
+# kinda/output.py
+
+"""
+Kinda-Lang Runtime Output Channels
+
+Program output (~sorta print) and construct diagnostics ([?], [tip], [shrug],
+[fuzzy], [welp], ...) go through two channels instead of calling print()
+directly:
+
+- The output channel writes through to sys.stdout by default, exactly like
+  print(). With a buffer size it collects text and writes it in blocks,
+  which turns one write syscall per line into one per block when stdout is
+  a pipe. Buffered text is flushed at exit, by the sandbox when a program
+  finishes or fails, and whenever the target stream changes. While a
+  program runs, channel_stdout() sends its plain print() calls through the
+  same buffer so they stay in order with ~sorta print.
+- The diagnostics channel sends construct chatter through the output channel
+  (keeping it in order with program output), to stderr, to a file, or
+  nowhere, and can keep only a fraction of messages.
+
+Configuration comes from the environment at import and can be overridden
+with configure_output() (the CLI does this for --output-buffer,
+--diagnostics and --diagnostics-sample):
+
+    KINDA_OUTPUT_BUFFER       "off"/"line"/"0" (write-through), "block", or a size in bytes
+    KINDA_DIAGNOSTICS         "stdout", "stderr", "off", or a file path
+    KINDA_DIAGNOSTICS_SAMPLE  Fraction of diagnostics to keep (0.0 - 1.0)
+"""
+
+import atexit
+import builtins
+import contextlib
+import os
+import sys
+import threading
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+OUTPUT_BUFFER_ENV = "KINDA_OUTPUT_BUFFER"
+DIAGNOSTICS_ENV = "KINDA_DIAGNOSTICS"
+DIAGNOSTICS_SAMPLE_ENV = "KINDA_DIAGNOSTICS_SAMPLE"
+
+# Block size used for "block" buffering
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+DIAGNOSTICS_DESTINATIONS = ("stdout", "stderr", "off")
+
+
+def parse_buffer_size(value: str) -> int:
+    """Parse a buffer setting; 0 means write-through."""
+    value = value.strip().lower()
+    if value in ("", "off", "line", "none"):
+        return 0
+    if value == "block":
+        return DEFAULT_BLOCK_SIZE
+    size = int(value)
+    if size < 0:
+        raise ValueError(f"Buffer size must not be negative: {size}")
+    return size
+
+
+def parse_sample_rate(value: str) -> float:
+    """Parse a diagnostics sample rate between 0 and 1."""
+    rate = float(value)
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError(f"Sample rate must be between 0 and 1: {rate}")
+    return rate
+
+
+class OutputChannel:
+    """
+    Program output with optional block buffering.
+
+    Args:
+        buffer_size: Characters to collect before writing; 0 writes every
+            call straight through
+        stream: Fixed target stream; None means whatever sys.stdout is at
+            the time of writing (so pytest capture and the sandbox see it)
+    """
+
+    def __init__(self, buffer_size: int = 0, stream: Optional[TextIO] = None):
+        self.buffer_size = buffer_size
+        self.stream = stream
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self._target: Optional[TextIO] = None
+        self._lock = threading.Lock()
+
+    def _resolve(self) -> TextIO:
+        if self.stream is not None:
+            return self.stream
+        stream = sys.stdout
+        # Text routed in by channel_stdout() goes to the stream it replaced
+        return stream.wrapped if isinstance(stream, ChannelStdout) else stream
+
+    def print(self, *args, sep: str = " ", end: str = "\n") -> None:
+        """print()-compatible write."""
+        if self.buffer_size <= 0:
+            if self.stream is None and sep == " " and end == "\n":
+                # Plain print() so write-through output is exactly what it always was
+                builtins.print(*args)
+            else:
+                builtins.print(*args, sep=sep, end=end, file=self._resolve())
+            return
+        self.write(sep.join(map(str, args)) + end)
+
+    def write(self, text: str) -> None:
+        if self.buffer_size <= 0:
+            self._resolve().write(text)
+            return
+
+        target = self._resolve()
+        with self._lock:
+            if self._pending and target is not self._target:
+                # Text buffered for another stream must land there first
+                self._flush_locked()
+            self._target = target
+            self._pending.append(text)
+            self._pending_size += len(text)
+            if self._pending_size >= self.buffer_size:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write out anything buffered."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        target = self._target
+        # Clear first so a failing write can't resend the same text
+        self._pending = []
+        self._pending_size = 0
+        self._target = None
+        if target is not None:
+            target.write(text)
+            target.flush()
+
+
+class ChannelStdout:
+    """
+    sys.stdout stand-in that writes through an output channel.
+
+    Installed by channel_stdout() so direct writes to stdout share the
+    channel's buffer instead of overtaking it. Anything else (encoding,
+    isatty, fileno, ...) comes from the wrapped stream.
+    """
+
+    def __init__(self, channel: OutputChannel, wrapped: TextIO):
+        self.channel = channel
+        self.wrapped = wrapped
+
+    def write(self, text: str) -> int:
+        self.channel.write(text)
+        return len(text)
+
+    def flush(self) -> None:
+        self.channel.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapped, name)
+
+
+class DiagnosticsChannel:
+    """
+    Construct diagnostics with a selectable destination and sampling.
+
+    Args:
+        destination: "stdout" (through the output channel), "stderr", "off",
+            or a file path to append to
+        sample_rate: Fraction of messages to keep. Sampling is deterministic
+            (every 1/rate-th message) so it never consumes the seeded RNG.
+        output: Output channel used for the "stdout" destination
+    """
+
+    def __init__(
+        self,
+        destination: str = "stdout",
+        sample_rate: float = 1.0,
+        output: Optional[OutputChannel] = None,
+    ):
+        self.destination = destination
+        self.sample_rate = sample_rate
+        self.output = output if output is not None else OutputChannel()
+        self.emitted = 0
+        self.dropped = 0
+        self._credit = 0.0
+        self._file: Optional[TextIO] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.destination != "off" and self.sample_rate > 0.0
+
+    def _sampled(self) -> bool:
+        if self.sample_rate >= 1.0:
+            return True
+        with self._lock:
+            self._credit += self.sample_rate
+            if self._credit >= 1.0:
+                self._credit -= 1.0
+                return True
+            return False
+
+    def print(self, *args, sep: str = " ", end: str = "\n") -> None:
+        """print()-compatible diagnostic."""
+        if not self.enabled or not self._sampled():
+            self.dropped += 1
+            return
+        self.emitted += 1
+
+        if self.destination == "stdout":
+            self.output.print(*args, sep=sep, end=end)
+        elif self.destination == "stderr":
+            builtins.print(*args, sep=sep, end=end, file=sys.stderr)
+        else:
+            with self._lock:
+                if self._file is None:
+                    self._file = open(self.destination, "a", encoding="utf-8")
+                builtins.print(*args, sep=sep, end=end, file=self._file)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _settings_from_env(environ: Dict[str, str]) -> Dict[str, Any]:
+    """Settings from the environment; unset or invalid values use the defaults."""
+    settings: Dict[str, Any] = {
+        "buffer_size": 0,
+        "diagnostics": "stdout",
+        "diagnostics_sample": 1.0,
+    }
+    try:
+        settings["buffer_size"] = parse_buffer_size(environ.get(OUTPUT_BUFFER_ENV, ""))
+    except ValueError:
+        pass
+    destination = environ.get(DIAGNOSTICS_ENV, "").strip()
+    if destination:
+        settings["diagnostics"] = destination
+    if DIAGNOSTICS_SAMPLE_ENV in environ:
+        try:
+            settings["diagnostics_sample"] = parse_sample_rate(environ[DIAGNOSTICS_SAMPLE_ENV])
+        except ValueError:
+            pass
+    return settings
+
+
+_output = OutputChannel()
+_diagnostics = DiagnosticsChannel(output=_output)
+
+
+def get_output_channel() -> OutputChannel:
+    return _output
+
+
+def get_diagnostics_channel() -> DiagnosticsChannel:
+    return _diagnostics
+
+
+def configure_output(
+    buffer_size: Optional[int] = None,
+    diagnostics: Optional[str] = None,
+    diagnostics_sample: Optional[float] = None,
+) -> None:
+    """Change output settings; unspecified settings keep their current value."""
+    flush_output()
+    if buffer_size is not None:
+        _output.buffer_size = buffer_size
+    if diagnostics is not None and diagnostics != _diagnostics.destination:
+        _diagnostics.close()
+        _diagnostics.destination = diagnostics
+    if diagnostics_sample is not None:
+        _diagnostics.sample_rate = diagnostics_sample
+
+
+def configure_output_from_env(environ: Optional[Dict[str, str]] = None) -> None:
+    """Reset to KINDA_OUTPUT_BUFFER / KINDA_DIAGNOSTICS / KINDA_DIAGNOSTICS_SAMPLE (or defaults)."""
+    configure_output(**_settings_from_env(dict(os.environ) if environ is None else environ))
+
+
+def emit(*args, sep: str = " ", end: str = "\n") -> None:
+    """Write program output (used by ~sorta print)."""
+    _output.print(*args, sep=sep, end=end)
+
+
+def diagnostic(*args, sep: str = " ", end: str = "\n") -> None:
+    """Write a construct diagnostic."""
+    _diagnostics.print(*args, sep=sep, end=end)
+
+
+def flush_output() -> None:
+    """Flush buffered program output and diagnostics."""
+    _output.flush()
+    _diagnostics.flush()
+
+
+@contextlib.contextmanager
+def channel_stdout() -> Iterator[None]:
+    """
+    Route sys.stdout through the output channel while it buffers.
+
+    Keeps a program's print() calls in order with ~sorta print and stdout
+    diagnostics. Does nothing in write-through mode or when the channel has
+    a fixed stream. Text still buffered on exit is written to the original
+    stream by the next flush.
+    """
+    if _output.buffer_size <= 0 or _output.stream is not None:
+        yield
+        return
+    previous = sys.stdout
+    sys.stdout = ChannelStdout(_output, previous)
+    try:
+        yield
+    finally:
+        sys.stdout = previous
+
+
+def _flush_at_exit() -> None:
+    try:
+        flush_output()
+    except (OSError, ValueError):
+        # The target stream may already be closed during interpreter shutdown
+        pass
+    _diagnostics.close()
+
+
+configure_output_from_env()
+atexit.register(_flush_at_exit)
@@ -71,9 +71,11 @@ class ErrorTracker:
                 f"[STRICT MODE] {construct_type} error: {error_message} (context: {context})"
             )
         elif self.mode == ErrorHandlingMode.WARNING:
-            print(f"[!] {construct_type} error: {error_message}")
+            from kinda.output import diagnostic
+
+            diagnostic(f"[!] {construct_type} error: {error_message}")
             if context:
-                print(f"    Context: {context}")
+                diagnostic(f"    Context: {context}")
 
     def get_error_rate(self) -> float:
         """Calculate overall error handling rate (errors caught / errors that could occur)."""
@@ -675,6 +677,10 @@ class PersonalityContext:
 
     def get_chaos_probability(self, base_key: str, condition: Any = True) -> float:
         """Get chaos-adjusted probability for a construct."""
+        return self.apply_cascade(self.get_base_chaos_probability(base_key))
+
+    def get_base_chaos_probability(self, base_key: str) -> float:
+        """Get a construct's chaos-amplified probability before cascade effects."""
         base_prob = getattr(self.profile, f"{base_key}_base", 0.5)
 
         # Combine personality profile chaos_amplifier with chaos_level multiplier
@@ -698,6 +704,10 @@ class PersonalityContext:
             else:
                 adjusted = base_prob + (0.5 - base_prob) * (combined_chaos_amplifier - 1.0)
 
+        return adjusted
+
+    def apply_cascade(self, adjusted: float) -> float:
+        """Apply current cascade effects to a base chaos probability."""
         # Apply cascade effects
         if self.instability_level > 0:
             cascade_impact = self.instability_level * self.profile.cascade_strength
@@ -953,6 +963,11 @@ def chaos_probability(base_key: str, condition: Any = True) -> float:
     return get_personality().get_chaos_probability(base_key, condition)
 
 
+def chaos_base_probability(base_key: str) -> float:
+    """Get a construct's personality-adjusted probability before cascade effects."""
+    return get_personality().get_base_chaos_probability(base_key)
+
+
 def chaos_fuzz_range(base_key: str = "int") -> Tuple[int, int]:
     """Get personality-adjusted fuzz range."""
     return get_personality().get_fuzz_range(base_key)
@@ -1056,6 +1071,58 @@ def get_kinda_repeat_variance() -> float:
     return base_variance * combined_amplifier
 
 
+# Personality-specialized ("frozen") builds
+FROZEN_PROBABILITY_KEYS = (
+    "sometimes",
+    "maybe",
+    "probably",
+    "rarely",
+    "sometimes_while",
+    "maybe_for",
+    "sorta_print",
+)
+
+
+def frozen_personality_values(mood: str, chaos_level: int) -> Dict[str, Any]:
+    """
+    Get the personality values constructs look up at runtime, for one fixed
+    mood and chaos level.
+
+    Probabilities are the pre-cascade base probabilities; cascade effects
+    depend on runtime instability and are still applied by the constructs.
+    """
+    ctx = PersonalityContext(mood, chaos_level)
+    values: Dict[str, Any] = {
+        key: ctx.get_base_chaos_probability(key) for key in FROZEN_PROBABILITY_KEYS
+    }
+    values["int_fuzz_range"] = ctx.get_fuzz_range("int")
+    values["float_drift_range"] = ctx.get_float_drift_range()
+    values["ish_variance"] = ctx.get_ish_variance()
+    values["ish_tolerance"] = ctx.get_ish_tolerance()
+    values["binary_probabilities"] = ctx.get_binary_probabilities()
+    values["kinda_repeat_variance"] = (
+        ctx.profile.kinda_repeat_variance * ctx.profile.chaos_amplifier * ctx.chaos_multiplier
+    )
+    return values
+
+
+class FrozenPersonalityGuard:
+    """
+    Tells frozen code whether its inlined personality values still apply.
+
+    Calling the guard returns True while the active personality has the mood
+    and chaos level the code was frozen for.
+    """
+
+    def __init__(self, mood: str, chaos_level: int) -> None:
+        self.mood = mood.lower()
+        self.chaos_level = chaos_level
+
+    def __call__(self) -> bool:
+        ctx = PersonalityContext._instance or PersonalityContext.get_instance()
+        return ctx.mood == self.mood and ctx.chaos_level == self.chaos_level
+
+
 def get_eventually_until_confidence() -> float:
     """Get personality-adjusted confidence threshold for ~eventually_until constructs."""
     personality = get_personality()
@@ -8,6 +8,8 @@ preventing malicious file access and code execution vulnerabilities.
 
 Components:
 - execution.py: Main secure execution engine
+- worker_pool.py: Prewarmed, resource-limited worker processes for the engine
+- output_capture.py: Bounded output capture with streaming violation scanning
 - sandbox.py: Python runtime restrictions and safe builtins
 - filesystem.py: File access controls and path validation
 
@@ -25,6 +27,8 @@ Usage:
 """
 
 from .execution import SecureExecutionEngine, SecurityLevel, ExecutionResult
+from .worker_pool import SecureWorkerPool
+from .output_capture import OutputCapture, ViolationScanner
 from .sandbox import PythonSandbox, SafeBuiltins
 from .filesystem import FileSystemSandbox, FileAccessError
 
@@ -70,6 +74,9 @@ __all__ = [
     "SecureExecutionEngine",
     "SecurityLevel",
     "ExecutionResult",
+    "SecureWorkerPool",
+    "OutputCapture",
+    "ViolationScanner",
     "PythonSandbox",
     "SafeBuiltins",
     "FileSystemSandbox",
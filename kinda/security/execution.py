@@ -21,12 +21,23 @@ import time
 import tempfile
 import subprocess
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Union, TYPE_CHECKING
 from pathlib import Path
 from dataclasses import dataclass
 
+from kinda.output import channel_stdout, flush_output
 from .sandbox import PythonSandbox
 from .filesystem import FileSystemSandbox, FileAccessError
+from .output_capture import (
+    DEFAULT_MAX_OUTPUT_BYTES,
+    OUTPUT_SCANNER,
+    OutputCapture,
+    OutputViolationAbort,
+    merged_violations,
+)
+
+if TYPE_CHECKING:
+    from .worker_pool import SecureWorkerPool
 
 
 class SecurityLevel(Enum):
@@ -56,6 +67,71 @@ class ExecutionResult:
         return len(self.security_violations) > 0 or len(self.blocked_operations) > 0
 
 
+def run_captured(
+    program_code: str,
+    secure_globals: Dict[str, Any],
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    abort_on_violation: bool = False,
+) -> Dict[str, Any]:
+    """
+    Execute code in the given globals, capturing stdout/stderr.
+
+    Output goes to bounded OutputCapture streams that scan for violations as
+    it is written; with abort_on_violation the program is stopped at the
+    first match. Shared by the in-process path and the worker pool so both
+    report exceptions and violations the same way.
+    """
+    security_violations: List[str] = []
+    stdout_capture = OutputCapture(max_output_bytes, abort_on_violation=abort_on_violation)
+    stderr_capture = OutputCapture(max_output_bytes, abort_on_violation=abort_on_violation)
+    old_stdout = sys.stdout
+    old_stderr = sys.stderr
+    sys.stdout = stdout_capture
+    sys.stderr = stderr_capture
+
+    try:
+        # Execute the code with restricted environment
+        with channel_stdout():
+            exec(program_code, secure_globals)
+            # Buffered runtime output belongs in this capture, not whatever comes next
+            flush_output()
+        return_code = 0
+
+    except OutputViolationAbort as e:
+        return_code = 1
+        stderr_capture.abort_on_violation = False
+        stderr_capture.write(f"\n[SECURITY] Execution aborted on output violation: {e.violation}")
+
+    except Exception as e:
+        return_code = 1
+        # Exception text is scanned like any other output, but never aborts
+        stderr_capture.abort_on_violation = False
+        stderr_capture.write(f"\n{type(e).__name__}: {e}")
+
+        # Check if it's a security-related exception
+        if "security" in str(e).lower() or "permission" in str(e).lower():
+            security_violations.append(f"runtime_security_error: {e}")
+
+    finally:
+        try:
+            flush_output()
+        except OutputViolationAbort:
+            # Already recorded by the capture's scan
+            pass
+        # Restore stdout/stderr
+        sys.stdout = old_stdout
+        sys.stderr = old_stderr
+
+    return {
+        "stdout": stdout_capture.getvalue(),
+        "stderr": stderr_capture.getvalue(),
+        "return_code": return_code,
+        "security_violations": security_violations,
+        "output_violations": merged_violations(stdout_capture, stderr_capture),
+        "truncated_bytes": stdout_capture.truncated_bytes + stderr_capture.truncated_bytes,
+    }
+
+
 class SecureExecutionEngine:
     """
     Main secure execution engine for kinda-lang programs.
@@ -65,14 +141,31 @@ class SecureExecutionEngine:
     2. Restricting Python imports to safe modules
     3. Monitoring resource usage and execution time
     4. Providing secure __builtins__ environment
+
+    Pass a SecureWorkerPool to run programs in prewarmed worker processes
+    under RLIMIT_AS/RLIMIT_CPU and a wall-clock watchdog instead of in the
+    calling process.
     """
 
-    def __init__(self, security_level: SecurityLevel = SecurityLevel.SAFE):
+    def __init__(
+        self,
+        security_level: SecurityLevel = SecurityLevel.SAFE,
+        worker_pool: Optional["SecureWorkerPool"] = None,
+    ):
+        if worker_pool is not None and worker_pool.security_level != security_level:
+            raise ValueError(
+                f"Worker pool was built for {worker_pool.security_level.value} execution, "
+                f"not {security_level.value}"
+            )
+
         self.security_level = security_level
         self.filesystem_sandbox = FileSystemSandbox()
         self.python_sandbox = PythonSandbox()
         self.max_execution_time = self._get_execution_timeout()
         self.max_memory_mb = self._get_memory_limit()
+        self.max_output_bytes = self._get_output_limit()
+        self.worker_pool = worker_pool
+        self._globals_template: Optional[Dict[str, Any]] = None
 
     def _get_execution_timeout(self) -> int:
         """Get execution timeout based on security level"""
@@ -92,6 +185,15 @@ class SecureExecutionEngine:
         }
         return limits.get(self.security_level, 128)
 
+    def _get_output_limit(self) -> int:
+        """Get per-stream captured output limit in bytes based on security level"""
+        limits = {
+            SecurityLevel.SAFE: DEFAULT_MAX_OUTPUT_BYTES,  # 1 MB
+            SecurityLevel.CAUTION: 4 * DEFAULT_MAX_OUTPUT_BYTES,  # 4 MB
+            SecurityLevel.RISKY: 16 * DEFAULT_MAX_OUTPUT_BYTES,  # 16 MB
+        }
+        return limits.get(self.security_level, DEFAULT_MAX_OUTPUT_BYTES)
+
     def execute_file(
         self, program_path: Path, working_directory: Optional[Path] = None
     ) -> ExecutionResult:
@@ -174,43 +276,33 @@ class SecureExecutionEngine:
                         resource_usage={},
                     )
 
-            # Execute with restricted imports and builtins
-            stdout_capture: List[str] = []
-            stderr_capture: List[str] = []
-
-            # Create secure execution environment
-            secure_globals = self._create_secure_globals(working_directory)
-
-            # Redirect stdout/stderr for capture
-            import io
-
-            old_stdout = sys.stdout
-            old_stderr = sys.stderr
-            sys.stdout = io.StringIO()
-            sys.stderr = io.StringIO()
-
-            try:
-                # Execute the code with restricted environment
-                exec(program_code, secure_globals)
-
-                # Capture output
-                stdout = sys.stdout.getvalue()
-                stderr = sys.stderr.getvalue()
-                return_code = 0
-
-            except Exception as e:
-                stdout = sys.stdout.getvalue()
-                stderr = sys.stderr.getvalue() + f"\n{type(e).__name__}: {e}"
-                return_code = 1
-
-                # Check if it's a security-related exception
-                if "security" in str(e).lower() or "permission" in str(e).lower():
-                    security_violations.append(f"runtime_security_error: {e}")
+            # Output violations fail SAFE runs anyway, so stop at the first one
+            abort_on_violation = self.security_level == SecurityLevel.SAFE
+
+            if self.worker_pool is not None:
+                # Run in a prewarmed worker process under OS resource limits
+                outcome = self.worker_pool.run(
+                    program_code,
+                    working_directory,
+                    timeout=self.max_execution_time,
+                    memory_mb=self.max_memory_mb,
+                    max_output_bytes=self.max_output_bytes,
+                    abort_on_violation=abort_on_violation,
+                )
+            else:
+                secure_globals = self._secure_globals_for(working_directory)
+                outcome = run_captured(
+                    program_code,
+                    secure_globals,
+                    max_output_bytes=self.max_output_bytes,
+                    abort_on_violation=abort_on_violation,
+                )
 
-            finally:
-                # Restore stdout/stderr
-                sys.stdout = old_stdout
-                sys.stderr = old_stderr
+            stdout = outcome["stdout"]
+            stderr = outcome["stderr"]
+            return_code = outcome["return_code"]
+            security_violations.extend(outcome["security_violations"])
+            worker_usage = outcome.get("resource_usage", {})
 
         except Exception as e:
             execution_time = time.time() - start_time
@@ -227,8 +319,11 @@ class SecureExecutionEngine:
 
         execution_time = time.time() - start_time
 
-        # Check for security violations in output
-        security_violations.extend(self._scan_output_for_violations(stdout, stderr))
+        # Check for security violations in output (already scanned while streaming)
+        if "output_violations" in outcome:
+            security_violations.extend(outcome["output_violations"])
+        else:
+            security_violations.extend(self._scan_output_for_violations(stdout, stderr))
 
         # Determine success based on return code and security violations
         success = return_code == 0 and (
@@ -247,6 +342,8 @@ class SecureExecutionEngine:
                 "execution_time": execution_time,
                 "memory_limit_mb": self.max_memory_mb,
                 "timeout_seconds": self.max_execution_time,
+                "output_truncated_bytes": outcome.get("truncated_bytes", 0),
+                **worker_usage,
             },
         )
 
@@ -285,42 +382,12 @@ class SecureExecutionEngine:
 
     def _scan_output_for_violations(self, stdout: str, stderr: str) -> List[str]:
         """Scan execution output for security violations"""
-        violations = []
-        combined_output = stdout + stderr
-
-        # Check for file system access violations
-        violation_patterns = [
-            "/etc/passwd",
-            "/etc/shadow",
-            "/root/",
-            "/home/",
-            "/var/",
-            "/usr/",
-            "/sys/",
-            "/proc/",
-            "/.ssh/",
-            "/tmp/",
-        ]
-
-        for pattern in violation_patterns:
-            if pattern in combined_output:
-                violations.append(f"filesystem_access:{pattern}")
-
-        # Check for dangerous module usage
-        dangerous_modules = [
-            "subprocess",
-            "os.system",
-            "os.popen",
-            "eval(",
-            "exec(",
-            "__import__",
-        ]
-
-        for module in dangerous_modules:
-            if module in combined_output:
-                violations.append(f"dangerous_module:{module}")
-
-        return violations
+        # Feed both streams through one scan so the result matches scanning
+        # their concatenation
+        scan = OUTPUT_SCANNER.start()
+        scan.feed(stdout)
+        scan.feed(stderr)
+        return scan.violations()
 
     def execute_code(self, code: str, working_directory: Optional[Path] = None) -> ExecutionResult:
         """
@@ -507,11 +574,31 @@ class SecureExecutionEngine:
 
         return {"safe": safe, "violations": violations, "blocked": blocked}
 
-    def _create_secure_globals(self, working_directory: Path) -> Dict[str, Any]:
-        """Create secure global environment for code execution"""
-        # Start with safe builtins
-        secure_globals = self.python_sandbox.safe_builtins.get_safe_builtins()
+    def _secure_globals_for(self, working_directory: Path) -> Dict[str, Any]:
+        """
+        Fresh secure globals for one execution.
 
+        The safe builtins are looked up once per engine. The os/sys shims, the
+        import hook that hands them out and the globals/builtins dicts are
+        rebuilt for every execution so programs can't leak state into later runs.
+        """
+        if self._globals_template is None:
+            self._globals_template = self._create_secure_globals(working_directory)
+
+        secure_globals = dict(self._globals_template)
+        secure_builtins = dict(self._globals_template["__builtins__"])
+
+        safe_modules = self._create_safe_modules()
+        secure_import = self._create_secure_import(safe_modules)
+        secure_globals.update(safe_modules)
+        secure_globals["__import__"] = secure_import
+        secure_builtins["__import__"] = secure_import
+        secure_globals["__builtins__"] = secure_builtins
+        secure_globals["__file__"] = str(Path(working_directory) / "__main__.py")
+        return secure_globals
+
+    def _create_safe_modules(self) -> Dict[str, Any]:
+        """Modules programs may import, with fresh os/sys shims"""
         # Add basic Python modules that are safe
         import math
         import random
@@ -580,11 +667,10 @@ class SecureExecutionEngine:
             safe_modules["pathlib"] = pathlib
 
         # Note: os and sys modules are now provided safely in all security levels above
+        return safe_modules
 
-        # Add available modules to globals
-        secure_globals.update(safe_modules)
-
-        # Override __import__ to control module imports
+    def _create_secure_import(self, safe_modules: Dict[str, Any]) -> Callable[..., Any]:
+        """__import__ replacement that hands out safe_modules and blocks dangerous ones"""
         original_import = (
             __builtins__.__import__ if hasattr(__builtins__, "__import__") else __import__
         )
@@ -599,6 +685,19 @@ class SecureExecutionEngine:
                 # Allow other imports normally
                 return original_import(name, globals, locals, fromlist, level)
 
+        return secure_import
+
+    def _create_secure_globals(self, working_directory: Path) -> Dict[str, Any]:
+        """Create secure global environment for code execution"""
+        # Start with safe builtins
+        secure_globals = self.python_sandbox.safe_builtins.get_safe_builtins()
+
+        # Add available modules to globals
+        safe_modules = self._create_safe_modules()
+        secure_globals.update(safe_modules)
+
+        # Override __import__ to control module imports
+        secure_import = self._create_secure_import(safe_modules)
         secure_globals["__import__"] = secure_import
 
         # Also need to create secure builtins
@@ -0,0 +1,284 @@
+# kinda/security/output_capture.py
+
+"""
+Bounded, incrementally scanned output capture for sandboxed execution.
+
+Sandboxed programs used to write into an unbounded io.StringIO whose full
+contents were concatenated and substring-searched once per violation pattern
+after the run. A program printing in a loop could exhaust memory before the
+scan even started.
+
+OutputCapture is a text stream that:
+- keeps at most a configurable number of bytes, split between the head and
+  the tail of the output (the middle is replaced by a truncation marker)
+- feeds every write through a single Aho-Corasick automaton built once from
+  the violation patterns, so matches are found as output is produced,
+  including matches that straddle two writes
+- can abort the program on the first violation instead of letting it run on
+"""
+
+import io
+import re
+from collections import deque
+from typing import Dict, List, Optional, Set
+
+# Output that suggests the program touched sensitive paths
+FILESYSTEM_VIOLATION_PATTERNS = [
+    "/etc/passwd",
+    "/etc/shadow",
+    "/root/",
+    "/home/",
+    "/var/",
+    "/usr/",
+    "/sys/",
+    "/proc/",
+    "/.ssh/",
+    "/tmp/",
+]
+
+# Output that suggests the program used dangerous modules or builtins
+DANGEROUS_MODULE_PATTERNS = [
+    "subprocess",
+    "os.system",
+    "os.popen",
+    "eval(",
+    "exec(",
+    "__import__",
+]
+
+# Default per-stream capture limit
+DEFAULT_MAX_OUTPUT_BYTES = 1024 * 1024
+
+
+class OutputViolationAbort(BaseException):
+    """
+    Raised from inside print()/write() to stop a program on a violation.
+
+    Derives from BaseException so a program's own ``except Exception``
+    can't swallow it.
+    """
+
+    def __init__(self, violation: str):
+        super().__init__(violation)
+        self.violation = violation
+
+
+class ViolationScanner:
+    """
+    Aho-Corasick automaton over a fixed set of patterns.
+
+    The automaton is compiled to a full transition table, so scanning costs
+    one dict lookup per character regardless of how many patterns there are.
+    Scanning state is kept per ScanState, letting several streams share one
+    automaton.
+
+    Args:
+        patterns: Mapping of pattern text to the violation it reports
+    """
+
+    def __init__(self, patterns: Dict[str, str]):
+        self.patterns = list(patterns)
+        self.labels = [patterns[pattern] for pattern in self.patterns]
+
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Set[int]] = [set()]
+        prefix_states: Dict[str, int] = {}
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for position, char in enumerate(pattern):
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append(set())
+                    goto[state][char] = len(goto) - 1
+                    prefix_states[pattern[: position + 1]] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state].add(index)
+
+        # Breadth-first construction of failure links, folded into a full
+        # transition table (a DFA) as we go
+        fail = [0] * len(goto)
+        transitions: List[Dict[str, int]] = [dict(goto[0])]
+        transitions.extend({} for _ in range(len(goto) - 1))
+        pending = deque(goto[0].values())
+        while pending:
+            state = pending.popleft()
+            transitions[state] = dict(transitions[fail[state]])
+            transitions[state].update(goto[state])
+            outputs[state] |= outputs[fail[state]]
+            for char, child in goto[state].items():
+                fail[child] = transitions[fail[state]].get(char, 0) if state else 0
+                pending.append(child)
+
+        self._transitions = transitions
+        self._outputs = [frozenset(found) for found in outputs]
+        # Text with no complete pattern in it only moves the automaton to the
+        # state of its longest suffix that is a pattern prefix. Both checks are
+        # done with regexes so ordinary output never hits the per-character loop.
+        self._prefilter = re.compile("|".join(re.escape(pattern) for pattern in self.patterns))
+        self._prefix_states = prefix_states
+        self._window = max((len(pattern) for pattern in self.patterns), default=1) - 1
+        self._suffix = re.compile(
+            "(?:" + "|".join(re.escape(prefix) for prefix in prefix_states) + r")\Z"
+        )
+
+    def start(self) -> "ScanState":
+        """Fresh scanning state for one stream."""
+        return ScanState(self)
+
+    def scan(self, text: str) -> List[str]:
+        """Violations found in a complete text, in pattern order."""
+        state = self.start()
+        state.feed(text)
+        return state.violations()
+
+
+class ScanState:
+    """Automaton position and matches for one stream."""
+
+    def __init__(self, scanner: ViolationScanner):
+        self.scanner = scanner
+        self.state = 0
+        self.found: Set[int] = set()
+
+    def feed(self, text: str) -> List[str]:
+        """Advance over text; returns violations not seen before, in pattern order."""
+        scanner = self.scanner
+        if len(self.found) == len(scanner.patterns):
+            return []
+
+        transitions = scanner._transitions
+        outputs = scanner._outputs
+        state = self.state
+        new: Set[int] = set()
+        position = 0
+        length = len(text)
+
+        while position < length:
+            if state == 0:
+                match = scanner._prefilter.search(text, position)
+                if match is None:
+                    # No match can start from here on: only the tail matters
+                    suffix = scanner._suffix.search(text, max(position, length - scanner._window))
+                    if suffix is not None:
+                        state = scanner._prefix_states[suffix.group()]
+                    break
+                # Nothing before the leftmost match can take part in one
+                position = match.start()
+            state = transitions[state].get(text[position], 0)
+            if outputs[state]:
+                new |= outputs[state] - self.found
+            position += 1
+
+        self.state = state
+        self.found |= new
+        return [scanner.labels[index] for index in sorted(new)]
+
+    def violations(self) -> List[str]:
+        """All violations found so far, in pattern order."""
+        return [self.scanner.labels[index] for index in sorted(self.found)]
+
+
+def _default_patterns() -> Dict[str, str]:
+    patterns = {
+        pattern: f"filesystem_access:{pattern}" for pattern in FILESYSTEM_VIOLATION_PATTERNS
+    }
+    patterns.update(
+        {pattern: f"dangerous_module:{pattern}" for pattern in DANGEROUS_MODULE_PATTERNS}
+    )
+    return patterns
+
+
+# Built once at import; shared by every capture stream
+OUTPUT_SCANNER = ViolationScanner(_default_patterns())
+
+
+class OutputCapture(io.TextIOBase):
+    """
+    Text stream that keeps a bounded head and tail and scans as it goes.
+
+    Args:
+        max_bytes: Bytes of UTF-8 output to retain; half is kept from the
+            start of the output and half from the end
+        scanner: Automaton to scan writes with (None disables scanning)
+        abort_on_violation: Raise OutputViolationAbort on the first match
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+        scanner: Optional[ViolationScanner] = OUTPUT_SCANNER,
+        abort_on_violation: bool = False,
+    ):
+        super().__init__()
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+
+        self.max_bytes = max_bytes
+        self._head_limit = max_bytes - max_bytes // 2
+        self._tail_limit = max_bytes // 2
+        self._head = bytearray()
+        self._tail = bytearray()
+        self.total_bytes = 0
+        self.scan_state = scanner.start() if scanner is not None else None
+        self.abort_on_violation = abort_on_violation
+
+    @property
+    def truncated_bytes(self) -> int:
+        """Bytes dropped from the middle of the output."""
+        return self.total_bytes - len(self._head) - len(self._tail)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if not isinstance(text, str):
+            raise TypeError(f"write() argument must be str, not {type(text).__name__}")
+
+        if self.scan_state is not None:
+            new_violations = self.scan_state.feed(text)
+            if new_violations and self.abort_on_violation:
+                self._store(text)
+                raise OutputViolationAbort(new_violations[0])
+
+        self._store(text)
+        return len(text)
+
+    def _store(self, text: str) -> None:
+        data = text.encode("utf-8", "surrogatepass")
+        self.total_bytes += len(data)
+
+        room = self._head_limit - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+        if not data or not self._tail_limit:
+            return
+
+        if len(data) >= self._tail_limit:
+            self._tail[:] = data[-self._tail_limit :]
+        else:
+            self._tail += data
+            excess = len(self._tail) - self._tail_limit
+            if excess > 0:
+                del self._tail[:excess]
+
+    def getvalue(self) -> str:
+        """Retained output, with a marker where the middle was dropped."""
+        head = self._head.decode("utf-8", "replace")
+        tail = self._tail.decode("utf-8", "replace")
+        if self.truncated_bytes:
+            return f"{head}\n[... {self.truncated_bytes} bytes of output truncated ...]\n{tail}"
+        return head + tail
+
+
+def merged_violations(*captures: OutputCapture) -> List[str]:
+    """Violations found by any of the captures, in pattern order."""
+    found: Set[int] = set()
+    scanner = None
+    for capture in captures:
+        if capture.scan_state is not None:
+            found |= capture.scan_state.found
+            scanner = capture.scan_state.scanner
+    if scanner is None:
+        return []
+    return [scanner.labels[index] for index in sorted(found)]
@@ -0,0 +1,379 @@
+# kinda/security/worker_pool.py
+
+"""
+Prewarmed, resource-limited worker processes for SecureExecutionEngine.
+
+Running programs in the calling process means there is no way to enforce a
+memory or CPU limit, and every run pays for setting up the secure globals.
+SecureWorkerPool keeps a few worker processes alive that have already
+imported the personality system, the fuzzy runtime and the safe modules, and
+built the secure globals once. Each job is executed in a fork of a worker
+(copy-on-write, so nothing a program does leaks into later jobs) with
+RLIMIT_AS and RLIMIT_CPU applied, while the worker acts as a wall-clock
+watchdog and kills the job when it overruns.
+
+Workers are started through multiprocessing's "forkserver" context where
+available so they come from a clean, single-threaded server process with
+the heavy modules preloaded. multiprocessing has a single forkserver per
+process, so creating a pool sets that server's preload list to
+PRELOAD_MODULES for everyone: other forkserver users in the same process
+get these modules preloaded, and a preload list they set before the
+server started is replaced. Pass start_method="spawn" to leave the
+forkserver alone. On platforms without fork() the job runs inside the
+worker itself and only the parent-side watchdog applies.
+
+Usage:
+    from kinda.security.execution import SecureExecutionEngine, SecurityLevel
+    from kinda.security.worker_pool import SecureWorkerPool
+
+    with SecureWorkerPool(size=2, security_level=SecurityLevel.SAFE) as pool:
+        engine = SecureExecutionEngine(SecurityLevel.SAFE, worker_pool=pool)
+        result = engine.execute_file(program_path)
+"""
+
+import math
+import multiprocessing
+import os
+import pickle
+import queue
+import select
+import signal
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .execution import SecureExecutionEngine, SecurityLevel, run_captured
+from .output_capture import DEFAULT_MAX_OUTPUT_BYTES
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    resource = None  # type: ignore[assignment]
+
+# Modules every worker imports before it accepts jobs
+PRELOAD_MODULES = [
+    "kinda.personality",
+    "kinda.langs.python.runtime.fuzzy",
+    "kinda.security.execution",
+    "math",
+    "random",
+    "json",
+    "datetime",
+]
+
+# Extra time the parent waits past the job timeout before declaring a worker hung
+WATCHDOG_GRACE_SECONDS = 5.0
+
+# Seconds a new worker gets to finish prewarming
+WORKER_STARTUP_TIMEOUT = 60.0
+
+
+def _current_address_space() -> Optional[int]:
+    """Virtual memory size of this process in bytes, if the platform reports it."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[0])
+        return pages * resource.getpagesize()
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _apply_resource_limits(memory_mb: int, timeout: float) -> None:
+    """
+    Limit the current process to memory_mb more address space and timeout CPU seconds.
+
+    The memory budget is added to what the prewarmed interpreter already
+    maps, so the limit measures what the program allocates rather than the
+    size of the imported runtime.
+    """
+    if resource is None:
+        return
+
+    baseline = _current_address_space()
+    if baseline is not None:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        soft = baseline + memory_mb * 1024 * 1024
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = max(1, math.ceil(timeout))
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _resource_usage() -> Dict[str, Any]:
+    """CPU time and peak memory of the current process."""
+    if resource is None:
+        return {}
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return {
+        "cpu_time_seconds": usage.ru_utime + usage.ru_stime,
+        # ru_maxrss is in kilobytes on Linux
+        "peak_memory_mb": usage.ru_maxrss / 1024,
+    }
+
+
+def _failure(message: str, violation: str) -> Dict[str, Any]:
+    """Outcome for a job that never produced a result of its own."""
+    return {
+        "stdout": "",
+        "stderr": message,
+        "return_code": 1,
+        "security_violations": [violation],
+    }
+
+
+def _read_until_eof(fd: int, deadline: float) -> Optional[bytes]:
+    """Read a pipe to EOF; None if the deadline passes first."""
+    chunks: List[bytes] = []
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            return None
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def _run_forked(
+    engine: SecureExecutionEngine, job: Dict[str, Any], memory_mb: int, timeout: float
+) -> Dict[str, Any]:
+    """Run one job in a forked child of the worker under resource limits."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:  # pragma: no cover - runs in the forked child
+        os.close(read_fd)
+        try:
+            _apply_resource_limits(memory_mb, timeout)
+            outcome = run_captured(
+                job["code"],
+                engine._secure_globals_for(Path(job["working_directory"])),
+                max_output_bytes=job["max_output_bytes"],
+                abort_on_violation=job["abort_on_violation"],
+            )
+            outcome["resource_usage"] = _resource_usage()
+            payload = pickle.dumps(outcome)
+        except BaseException as e:
+            payload = pickle.dumps(_failure(f"{type(e).__name__}: {e}", "worker_execution_error"))
+        view = memoryview(payload)
+        while view:
+            written = os.write(write_fd, view)
+            view = view[written:]
+        os._exit(0)
+
+    os.close(write_fd)
+    try:
+        data = _read_until_eof(read_fd, time.monotonic() + timeout)
+    finally:
+        os.close(read_fd)
+
+    if data is None:
+        # Wall-clock watchdog: the job overran its timeout
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        return _failure(f"Execution timed out after {timeout} seconds", "execution_timeout")
+
+    _, status = os.waitpid(pid, 0)
+    if data:
+        return pickle.loads(data)
+
+    if os.WIFSIGNALED(status) and os.WTERMSIG(status) == getattr(signal, "SIGXCPU", None):
+        return _failure(f"CPU time limit of {timeout} seconds exceeded", "cpu_time_limit_exceeded")
+    return _failure("Execution terminated without a result", "worker_crashed")
+
+
+def _worker_main(conn, security_level_value: str) -> None:  # pragma: no cover - subprocess
+    """Worker loop: prewarm once, then run jobs until told to stop."""
+    import importlib
+
+    for module_name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+    engine = SecureExecutionEngine(SecurityLevel(security_level_value))
+    # Build the secure globals template once; jobs only copy it
+    engine._secure_globals_for(Path.cwd())
+    conn.send("ready")
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+
+        if hasattr(os, "fork"):
+            outcome = _run_forked(engine, job, job["memory_mb"], job["timeout"])
+        else:
+            outcome = run_captured(
+                job["code"],
+                engine._secure_globals_for(Path(job["working_directory"])),
+                max_output_bytes=job["max_output_bytes"],
+                abort_on_violation=job["abort_on_violation"],
+            )
+        conn.send(outcome)
+
+
+class _Worker:
+    """A worker process and the parent's end of its pipe."""
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+
+    def stop(self, force: bool = False) -> None:
+        if not force:
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                force = True
+        if force:
+            self.process.kill()
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class SecureWorkerPool:
+    """
+    Pool of prewarmed processes that run programs under OS resource limits.
+
+    Args:
+        size: Number of worker processes
+        security_level: Security level the workers' secure globals are built for
+        start_method: multiprocessing start method; defaults to "forkserver"
+            when the platform supports it, otherwise "spawn". The forkserver
+            preload list is process-wide (see the module docstring).
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        security_level: SecurityLevel = SecurityLevel.SAFE,
+        start_method: Optional[str] = None,
+    ):
+        if size < 1:
+            raise ValueError("Worker pool size must be at least 1")
+
+        if start_method is None:
+            available = multiprocessing.get_all_start_methods()
+            start_method = "forkserver" if "forkserver" in available else "spawn"
+
+        self.size = size
+        self.security_level = security_level
+        self._context = multiprocessing.get_context(start_method)
+        if start_method == "forkserver":
+            # Process-wide: replaces the preload list of the one shared
+            # forkserver, and only takes effect if it hasn't started yet
+            self._context.set_forkserver_preload(PRELOAD_MODULES)
+
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._workers: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        for _ in range(size):
+            self._idle.put(self._start_worker())
+
+    def _start_worker(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.security_level.value),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+
+        worker = _Worker(process, parent_conn)
+        if not parent_conn.poll(WORKER_STARTUP_TIMEOUT) or parent_conn.recv() != "ready":
+            worker.stop(force=True)
+            raise RuntimeError("Secure worker failed to start")
+
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _replace_worker(self, worker: _Worker) -> None:
+        """Kill a misbehaving worker and put a fresh one in its place."""
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        worker.stop(force=True)
+        if not self._closed:
+            self._idle.put(self._start_worker())
+
+    def run(
+        self,
+        code: str,
+        working_directory: Path,
+        timeout: float = 30.0,
+        memory_mb: int = 128,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+        abort_on_violation: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Execute code in a worker.
+
+        Returns a dict with stdout, stderr, return_code, security_violations
+        and resource_usage, matching what run_captured() reports in-process.
+        """
+        if self._closed:
+            raise RuntimeError("Worker pool is closed")
+
+        dispatch_start = time.perf_counter()
+        worker = self._idle.get()
+        job = {
+            "code": code,
+            "working_directory": str(working_directory),
+            "timeout": timeout,
+            "memory_mb": memory_mb,
+            "max_output_bytes": max_output_bytes,
+            "abort_on_violation": abort_on_violation,
+        }
+
+        try:
+            worker.conn.send(job)
+            if not worker.conn.poll(timeout + WATCHDOG_GRACE_SECONDS):
+                self._replace_worker(worker)
+                return _failure(f"Execution timed out after {timeout} seconds", "execution_timeout")
+            outcome = worker.conn.recv()
+        except (EOFError, OSError):
+            self._replace_worker(worker)
+            return _failure("Secure worker exited unexpectedly", "worker_crashed")
+
+        self._idle.put(worker)
+        usage = dict(outcome.get("resource_usage", {}))
+        usage["isolation"] = "worker_pool"
+        usage["round_trip_seconds"] = time.perf_counter() - dispatch_start
+        outcome["resource_usage"] = usage
+        return outcome
+
+    def close(self) -> None:
+        """Stop all workers."""
+        self._closed = True
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def __enter__(self) -> "SecureWorkerPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -7,7 +7,7 @@ language constructs.
 
 from .environment import EnvironmentDetector, EnvironmentContext, CIEnvironment, PlatformProfile
 from .thresholds import ThresholdManager, PerformanceBaseline
-from .dependencies import DependencyResolver
+from .dependencies import DependencyResolver, OverheadSimulator
 from .statistics import StatisticalValidator
 from .pytest_plugin import PerformanceTestFramework
 
@@ -18,6 +18,8 @@ from .confidence import (
     ConfidenceMethod,
     wilson_score_interval,
     bootstrap_confidence_interval,
+    bootstrap_distribution,
+    binomial_test_p_value,
     StatisticalFrameworkError,
     ConfidenceIntervalError,
     InsufficientDataError,
@@ -26,10 +28,13 @@ from .assertions import (
     StatisticalTester,
     StatisticalValidationError,
     StatisticalConfig,
+    SequentialProbabilityRatioTest,
+    SequentialTestResult,
     statistical_assert,
     binomial_assert,
     proportion_assert,
     eventually_assert,
+    sequential_assert,
 )
 from .distributions import (
     DistributionTester,
@@ -49,6 +54,7 @@ __all__ = [
     "ThresholdManager",
     "PerformanceBaseline",
     "DependencyResolver",
+    "OverheadSimulator",
     "StatisticalValidator",
     "PerformanceTestFramework",
     # Statistical Testing Framework - Confidence Intervals
@@ -57,6 +63,8 @@ __all__ = [
     "ConfidenceMethod",
     "wilson_score_interval",
     "bootstrap_confidence_interval",
+    "bootstrap_distribution",
+    "binomial_test_p_value",
     "StatisticalFrameworkError",
     "ConfidenceIntervalError",
     "InsufficientDataError",
@@ -64,10 +72,13 @@ __all__ = [
     "StatisticalTester",
     "StatisticalValidationError",
     "StatisticalConfig",
+    "SequentialProbabilityRatioTest",
+    "SequentialTestResult",
     "statistical_assert",
     "binomial_assert",
     "proportion_assert",
     "eventually_assert",
+    "sequential_assert",
     # Statistical Testing Framework - Distributions
     "DistributionTester",
     "DistributionTestResult",
@@ -5,8 +5,9 @@ This module provides user-friendly statistical assertion functions that
 integrate with the confidence interval framework and pytest.
 """
 
-from typing import Union, Optional, Dict, Any, Callable
+from typing import Union, Optional, Dict, Any, Callable, List
 from dataclasses import dataclass
+import math
 import warnings
 
 from .confidence import (
@@ -15,6 +16,7 @@ from .confidence import (
     ConfidenceMethod,
     wilson_score_interval,
     bootstrap_confidence_interval,
+    binomial_test_p_value,
     StatisticalFrameworkError,
 )
 
@@ -65,6 +67,99 @@ class StatisticalConfig:
     ci_environment_adjustment: float = 0.02  # More lenient in CI
     max_sample_size: int = 10000
     min_sample_size: int = 10
+    sequential_tolerance: float = 0.1  # Half-width of the acceptable band for SPRT
+
+
+@dataclass
+class SequentialTestResult:
+    """Outcome of a sequential probability ratio test."""
+
+    passed: bool
+    decision: str  # "accept", "reject" or "truncated"
+    samples_used: int
+    successes: int
+    observed: float
+
+    def __bool__(self) -> bool:
+        return self.passed
+
+
+class SequentialProbabilityRatioTest:
+    """
+    Wald's sequential probability ratio test for a proportion within a tolerance band.
+
+    Each edge of ``expected_p ± tolerance`` that lies inside (0, 1) gets its own
+    one-sided SPRT between a rate just inside the band (accept) and one just
+    outside it (reject), so a rate exactly on the edge is a coin flip, as with
+    the fixed-sample ``|observed - expected| <= tolerance`` rule. The test rejects
+    as soon as either side rejects and accepts once every side has accepted.
+    ``alpha`` is split across the sides.
+    """
+
+    def __init__(
+        self, expected_p: float, tolerance: float, alpha: float = 0.05, beta: float = 0.05
+    ):
+        if not 0 <= expected_p <= 1:
+            raise ValueError(f"expected_p must be in [0, 1], got {expected_p}")
+        if tolerance <= 0:
+            raise ValueError(f"tolerance must be positive, got {tolerance}")
+        if not (0 < alpha < 1 and 0 < beta < 1):
+            raise ValueError("alpha and beta must be in (0, 1)")
+
+        self.expected_p = expected_p
+        self.tolerance = tolerance
+        self.successes = 0
+        self.samples_used = 0
+        self.decision: Optional[str] = None
+
+        # [log-ratio per success, log-ratio per failure, running log-likelihood ratio]
+        self._sides: List[List[float]] = []
+        for edge, direction in ((expected_p + tolerance, 1), (expected_p - tolerance, -1)):
+            if not 0 < edge < 1:
+                continue  # No rate can lie beyond this edge
+            half_width = min(tolerance / 2, edge / 2, (1 - edge) / 2)
+            p_accept = edge - direction * half_width
+            p_reject = edge + direction * half_width
+            self._sides.append(
+                [
+                    math.log(p_reject / p_accept),
+                    math.log((1 - p_reject) / (1 - p_accept)),
+                    0.0,
+                ]
+            )
+
+        side_alpha = alpha / max(1, len(self._sides))
+        self._reject_bound = math.log((1 - beta) / side_alpha)
+        self._accept_bound = math.log(beta / (1 - side_alpha))
+
+    @property
+    def observed(self) -> float:
+        """Observed success rate so far."""
+        return self.successes / self.samples_used if self.samples_used else 0.0
+
+    def update(self, success: bool) -> Optional[str]:
+        """Record one trial; returns "accept" or "reject" once decided, else None."""
+        if self.decision is not None:
+            return self.decision
+
+        self.samples_used += 1
+        if success:
+            self.successes += 1
+
+        undecided = False
+        for side in self._sides:
+            if side[2] <= self._accept_bound:
+                continue  # This side has already accepted
+            side[2] += side[0] if success else side[1]
+            if side[2] >= self._reject_bound:
+                self.decision = "reject"
+                return self.decision
+            if side[2] > self._accept_bound:
+                undecided = True
+
+        if not undecided:
+            self.decision = "accept"
+        return self.decision
 
 
 class StatisticalTester:
@@ -227,30 +322,84 @@ class StatisticalTester:
             context=f"eventually_assert: {context}" if context else "eventually_assert",
         )
 
-    def _calculate_p_value(self, successes: int, trials: int, expected_p: float) -> float:
-        """Calculate two-tailed p-value for binomial test."""
-        if trials == 0:
-            return 1.0
-
-        observed_p = successes / trials
+    def sequential_assert(
+        self,
+        trial_function: Callable[[], bool],
+        expected_p: float,
+        tolerance: Optional[float] = None,
+        confidence: Optional[float] = None,
+        power: Optional[float] = None,
+        max_samples: Optional[int] = None,
+        context: Optional[str] = None,
+    ) -> SequentialTestResult:
+        """
+        Validate a success rate by sampling only until the outcome is decided.
 
-        # Two-tailed test: calculate probability of observing this extreme or more extreme
-        # This is a simplified calculation - would use scipy.stats.binom_test in practice
+        Runs ``trial_function`` one trial at a time through a
+        SequentialProbabilityRatioTest and stops as soon as it accepts or
+        rejects. If ``max_samples`` is reached first, the fixed-sample tolerance
+        rule decides.
 
-        from math import comb
+        Args:
+            trial_function: Function that returns True/False for one trial
+            expected_p: Expected success probability
+            tolerance: Acceptable distance from expected_p (defaults to config)
+            confidence: 1 - false rejection rate (defaults to config)
+            power: 1 - false acceptance rate (defaults to confidence)
+            max_samples: Trial budget (defaults to config max_sample_size)
+            context: Description for error messages
 
-        # Calculate exact binomial probabilities
-        extreme_prob = 0.0
+        Returns:
+            SequentialTestResult, including the number of samples actually used
 
-        for k in range(trials + 1):
-            k_prob = comb(trials, k) * (expected_p**k) * ((1 - expected_p) ** (trials - k))
-            k_p = k / trials
+        Raises:
+            StatisticalValidationError: If validation fails
+        """
+        confidence = confidence or self.config.default_confidence
+        if self._is_ci_environment:
+            confidence = max(0.9, confidence - self.config.ci_environment_adjustment)
+        power = power or confidence
+        tolerance = tolerance or self.config.sequential_tolerance
+        max_samples = max_samples or self.config.max_sample_size
 
-            # Include if as extreme or more extreme than observed
-            if abs(k_p - expected_p) >= abs(observed_p - expected_p):
-                extreme_prob += k_prob
+        sprt = SequentialProbabilityRatioTest(expected_p, tolerance, 1 - confidence, 1 - power)
+        while sprt.samples_used < max_samples and sprt.decision is None:
+            try:
+                success = bool(trial_function())
+            except Exception:
+                # Failed trials don't count as successes
+                success = False
+            sprt.update(success)
+
+        observed = sprt.observed
+        if sprt.decision is None:
+            decision = "truncated"
+            passed = abs(observed - expected_p) <= tolerance
+        else:
+            decision = sprt.decision
+            passed = decision == "accept"
+
+        if not passed:
+            ci = self.calculator.calculate_interval(
+                sprt.successes, sprt.samples_used, confidence, ConfidenceMethod.WILSON
+            )
+            p_value = self._calculate_p_value(sprt.successes, sprt.samples_used, expected_p)
+            label = f"sequential_assert ({decision} after {sprt.samples_used} samples)"
+            raise StatisticalValidationError(
+                observed, expected_p, ci, p_value, f"{label}: {context}" if context else label
+            )
+
+        return SequentialTestResult(
+            passed=passed,
+            decision=decision,
+            samples_used=sprt.samples_used,
+            successes=sprt.successes,
+            observed=observed,
+        )
 
-        return min(1.0, extreme_prob)
+    def _calculate_p_value(self, successes: int, trials: int, expected_p: float) -> float:
+        """Calculate two-tailed p-value for binomial test."""
+        return binomial_test_p_value(successes, trials, expected_p)
 
     def _detect_ci_environment(self) -> bool:
         """Detect if running in CI environment."""
@@ -311,6 +460,21 @@ def proportion_assert(
     return _default_tester.proportion_assert(count, total, expected_rate, confidence, context)
 
 
+def sequential_assert(
+    trial_function: Callable[[], bool],
+    expected_p: float,
+    tolerance: Optional[float] = None,
+    confidence: float = 0.95,
+    power: Optional[float] = None,
+    max_samples: Optional[int] = None,
+    context: Optional[str] = None,
+) -> SequentialTestResult:
+    """Global sequential (SPRT) assertion function."""
+    return _default_tester.sequential_assert(
+        trial_function, expected_p, tolerance, confidence, power, max_samples, context
+    )
+
+
 def eventually_assert(
     test_function: Callable[[], bool],
     expected_success_rate: float = 0.5,
@@ -7,11 +7,17 @@ for various statistical scenarios in probabilistic programming testing.
 
 import math
 import statistics
-from typing import Tuple, List, Optional, Union
+from typing import Tuple, List, Optional, Sequence, Union
 from dataclasses import dataclass
 from enum import Enum
 import numpy as np
 
+# Default seed for bootstrap resampling so intervals are reproducible
+DEFAULT_BOOTSTRAP_SEED = 42
+
+# Upper bound on resample matrix size (elements) materialized at once
+_BOOTSTRAP_BLOCK_ELEMENTS = 1 << 22
+
 
 class ConfidenceMethod(Enum):
     """Available confidence interval calculation methods."""
@@ -65,11 +71,59 @@ class InsufficientDataError(StatisticalFrameworkError):
     pass
 
 
+def bootstrap_distribution(
+    samples: Union[Sequence[float], np.ndarray],
+    n_bootstrap: int,
+    statistic: str = "median",
+    seed: Optional[int] = DEFAULT_BOOTSTRAP_SEED,
+) -> np.ndarray:
+    """
+    Vectorized bootstrap distribution of a sample statistic.
+
+    Draws an (n_bootstrap, n) index matrix from a seeded Generator and reduces
+    each row with a single NumPy call. Large problems are processed in row
+    blocks so memory stays bounded.
+
+    Args:
+        samples: Observed samples
+        n_bootstrap: Number of bootstrap resamples
+        statistic: "mean", "median" or "std"
+        seed: Seed for the resampling Generator (None for fresh entropy)
+
+    Returns:
+        Array of n_bootstrap statistic values
+    """
+    reducers = {
+        "mean": lambda m: np.mean(m, axis=1),
+        "median": lambda m: np.median(m, axis=1),
+        "std": lambda m: np.std(m, axis=1, ddof=1) if m.shape[1] > 1 else np.zeros(len(m)),
+    }
+    if statistic not in reducers:
+        raise ValueError(f"Unknown statistic: {statistic}")
+
+    data = np.asarray(samples, dtype=float)
+    n = len(data)
+    if n == 0:
+        raise ValueError("Empty sample list")
+
+    rng = np.random.default_rng(seed)
+    reduce = reducers[statistic]
+    rows_per_block = max(1, _BOOTSTRAP_BLOCK_ELEMENTS // n)
+
+    results = np.empty(n_bootstrap, dtype=float)
+    for start in range(0, n_bootstrap, rows_per_block):
+        stop = min(n_bootstrap, start + rows_per_block)
+        indices = rng.integers(0, n, size=(stop - start, n))
+        results[start:stop] = reduce(data[indices])
+    return results
+
+
 class ConfidenceCalculator:
     """Core confidence interval calculation engine."""
 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = DEFAULT_BOOTSTRAP_SEED):
         self._z_score_cache = self._build_z_score_cache()
+        self.seed = seed
 
     def calculate_interval(
         self,
@@ -220,29 +274,23 @@ class ConfidenceCalculator:
         if trials == 0:
             return ConfidenceInterval(0.0, 1.0, confidence, ConfidenceMethod.BOOTSTRAP, 0, 0.0)
 
-        # Generate bootstrap samples
+        # Generate all bootstrap resamples with a single draw
         n_bootstrap = min(10000, max(1000, trials * 10))
-        bootstrap_proportions = []
-
         p_original = successes / trials
 
-        for _ in range(n_bootstrap):
-            # Bootstrap resample
-            bootstrap_successes = np.random.binomial(trials, p_original)
-            bootstrap_p = bootstrap_successes / trials
-            bootstrap_proportions.append(bootstrap_p)
+        rng = np.random.default_rng(self.seed)
+        bootstrap_proportions = rng.binomial(trials, p_original, size=n_bootstrap) / trials
 
         # Calculate percentiles
         alpha = 1 - confidence
         lower_percentile = (alpha / 2) * 100
         upper_percentile = (1 - alpha / 2) * 100
 
-        lower = np.percentile(bootstrap_proportions, lower_percentile)
-        upper = np.percentile(bootstrap_proportions, upper_percentile)
+        lower, upper = np.percentile(bootstrap_proportions, [lower_percentile, upper_percentile])
 
         return ConfidenceInterval(
-            lower=lower,
-            upper=upper,
+            lower=float(lower),
+            upper=float(upper),
             confidence=confidence,
             method=ConfidenceMethod.BOOTSTRAP,
             sample_size=trials,
@@ -345,32 +393,20 @@ def wilson_score_interval(
 
 
 def bootstrap_confidence_interval(
-    samples: List[float], confidence: float = 0.95, statistic: str = "mean"
+    samples: List[float],
+    confidence: float = 0.95,
+    statistic: str = "mean",
+    seed: Optional[int] = DEFAULT_BOOTSTRAP_SEED,
 ) -> ConfidenceInterval:
     """Calculate bootstrap confidence interval for arbitrary statistic."""
     if not samples:
         raise ValueError("Empty sample list")
 
     n_bootstrap = min(10000, max(1000, len(samples) * 10))
-    bootstrap_stats = []
-
-    for _ in range(n_bootstrap):
-        bootstrap_sample = np.random.choice(samples, size=len(samples), replace=True)
-        # Convert numpy array to native Python types for statistics module compatibility
-        bootstrap_sample = [float(x) for x in bootstrap_sample]
-        if statistic == "mean":
-            stat = statistics.mean(bootstrap_sample)
-        elif statistic == "median":
-            stat = statistics.median(bootstrap_sample)
-        elif statistic == "std":
-            stat = statistics.stdev(bootstrap_sample) if len(bootstrap_sample) > 1 else 0
-        else:
-            raise ValueError(f"Unknown statistic: {statistic}")
-        bootstrap_stats.append(stat)
+    bootstrap_stats = bootstrap_distribution(samples, n_bootstrap, statistic, seed)
 
     alpha = 1 - confidence
-    lower = np.percentile(bootstrap_stats, (alpha / 2) * 100)
-    upper = np.percentile(bootstrap_stats, (1 - alpha / 2) * 100)
+    lower, upper = np.percentile(bootstrap_stats, [(alpha / 2) * 100, (1 - alpha / 2) * 100])
 
     if statistic == "mean":
         point_est = statistics.mean(samples)
@@ -380,10 +416,106 @@ def bootstrap_confidence_interval(
         point_est = statistics.stdev(samples) if len(samples) > 1 else 0
 
     return ConfidenceInterval(
-        lower=lower,
-        upper=upper,
+        lower=float(lower),
+        upper=float(upper),
         confidence=confidence,
         method=ConfidenceMethod.BOOTSTRAP,
         sample_size=len(samples),
         point_estimate=point_est,
     )
+
+
+def _binomial_log_pmf(k: int, trials: int, log_p: float, log_q: float) -> float:
+    """Log of the binomial probability mass at k."""
+    return (
+        math.lgamma(trials + 1)
+        - math.lgamma(k + 1)
+        - math.lgamma(trials - k + 1)
+        + k * log_p
+        + (trials - k) * log_q
+    )
+
+
+def _binomial_tail_sum(
+    start: int, stop: int, step: int, trials: int, p: float, log_p: float, log_q: float
+) -> float:
+    """
+    Sum the binomial mass from start towards stop (inclusive), walking away from the mode.
+
+    The sum is anchored at the log-mass of the first term and extended with the
+    pmf ratio recurrence, stopping once the remaining terms can no longer move
+    the total. Beyond the region near the mode the terms decay geometrically, so
+    only O(sqrt(trials)) terms are ever visited.
+    """
+    log_first = _binomial_log_pmf(start, trials, log_p, log_q)
+    odds = p / (1 - p)
+
+    relative_total = 0.0
+    term = 1.0
+    k = start
+    while True:
+        relative_total += term
+        if k == stop or term < relative_total * 1e-17:
+            break
+        if step > 0:
+            term *= (trials - k) / (k + 1) * odds
+        else:
+            term *= k / (trials - k + 1) / odds
+        k += step
+
+    return math.exp(log_first + math.log(relative_total))
+
+
+def binomial_test_p_value(successes: int, trials: int, expected_p: float) -> float:
+    """
+    Exact two-tailed binomial test p-value, computed in log space.
+
+    Sums the probability of every outcome at least as far from the expected
+    count as the observed one. Terms are evaluated with log-gamma rather than
+    big-integer ``comb``, and only the O(sqrt(trials)) terms that contribute
+    to the result are visited, so this stays fast and finite for millions of
+    trials.
+    """
+    if trials <= 0:
+        return 1.0
+    if expected_p <= 0.0:
+        return 1.0 if successes <= 0 else 0.0
+    if expected_p >= 1.0:
+        return 1.0 if successes >= trials else 0.0
+
+    mean = trials * expected_p
+    std = math.sqrt(mean * (1 - expected_p))
+    deviation = abs(successes - mean)
+    eps = 1e-9 * max(1.0, mean)
+
+    # Outcomes k <= lower or k >= upper are at least as extreme as observed
+    if successes <= mean:
+        lower = successes
+        upper = math.ceil(mean + deviation - eps)
+    else:
+        lower = math.floor(mean - deviation + eps)
+        upper = successes
+
+    if upper - lower <= 1:
+        return 1.0
+
+    log_p = math.log(expected_p)
+    log_q = math.log1p(-expected_p)
+
+    if deviation <= 3 * std:
+        # Close to the mean: the central band is short, and its complement is
+        # not small enough for cancellation to matter
+        start = max(lower + 1, 0)
+        stop = min(upper - 1, trials)
+        central = sum(
+            math.exp(_binomial_log_pmf(k, trials, log_p, log_q)) for k in range(start, stop + 1)
+        )
+        return min(1.0, max(0.0, 1.0 - central))
+
+    p_value = 0.0
+    if lower >= 0:
+        p_value += _binomial_tail_sum(lower, 0, -1, trials, expected_p, log_p, log_q)
+    if upper <= trials:
+        p_value += _binomial_tail_sum(upper, trials, 1, trials, expected_p, log_p, log_q)
+
+    return min(1.0, p_value)
@@ -2,18 +2,89 @@
 
 import importlib
 import inspect
+import statistics
 import time
 from typing import Any, Callable, Dict, Optional
 from unittest.mock import MagicMock
 from functools import wraps
 
+# Module holding the generated runtime, which also carries the composed ~ish functions
+RUNTIME_MODULE = "kinda.langs.python.runtime.fuzzy"
+
+
+class OverheadSimulator:
+    """
+    Opt-in, calibrated model of per-call overhead for fallback functions.
+
+    Fallbacks run at native speed by default. When a performance test needs a
+    fallback to cost as much as the implementation it stands in for, attach a
+    simulator to the DependencyResolver: each call then busy-waits on
+    ``perf_counter_ns`` for the modelled overhead, which (unlike
+    ``time.sleep``) is accurate at microsecond scale.
+    """
+
+    def __init__(self, per_call_seconds: float):
+        if per_call_seconds < 0:
+            raise ValueError("per_call_seconds must be non-negative")
+        self.per_call_seconds = per_call_seconds
+        self._per_call_ns = int(per_call_seconds * 1e9)
+        self._timer_cost_ns = self._calibrate_timer_cost()
+
+    @staticmethod
+    def _calibrate_timer_cost(runs: int = 1000) -> int:
+        """Median cost of one perf_counter_ns() call."""
+        clock = time.perf_counter_ns
+        costs = []
+        for _ in range(runs):
+            start = clock()
+            clock()
+            costs.append(clock() - start)
+        return int(statistics.median(costs)) // 2
+
+    @classmethod
+    def calibrated(
+        cls, reference: Callable, baseline: Callable, *args: Any, runs: int = 200
+    ) -> "OverheadSimulator":
+        """
+        Model the median extra cost of ``reference(*args)`` over ``baseline(*args)``.
+
+        Useful for making a fallback cost what the real implementation costs on
+        a machine where that implementation is available.
+        """
+
+        def median_ns(func: Callable) -> float:
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter_ns()
+                func(*args)
+                timings.append(time.perf_counter_ns() - start)
+            return statistics.median(timings)
+
+        return cls(max(0.0, median_ns(reference) - median_ns(baseline)) / 1e9)
+
+    def __call__(self) -> None:
+        """Spend the modelled overhead."""
+        if self._per_call_ns <= self._timer_cost_ns:
+            return
+        clock = time.perf_counter_ns
+        deadline = clock() + self._per_call_ns - self._timer_cost_ns
+        while clock() < deadline:
+            pass
+
 
 class DependencyResolver:
     """Resolves missing dependencies for performance tests."""
 
-    def __init__(self):
+    def __init__(self, overhead_simulator: Optional[OverheadSimulator] = None):
         self._fallback_implementations: Dict[str, Callable] = {}
         self._module_cache: Dict[str, Optional[Any]] = {}
+        self.overhead_simulator = overhead_simulator
+
+    def set_overhead_simulator(self, overhead_simulator: Optional[OverheadSimulator]) -> None:
+        """Attach (or with None, remove) the overhead model used by fallbacks."""
+        self.overhead_simulator = overhead_simulator
+        # Fallbacks bake the hook in when they are built
+        self._fallback_implementations.clear()
 
     def resolve_module(self, module_path: str) -> Optional[Any]:
         """Resolve module with caching."""
@@ -80,50 +151,57 @@ class DependencyResolver:
         self._fallback_implementations[fallback_key] = fallback
         return fallback
 
-    def _create_ish_comparison_fallback(self) -> Callable:
-        """Create fallback for ish_comparison_composed that maintains performance characteristics."""
-        try:
-            from kinda.langs.python.runtime.fuzzy import ish_comparison
-        except ImportError:
-            # Fallback if even the base function is missing
-            def ish_comparison(a, b):
-                """Minimal ish comparison fallback."""
-                return abs(a - b) < (0.1 * max(abs(a), abs(b), 1.0))
+    def _resolve_runtime_function(self, function_name: str) -> Optional[Callable]:
+        """Find a function in the generated kinda runtime, if it is available."""
+        runtime = self.resolve_module(RUNTIME_MODULE)
+        return getattr(runtime, function_name, None) if runtime is not None else None
 
-        @wraps(ish_comparison)
-        def ish_comparison_composed_fallback(*args, **kwargs):
-            # Add realistic overhead to simulate composition framework
-            # This ensures performance tests exercise realistic overhead patterns
-            start = time.perf_counter()
+    def _make_fallback(self, implementation: Callable, function_name: str) -> Callable:
+        """Wrap an implementation as a marked fallback, adding modelled overhead if opted in."""
+        simulate_overhead = self.overhead_simulator
 
-            # Simulate composition framework overhead
-            # Based on typical framework overhead analysis: ~10-50μs
-            self._simulate_composition_overhead()
+        if simulate_overhead is None:
 
-            # Call the original function
-            result = ish_comparison(*args, **kwargs)
+            @wraps(implementation)
+            def fallback(*args, **kwargs):
+                return implementation(*args, **kwargs)
 
-            # Ensure minimum realistic overhead for performance testing
-            elapsed = time.perf_counter() - start
-            min_overhead = 1e-5  # 10μs minimum overhead
-            if elapsed < min_overhead:
-                time.sleep(min_overhead - elapsed)
+        else:
 
-            return result
+            @wraps(implementation)
+            def fallback(*args, **kwargs):
+                simulate_overhead()
+                return implementation(*args, **kwargs)
 
         # Add metadata to identify as fallback
-        ish_comparison_composed_fallback._is_fallback = True
-        ish_comparison_composed_fallback._fallback_for = "ish_comparison_composed"
+        fallback._is_fallback = True
+        fallback._fallback_for = function_name
 
-        return ish_comparison_composed_fallback
+        return fallback
+
+    def _create_ish_comparison_fallback(self) -> Callable:
+        """Create fallback for ish_comparison_composed using the best available implementation."""
+        implementation = self._resolve_runtime_function(
+            "ish_comparison_composed"
+        ) or self._resolve_runtime_function("ish_comparison")
+
+        if implementation is None:
+            # Fallback if even the base function is missing
+            def implementation(a, b, tolerance_base=None):
+                """Minimal ish comparison fallback."""
+                return abs(a - b) < (0.1 * max(abs(a), abs(b), 1.0))
+
+        return self._make_fallback(implementation, "ish_comparison_composed")
 
     def _create_ish_value_fallback(self) -> Callable:
-        """Create fallback for ish_value_composed that maintains performance characteristics."""
-        try:
-            from kinda.langs.python.runtime.fuzzy import ish_value
-        except ImportError:
+        """Create fallback for ish_value_composed using the best available implementation."""
+        implementation = self._resolve_runtime_function(
+            "ish_value_composed"
+        ) or self._resolve_runtime_function("ish_value")
+
+        if implementation is None:
             # Fallback if even the base function is missing
-            def ish_value(value):
+            def implementation(value, target_val=None):
                 """Minimal ish value fallback."""
                 import random
 
@@ -131,39 +209,16 @@ class DependencyResolver:
                 variation = value * 0.1 * (random.random() - 0.5)
                 return value + variation
 
-        @wraps(ish_value)
-        def ish_value_composed_fallback(*args, **kwargs):
-            # Add realistic overhead to simulate composition framework
-            start = time.perf_counter()
-
-            # Simulate composition framework overhead
-            self._simulate_composition_overhead()
-
-            # Call the original function
-            result = ish_value(*args, **kwargs)
-
-            # Ensure minimum realistic overhead for performance testing
-            elapsed = time.perf_counter() - start
-            min_overhead = 1e-5  # 10μs minimum overhead
-            if elapsed < min_overhead:
-                time.sleep(min_overhead - elapsed)
-
-            return result
-
-        # Add metadata to identify as fallback
-        ish_value_composed_fallback._is_fallback = True
-        ish_value_composed_fallback._fallback_for = "ish_value_composed"
-
-        return ish_value_composed_fallback
+        return self._make_fallback(implementation, "ish_value_composed")
 
     def _create_generic_ish_fallback(self, function_name: str) -> Callable:
         """Create generic fallback for ish composition functions."""
+        implementation = self._resolve_runtime_function(function_name)
+        if implementation is not None:
+            return self._make_fallback(implementation, function_name)
 
         def generic_ish_fallback(*args, **kwargs):
             """Generic fallback for ish composition functions."""
-            # Add realistic overhead
-            self._simulate_composition_overhead()
-
             # Return a reasonable default based on function name
             if "comparison" in function_name.lower():
                 # Return a fuzzy comparison result
@@ -190,52 +245,19 @@ class DependencyResolver:
                 # Generic return
                 return args[0] if args else None
 
-        # Add metadata
-        generic_ish_fallback._is_fallback = True
-        generic_ish_fallback._fallback_for = function_name
-
-        return generic_ish_fallback
+        return self._make_fallback(generic_ish_fallback, function_name)
 
     def _create_generic_fallback(self, function_name: str) -> Callable:
         """Create generic fallback for unknown functions."""
 
         def generic_fallback(*args, **kwargs):
             """Generic fallback that returns reasonable defaults."""
-            # Minimal overhead
-            time.sleep(1e-6)  # 1μs
-
             # Return reasonable default
             if args:
                 return args[0]  # Return first argument
             return None
 
-        # Add metadata
-        generic_fallback._is_fallback = True
-        generic_fallback._fallback_for = function_name
-
-        return generic_fallback
-
-    def _simulate_composition_overhead(self) -> None:
-        """Simulate realistic composition framework overhead."""
-        # Simulate typical framework overhead: function lookup, validation, etc.
-        # This represents realistic overhead patterns seen in composition frameworks
-
-        # Simulate hash table lookup (dict access)
-        dummy_dict = {"key1": "value1", "key2": "value2", "key3": "value3"}
-        for key in dummy_dict:
-            _ = dummy_dict.get(key)
-
-        # Simulate type checking/validation
-        dummy_value = 42.0
-        _ = isinstance(dummy_value, (int, float))
-        _ = hasattr(dummy_value, "__call__")
-
-        # Simulate small arithmetic operations
-        for i in range(10):
-            _ = i * 2 + 1
-
-        # Add minimum sleep to ensure measurable overhead
-        time.sleep(5e-6)  # 5μs
+        return self._make_fallback(generic_fallback, function_name)
 
     def is_fallback_function(self, func: Callable) -> bool:
         """Check if a function is a fallback implementation."""
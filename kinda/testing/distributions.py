@@ -5,15 +5,20 @@ This module provides statistical tests for validating probability distributions
 and comparing observed vs expected behavior in probabilistic systems.
 """
 
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 import math
 import statistics
 
-from .confidence import ConfidenceInterval
+import numpy as np
+
+from .confidence import ConfidenceInterval, binomial_test_p_value
 from .assertions import StatisticalValidationError
 
+# Samples accepted by the KS tests: plain sequences or NumPy arrays
+ArrayLike = Union[Sequence[float], np.ndarray]
+
 
 class DistributionTest(Enum):
     """Available distribution testing methods."""
@@ -128,18 +133,19 @@ class DistributionTester:
 
     def kolmogorov_smirnov_test(
         self,
-        sample1: List[float],
-        sample2: Optional[List[float]] = None,
-        expected_cdf: Optional[callable] = None,
+        sample1: ArrayLike,
+        sample2: Optional[ArrayLike] = None,
+        expected_cdf: Optional[Callable] = None,
         significance: float = 0.05,
     ) -> DistributionTestResult:
         """
         Perform Kolmogorov-Smirnov test.
 
         Args:
-            sample1: First sample
+            sample1: First sample (sequence or NumPy array)
             sample2: Second sample (for two-sample test)
-            expected_cdf: Expected CDF function (for one-sample test)
+            expected_cdf: Expected CDF function (for one-sample test); called
+                once with the sorted sample array when it accepts arrays
             significance: Significance level
 
         Returns:
@@ -225,30 +231,23 @@ class DistributionTester:
         return self.chi_square_test(construct_samples, personality_probabilities, significance)
 
     def _ks_two_sample(
-        self, sample1: List[float], sample2: List[float], significance: float
+        self, sample1: ArrayLike, sample2: ArrayLike, significance: float
     ) -> DistributionTestResult:
         """Two-sample Kolmogorov-Smirnov test."""
-        if not sample1 or not sample2:
+        sorted1 = np.sort(np.asarray(sample1, dtype=float).ravel())
+        sorted2 = np.sort(np.asarray(sample2, dtype=float).ravel())
+        if sorted1.size == 0 or sorted2.size == 0:
             raise ValueError("Both samples must be non-empty")
 
-        # Sort samples
-        sorted1 = sorted(sample1)
-        sorted2 = sorted(sample2)
-
-        # Calculate empirical CDFs and find maximum difference
-        max_diff = 0.0
-
-        # Get all unique values
-        all_values = sorted(set(sorted1 + sorted2))
-
-        for value in all_values:
-            cdf1 = sum(1 for x in sorted1 if x <= value) / len(sorted1)
-            cdf2 = sum(1 for x in sorted2 if x <= value) / len(sorted2)
-            diff = abs(cdf1 - cdf2)
-            max_diff = max(max_diff, diff)
+        # Both empirical CDFs only step at sample points, so evaluating them at
+        # the pooled values via binary search finds the maximum difference
+        pooled = np.concatenate((sorted1, sorted2))
+        cdf1 = np.searchsorted(sorted1, pooled, side="right") / sorted1.size
+        cdf2 = np.searchsorted(sorted2, pooled, side="right") / sorted2.size
+        max_diff = float(np.max(np.abs(cdf1 - cdf2)))
 
         # Calculate critical value
-        n1, n2 = len(sorted1), len(sorted2)
+        n1, n2 = sorted1.size, sorted2.size
         critical_value = self._ks_critical_value(n1, n2, significance)
 
         is_valid = max_diff <= critical_value
@@ -274,21 +273,21 @@ class DistributionTester:
         )
 
     def _ks_one_sample(
-        self, sample: List[float], expected_cdf: callable, significance: float
+        self, sample: ArrayLike, expected_cdf: Callable, significance: float
     ) -> DistributionTestResult:
         """One-sample Kolmogorov-Smirnov test."""
-        if not sample:
+        sorted_sample = np.sort(np.asarray(sample, dtype=float).ravel())
+        n = sorted_sample.size
+        if n == 0:
             raise ValueError("Sample must be non-empty")
 
-        sorted_sample = sorted(sample)
-        n = len(sorted_sample)
-        max_diff = 0.0
+        expected = self._evaluate_cdf(expected_cdf, sorted_sample)
 
-        for i, value in enumerate(sorted_sample):
-            empirical_cdf = (i + 1) / n
-            expected_cdf_value = expected_cdf(value)
-            diff = abs(empirical_cdf - expected_cdf_value)
-            max_diff = max(max_diff, diff)
+        # The empirical CDF jumps at each unique value; compare the expected CDF
+        # against the levels just after (D+) and just before (D-) each jump
+        upper = np.searchsorted(sorted_sample, sorted_sample, side="right") / n
+        lower = np.searchsorted(sorted_sample, sorted_sample, side="left") / n
+        max_diff = float(max(np.max(upper - expected), np.max(expected - lower)))
 
         critical_value = self._ks_critical_value(n, None, significance)
         is_valid = max_diff <= critical_value
@@ -312,6 +311,22 @@ class DistributionTester:
             message=message,
         )
 
+    @staticmethod
+    def _evaluate_cdf(expected_cdf: Callable, values: np.ndarray) -> np.ndarray:
+        """
+        Evaluate a CDF over sorted sample values.
+
+        NumPy-aware CDFs (ufunc expressions, scipy distributions) are called once
+        on the whole array; scalar-only callables fall back to one call per value.
+        """
+        try:
+            result = np.asarray(expected_cdf(values), dtype=float)
+            if result.shape == values.shape:
+                return result
+        except (TypeError, ValueError):
+            pass
+        return np.fromiter((expected_cdf(v) for v in values.tolist()), float, values.size)
+
     def _get_chi_square_critical(self, df: int, significance: float) -> float:
         """Get chi-square critical value."""
         key = (df, significance)
@@ -369,20 +384,7 @@ class DistributionTester:
 
     def _binomial_test_p_value(self, successes: int, trials: int, expected_p: float) -> float:
         """Calculate binomial test p-value."""
-        observed_p = successes / trials
-
-        # Two-tailed test
-        from math import comb
-
-        extreme_prob = 0.0
-        for k in range(trials + 1):
-            k_prob = comb(trials, k) * (expected_p**k) * ((1 - expected_p) ** (trials - k))
-            k_p = k / trials
-
-            if abs(k_p - expected_p) >= abs(observed_p - expected_p):
-                extreme_prob += k_prob
-
-        return min(1.0, extreme_prob)
+        return binomial_test_p_value(successes, trials, expected_p)
 
     def _normal_cdf(self, z: float) -> float:
         """Approximate normal CDF."""
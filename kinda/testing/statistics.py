@@ -6,6 +6,8 @@ from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from .confidence import DEFAULT_BOOTSTRAP_SEED, bootstrap_distribution
+
 
 class ValidationMethod(Enum):
     """Statistical validation methods."""
@@ -43,8 +45,9 @@ class ComparisonResult:
 class StatisticalValidator:
     """Provides statistical validation for performance tests."""
 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = DEFAULT_BOOTSTRAP_SEED):
         self._validation_cache: Dict[str, ValidationResult] = {}
+        self.seed = seed
 
     def validate_performance(
         self,
@@ -116,11 +119,19 @@ class StatisticalValidator:
         baseline_median = statistics.median(baseline_samples)
         comparison_median = statistics.median(comparison_samples)
 
+        # A zero baseline leaves the relative overhead undefined
+        if baseline_median <= 0:
+            return ComparisonResult(
+                is_valid=False,
+                message="Baseline too fast to measure overhead",
+                overhead_percent=float("inf"),
+                significance_test=None,
+                p_value=None,
+                effect_size=None,
+            )
+
         # Calculate overhead percentage
-        if baseline_median > 0:
-            overhead_percent = ((comparison_median - baseline_median) / baseline_median) * 100
-        else:
-            overhead_percent = 0.0
+        overhead_percent = ((comparison_median - baseline_median) / baseline_median) * 100
 
         # Perform statistical significance test
         p_value, test_name = self._perform_significance_test(baseline_samples, comparison_samples)
@@ -246,30 +257,26 @@ class StatisticalValidator:
     ) -> ValidationResult:
         """Validate using bootstrap confidence intervals."""
         try:
-            # Perform bootstrap resampling
+            # Perform vectorized bootstrap resampling
             n_bootstrap = min(1000, len(samples) * 50)
-            bootstrap_medians = []
-
-            for _ in range(n_bootstrap):
-                bootstrap_sample = np.random.choice(samples, size=len(samples), replace=True)
-                bootstrap_medians.append(statistics.median(bootstrap_sample))
+            bootstrap_medians = bootstrap_distribution(samples, n_bootstrap, "median", self.seed)
 
             # Calculate percentiles for confidence interval
             alpha = 1 - confidence_level
             lower_percentile = (alpha / 2) * 100
             upper_percentile = (1 - alpha / 2) * 100
 
-            ci_lower = np.percentile(bootstrap_medians, lower_percentile)
-            ci_upper = np.percentile(bootstrap_medians, upper_percentile)
+            ci_lower, ci_upper = (
+                float(v)
+                for v in np.percentile(bootstrap_medians, [lower_percentile, upper_percentile])
+            )
 
             # Check if confidence interval is within thresholds
             is_valid = ci_lower >= lower_threshold and ci_upper <= upper_threshold
 
             # Estimate p-value from bootstrap distribution
-            outside_count = sum(
-                1 for m in bootstrap_medians if m < lower_threshold or m > upper_threshold
-            )
-            p_value = outside_count / len(bootstrap_medians)
+            outside = (bootstrap_medians < lower_threshold) | (bootstrap_medians > upper_threshold)
+            p_value = float(np.mean(outside))
 
             message = (
                 f"Bootstrap validation: median={stats['median']:.4f}, "
@@ -445,6 +452,28 @@ class StatisticalValidator:
         except Exception:
             return None
 
+    def median_confidence_interval(
+        self, samples: List[float], confidence_level: float = 0.95
+    ) -> Tuple[float, float]:
+        """
+        MAD-based confidence interval for the median, as used by robust validation.
+
+        Args:
+            samples: Performance measurements
+            confidence_level: Confidence level for the interval
+
+        Returns:
+            (lower, upper) bounds of the interval
+        """
+        if not samples:
+            raise ValueError("Cannot compute a confidence interval without samples")
+
+        median = statistics.median(samples)
+        mad = self._median_absolute_deviation(samples)
+        confidence_multiplier = self._get_confidence_multiplier(confidence_level)
+        margin_of_error = mad * 1.4826 * confidence_multiplier / np.sqrt(len(samples))
+        return median - margin_of_error, median + margin_of_error
+
     def _median_absolute_deviation(self, samples: List[float]) -> float:
         """Calculate Median Absolute Deviation."""
         if not samples:
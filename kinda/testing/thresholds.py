@@ -1,13 +1,65 @@
 """Statistical threshold management for performance tests."""
 
+import atexit
 import json
+import os
 import statistics
+import tempfile
 import numpy as np
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import IO, Dict, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+from .confidence import bootstrap_distribution
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore
+
+try:
+    import msvcrt
+except ImportError:  # pragma: no cover - POSIX
+    msvcrt = None  # type: ignore
+
+
+def _lock_file(lock_file: IO[str]) -> None:
+    """Block until this process holds an exclusive lock on an open file."""
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+    elif msvcrt is not None:  # pragma: no cover - Windows
+        # Lock the first byte; LK_LOCK gives up after ~10s, so keep retrying
+        lock_file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+
+def _unlock_file(lock_file: IO[str]) -> None:
+    """Release a lock taken with _lock_file."""
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    elif msvcrt is not None:  # pragma: no cover - Windows
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# Write-behind managers with updates not yet written, flushed at exit
+_unflushed_managers: Set["ThresholdManager"] = set()
+
+
+def _flush_at_exit() -> None:
+    for manager in list(_unflushed_managers):
+        manager.flush()
+
+
+atexit.register(_flush_at_exit)
+
 
 @dataclass
 class PerformanceBaseline:
@@ -31,12 +83,31 @@ class PerformanceBaseline:
         return cls(**data)
 
 
+@dataclass
+class SampleSummary:
+    """Robust statistics for one batch of performance samples."""
+
+    median_time: float
+    mad_time: float
+    sample_count: int
+    confidence_interval: Tuple[float, float]
+
+
 class ThresholdManager:
-    """Manages adaptive performance thresholds."""
+    """Manages adaptive performance thresholds.
 
-    def __init__(self, cache_path: Optional[Path] = None):
+    Baseline updates are write-behind: update_baseline() only changes the
+    in-memory baselines and queues the update. flush() (called once from
+    pytest_sessionfinish) takes a file lock, re-reads the cache, replays the
+    queued updates on top of whatever other processes (e.g. pytest-xdist
+    workers) wrote in the meantime, and writes the result atomically.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None, write_behind: bool = True):
         self.cache_path = cache_path or Path(".performance-cache/baselines.json")
+        self.write_behind = write_behind
         self.baselines: Dict[str, PerformanceBaseline] = {}
+        self._pending_updates: List[Tuple[str, str, SampleSummary]] = []
         self._load_baselines()
 
     def calculate_threshold(
@@ -59,17 +130,51 @@ class ThresholdManager:
     def update_baseline(
         self, test_name: str, environment_key: str, new_samples: List[float]
     ) -> None:
-        """Update baseline with new performance data."""
-        baseline_key = f"{test_name}:{environment_key}"
+        """Update baseline with new performance data (persisted on flush)."""
+        if not new_samples:
+            return
 
-        if baseline_key in self.baselines:
-            # Update existing baseline with exponential smoothing
-            self._update_existing_baseline(baseline_key, new_samples)
+        summary = self._summarize_samples(new_samples)
+        self._apply_update(self.baselines, test_name, environment_key, summary)
+        self._pending_updates.append((test_name, environment_key, summary))
+
+        if self.write_behind:
+            _unflushed_managers.add(self)
         else:
-            # Create new baseline
-            self._create_new_baseline(test_name, environment_key, new_samples)
+            self.flush()
 
-        self._save_baselines()
+    @property
+    def pending_update_count(self) -> int:
+        """Number of baseline updates not yet written to the cache file."""
+        return len(self._pending_updates)
+
+    def flush(self) -> None:
+        """Merge queued baseline updates into the cache file."""
+        if not self._pending_updates:
+            return
+
+        pending = self._pending_updates
+        self._pending_updates = []
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._cache_lock():
+                # Replay our updates on top of the latest on-disk state so
+                # concurrent writers never lose each other's baselines
+                try:
+                    merged = self._read_baselines_file()
+                except (json.JSONDecodeError, ValueError):
+                    # A corrupted cache file is replaced
+                    merged = {}
+                for test_name, environment_key, summary in pending:
+                    self._apply_update(merged, test_name, environment_key, summary)
+                self._write_baselines_file(merged)
+            self.baselines.update(merged)
+            _unflushed_managers.discard(self)
+        except Exception as e:
+            # Keep the updates queued so a later flush can retry
+            self._pending_updates = pending + self._pending_updates
+            print(f"Warning: Failed to save performance baselines: {e}")
 
     def get_baseline(self, test_name: str, environment_key: str) -> Optional[PerformanceBaseline]:
         """Get baseline for specific test and environment."""
@@ -135,65 +240,61 @@ class ThresholdManager:
 
         return lower_threshold, upper_threshold
 
-    def _update_existing_baseline(self, baseline_key: str, new_samples: List[float]) -> None:
-        """Update existing baseline with exponential smoothing."""
-        baseline = self.baselines[baseline_key]
+    def _summarize_samples(self, samples: List[float]) -> SampleSummary:
+        """Calculate the robust statistics used to update a baseline."""
+        return SampleSummary(
+            median_time=statistics.median(samples),
+            mad_time=self._median_absolute_deviation(samples),
+            sample_count=len(samples),
+            confidence_interval=self._bootstrap_confidence_interval(samples, 0.95),
+        )
 
-        if not new_samples:
-            return
+    def _apply_update(
+        self,
+        baselines: Dict[str, PerformanceBaseline],
+        test_name: str,
+        environment_key: str,
+        summary: SampleSummary,
+    ) -> None:
+        """Fold a sample summary into a baseline mapping."""
+        baseline_key = f"{test_name}:{environment_key}"
+        baseline = baselines.get(baseline_key)
 
-        # Calculate statistics for new samples
-        new_median = statistics.median(new_samples)
-        new_mad = self._median_absolute_deviation(new_samples)
-        new_confidence_interval = self._bootstrap_confidence_interval(new_samples, 0.95)
+        if baseline is None:
+            # Create new baseline
+            baselines[baseline_key] = PerformanceBaseline(
+                test_name=test_name,
+                environment_key=environment_key,
+                median_time=summary.median_time,
+                mad_time=summary.mad_time,
+                sample_count=summary.sample_count,
+                last_updated=datetime.now().isoformat(),
+                confidence_interval=summary.confidence_interval,
+            )
+            return
 
-        # Exponential smoothing parameters
+        # Update existing baseline with exponential smoothing
         alpha = 0.3  # Smoothing factor (30% weight to new data)
 
-        # Update baseline with smoothed values
-        updated_median = (1 - alpha) * baseline.median_time + alpha * new_median
-        updated_mad = (1 - alpha) * baseline.mad_time + alpha * new_mad
+        updated_median = (1 - alpha) * baseline.median_time + alpha * summary.median_time
+        updated_mad = (1 - alpha) * baseline.mad_time + alpha * summary.mad_time
 
         # Update confidence interval (blend endpoints)
         updated_ci = (
-            (1 - alpha) * baseline.confidence_interval[0] + alpha * new_confidence_interval[0],
-            (1 - alpha) * baseline.confidence_interval[1] + alpha * new_confidence_interval[1],
+            (1 - alpha) * baseline.confidence_interval[0] + alpha * summary.confidence_interval[0],
+            (1 - alpha) * baseline.confidence_interval[1] + alpha * summary.confidence_interval[1],
         )
 
-        # Update baseline
-        self.baselines[baseline_key] = PerformanceBaseline(
+        baselines[baseline_key] = PerformanceBaseline(
             test_name=baseline.test_name,
             environment_key=baseline.environment_key,
             median_time=updated_median,
             mad_time=updated_mad,
-            sample_count=baseline.sample_count + len(new_samples),
+            sample_count=baseline.sample_count + summary.sample_count,
             last_updated=datetime.now().isoformat(),
             confidence_interval=updated_ci,
         )
 
-    def _create_new_baseline(
-        self, test_name: str, environment_key: str, samples: List[float]
-    ) -> None:
-        """Create new baseline from samples."""
-        if not samples:
-            return
-
-        baseline_key = f"{test_name}:{environment_key}"
-
-        median = statistics.median(samples)
-        mad = self._median_absolute_deviation(samples)
-        confidence_interval = self._bootstrap_confidence_interval(samples, 0.95)
-
-        self.baselines[baseline_key] = PerformanceBaseline(
-            test_name=test_name,
-            environment_key=environment_key,
-            median_time=median,
-            mad_time=mad,
-            sample_count=len(samples),
-            last_updated=datetime.now().isoformat(),
-            confidence_interval=confidence_interval,
-        )
-
     def _median_absolute_deviation(self, samples: List[float]) -> float:
         """Calculate Median Absolute Deviation (MAD) - more robust than standard deviation."""
         if not samples:
@@ -213,14 +314,9 @@ class ThresholdManager:
             return 0.0, 0.0
 
         try:
-            # Simple bootstrap implementation
-            bootstrap_medians = []
+            # Vectorized bootstrap of the median
             n_bootstrap = min(1000, len(samples) * 10)  # Reasonable bootstrap size
-
-            for _ in range(n_bootstrap):
-                # Bootstrap resample
-                bootstrap_sample = np.random.choice(samples, size=len(samples), replace=True)
-                bootstrap_medians.append(statistics.median(bootstrap_sample))
+            bootstrap_medians = bootstrap_distribution(samples, n_bootstrap, "median")
 
             # Calculate percentiles for confidence interval
             alpha = 1 - confidence_level
@@ -255,40 +351,73 @@ class ThresholdManager:
     def _load_baselines(self) -> None:
         """Load baselines from cache file."""
         try:
-            if self.cache_path.exists():
-                with open(self.cache_path, "r") as f:
-                    data = json.load(f)
-
-                # Validate and load baselines
-                for key, baseline_data in data.items():
-                    try:
-                        baseline = PerformanceBaseline.from_dict(baseline_data)
-                        self.baselines[key] = baseline
-                    except Exception as e:
-                        # Skip invalid baseline entries
-                        print(f"Warning: Failed to load baseline {key}: {e}")
-                        continue
-
-        except (FileNotFoundError, json.JSONDecodeError, Exception):
-            # Start fresh if cache is corrupted or missing
+            self.baselines = self._read_baselines_file()
+        except (json.JSONDecodeError, OSError, ValueError):
+            # Start fresh if cache is corrupted or unreadable
             self.baselines = {}
+        if not self.cache_path.exists():
             self._create_cache_directory()
 
+    def _read_baselines_file(self) -> Dict[str, PerformanceBaseline]:
+        """Read and validate the baselines currently stored on disk."""
+        baselines: Dict[str, PerformanceBaseline] = {}
+        if not self.cache_path.exists():
+            return baselines
+
+        with open(self.cache_path, "r") as f:
+            data = json.load(f)
+
+        # Validate and load baselines
+        for key, baseline_data in data.items():
+            try:
+                baseline = PerformanceBaseline.from_dict(baseline_data)
+                baseline.confidence_interval = tuple(baseline.confidence_interval)
+                baselines[key] = baseline
+            except Exception as e:
+                # Skip invalid baseline entries
+                print(f"Warning: Failed to load baseline {key}: {e}")
+                continue
+
+        return baselines
+
+    def _write_baselines_file(self, baselines: Dict[str, PerformanceBaseline]) -> None:
+        """Write baselines atomically (unique temp file, then replace)."""
+        data = {key: baseline.to_dict() for key, baseline in baselines.items()}
+
+        fd, temp_name = tempfile.mkstemp(
+            dir=self.cache_path.parent, prefix=self.cache_path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_name, self.cache_path)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+
+    @contextmanager
+    def _cache_lock(self) -> Iterator[None]:
+        """Hold an exclusive inter-process lock on the cache file."""
+        lock_path = self.cache_path.with_name(self.cache_path.name + ".lock")
+        with open(lock_path, "a+") as lock_file:
+            _lock_file(lock_file)
+            try:
+                yield
+            finally:
+                _unlock_file(lock_file)
+
     def _save_baselines(self) -> None:
-        """Save baselines to cache file."""
+        """Save the full in-memory baselines to cache file (replacing it)."""
         try:
             # Ensure cache directory exists
             self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Convert baselines to serializable format
-            data = {key: baseline.to_dict() for key, baseline in self.baselines.items()}
-
-            # Write atomically (write to temp file, then rename)
-            temp_path = self.cache_path.with_suffix(".tmp")
-            with open(temp_path, "w") as f:
-                json.dump(data, f, indent=2)
-
-            temp_path.rename(self.cache_path)
+            with self._cache_lock():
+                self._write_baselines_file(self.baselines)
+            self._pending_updates = []
+            _unflushed_managers.discard(self)
 
         except Exception as e:
             print(f"Warning: Failed to save performance baselines: {e}")
@@ -6,5 +6,6 @@ Epic #127: Foundation for v0.6.0 C/MATLAB support with extensible architecture.
 
 from .engine import TranspilerEngine, LanguageTarget
 from .targets.python_enhanced import PythonEnhancedTarget
+from .targets.python_numpy import PythonNumpyTarget
 
-__all__ = ["TranspilerEngine", "LanguageTarget", "PythonEnhancedTarget"]
+__all__ = ["TranspilerEngine", "LanguageTarget", "PythonEnhancedTarget", "PythonNumpyTarget"]
@@ -5,18 +5,21 @@ This module provides the core transpiler infrastructure that enables kinda-lang
 to target multiple languages including Python, C, and MATLAB/Octave.
 """
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Any, Optional, Set, Union
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 
 from ..grammar.python.constructs import KindaPythonConstructs as PYTHON_CONSTRUCTS
+from . import optimizer
 
 
 class LanguageType(Enum):
     """Supported target languages"""
 
     PYTHON_ENHANCED = "python_enhanced"
+    PYTHON_NUMPY = "python_numpy"
     C = "c"
     MATLAB = "matlab"
     OCTAVE = "octave"
@@ -34,6 +37,219 @@ class ConstructImplementation:
     examples: List[str]
 
 
+@dataclass
+class ConstructSite:
+    """
+    A piece of kinda-lang source that can be rewritten.
+
+    Usually a ~construct { body } block. Value constructs can also be
+    written inline: ~kinda float x = value declares target x, while
+    ~kinda_float(value) and x ~ish y carry their operands instead of a body.
+    """
+
+    construct_name: str
+    start: int
+    end: int
+    body: str
+    header: str = ""
+    operands: Tuple[str, ...] = ()
+    target: str = ""
+
+
+@dataclass
+class ConstructScan:
+    """Constructs used by a kinda-lang source and the blocks to rewrite"""
+
+    constructs_used: List[str]
+    sites: List[ConstructSite]
+
+
+_CONSTRUCT_TOKEN = re.compile(r"~(\w+)")
+_BLOCK_OPEN = re.compile(r"\s*\{")
+
+# Loop constructs take a same-line header before their block:
+# ~kinda_repeat(count) { ... } and ~maybe_for item in iterable { ... }
+_HEADED_BLOCK_OPEN = re.compile(r"([^{}\n]*)\{")
+_KINDA_REPEAT_HEADER = re.compile(r"\s*\((.+)\)\s*$")
+_MAYBE_FOR_HEADER = re.compile(r"\s+([A-Za-z_]\w*)\s+in\s+(.+?)\s*$")
+
+# Constructs whose templates take a single {value}
+_VALUE_CONSTRUCTS = ("kinda_int", "kinda_float", "kinda_bool", "ish_value")
+
+# ~kinda float x = value (or ~= value), up to a comment, semicolon or end of line
+_DECLARATION = re.compile(
+    r"~kinda[ \t]+(int|float|bool)[ \t]+([A-Za-z_]\w*)[ \t]*~?=[ \t]*([^#;\n]+?)[ \t]*(?=#|;|$)",
+    re.MULTILINE,
+)
+
+# Operands of ~ish: a name (with any suffixes) or number on the left, an
+# expression up to the end of the clause on the right
+_ISH_LEFT_OPERAND = re.compile(r"[A-Za-z_]\w*|\d+(?:\.\d+)?$")
+_ISH_RIGHT_OPERAND = re.compile(
+    r"[ \t]+([^~#;\n]+?)(?=[ \t]+(?:and|or)\b|[ \t]*(?:\)|\]|:|#|;|~|$))", re.MULTILINE
+)
+
+
+def site_parameters(site: ConstructSite) -> Dict[str, str]:
+    """
+    Template parameters for a rewrite site, parsed from its block and header.
+
+    Raises ValueError when a loop construct is missing the header its
+    templates need (the count for ~kinda_repeat, the loop variable and
+    iterable for ~maybe_for).
+    """
+    parameters = {"body": site.body}
+    if site.construct_name in _VALUE_CONSTRUCTS:
+        parameters["value"] = site.operands[0] if site.operands else site.body.strip()
+    elif site.construct_name == "ish_comparison":
+        parameters["left"], parameters["right"] = site.operands
+    elif site.construct_name == "kinda_repeat":
+        match = _KINDA_REPEAT_HEADER.match(site.header)
+        if match is None:
+            raise ValueError("~kinda_repeat needs a count: ~kinda_repeat(n) { ... }")
+        parameters["count"] = match.group(1).strip()
+    elif site.construct_name == "maybe_for":
+        match = _MAYBE_FOR_HEADER.match(site.header)
+        if match is None:
+            raise ValueError(
+                "~maybe_for needs a loop variable and iterable: ~maybe_for item in items { ... }"
+            )
+        parameters["item"], parameters["iterable"] = match.groups()
+    return parameters
+
+
+def scan_constructs(kinda_code: str) -> ConstructScan:
+    """
+    Find the constructs a kinda-lang source uses in a single left-to-right scan.
+
+    Every ~name token naming a known construct counts as a use. A token
+    followed by a { ... } block (up to the first closing brace) is also a
+    rewrite site; tokens inside a site's block are counted but not rewritten
+    separately. Declarations (~kinda float x = value), value constructs
+    called inline (~kinda_float(value)) and ~ish comparisons and values are
+    rewrite sites too. Each character is examined a bounded number of times,
+    so the scan is linear in the source length.
+    """
+    found: Set[str] = set()
+    sites: List[ConstructSite] = []
+    site_end = 0
+    close = -1  # most recent "}" found, reused while it's still ahead of us
+
+    for token in _CONSTRUCT_TOKEN.finditer(kinda_code):
+        name = token.group(1)
+        inline = _inline_site(kinda_code, token)
+        if inline is not None:
+            found.add(inline.construct_name)
+            if inline.start >= site_end:
+                sites.append(inline)
+                site_end = inline.end
+            continue
+        if name not in PYTHON_CONSTRUCTS:
+            continue
+        found.add(name)
+        if token.start() < site_end:
+            continue
+
+        if name in ("kinda_repeat", "maybe_for"):
+            block = _HEADED_BLOCK_OPEN.match(kinda_code, token.end())
+        else:
+            block = _BLOCK_OPEN.match(kinda_code, token.end())
+        if block is None:
+            continue
+        if close < block.end():
+            close = kinda_code.find("}", block.end())
+            if close == -1:
+                # No closing brace anywhere after this point, so no more sites
+                site_end = len(kinda_code)
+                continue
+        header = kinda_code[token.end() : block.end() - 1]
+        sites.append(
+            ConstructSite(
+                name, token.start(), close + 1, kinda_code[block.end() : close], header.rstrip()
+            )
+        )
+        site_end = close + 1
+
+    return ConstructScan([name for name in PYTHON_CONSTRUCTS if name in found], sites)
+
+
+def _inline_site(kinda_code: str, token: "re.Match[str]") -> Optional[ConstructSite]:
+    """The declaration, inline call or ~ish site a ~name token starts, if any."""
+    name = token.group(1)
+    if name == "kinda":
+        match = _DECLARATION.match(kinda_code, token.start())
+        if match is None:
+            return None
+        kind, target, value = match.groups()
+        return ConstructSite(
+            f"kinda_{kind}", match.start(), match.end(), "", operands=(value,), target=target
+        )
+
+    if name == "ish":
+        left = _left_operand(kinda_code, token.start())
+        if left is None:
+            return None
+        start, left_operand = left
+        right = _ISH_RIGHT_OPERAND.match(kinda_code, token.end())
+        if left_operand[0].isdigit():
+            return ConstructSite("ish_value", start, token.end(), "", operands=(left_operand,))
+        if right is None:
+            return None
+        return ConstructSite(
+            "ish_comparison", start, right.end(1), "", operands=(left_operand, right.group(1))
+        )
+
+    if name in _VALUE_CONSTRUCTS and kinda_code.startswith("(", token.end()):
+        close = _closing_parenthesis(kinda_code, token.end())
+        if close == -1:
+            return None
+        value = kinda_code[token.end() + 1 : close].strip()
+        return ConstructSite(name, token.start(), close + 1, "", operands=(value,))
+
+    return None
+
+
+def _left_operand(kinda_code: str, end: int) -> Optional[Tuple[int, str]]:
+    """
+    (start, text) of the operand just before end, skipping spaces: a number,
+    or a name followed by any attribute, index or call suffixes (values[0]).
+    """
+    stop = end
+    while stop > 0 and kinda_code[stop - 1] in " \t":
+        stop -= 1
+    start = stop
+    depth = 0
+    while start > 0:
+        char = kinda_code[start - 1]
+        if char in ")]":
+            depth += 1
+        elif char in "([":
+            if depth == 0:
+                break
+            depth -= 1
+        elif char == "\n" or (depth == 0 and not (char.isalnum() or char in "_.")):
+            break
+        start -= 1
+    operand = kinda_code[start:stop]
+    if depth or not _ISH_LEFT_OPERAND.match(operand):
+        return None
+    return start, operand
+
+
+def _closing_parenthesis(kinda_code: str, open_index: int) -> int:
+    """Index of the ")" matching the "(" at open_index, -1 if it is never closed."""
+    depth = 0
+    for index in range(open_index, len(kinda_code)):
+        char = kinda_code[index]
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return index
+    return -1
+
+
 @dataclass
 class TranspilerResult:
     """Result of transpilation operation"""
@@ -177,42 +393,105 @@ class OptimizationPass(ABC):
         """Get the name of this optimization pass"""
         pass
 
+    def estimate_savings(self, metadata: Dict[str, Any]) -> Optional[float]:
+        """Static estimate of the microseconds saved per run of the rewritten sites"""
+        return None
 
-class DeadCodeElimination(OptimizationPass):
-    """Remove unused constructs and variables"""
+    def _record(self, metadata: Dict[str, Any], rewrites: List[str]) -> None:
+        """Remember what this pass rewrote for estimate_savings() and the engine"""
+        metadata.setdefault("rewrites", {})[self.get_pass_name()] = rewrites
 
-    def optimize(self, code: str, language: LanguageType, metadata: Dict[str, Any]) -> str:
-        """Remove dead code (simplified implementation)"""
-        # This would contain sophisticated dead code analysis
-        # For now, just return the code as-is
-        return code
 
-    def get_pass_name(self) -> str:
-        return "dead_code_elimination"
+# Targets whose generated code the optimization passes can parse
+PYTHON_TARGETS = {LanguageType.PYTHON_ENHANCED}
 
 
 class ProbabilityOptimization(OptimizationPass):
-    """Optimize probability calculations and reduce redundant random calls"""
+    """
+    Fold constructs with certain outcomes and hoist loop probability lookups.
+
+    Folding needs a fixed personality (metadata["personality"]); hoisting
+    is exact for any personality. Savings are the static per-site estimates
+    in optimizer.SITE_SAVINGS_US, each rewritten site counted once.
+    """
 
     def optimize(self, code: str, language: LanguageType, metadata: Dict[str, Any]) -> str:
-        """Optimize probability-related code"""
-        # This would analyze and optimize probability constructs
-        # For now, just return the code as-is
-        return code
+        """Fold certain constructs and hoist loop-invariant probability lookups"""
+        self._record(metadata, [])
+        if language not in PYTHON_TARGETS:
+            return code
+        tree = optimizer.parse_python(code)
+        if tree is None:
+            return code
+
+        rewrites: List[str] = []
+        personality = metadata.get("personality")
+        if personality:
+            outcomes = optimizer.fold_outcomes(
+                personality["mood"],
+                personality["chaos_level"],
+                metadata.get("fold_tolerance", 0.0),
+            )
+            folder = optimizer.ProbabilityFolder(outcomes)
+            tree = folder.visit(tree)
+            rewrites.extend(f"fold:{name}" for name in folder.folded)
+
+        hoister = optimizer.ProbabilityHoister()
+        hoister.run(tree)
+        rewrites.extend(f"hoist:{name}" for name in hoister.hoisted)
+
+        self._record(metadata, rewrites)
+        if not rewrites:
+            return code
+        return optimizer.to_source(tree, code)
+
+    def estimate_savings(self, metadata: Dict[str, Any]) -> Optional[float]:
+        rewrites = metadata.get("rewrites", {}).get(self.get_pass_name(), [])
+        return optimizer.estimated_savings_us(rewrites)
 
     def get_pass_name(self) -> str:
         return "probability_optimization"
 
 
+class DeadCodeElimination(OptimizationPass):
+    """
+    Remove constant branches and unreferenced runtime helpers.
+
+    Runs after probability folding, which is what usually makes branches
+    constant. Removed code only costs anything when the module is loaded,
+    so no per-run savings are estimated.
+    """
+
+    def optimize(self, code: str, language: LanguageType, metadata: Dict[str, Any]) -> str:
+        """Remove dead branches and unused helpers"""
+        self._record(metadata, [])
+        if language not in PYTHON_TARGETS:
+            return code
+        tree = optimizer.parse_python(code)
+        if tree is None:
+            return code
+
+        branches, helpers = optimizer.eliminate_dead_code(tree)
+        rewrites = ["branch"] * branches + [f"helper:{name}" for name in helpers]
+        self._record(metadata, rewrites)
+        if not rewrites:
+            return code
+        return optimizer.to_source(tree, code)
+
+    def get_pass_name(self) -> str:
+        return "dead_code_elimination"
+
+
 class TranspilerEngine:
     """Main transpiler engine for multi-language code generation"""
 
     def __init__(self):
         self.targets: Dict[LanguageType, LanguageTarget] = {}
         self.construct_registry = ConstructRegistry()
+        # Folding runs first so dead code elimination can clean up after it
         self.optimization_passes: List[OptimizationPass] = [
-            DeadCodeElimination(),
             ProbabilityOptimization(),
+            DeadCodeElimination(),
         ]
 
         # Initialize with default targets
@@ -221,11 +500,15 @@ class TranspilerEngine:
     def _initialize_default_targets(self):
         """Initialize with default language targets"""
         from .targets.python_enhanced import PythonEnhancedTarget
+        from .targets.python_numpy import PythonNumpyTarget
 
         # Register Python Enhanced target
         python_target = PythonEnhancedTarget()
         self.register_target(python_target)
 
+        # Register vectorized NumPy target (numpy is only needed to run its output)
+        self.register_target(PythonNumpyTarget())
+
     def register_target(self, target: LanguageTarget) -> None:
         """Register a language target"""
         self.targets[target.language] = target
@@ -246,7 +529,11 @@ class TranspilerEngine:
         return None
 
     def transpile(
-        self, kinda_code: str, target_language: LanguageType, optimization_level: int = 1
+        self,
+        kinda_code: str,
+        target_language: LanguageType,
+        optimization_level: int = 1,
+        personality: Optional[Dict[str, Any]] = None,
     ) -> TranspilerResult:
         """
         Transpile kinda-lang code to target language.
@@ -254,7 +541,11 @@ class TranspilerEngine:
         Args:
             kinda_code: Source kinda-lang code
             target_language: Target language for transpilation
-            optimization_level: Level of optimization (0-3)
+            optimization_level: Level of optimization (0-3). 1 folds and
+                hoists probabilities, 2 also eliminates dead code, 3 also
+                folds probabilities within AGGRESSIVE_FOLD_TOLERANCE of 0 or 1.
+            personality: Fixed personality the code will run under, as
+                {"mood": ..., "chaos_level": ...}; enables probability folding
 
         Returns:
             TranspilerResult with generated code and metadata
@@ -275,7 +566,8 @@ class TranspilerEngine:
 
         try:
             # Parse kinda-lang code and identify constructs
-            constructs_used = self._parse_constructs(kinda_code)
+            scan = self._parse_constructs(kinda_code)
+            constructs_used = scan.constructs_used
 
             # Check construct support
             unsupported = []
@@ -296,12 +588,13 @@ class TranspilerEngine:
                 )
 
             # Generate target code
-            target_code = self._generate_target_code(kinda_code, target, constructs_used)
+            target_code = self._generate_target_code(kinda_code, target, scan)
 
             # Apply optimizations
+            optimization_estimate: Dict[str, float] = {}
             if optimization_level > 0:
-                target_code = self._apply_optimizations(
-                    target_code, target_language, optimization_level
+                target_code, optimization_estimate = self._apply_optimizations(
+                    target_code, target_language, optimization_level, personality
                 )
 
             # Validate generated code
@@ -316,6 +609,7 @@ class TranspilerEngine:
 
             # Estimate performance
             performance_estimate = target.estimate_performance(constructs_used)
+            performance_estimate.update(optimization_estimate)
 
             return TranspilerResult(
                 success=len(validation_errors) == 0,
@@ -365,22 +659,12 @@ class TranspilerEngine:
         """Validate all registered targets for consistency"""
         return self.construct_registry.validate_implementation_consistency()
 
-    def _parse_constructs(self, kinda_code: str) -> List[str]:
-        """Parse kinda-lang code to identify used constructs"""
-        constructs = []
-
-        # Simple regex-based parsing (in real implementation, would use proper AST)
-        import re
-
-        for construct_name in PYTHON_CONSTRUCTS:
-            pattern = rf"~{construct_name}\b"
-            if re.search(pattern, kinda_code):
-                constructs.append(construct_name)
-
-        return constructs
+    def _parse_constructs(self, kinda_code: str) -> ConstructScan:
+        """Parse kinda-lang code to identify used constructs and rewrite sites"""
+        return scan_constructs(kinda_code)
 
     def _generate_target_code(
-        self, kinda_code: str, target: LanguageTarget, constructs_used: List[str]
+        self, kinda_code: str, target: LanguageTarget, scan: ConstructScan
     ) -> str:
         """Generate target language code"""
         # This is a simplified implementation
@@ -388,7 +672,7 @@ class TranspilerEngine:
 
         # Get dependencies
         dependencies = set()
-        for construct in constructs_used:
+        for construct in scan.constructs_used:
             impl = target.get_construct_implementation(construct)
             if impl:
                 dependencies.update(impl.dependencies)
@@ -399,32 +683,64 @@ class TranspilerEngine:
         # Header
         code_parts.append(target.generate_header(dependencies))
 
-        # Body (simplified transformation)
-        transformed_body = kinda_code
-        for construct in constructs_used:
-            impl = target.get_construct_implementation(construct)
-            if impl:
-                # Apply construct-specific transformation
-                # This is very simplified - real implementation would be much more sophisticated
-                pattern = rf"~{construct}\s*\{{([^}}]*)\}}"
-                replacement = impl.template.format(body=r"\1")
-                transformed_body = re.sub(pattern, replacement, transformed_body)
-
-        code_parts.append(transformed_body)
+        # Body (simplified transformation): splice each rewritten block in order
+        pieces = []
+        position = 0
+        for site in scan.sites:
+            impl = target.get_construct_implementation(site.construct_name)
+            if impl is None:
+                continue
+            pieces.append(kinda_code[position : site.start])
+            code = impl.template.format(**site_parameters(site))
+            pieces.append(f"{site.target} = {code}" if site.target else code)
+            position = site.end
+        pieces.append(kinda_code[position:])
+
+        code_parts.append("".join(pieces))
 
         # Footer
         code_parts.append(target.generate_footer())
 
         return "\n".join(part for part in code_parts if part)
 
-    def _apply_optimizations(self, code: str, language: LanguageType, level: int) -> str:
-        """Apply optimization passes based on level"""
+    def _apply_optimizations(
+        self,
+        code: str,
+        language: LanguageType,
+        level: int,
+        personality: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, Dict[str, float]]:
+        """Apply optimization passes based on level, estimating what each one saves"""
+        if personality is not None:
+            from ..personality import PERSONALITY_PROFILES
+
+            if personality.get("mood") not in PERSONALITY_PROFILES:
+                raise ValueError(f"Unknown mood for optimization: {personality.get('mood')}")
+            personality = {
+                "mood": personality["mood"],
+                "chaos_level": int(personality.get("chaos_level", 5)),
+            }
+
+        metadata: Dict[str, Any] = {
+            "personality": personality,
+            "fold_tolerance": optimizer.AGGRESSIVE_FOLD_TOLERANCE if level >= 3 else 0.0,
+            "rewrites": {},
+        }
+        estimate: Dict[str, float] = {}
         optimized_code = code
 
         # Apply optimization passes based on level
         passes_to_apply = self.optimization_passes[:level]
 
         for pass_instance in passes_to_apply:
-            optimized_code = pass_instance.optimize(optimized_code, language, {})
+            before = optimized_code
+            optimized_code = pass_instance.optimize(before, language, metadata)
+
+            name = pass_instance.get_pass_name()
+            rewrites = metadata["rewrites"].get(name, [])
+            estimate[f"{name}_rewrites"] = float(len(rewrites))
+            savings = pass_instance.estimate_savings(metadata)
+            if savings is not None:
+                estimate[f"{name}_saved_us"] = savings
 
-        return optimized_code
+        return optimized_code, estimate
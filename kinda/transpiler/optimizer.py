@@ -0,0 +1,512 @@
+"""
+Optimizations over generated Python code
+
+The transpiler's optimization passes work on the AST of the generated code.
+They understand both shapes of construct call the code generators emit:
+bare runtime helpers (``sometimes(x > 1)``, ``maybe_for_item_execute()``)
+as written by ``kinda transform``, and ``kinda.runtime.<construct>(...)``
+calls as written by the Python Enhanced target.
+
+- Probability folding: with a fixed personality, a construct whose
+  probability is 0 or 1 no matter how the cascade evolves always decides the
+  same way, so the call is replaced by its outcome.
+- Hoisting: the loop helpers look up their probability on every iteration.
+  The personality part of that lookup never changes inside a loop, so it is
+  computed once before the loop and passed in (the cascade is still applied
+  per iteration, so behaviour is unchanged). Only ``kinda transform`` output
+  calls the loop helpers; the Enhanced target's ``kinda.runtime.maybe_for``
+  already draws its probability once per call, so hoisting never applies to
+  code coming from ``TranspilerEngine.transpile``.
+- Dead code elimination: branches on constant conditions are removed, as
+  are runtime helper definitions the generator emitted and helper imports
+  nothing refers to any more.
+
+Passes report what they saved with the static per-site estimates in
+SITE_SAVINGS_US rather than by timing anything during transpilation.
+"""
+
+import ast
+import functools
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..grammar.python.constructs import KindaPythonConstructs as PYTHON_CONSTRUCTS
+
+# Helpers that return a personality-weighted decision -> probability key
+CONDITION_HELPERS = {
+    "sometimes": "sometimes",
+    "maybe": "maybe",
+    "probably": "probably",
+    "rarely": "rarely",
+    "sometimes_while_condition": "sometimes_while",
+    "maybe_for_item_execute": "maybe_for",
+}
+
+# Loop helpers that accept a precomputed base probability
+HOISTABLE_HELPERS = {
+    "sometimes_while_condition": "sometimes_while",
+    "maybe_for_item_execute": "maybe_for",
+}
+
+# Probabilities this close to 0 or 1 are folded at optimization level 3
+AGGRESSIVE_FOLD_TOLERANCE = 0.005
+
+HOISTED_NAME_PREFIX = "_kinda_base_"
+BASE_PROBABILITY_FUNCTION = "chaos_base_probability"
+
+# Microseconds saved each time a rewritten call site runs, per rewrite kind.
+# Measured once under the playful personality at chaos 5 (see
+# TestSiteSavings in tests/transpiler/test_optimization_passes.py); folding
+# a kinda transform helper skips its security check and personality lookup,
+# folding the Enhanced form skips a KindaRuntime call, and hoisting only
+# skips the base probability lookup.
+SITE_SAVINGS_US: Dict[str, float] = {
+    "fold:sometimes": 20.0,
+    "fold:maybe": 20.0,
+    "fold:probably": 20.0,
+    "fold:rarely": 20.0,
+    "fold:sometimes_while_condition": 20.0,
+    "fold:maybe_for_item_execute": 4.0,
+    "fold:kinda.runtime.sometimes": 0.15,
+    "fold:kinda.runtime.maybe": 0.15,
+    "fold:kinda.runtime.probably": 0.15,
+    "fold:kinda.runtime.rarely": 0.15,
+    "hoist:sometimes_while_condition": 0.4,
+    "hoist:maybe_for_item_execute": 0.4,
+}
+
+
+def parse_python(code: str) -> Optional[ast.Module]:
+    """Parse generated code; None if it isn't valid Python."""
+    try:
+        return ast.parse(code)
+    except SyntaxError:
+        return None
+
+
+def to_source(tree: ast.Module, original: str) -> str:
+    """Unparse a tree, keeping the comment header of the original code."""
+    import astor
+
+    header = []
+    for line in original.splitlines():
+        if line.startswith("#") or not line.strip():
+            header.append(line)
+        else:
+            break
+    source = astor.to_source(tree)
+    header_text = "\n".join(header).strip("\n")
+    return f"{header_text}\n\n{source}" if header_text else source
+
+
+def _helper_name(call: ast.Call) -> Optional[str]:
+    """Runtime helper a call refers to, if any."""
+    func = call.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        base = func.value
+        while isinstance(base, ast.Attribute):
+            base = base.value
+        if isinstance(base, ast.Name) and base.id == "kinda":
+            return func.attr
+    return None
+
+
+def _is_pure(node: ast.AST) -> bool:
+    """Evaluating node has no side effects worth keeping (names, constants, comparisons)."""
+    if isinstance(node, (ast.Constant, ast.Name)):
+        return True
+    if isinstance(node, ast.Lambda):
+        return not node.args.defaults and not any(node.args.kw_defaults)
+    if isinstance(node, ast.Compare):
+        return _is_pure(node.left) and all(_is_pure(c) for c in node.comparators)
+    if isinstance(node, ast.BoolOp):
+        return all(_is_pure(value) for value in node.values)
+    if isinstance(node, ast.UnaryOp):
+        return _is_pure(node.operand)
+    return False
+
+
+def _is_plain_condition(node: ast.AST) -> bool:
+    """
+    The condition is a plain boolean the security check will always pass.
+
+    Conditions are checked against dangerous patterns by their str(), so
+    only expressions whose value is a bool or number are safe to inline.
+    """
+    if isinstance(node, ast.Constant):
+        return isinstance(node.value, (bool, int, float))
+    if isinstance(node, (ast.Compare, ast.Lambda)):
+        return True
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return True
+    if isinstance(node, ast.BoolOp):
+        return all(_is_plain_condition(value) for value in node.values)
+    return False
+
+
+def constant_truth(node: ast.AST) -> Optional[bool]:
+    """Truth value of a constant expression, None if it isn't constant."""
+    if isinstance(node, ast.Constant):
+        return bool(node.value)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        inner = constant_truth(node.operand)
+        return None if inner is None else not inner
+    return None
+
+
+def fold_outcomes(mood: str, chaos_level: int, tolerance: float = 0.0) -> Dict[str, Optional[bool]]:
+    """
+    Decide which constructs are certain under a fixed personality.
+
+    Instability is capped at 1, so a construct's probability stays between
+    base * (1 - cascade_strength) and base for the whole run. A construct is
+    certain to succeed when the lower bound is within tolerance of 1 and
+    certain to fail when the upper bound is within tolerance of 0.
+    """
+    from ..personality import PersonalityContext
+
+    context = PersonalityContext(mood, chaos_level)
+    outcomes: Dict[str, Optional[bool]] = {}
+    for key in set(CONDITION_HELPERS.values()):
+        highest = min(1.0, context.get_base_chaos_probability(key))
+        lowest = max(0.0, highest * (1.0 - context.profile.cascade_strength))
+        if lowest >= 1.0 - tolerance:
+            outcomes[key] = True
+        elif highest <= tolerance:
+            outcomes[key] = False
+        else:
+            outcomes[key] = None
+    return outcomes
+
+
+class ProbabilityFolder(ast.NodeTransformer):
+    """
+    Replace construct calls with certain outcomes by their result.
+
+    Helper form ``sometimes(cond)`` returns ``bool(cond)`` when certain to
+    succeed and ``False`` when certain to fail; the Enhanced form
+    ``kinda.runtime.sometimes(lambda: body)`` becomes ``body`` or ``None``.
+    Folded calls no longer draw from the personality RNG, so seeded runs of
+    optimized and unoptimized code diverge after the first folded site.
+    """
+
+    def __init__(self, outcomes: Dict[str, Optional[bool]]):
+        self.outcomes = outcomes
+        self.folded: List[str] = []
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        self.generic_visit(node)
+        name = _helper_name(node)
+        outcome = self.outcomes.get(CONDITION_HELPERS.get(name or ""))
+        if outcome is None:
+            return node
+
+        replacement = self._fold(node, name, outcome)
+        if replacement is None:
+            return node
+        self.folded.append(name if isinstance(node.func, ast.Name) else f"kinda.runtime.{name}")
+        return ast.copy_location(replacement, node)
+
+    def _fold(self, node: ast.Call, name: str, outcome: bool) -> Optional[ast.expr]:
+        if any(keyword.arg != "base_prob" for keyword in node.keywords) or len(node.args) > 1:
+            return None
+        condition = node.args[0] if node.args else None
+
+        if (
+            isinstance(node.func, ast.Attribute)
+            and isinstance(condition, ast.Lambda)
+            and not condition.args.args
+        ):
+            # Enhanced form: the lambda is the body to run
+            return condition.body if outcome else ast.Constant(value=None)
+
+        if not outcome:
+            if condition is None or _is_pure(condition):
+                return ast.Constant(value=False)
+            return None
+
+        if condition is None:
+            return ast.Constant(value=True)
+        if not _is_plain_condition(condition):
+            return None
+        if isinstance(condition, ast.Constant):
+            return ast.Constant(value=bool(condition.value))
+        if isinstance(condition, ast.Lambda):
+            return ast.Constant(value=True)
+        wrapped = ast.Call(func=ast.Name(id="bool", ctx=ast.Load()), args=[condition], keywords=[])
+        wrapped.kinda_folded = True  # type: ignore[attr-defined]
+        return wrapped
+
+    def _unwrap_test(self, node: ast.AST) -> ast.AST:
+        # Truthiness is all a test needs, so bool() around a folded condition can go
+        self.generic_visit(node)
+        test = node.test  # type: ignore[attr-defined]
+        if isinstance(test, ast.Call) and getattr(test, "kinda_folded", False):
+            node.test = test.args[0]  # type: ignore[attr-defined]
+        return node
+
+    visit_If = _unwrap_test
+    visit_While = _unwrap_test
+    visit_IfExp = _unwrap_test
+    visit_Assert = _unwrap_test
+
+
+def _calls_outside_nested_scopes(nodes: List[ast.AST]):
+    """Calls in nodes, not descending into functions, lambdas or classes."""
+    pending = list(nodes)
+    while pending:
+        node = pending.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+            continue
+        if isinstance(node, ast.Call):
+            yield node
+        pending.extend(ast.iter_child_nodes(node))
+
+
+def _statement_lists(node: ast.AST):
+    for field in ("body", "orelse", "finalbody"):
+        statements = getattr(node, field, None)
+        if isinstance(statements, list) and statements and isinstance(statements[0], ast.stmt):
+            yield statements
+    for handler in getattr(node, "handlers", []):
+        yield handler.body
+    for case in getattr(node, "cases", []):
+        yield case.body
+
+
+class ProbabilityHoister:
+    """Compute loop helpers' base probabilities once per loop instead of per iteration."""
+
+    def __init__(self):
+        self.hoisted: List[str] = []
+
+    def run(self, tree: ast.Module) -> None:
+        self._process(tree.body)
+        if self.hoisted:
+            ensure_import(tree, "kinda.personality", BASE_PROBABILITY_FUNCTION)
+
+    def _process(self, statements: List[ast.stmt]) -> None:
+        index = 0
+        while index < len(statements):
+            statement = statements[index]
+            if isinstance(statement, (ast.For, ast.AsyncFor, ast.While)):
+                assignments = self._hoist(statement)
+                statements[index:index] = assignments
+                index += len(assignments)
+            for inner in _statement_lists(statement):
+                self._process(inner)
+            index += 1
+
+    def _hoist(self, loop: ast.stmt) -> List[ast.stmt]:
+        scanned: List[ast.AST] = list(loop.body)
+        if isinstance(loop, ast.While):
+            scanned.append(loop.test)
+
+        keys: List[str] = []
+        for call in _calls_outside_nested_scopes(scanned):
+            name = _helper_name(call)
+            if not isinstance(call.func, ast.Name) or name not in HOISTABLE_HELPERS:
+                continue
+            if any(keyword.arg == "base_prob" for keyword in call.keywords):
+                continue
+            key = HOISTABLE_HELPERS[name]
+            call.keywords.append(
+                ast.keyword(arg="base_prob", value=ast.Name(HOISTED_NAME_PREFIX + key, ast.Load()))
+            )
+            self.hoisted.append(name)
+            if key not in keys:
+                keys.append(key)
+
+        return [
+            ast.copy_location(
+                ast.Assign(
+                    targets=[ast.Name(HOISTED_NAME_PREFIX + key, ast.Store())],
+                    value=ast.Call(
+                        func=ast.Name(BASE_PROBABILITY_FUNCTION, ast.Load()),
+                        args=[ast.Constant(value=key)],
+                        keywords=[],
+                    ),
+                ),
+                loop,
+            )
+            for key in sorted(keys)
+        ]
+
+
+def ensure_import(tree: ast.Module, module: str, name: str) -> None:
+    """Add ``from module import name`` after the docstring and __future__ imports."""
+    for statement in tree.body:
+        if isinstance(statement, ast.ImportFrom) and statement.module == module:
+            if any(alias.name == name and alias.asname is None for alias in statement.names):
+                return
+
+    position = 0
+    for position, statement in enumerate(tree.body):
+        is_docstring = (
+            position == 0
+            and isinstance(statement, ast.Expr)
+            and isinstance(statement.value, ast.Constant)
+            and isinstance(statement.value.value, str)
+        )
+        is_future = isinstance(statement, ast.ImportFrom) and statement.module == "__future__"
+        if not (is_docstring or is_future):
+            break
+    else:
+        position = len(tree.body)
+    tree.body.insert(position, ast.ImportFrom(module=module, names=[ast.alias(name=name)], level=0))
+
+
+class DeadBranchEliminator(ast.NodeTransformer):
+    """Drop branches on constant conditions and constant expression statements."""
+
+    def __init__(self):
+        self.removed = 0
+
+    def visit_If(self, node: ast.If) -> Any:
+        self.generic_visit(node)
+        truth = constant_truth(node.test)
+        if truth is None:
+            return node
+        self.removed += 1
+        kept = node.body if truth else node.orelse
+        return kept or None
+
+    def visit_While(self, node: ast.While) -> Any:
+        self.generic_visit(node)
+        if constant_truth(node.test) is False:
+            self.removed += 1
+            return node.orelse or None
+        return node
+
+    def visit_IfExp(self, node: ast.IfExp) -> Any:
+        self.generic_visit(node)
+        truth = constant_truth(node.test)
+        if truth is None:
+            return node
+        self.removed += 1
+        return node.body if truth else node.orelse
+
+    def visit_Expr(self, node: ast.Expr) -> Any:
+        self.generic_visit(node)
+        # Folded Enhanced-form calls leave bare None/True/False statements behind
+        if isinstance(node.value, ast.Constant) and isinstance(
+            node.value.value, (bool, type(None))
+        ):
+            self.removed += 1
+            return None
+        return node
+
+
+def _fill_empty_bodies(tree: ast.AST) -> None:
+    """Put ``pass`` into blocks that elimination left empty."""
+    for node in ast.walk(tree):
+        body = getattr(node, "body", None)
+        if isinstance(body, list) and not body and not isinstance(node, ast.Module):
+            body.append(ast.Pass())
+
+
+@functools.lru_cache(maxsize=None)
+def generated_helpers() -> Dict[str, str]:
+    """ast.dump() of every function the runtime construct bodies define, by name."""
+    helpers: Dict[str, str] = {}
+    for construct in PYTHON_CONSTRUCTS.values():
+        tree = parse_python(construct.get("body", ""))
+        if tree is None:
+            continue
+        for statement in tree.body:
+            if isinstance(statement, ast.FunctionDef):
+                helpers[statement.name] = ast.dump(statement)
+    return helpers
+
+
+def _is_generated_helper(statement: ast.stmt) -> bool:
+    """The statement is a runtime helper exactly as the generator emits it."""
+    if not isinstance(statement, ast.FunctionDef):
+        return False
+    return generated_helpers().get(statement.name) == ast.dump(statement)
+
+
+def remove_unused_helpers(tree: ast.Module) -> List[str]:
+    """
+    Remove runtime helper definitions and kinda imports nothing refers to.
+
+    Only module-level functions identical to a helper the generator emits
+    and names imported from kinda modules are candidates, so user code is
+    never dropped, even when it reuses a helper's name. Runs to a fixpoint
+    since helpers refer to each other.
+    """
+    removed: List[str] = []
+    changed = True
+    while changed:
+        changed = False
+        references = Counter(node.id for node in ast.walk(tree) if isinstance(node, ast.Name))
+        exported = _exported_names(tree)
+
+        kept: List[ast.stmt] = []
+        for statement in tree.body:
+            if _is_generated_helper(statement):
+                own = Counter(
+                    node.id
+                    for node in ast.walk(statement)
+                    if isinstance(node, ast.Name) and node.id == statement.name
+                )
+                if references[statement.name] == own[statement.name] and (
+                    statement.name not in exported
+                ):
+                    removed.append(statement.name)
+                    changed = True
+                    continue
+
+            if (
+                isinstance(statement, ast.ImportFrom)
+                and (statement.module or "").startswith("kinda.")
+                and statement.names[0].name != "*"
+            ):
+                used = [
+                    alias
+                    for alias in statement.names
+                    if references[alias.asname or alias.name]
+                    or (alias.asname or alias.name) in exported
+                ]
+                if len(used) != len(statement.names):
+                    removed.extend(
+                        alias.asname or alias.name for alias in statement.names if alias not in used
+                    )
+                    changed = True
+                    if not used:
+                        continue
+                    statement.names = used
+            kept.append(statement)
+        tree.body = kept
+    return removed
+
+
+def _exported_names(tree: ast.Module) -> set:
+    for statement in tree.body:
+        if (
+            isinstance(statement, ast.Assign)
+            and any(isinstance(t, ast.Name) and t.id == "__all__" for t in statement.targets)
+            and isinstance(statement.value, (ast.List, ast.Tuple))
+        ):
+            return {
+                element.value
+                for element in statement.value.elts
+                if isinstance(element, ast.Constant) and isinstance(element.value, str)
+            }
+    return set()
+
+
+def eliminate_dead_code(tree: ast.Module) -> Tuple[int, List[str]]:
+    """Run branch elimination and helper removal; returns (branches removed, helpers removed)."""
+    eliminator = DeadBranchEliminator()
+    eliminator.visit(tree)
+    _fill_empty_bodies(tree)
+    helpers = remove_unused_helpers(tree)
+    return eliminator.removed, helpers
+
+
+def estimated_savings_us(rewrites: List[str]) -> float:
+    """Microseconds saved when every rewritten site runs once, from SITE_SAVINGS_US."""
+    return sum(SITE_SAVINGS_US.get(rewrite, 0.0) for rewrite in rewrites)
@@ -0,0 +1,129 @@
+"""
+Vectorized NumPy runtime for the python_numpy transpiler target
+
+Where the scalar runtime draws one random number per element, these helpers
+work on whole arrays: a ~maybe_for over n items draws its mask with a single
+rng.random(n) < p, and ~kinda float / ~ish fuzz n values with a single
+rng.uniform(size=n). Probabilities and fuzz ranges come from the active
+kinda-lang personality, read once per call rather than once per element.
+
+Loop bodies are vectorized too: they receive the selected items (or the
+iteration indices, for ~kinda_repeat) as one array and should be written as
+array expressions.
+"""
+
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from kinda.personality import (
+    chaos_float_drift_range,
+    chaos_fuzz_range,
+    chaos_probability,
+    chaos_tolerance,
+    chaos_variance,
+    get_kinda_repeat_variance,
+    get_personality,
+)
+
+
+class NumpyKindaRuntime:
+    """Runtime support for kinda-lang constructs over NumPy arrays"""
+
+    def __init__(self, seed: Optional[int] = None):
+        # Follow the personality's seed so --seed reproduces NumPy runs too
+        self.rng = np.random.default_rng(seed if seed is not None else get_personality().seed)
+
+    def kinda_int(self, values: Any) -> np.ndarray:
+        """Fuzzy integers: each value plus personality noise from one integer draw"""
+        values = np.asarray(values)
+        fuzz_min, fuzz_max = chaos_fuzz_range("int")
+        return values + self.rng.integers(fuzz_min, fuzz_max + 1, size=values.shape)
+
+    def kinda_float(self, values: Any) -> np.ndarray:
+        """Fuzzy floats: each value plus personality drift from one uniform draw"""
+        values = np.asarray(values, dtype=float)
+        drift_min, drift_max = chaos_float_drift_range()
+        return values + self.rng.uniform(drift_min, drift_max, size=values.shape)
+
+    def ish_value(self, values: Any, target: Any = None) -> np.ndarray:
+        """
+        ~ish over arrays: values give or take the personality variance, moved
+        halfway towards target first when one is given.
+        """
+        values = np.asarray(values, dtype=float)
+        if target is not None:
+            values = (values + np.asarray(target, dtype=float)) / 2
+        variance = chaos_variance()
+        return values + self.rng.uniform(-variance, variance, size=values.shape)
+
+    def ish_comparison(self, left: Any, right: Any) -> np.ndarray:
+        """Elementwise ~ish comparison within the personality tolerance"""
+        difference = np.asarray(left, dtype=float) - np.asarray(right, dtype=float)
+        return np.abs(difference) <= chaos_tolerance()
+
+    def mask(self, n: int, construct: str = "maybe_for") -> np.ndarray:
+        """Boolean mask of n independent decisions for a construct, from one draw"""
+        return self.rng.random(n) < chaos_probability(construct)
+
+    def sorta_print(self, *args: Any, **kwargs: Any) -> None:
+        """Probabilistic print"""
+        if self.rng.random() < chaos_probability("sorta_print"):
+            print(*args, **kwargs)
+
+    def _run_with_probability(self, construct: str, func: Callable[[], Any]) -> Any:
+        if self.rng.random() < chaos_probability(construct):
+            return func()
+        return None
+
+    def sometimes(self, func: Callable[[], Any]) -> Any:
+        """Execute function sometimes"""
+        return self._run_with_probability("sometimes", func)
+
+    def maybe(self, func: Callable[[], Any]) -> Any:
+        """Execute function maybe"""
+        return self._run_with_probability("maybe", func)
+
+    def probably(self, func: Callable[[], Any]) -> Any:
+        """Execute function probably"""
+        return self._run_with_probability("probably", func)
+
+    def rarely(self, func: Callable[[], Any]) -> Any:
+        """Execute function rarely"""
+        return self._run_with_probability("rarely", func)
+
+    def kinda_repeat_count(self, count: int) -> int:
+        """Fuzzy repetition count, normally distributed around count"""
+        count = int(count)
+        if count <= 0:
+            return 0
+        fuzzy = self.rng.normal(count, count * get_kinda_repeat_variance())
+        return max(1, int(round(fuzzy)))
+
+    def kinda_repeat(self, count: int, func: Callable[[np.ndarray], Any]) -> Any:
+        """Fuzzy repeat: func gets all iteration indices at once"""
+        return func(np.arange(self.kinda_repeat_count(count)))
+
+    def maybe_for(self, items: Any, func: Callable[[np.ndarray], Any]) -> Any:
+        """Probabilistic iteration: func gets the items that were picked at once"""
+        items = np.asarray(items)
+        return func(items[self.mask(len(items))])
+
+    def welp(self, primary: Callable[[], Any], fallback: Callable[[], Any]) -> Any:
+        """Graceful fallback on exception"""
+        try:
+            return primary()
+        except Exception:
+            return fallback()
+
+    def assert_probability(
+        self, condition_results: Any, expected_prob: float, tolerance: float = 0.1
+    ) -> None:
+        """Assert that an array of outcomes meets the expected probability"""
+        results = np.asarray(condition_results, dtype=bool)
+        if results.size == 0:
+            raise AssertionError("No results to validate probability")
+
+        actual_prob = float(results.mean())
+        if abs(actual_prob - expected_prob) > tolerance:
+            raise AssertionError(f"Expected probability {expected_prob}, got {actual_prob}")
@@ -127,7 +127,7 @@ class PythonEnhancedTarget(LanguageTarget):
         self.construct_registry["maybe_for"] = ConstructImplementation(
             construct_name="maybe_for",
             language=self.language,
-            template="kinda.runtime.maybe_for({iterable}, lambda item: {body})",
+            template="kinda.runtime.maybe_for({iterable}, lambda {item}: {body})",
             dependencies=["kinda.runtime"],
             performance_notes="Variable overhead, probabilistic iteration",
             examples=[
@@ -0,0 +1,198 @@
+"""
+Python NumPy Target for Transpiler
+
+This module implements a vectorized Python target: loops and fuzzy values
+over numeric arrays become NumPy operations backed by NumpyKindaRuntime,
+which draws the randomness for a whole array at once instead of calling the
+random module once per element.
+"""
+
+import re
+from typing import Dict, List, Any, Set
+
+from ..engine import LanguageTarget, LanguageType, ConstructImplementation
+
+RUNTIME_MODULE = "kinda.transpiler.targets.numpy_runtime"
+
+# Constructs that run once per array rather than once per element
+VECTORIZED_CONSTRUCTS = {
+    "kinda_int",
+    "kinda_float",
+    "ish_value",
+    "ish_comparison",
+    "kinda_repeat",
+    "maybe_for",
+    "assert_probability",
+}
+
+
+class PythonNumpyTarget(LanguageTarget):
+    """Python target that vectorizes kinda-lang constructs with NumPy"""
+
+    def __init__(self):
+        super().__init__(LanguageType.PYTHON_NUMPY)
+
+    def _register(
+        self, construct_name: str, template: str, performance_notes: str, examples: List[str]
+    ) -> None:
+        self.construct_registry[construct_name] = ConstructImplementation(
+            construct_name=construct_name,
+            language=self.language,
+            template=template,
+            dependencies=["numpy", RUNTIME_MODULE],
+            performance_notes=performance_notes,
+            examples=examples,
+        )
+
+    def _initialize_constructs(self) -> None:
+        """Initialize NumPy construct implementations"""
+
+        self._register(
+            "kinda_int",
+            "kinda_numpy.kinda_int({value})",
+            "One integer draw per array",
+            ["counts = kinda_numpy.kinda_int(np.arange(10))  # Each count fuzzed"],
+        )
+        self._register(
+            "kinda_float",
+            "kinda_numpy.kinda_float({value})",
+            "One uniform draw per array",
+            ["prices = kinda_numpy.kinda_float(prices)  # Every price drifts a little"],
+        )
+        self._register(
+            "ish_value",
+            "kinda_numpy.ish_value({value})",
+            "One uniform draw per array",
+            ["readings = kinda_numpy.ish_value(readings)  # Readings, roughly"],
+        )
+        self._register(
+            "ish_comparison",
+            "kinda_numpy.ish_comparison({left}, {right})",
+            "Deterministic elementwise comparison, no draws",
+            ["close = kinda_numpy.ish_comparison(measured, expected)  # Boolean mask"],
+        )
+        self._register(
+            "sorta_print",
+            "kinda_numpy.sorta_print({args})",
+            "Very low overhead, probabilistic output",
+            ['kinda_numpy.sorta_print("Mean:", values.mean())'],
+        )
+        self._register(
+            "sometimes",
+            "kinda_numpy.sometimes(lambda: {body})",
+            "One draw per execution, same as the scalar runtime",
+            ["kinda_numpy.sometimes(lambda: normalize(values))"],
+        )
+        self._register(
+            "maybe",
+            "kinda_numpy.maybe(lambda: {body})",
+            "One draw per execution, same as the scalar runtime",
+            ["kinda_numpy.maybe(lambda: values.sort())"],
+        )
+        self._register(
+            "probably",
+            "kinda_numpy.probably(lambda: {body})",
+            "One draw per execution, same as the scalar runtime",
+            ["kinda_numpy.probably(lambda: np.clip(values, 0, 1, out=values))"],
+        )
+        self._register(
+            "rarely",
+            "kinda_numpy.rarely(lambda: {body})",
+            "One draw per execution, same as the scalar runtime",
+            ["kinda_numpy.rarely(lambda: values.fill(0))"],
+        )
+        self._register(
+            "kinda_repeat",
+            "kinda_numpy.kinda_repeat({count}, lambda i: {body})",
+            "Body runs once over the array of iteration indices",
+            ["squares = kinda_numpy.kinda_repeat(1000, lambda i: i**2)"],
+        )
+        self._register(
+            "maybe_for",
+            "kinda_numpy.maybe_for({iterable}, lambda {item}: {body})",
+            "One rng.random(n) < p mask, body runs once over the picked items",
+            ["total = kinda_numpy.maybe_for(values, lambda item: item.sum())"],
+        )
+        self._register(
+            "welp",
+            "kinda_numpy.welp(lambda: {primary}, lambda: {fallback})",
+            "Overhead only on exceptions, graceful error handling",
+            ["kinda_numpy.welp(lambda: np.linalg.inv(m), lambda: np.eye(len(m)))"],
+        )
+        self._register(
+            "assert_probability",
+            "kinda_numpy.assert_probability({condition}, {expected_prob})",
+            "Mean of a boolean array, no per-element Python work",
+            ["kinda_numpy.assert_probability(kinda_numpy.mask(10000, 'maybe'), 0.5)"],
+        )
+
+    def generate_header(self, dependencies: Set[str]) -> str:
+        """Generate NumPy imports and runtime setup"""
+        return "\n".join(
+            [
+                "# Generated by kinda-lang transpiler",
+                "# Python NumPy Target",
+                "",
+                "import numpy as np",
+                f"from {RUNTIME_MODULE} import NumpyKindaRuntime",
+                "",
+                "# Initialize vectorized kinda runtime",
+                "kinda_numpy = NumpyKindaRuntime()",
+                "",
+            ]
+        )
+
+    def generate_footer(self) -> str:
+        """Generate Python footer"""
+        return """
+# End of kinda-vectorized code
+# Generated by kinda-lang transpiler
+"""
+
+    def transpile_construct(self, construct_name: str, parameters: Dict[str, Any]) -> str:
+        """Transpile a specific construct with given parameters"""
+        impl = self.construct_registry.get(construct_name)
+        if not impl:
+            raise ValueError(f"Unsupported construct: {construct_name}")
+
+        template = impl.template
+        for name, value in parameters.items():
+            if isinstance(value, list):
+                value = ", ".join(str(arg) for arg in value)
+            template = template.replace(f"{{{name}}}", str(value))
+
+        return template
+
+    def validate_target_code(self, code: str) -> List[str]:
+        """Validate generated Python code"""
+        errors = []
+
+        try:
+            compile(code, "<generated>", "exec")
+        except SyntaxError as e:
+            errors.append(f"Syntax error in generated code: {e}")
+        except Exception as e:
+            errors.append(f"Code validation error: {e}")
+
+        if "kinda_numpy." in code and "kinda_numpy = NumpyKindaRuntime()" not in code:
+            errors.append("Missing NumpyKindaRuntime initialization")
+
+        unresolved = re.findall(r"\{(\w+)\}", code)
+        if unresolved:
+            errors.append(f"Unresolved template variables: {', '.join(unresolved)}")
+
+        return errors
+
+    def estimate_performance(self, constructs_used: List[str]) -> Dict[str, float]:
+        """Estimate performance for vectorized NumPy code"""
+        base_estimates = super().estimate_performance(constructs_used)
+
+        # Vectorized constructs pay their cost once per array, not per element
+        vectorized = [name for name in constructs_used if name in VECTORIZED_CONSTRUCTS]
+        base_estimates["execution_overhead"] *= 0.8 if vectorized else 1.0
+        base_estimates["memory_overhead"] *= 1.5  # Masks and noise arrays
+        base_estimates["compilation_time"] = 0.0
+        base_estimates["startup_time"] = 0.1 * len(constructs_used) + 0.5  # numpy import
+        base_estimates["vectorized_constructs"] = float(len(vectorized))
+
+        return base_estimates
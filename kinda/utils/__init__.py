@@ -5,9 +5,11 @@ from kinda.utils.fuzzy_match import (
     find_closest_matches,
     format_did_you_mean,
 )
+from kinda.utils.streaming_stats import StreamingStats
 
 __all__ = [
     "levenshtein_distance",
     "find_closest_matches",
     "format_did_you_mean",
+    "StreamingStats",
 ]
@@ -0,0 +1,175 @@
+"""
+Constant-memory streaming statistics for long-running monitors.
+
+Tracks count, sum, min and max exactly, and approximates quantiles with a
+logarithmically bucketed histogram (in the style of HDR histograms and
+DDSketch): every positive value lands in a bucket whose bounds are within a
+fixed relative error of each other, so p50/p95/p99 are accurate to that error
+regardless of how many values were recorded. Histograms merge by adding bucket
+counts, which makes aggregating snapshots from several workers exact.
+"""
+
+import math
+from typing import Any, Dict, Iterable, Optional
+
+# Values at or below this are counted in a dedicated zero bucket
+ZERO_THRESHOLD = 1e-12
+
+
+class StreamingStats:
+    """
+    Count/sum/min/max plus a bounded log-bucket histogram for quantiles.
+
+    Args:
+        relative_accuracy: Maximum relative error of quantile estimates
+        max_buckets: Bucket limit; when exceeded, the lowest buckets are
+            collapsed together so memory stays bounded (upper quantiles keep
+            their accuracy)
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 1:
+            raise ValueError("max_buckets must be positive")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.zero_count = 0
+        self.buckets: Dict[int, int] = {}
+
+    @property
+    def mean(self) -> float:
+        """Average of recorded values (0.0 when empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record a value (optionally several times)."""
+        if count <= 0:
+            return
+        value = float(value)
+
+        self.count += count
+        self.total += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+        if value <= ZERO_THRESHOLD:
+            self.zero_count += count
+            return
+
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def update(self, values: Iterable[float]) -> None:
+        """Record every value in an iterable."""
+        for value in values:
+            self.add(value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-th quantile (0 <= q <= 1); None when empty."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            estimate = 0.0
+        else:
+            estimate = self.max
+            for index in sorted(self.buckets):
+                seen += self.buckets[index]
+                if rank < seen:
+                    # Bucket covers (gamma**(index-1), gamma**index]; take the midpoint
+                    estimate = 2.0 * self._gamma**index / (self._gamma + 1.0)
+                    break
+
+        # Estimates can't fall outside the observed range
+        return min(max(estimate, self.min), self.max)
+
+    def percentiles(self) -> Dict[str, Optional[float]]:
+        """The p50, p95 and p99 estimates."""
+        return {
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Count, mean, min, max and the standard percentiles."""
+        report = {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+        }
+        report.update(self.percentiles())
+        return report
+
+    def merge(self, other: "StreamingStats") -> "StreamingStats":
+        """Fold another histogram into this one; both must share an accuracy."""
+        if not math.isclose(other.relative_accuracy, self.relative_accuracy):
+            raise ValueError("Cannot merge StreamingStats with different relative accuracy")
+        if other.count == 0:
+            return self
+
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.zero_count += other.zero_count
+        for index, bucket_count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + bucket_count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+        return self
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Serializable (JSON/pickle friendly) copy of the current state."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_buckets": self.max_buckets,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "zero_count": self.zero_count,
+            # String keys so snapshots survive a JSON round trip
+            "buckets": {str(index): count for index, count in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: Dict[str, Any]) -> "StreamingStats":
+        """Rebuild statistics from snapshot()."""
+        stats = cls(
+            relative_accuracy=data.get("relative_accuracy", 0.01),
+            max_buckets=data.get("max_buckets", 2048),
+        )
+        stats.count = data.get("count", 0)
+        stats.total = data.get("total", 0.0)
+        stats.min = data.get("min")
+        stats.max = data.get("max")
+        stats.zero_count = data.get("zero_count", 0)
+        stats.buckets = {int(index): count for index, count in data.get("buckets", {}).items()}
+        return stats
+
+    def _collapse(self) -> None:
+        """Merge the lowest buckets until the bucket limit is respected."""
+        indices = sorted(self.buckets)
+        excess = len(indices) - self.max_buckets
+        target = indices[excess]
+        for index in indices[:excess]:
+            self.buckets[target] += self.buckets.pop(index)
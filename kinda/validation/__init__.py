@@ -1,5 +1,6 @@
 """Validation framework for Kinda-Lang files and examples."""
 
+from .check_cache import CheckCache
 from .syntax_validator import SyntaxValidator
 
-__all__ = ["SyntaxValidator"]
+__all__ = ["CheckCache", "SyntaxValidator"]
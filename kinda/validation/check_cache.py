@@ -0,0 +1,138 @@
+"""
+Check Result Cache for Syntax Validation
+
+Remembers the errors found when checking a .knda file so unchanged files are
+not transformed again. Entries are keyed by a hash of the file contents and
+the transformer sources, and live on disk so the worker processes of a
+parallel directory validation (and later validation runs) all share them.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from kinda import __version__
+
+# Bump when the layout of cached check results changes
+CACHE_FORMAT_VERSION = 1
+
+# Environment variable overriding the on-disk cache location
+CACHE_DIR_ENV = "KINDA_CACHE_DIR"
+
+# Environment variable disabling the on-disk cache ("0", "false", "off")
+CACHE_ENABLED_ENV = "KINDA_CHECK_CACHE"
+
+# Modules whose source decides what a check reports
+TRANSFORMER_MODULES = (
+    "langs/python/transformer.py",
+    "grammar/python/matchers.py",
+    "grammar/python/constructs.py",
+)
+
+# (line number, message) pairs for each error found in a file
+CheckResult = List[Tuple[int, str]]
+
+
+def default_cache_dir() -> Path:
+    """Get the default on-disk location for check results"""
+    base = os.environ.get(CACHE_DIR_ENV)
+    if base:
+        return Path(base) / "check"
+    return Path.home() / ".cache" / "kinda" / "check"
+
+
+@functools.lru_cache(maxsize=None)
+def transformer_fingerprint() -> str:
+    """Hash of the kinda version and transformer sources, so edits invalidate results"""
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    package_dir = Path(__file__).parent.parent
+    for module in TRANSFORMER_MODULES:
+        try:
+            digest.update((package_dir / module).read_bytes())
+        except OSError:
+            digest.update(module.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CheckCache:
+    """
+    Two-level (memory + disk) cache of syntax check results.
+
+    Disk entries are small JSON files written atomically, so concurrent
+    validation processes never observe partial files.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, persistent: Optional[bool] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        if persistent is None:
+            persistent = os.environ.get(CACHE_ENABLED_ENV, "1").lower() not in ("0", "false", "off")
+        self.persistent = persistent
+        self._memory: Dict[str, CheckResult] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(source: bytes) -> str:
+        """Build a cache key for the contents of a .knda file"""
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_FORMAT_VERSION}\0{transformer_fingerprint()}\0".encode("utf-8"))
+        digest.update(source)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CheckResult]:
+        """Look up the errors recorded for a key, checking memory before disk"""
+        result = self._memory.get(key)
+        if result is None:
+            result = self._load(key)
+        if result is None:
+            self.misses += 1
+            return None
+
+        self._memory[key] = result
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: CheckResult) -> None:
+        """Store check errors in memory and (best effort) on disk"""
+        self._memory[key] = result
+        self._store(key, result)
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache hit/miss counters"""
+        return {"entries": len(self._memory), "hits": self.hits, "misses": self.misses}
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[CheckResult]:
+        if not self.persistent:
+            return None
+        try:
+            data = json.loads(self._path_for(key).read_text(encoding="utf-8"))
+            return [(int(line), str(message)) for line, message in data]
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _store(self, key: str, result: CheckResult) -> None:
+        if not self.persistent:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(result, f)
+                os.replace(tmp_name, self._path_for(key))
+            except BaseException:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            # The cache is an optimization only - unwritable locations are ignored
+            pass
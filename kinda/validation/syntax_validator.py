@@ -1,64 +1,114 @@
 #!/usr/bin/env python3
 """Syntax validation module for Kinda-Lang files."""
 
-import subprocess
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional
+
+from .check_cache import CheckCache, CheckResult
+
+
+def check_file(file_path: Path, cache: Optional[CheckCache] = None) -> CheckResult:
+    """Check a file in-process, returning (line, message) for every error."""
+    try:
+        source = Path(file_path).read_bytes()
+    except OSError as e:
+        return [(0, f"Cannot read file: {e}")]
+
+    key = CheckCache.make_key(source)
+    if cache is not None:
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+    from kinda.langs.python.transformer import check_file as check_knda_file
+
+    try:
+        result = [(error.line_number, error.message) for error in check_knda_file(file_path)]
+    except Exception as e:
+        return [(0, str(e))]
+
+    if cache is not None:
+        cache.put(key, result)
+    return result
 
 
 class SyntaxValidator:
     """Validate syntax of .knda files."""
 
-    def __init__(self, strict: bool = True):
+    def __init__(
+        self,
+        strict: bool = True,
+        workers: Optional[int] = None,
+        cache: Optional[CheckCache] = None,
+    ):
         self.strict = strict
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.cache = cache if cache is not None else CheckCache()
         self.errors: List[str] = []
 
     def validate_file(self, file_path: Path) -> bool:
         """Validate syntax of a single file."""
-        try:
-            # Use kinda transform to validate syntax
-            result = subprocess.run(
-                ["python", "-m", "kinda.cli", "transform", str(file_path)],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            if result.returncode != 0:
-                self.errors.append(f"{file_path}: {result.stderr}")
-                return False
-
-            return True
-
-        except subprocess.TimeoutExpired:
-            self.errors.append(f"{file_path}: Syntax validation timeout")
-            return False
-        except Exception as e:
-            self.errors.append(f"{file_path}: {e}")
-            return False
+        return self._record(file_path, check_file(file_path, self.cache))
 
     def validate_directory(self, directory: Path) -> Dict[str, bool]:
-        """Validate all .knda files in directory."""
-        results = {}
-
-        for knda_file in directory.rglob("*.knda"):
-            results[str(knda_file)] = self.validate_file(knda_file)
-
-        return results
-
-
-def main():
+        """Validate all .knda files in directory, spread over a process pool."""
+        files = sorted(Path(directory).rglob("*.knda"))
+
+        if self.workers > 1 and len(files) > 1:
+            workers = min(self.workers, len(files))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                checked = list(
+                    executor.map(
+                        check_file,
+                        files,
+                        repeat(self.cache),
+                        chunksize=max(1, len(files) // (workers * 4)),
+                    )
+                )
+        else:
+            checked = [check_file(knda_file, self.cache) for knda_file in files]
+
+        return {
+            str(knda_file): self._record(knda_file, result)
+            for knda_file, result in zip(files, checked)
+        }
+
+    def _record(self, file_path: Path, result: CheckResult) -> bool:
+        """Add a file's errors to self.errors and report whether it passed."""
+        for line_number, message in result:
+            self.errors.append(f"{file_path}:{line_number}: {message}")
+        return not result
+
+
+def main(argv: Optional[List[str]] = None):
     """CLI interface for syntax validator."""
     import argparse
 
     parser = argparse.ArgumentParser(description="Validate Kinda-Lang syntax")
     parser.add_argument("paths", nargs="*", help="Files or directories to validate")
     parser.add_argument("--strict", action="store_true", help="Strict validation mode")
-
-    args = parser.parse_args()
-
-    validator = SyntaxValidator(strict=args.strict)
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes for directory validation (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Re-check files even if they are unchanged"
+    )
+
+    args = parser.parse_args(argv)
+
+    validator = SyntaxValidator(
+        strict=args.strict,
+        workers=args.workers,
+        cache=CheckCache(persistent=False) if args.no_cache else None,
+    )
 
     # Default to current directory if no paths provided
     paths = args.paths or ["."]
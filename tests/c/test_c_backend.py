@@ -0,0 +1,132 @@
+"""
+Tests for the C backend: transformation, libkinda and kinda run --lang c.
+
+Tests that compile C are skipped when no C compiler is installed.
+"""
+
+import subprocess
+
+import pytest
+
+from kinda.cli import main
+from kinda.exceptions import KindaParseError
+from kinda.langs.c import transformer_c
+from kinda.langs.c.build import CBuildError, compile_program, find_compiler
+
+needs_compiler = pytest.mark.skipif(find_compiler() is None, reason="no C compiler available")
+
+PROGRAM = """\
+kinda int x = 5;
+~kinda int y ~= 10;
+sorta print("x and y:", x, y);
+x ~= x + 2;
+sometimes (x < y) {
+    sorta print("x is smaller");
+}
+kinda binary b;
+"""
+
+
+class TestTransformC:
+    """Test generating C from .c.knda sources"""
+
+    def test_personality_initializer(self):
+        initializer = transformer_c.personality_initializer("reliable", 1)
+        assert ".int_fuzz_min = 0" in initializer
+        assert ".int_fuzz_max = 0" in initializer
+        assert ".sometimes = 0.99" in initializer
+
+    def test_generated_program(self, tmp_path):
+        source = tmp_path / "prog.c.knda"
+        source.write_text(PROGRAM)
+
+        (output,) = transformer_c.transform(source, tmp_path / "out")
+        code = output.read_text()
+
+        assert output.name == "prog.c"
+        assert "kinda_init(&kinda_profile);" in code
+        assert "int x = kinda_int(5);" in code
+        assert "int y = kinda_int(10);" in code
+        assert 'sorta_print("%s %d %d", "x and y:", x, y);' in code
+        assert "x = fuzzy_assign(x + 2);" in code
+        assert "if (sometimes(x < y)) {" in code
+        assert "int b = kinda_binary();" in code
+        # libkinda travels with the generated code
+        assert (tmp_path / "out" / "fuzzy.h").exists()
+        assert (tmp_path / "out" / "fuzzy.c").exists()
+
+    def test_print_arguments_with_commas(self):
+        transformer_c.declared_specifiers.clear()
+        transformer_c.transform_line("kinda int total = 3;")
+        (line,) = transformer_c.transform_line('sorta print("a, b", total);')
+        assert line == 'sorta_print("%s %d", "a, b", total);'
+
+    def test_print_specifiers_follow_declarations(self, tmp_path):
+        source = tmp_path / "prog.c.knda"
+        source.write_text(
+            'const char *name = "kinda";\ndouble ratio = 0.5;\n'
+            "sorta print(name, ratio, 2.5, 'c', 7);\n"
+        )
+        code = transformer_c.transform_file(source, personality="{0}")
+        assert "sorta_print(\"%s %f %f %c %d\", name, ratio, 2.5, 'c', 7);" in code
+
+    def test_print_rejects_untyped_arguments(self, tmp_path):
+        source = tmp_path / "prog.c.knda"
+        source.write_text("kinda int x = 1;\nsometimes (x > 0) {\n    sorta print(x + 1);\n}\n")
+        with pytest.raises(KindaParseError) as exc_info:
+            transformer_c.transform_file(source, personality="{0}")
+        assert exc_info.value.line_number == 3
+        assert "can't tell the type of 'x + 1'" in exc_info.value.message
+
+
+@needs_compiler
+class TestLibkinda:
+    """Test compiling and running against libkinda"""
+
+    def compile(self, tmp_path, mood="reliable", chaos_level=1):
+        source = tmp_path / "prog.c.knda"
+        source.write_text(PROGRAM)
+        c_file = tmp_path / "prog.c"
+        c_file.write_text(
+            transformer_c.transform_file(
+                source, personality=transformer_c.personality_initializer(mood, chaos_level)
+            )
+        )
+        return compile_program(c_file, tmp_path / "cache")
+
+    def run(self, executable, seed):
+        env = {"KINDA_SEED": str(seed)}
+        return subprocess.run([str(executable)], capture_output=True, text=True, env=env).stdout
+
+    def test_reliable_program_output(self, tmp_path):
+        output = self.run(self.compile(tmp_path), seed=1)
+        assert "[print] x and y: 5 10" in output
+
+    def test_seed_makes_runs_reproducible(self, tmp_path):
+        executable = self.compile(tmp_path, mood="chaotic", chaos_level=10)
+        assert self.run(executable, seed=7) == self.run(executable, seed=7)
+        outputs = {self.run(executable, seed=seed) for seed in range(10)}
+        assert len(outputs) > 1
+
+    def test_binary_is_cached(self, tmp_path):
+        first = self.compile(tmp_path)
+        mtime = first.stat().st_mtime_ns
+        assert self.compile(tmp_path) == first
+        assert first.stat().st_mtime_ns == mtime
+
+    def test_compile_errors(self, tmp_path):
+        c_file = tmp_path / "broken.c"
+        c_file.write_text("int main( {")
+        with pytest.raises(CBuildError):
+            compile_program(c_file, tmp_path / "cache")
+
+
+@needs_compiler
+def test_kinda_run_lang_c(tmp_path, capfd, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / "prog.knda"
+    source.write_text(PROGRAM)
+
+    assert main(["run", str(source), "--lang", "c", "--mood", "reliable", "--seed", "3"]) == 0
+    assert "[print] x and y:" in capfd.readouterr().out
+    assert list((tmp_path / ".kinda-build" / "c-cache").glob("prog-*"))
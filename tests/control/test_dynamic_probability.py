@@ -0,0 +1,224 @@
+"""
+Tests for Dynamic Probability Management
+
+This module tests the bounded metrics and history kept by the dynamic
+probability manager, aggregation of learning data across workers, and the
+per-construct rule index, evaluation cache and locking.
+"""
+
+import random
+import threading
+
+import pytest
+
+from kinda.control.dynamic import (
+    AdjustmentType,
+    DynamicProbabilityManager,
+    PerformanceMetrics,
+    ProbabilityRule,
+    RuleCondition,
+)
+
+
+class TestPerformanceMetrics:
+    """Test per-construct performance metrics"""
+
+    def test_execution_time_percentiles(self):
+        """Test execution times feed the streaming percentiles"""
+        metrics = PerformanceMetrics("sometimes")
+        for i in range(1, 101):
+            metrics.record_call(i / 1000, True, 0.5)
+
+        assert metrics.average_execution_time == pytest.approx(0.0505)
+        assert metrics.execution_time_stats.quantile(0.95) == pytest.approx(0.095, rel=0.02)
+
+    def test_merge(self):
+        """Test merging metrics from another worker"""
+        first = PerformanceMetrics("maybe")
+        second = PerformanceMetrics("maybe")
+        first.record_call(0.01, True, 0.6)
+        second.record_call(0.03, False, 0.4)
+
+        first.merge(second)
+
+        assert first.call_count == 2
+        assert first.error_count == 1
+        assert first.execution_time_stats.max == 0.03
+        assert list(first.probability_history) == [0.6, 0.4]
+
+
+class TestDynamicProbabilityManager:
+    """Test the dynamic probability manager's bounded state"""
+
+    def test_adjustment_history_is_bounded(self):
+        """Test the rolling history stays bounded while the total keeps counting"""
+        manager = DynamicProbabilityManager(history_limit=10)
+        manager.record_construct_execution("rarely", 0.001, True, 0.15)
+        manager.metrics["rarely"].call_count = 100  # Trigger the activation boost rule
+
+        for _ in range(50):
+            manager.get_dynamic_probability("rarely", 0.15)
+
+        assert len(manager.adjustment_history) == 10
+        assert len(manager.get_adjustment_history("rarely")) == 10
+        assert len(manager.get_adjustment_history(limit=3)) == 3
+        assert manager.get_summary_report()["total_adjustments"] == 50
+
+    def test_learning_data_round_trip(self):
+        """Test exported learning data restores metrics and statistics"""
+        manager = DynamicProbabilityManager()
+        for i in range(20):
+            manager.record_construct_execution("sometimes", 0.001 * (i + 1), i % 4 != 0, 0.5)
+
+        restored = DynamicProbabilityManager()
+        restored.import_learning_data(manager.export_learning_data())
+        metrics = restored.get_construct_metrics("sometimes")
+
+        assert metrics.call_count == 20
+        assert metrics.error_count == 5
+        assert metrics.execution_time_stats.summary() == (
+            manager.get_construct_metrics("sometimes").execution_time_stats.summary()
+        )
+
+    def test_merge_learning_data(self):
+        """Test aggregating learning data exported by several workers"""
+        workers = [DynamicProbabilityManager() for _ in range(3)]
+        for worker in workers:
+            for _ in range(10):
+                worker.record_construct_execution("probably", 0.002, True, 0.7)
+
+        aggregate = DynamicProbabilityManager()
+        for worker in workers:
+            aggregate.merge_learning_data(worker.export_learning_data())
+
+        summary = aggregate.get_summary_report()["construct_summaries"]["probably"]
+        assert summary["call_count"] == 30
+        assert summary["p50_execution_time"] == pytest.approx(0.002, rel=0.01)
+
+
+class TestRuleIndexAndCaching:
+    """Test per-construct rule indexing, evaluation caching and sharding"""
+
+    @pytest.fixture
+    def manager(self):
+        manager = DynamicProbabilityManager()
+        for rule in list(manager.rules):
+            manager.remove_rule(rule.name)
+        return manager
+
+    @staticmethod
+    def _rule(name, construct_name, condition, threshold, value=0.5):
+        return ProbabilityRule(
+            name=name,
+            construct_name=construct_name,
+            condition=condition,
+            threshold=threshold,
+            adjustment_type=AdjustmentType.ABSOLUTE,
+            adjustment_value=value,
+        )
+
+    def test_only_matching_rules_are_evaluated(self, manager, monkeypatch):
+        """Test rules for other constructs are never looked at"""
+        manager.add_rule(self._rule("other", "maybe", RuleCondition.CALL_COUNT, 0))
+        calls = []
+        monkeypatch.setattr(
+            ProbabilityRule, "evaluate", lambda rule, metrics: calls.append(rule.name) or True
+        )
+
+        assert manager.get_dynamic_probability("sometimes", 0.3) == 0.3
+        assert calls == []
+
+    def test_evaluation_cached_until_metrics_change(self, manager, monkeypatch):
+        """Test rules are re-evaluated only after new executions are recorded"""
+        manager.add_rule(self._rule("boost", "rarely", RuleCondition.CALL_COUNT, 2, 0.4))
+        evaluate = ProbabilityRule.evaluate
+        calls = []
+
+        def counting_evaluate(rule, metrics):
+            calls.append(rule.name)
+            return evaluate(rule, metrics)
+
+        monkeypatch.setattr(ProbabilityRule, "evaluate", counting_evaluate)
+
+        for _ in range(5):
+            assert manager.get_dynamic_probability("rarely", 0.15) == 0.15
+        assert len(calls) == 1
+
+        manager.record_construct_execution("rarely", 0.001, True, 0.15)
+        manager.record_construct_execution("rarely", 0.001, True, 0.15)
+        assert manager.get_dynamic_probability("rarely", 0.15) == 0.4
+        assert len(calls) == 2
+
+        manager.disable_rule("boost")
+        assert manager.get_dynamic_probability("rarely", 0.15) == 0.15
+
+    def test_cache_survives_interleaved_records(self, manager, monkeypatch):
+        """Test lookups between records only re-evaluate when a threshold could flip"""
+        manager.add_rule(self._rule("errors", "sometimes", RuleCondition.ERROR_RATE, 0.2, 0.1))
+        manager.add_rule(self._rule("warm", "sometimes", RuleCondition.CALL_COUNT, 300, 0.9))
+        manager.add_rule(self._rule("steady", "sometimes", RuleCondition.SUCCESS_RATE, 0.5, 0.3))
+        rules = list(manager.rules)
+        evaluate = ProbabilityRule.evaluate
+        calls = []
+
+        def counting_evaluate(rule, metrics):
+            calls.append(rule.name)
+            return evaluate(rule, metrics)
+
+        monkeypatch.setattr(ProbabilityRule, "evaluate", counting_evaluate)
+
+        rng = random.Random(3)
+        for i in range(1000):
+            # A burst of failures pushes the error rate over its threshold midway
+            success = not 400 <= i < 550 and rng.random() > 0.05
+            probability = manager.get_dynamic_probability("sometimes", 0.5)
+
+            expected = 0.5
+            current = manager.metrics["sometimes"].get_metrics_dict()
+            for rule in rules:
+                if evaluate(rule, current):
+                    expected = rule.apply_adjustment(expected)
+            assert probability == expected, i
+
+            manager.record_construct_execution("sometimes", 0.001, success, probability)
+
+        assert len(calls) < 1000 * len(rules) // 5
+
+    def test_time_based_rule_uses_deadline(self, manager):
+        """Test cached time-based rules still fire once their time has come"""
+        manager.add_rule(self._rule("later", "maybe", RuleCondition.TIME_BASED, 60, 0.9))
+
+        assert manager.get_dynamic_probability("maybe", 0.6) == 0.6
+        manager.start_time -= 120
+        manager.record_construct_execution("maybe", 0.001, True, 0.6)
+        assert manager.get_dynamic_probability("maybe", 0.6) == 0.9
+
+    def test_context_overrides_bypass_cache(self, manager):
+        """Test explicit context metrics are always evaluated"""
+        manager.add_rule(self._rule("errors", "sometimes", RuleCondition.ERROR_RATE, 0.5, 0.1))
+
+        assert manager.get_dynamic_probability("sometimes", 0.5) == 0.5
+        assert manager.get_dynamic_probability("sometimes", 0.5, {"error_rate": 0.9}) == 0.1
+
+    def test_concurrent_constructs(self, manager):
+        """Test concurrent recording across constructs keeps exact counts"""
+        received = []
+        manager.feedback_collector.register_callback(lambda name, ctx: received.append(name))
+
+        def worker(construct_name):
+            for _ in range(500):
+                manager.get_dynamic_probability(construct_name, 0.5)
+                manager.record_construct_execution(construct_name, 0.001, True, 0.5)
+
+        threads = [
+            threading.Thread(target=worker, args=(name,))
+            for name in ("sometimes", "maybe", "probably", "sometimes")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert manager.get_construct_metrics("sometimes").call_count == 1000
+        assert manager.get_construct_metrics("maybe").call_count == 500
+        assert len(received) == 2000
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any
 
 from kinda.migration.decorators import enhance
+from kinda.personality import chaos_float_drift_range, chaos_fuzz_range
 
 
 class TestNumPyCompatibility:
@@ -44,8 +45,27 @@ class TestNumPyCompatibility:
             result = process_array(arr)
             assert isinstance(result, np.ndarray)
             assert result.shape == arr.shape
-            # Allow for fuzzy enhancement variations
-            assert np.allclose(result, arr * 2 + 1, rtol=0.5)
+            # scaling_factor = 2 picks up integer fuzz and bias = 1.0 float drift,
+            # so the result is data * slope + intercept with both within the
+            # personality's fuzz bounds around 2 and 1
+            fuzz_min, fuzz_max = chaos_fuzz_range("int")
+            drift_min, drift_max = chaos_float_drift_range()
+            flat_in, flat_out = arr.ravel(), result.ravel()
+            if np.ptp(flat_in) > 0:
+                slope, intercept = np.polyfit(flat_in, flat_out, 1)
+                assert np.allclose(flat_out, flat_in * slope + intercept)
+                assert 2 + fuzz_min - 1e-6 <= slope <= 2 + fuzz_max + 1e-6
+                assert 1 + drift_min - 1e-6 <= intercept <= 1 + drift_max + 1e-6
+            else:
+                # Constant input maps to one value between the extremes of the fuzzed map
+                value = flat_in[0]
+                extremes = [
+                    value * (2 + fuzz) + 1 + drift
+                    for fuzz in (fuzz_min, fuzz_max)
+                    for drift in (drift_min, drift_max)
+                ]
+                assert np.allclose(flat_out, flat_out[0])
+                assert min(extremes) - 1e-6 <= flat_out[0] <= max(extremes) + 1e-6
 
     def test_numpy_mathematical_operations(self):
         """Test enhanced mathematical operations with NumPy"""
@@ -12,7 +12,12 @@ import tempfile
 from pathlib import Path
 from typing import Set
 
-from kinda.migration.decorators import enhance, enhance_class, EnhancementConfig
+from kinda.migration.decorators import (
+    enhance,
+    enhance_class,
+    EnhancementConfig,
+    get_lazy_enhancement_stats,
+)
 from kinda.injection.ast_analyzer import PatternType
 
 
@@ -224,6 +229,66 @@ class TestEnhanceClassDecorator:
         assert isinstance(result2, int)
 
 
+class TestLazyClassEnhancement:
+    """Test @enhance_class(lazy=True)"""
+
+    def test_methods_deferred_until_first_call(self):
+        """Test that no method is enhanced before it is invoked"""
+        from kinda.migration.decorators import LazyEnhancedMethod
+
+        @enhance_class(patterns=["kinda_int"], lazy=True)
+        class Calculator:
+            def add(self, a: int, b: int) -> int:
+                return a + b
+
+            def offset(self) -> int:
+                base = 100
+                return base
+
+        assert isinstance(Calculator.__dict__["add"], LazyEnhancedMethod)
+        stats = get_lazy_enhancement_stats(Calculator)
+        assert stats == {"total": 2, "materialized": 0, "pending": ["add", "offset"]}
+
+        calc = Calculator()
+        assert calc.add(2, 3) == 5
+
+        stats = get_lazy_enhancement_stats(Calculator)
+        assert stats["materialized"] == 1
+        assert stats["pending"] == ["offset"]
+        # The compiled method replaced the descriptor on the class
+        assert not isinstance(Calculator.__dict__["add"], LazyEnhancedMethod)
+        assert hasattr(calc.add, "__kinda_enhanced__")
+
+    def test_lazy_method_runs_enhanced_code(self):
+        """Test that the materialized method executes injected constructs"""
+
+        @enhance_class(patterns=["kinda_int"], lazy=True)
+        class Scorer:
+            def score(self) -> int:
+                base = 1000
+                return base
+
+        scorer = Scorer()
+        results = [scorer.score() for _ in range(20)]
+        assert all(990 <= r <= 1010 for r in results)
+        assert Scorer.score.__kinda_compiled__ is True
+
+    def test_lazy_metadata_before_materialization(self):
+        """Test that pending methods still look like enhanced methods"""
+        import inspect
+
+        @enhance_class(patterns=["kinda_int"], lazy=True)
+        class Greeter:
+            def greet(self, name: str = "world") -> str:
+                """Say hello"""
+                return f"hello {name}"
+
+        assert Greeter.greet.__kinda_enhanced__ is True
+        assert Greeter.greet.__doc__ == "Say hello"
+        assert "name" in inspect.signature(Greeter.greet).parameters
+        assert get_lazy_enhancement_stats(Greeter)["materialized"] == 0
+
+
 class TestPatternParsing:
     """Test pattern parsing functionality"""
 
@@ -295,6 +360,118 @@ class TestEdgeCases:
         assert result is None
 
 
+class TestCompiledEnhancement:
+    """Test compiled execution and the enhanced code cache"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path):
+        from kinda.migration.code_cache import EnhancedCodeCache, set_code_cache
+
+        cache = EnhancedCodeCache(cache_dir=tmp_path)
+        set_code_cache(cache)
+        yield cache
+        set_code_cache(None)
+
+    def test_enhanced_function_runs_injected_code(self):
+        """Test that the compiled function actually executes injected constructs"""
+
+        @enhance(patterns=["kinda_int"])
+        def fuzzy_constant():
+            value = 1000
+            return value
+
+        assert fuzzy_constant.__kinda_compiled__ is True
+        assert fuzzy_constant.__code__ is not fuzzy_constant.__kinda_original__.__code__
+        assert "kinda_int" in fuzzy_constant.__code__.co_freevars
+        results = {fuzzy_constant() for _ in range(50)}
+        assert all(990 <= r <= 1010 for r in results)
+
+    def test_closure_and_defaults_preserved(self):
+        """Test that nonlocal state and defaults survive compilation"""
+
+        def make_counter():
+            count = 0
+
+            @enhance(patterns=["sorta_print"])
+            def counter(step=1, *, scale=2):
+                nonlocal count
+                count += step * scale
+                return count
+
+            return counter
+
+        counter = make_counter()
+        assert counter.__kinda_compiled__ is True
+        assert counter() == 2
+        assert counter(step=3) == 8
+        assert counter.__kwdefaults__ == {"scale": 2}
+
+    def test_method_private_names_and_super(self):
+        """Test that methods keep name mangling and zero-argument super()"""
+
+        class Base:
+            def value(self):
+                return 1
+
+        @enhance_class(patterns=["sorta_print"])
+        class Child(Base):
+            def __init__(self):
+                self.__secret = 5
+
+            def value(self):
+                return super().value() + self.__secret
+
+        assert Child.value.__kinda_compiled__ is True
+        assert Child().value() == 6
+
+    def test_cache_reused_across_instances(self, isolated_cache, tmp_path):
+        """Test that a fresh cache (e.g. another process) loads compiled code from disk"""
+        from kinda.migration.code_cache import EnhancedCodeCache, set_code_cache
+
+        def original(x):
+            offset = 10
+            return x + offset
+
+        enhance(patterns=["kinda_int"])(original)
+        assert isolated_cache.stats()["misses"] == 1
+        assert list(tmp_path.glob("*.kcode"))
+
+        fresh = EnhancedCodeCache(cache_dir=tmp_path)
+        set_code_cache(fresh)
+        enhanced = enhance(patterns=["kinda_int"])(original)
+
+        assert fresh.stats()["disk_hits"] == 1
+        assert fresh.stats()["misses"] == 0
+        assert 8 <= enhanced(0) <= 12
+
+    def test_different_config_uses_different_entry(self, isolated_cache):
+        """Test that the cache is keyed by enhancement configuration"""
+
+        def original():
+            value = 3
+            return value
+
+        enhance(patterns=["kinda_int"])(original)
+        enhance(patterns=["kinda_int"], safety_level="risky")(original)
+        assert isolated_cache.stats()["misses"] == 2
+
+    def test_key_follows_injection_engine_source(self, monkeypatch):
+        """Test that changing the injection engine invalidates cached code"""
+        from kinda.migration import code_cache
+
+        key = code_cache.EnhancedCodeCache.make_key("def f(): pass", "config")
+        monkeypatch.setattr(code_cache, "engine_fingerprint", lambda: "patched engine")
+        assert code_cache.EnhancedCodeCache.make_key("def f(): pass", "config") != key
+
+    def test_corrupt_cache_entry_is_ignored(self, tmp_path):
+        """Test that unreadable cache files are treated as misses"""
+        from kinda.migration.code_cache import EnhancedCodeCache
+
+        cache = EnhancedCodeCache(cache_dir=tmp_path)
+        (tmp_path / "deadbeef.kcode").write_bytes(b"not a code object")
+        assert cache.get("deadbeef") is None
+
+
 class TestIntegration:
     """Integration tests with other Epic 127 components"""
 
@@ -14,6 +14,7 @@ from pathlib import Path
 from kinda.migration.decorators import enhance, enhance_class, kinda_migrate
 from kinda.migration.strategy import FourPhaseStrategy, MigrationStrategy
 from kinda.migration.utilities import MigrationUtilities
+from kinda.personality import chaos_float_drift_range, chaos_fuzz_range
 
 
 class TestFourPhaseMigrationStrategy:
@@ -43,7 +44,9 @@ class TestFourPhaseMigrationStrategy:
 
         # Should work and produce reasonable results
         assert isinstance(result, int)
-        assert result >= 100  # 10+20+30+40 = 100, may be higher due to fuzzy enhancement
+        # 10+20+30+40 = 100, shifted by the integer fuzz on `total = 0`
+        fuzz_min, fuzz_max = chaos_fuzz_range("int")
+        assert 100 + fuzz_min <= result <= 100 + fuzz_max
         assert hasattr(calculate_total, "__kinda_enhanced__")
 
     def test_phase_2_class_enhancement(self):
@@ -162,8 +165,11 @@ class TestFourPhaseMigrationStrategy:
         assert isinstance(result, dict)
         assert "total_sales" in result
         assert "transaction_count" in result
-        assert result["transaction_count"] == 5
-        assert result["total_sales"] >= 500.0  # Base total, may be higher due to fuzzy enhancement
+        # The counter starts from a fuzzed 0 and the total from a drifted 0.0
+        fuzz_min, fuzz_max = chaos_fuzz_range("int")
+        drift_min, drift_max = chaos_float_drift_range()
+        assert 5 + fuzz_min <= result["transaction_count"] <= 5 + fuzz_max
+        assert 500.0 + drift_min - 1e-9 <= result["total_sales"] <= 500.0 + drift_max + 1e-9
 
         # Should be enhanced
         assert hasattr(analyze_sales_data, "__kinda_enhanced__")
@@ -23,6 +23,7 @@ from dataclasses import dataclass
 from kinda.migration.decorators import enhance
 from kinda.injection.injection_engine import InjectionEngine, InjectionConfig
 from kinda.injection.ast_analyzer import PatternType
+from kinda.langs.python.runtime.fuzzy import kinda_int, sorta_print
 
 
 @dataclass
@@ -41,8 +42,8 @@ class PerformanceResult:
     def meets_target(self) -> bool:
         """Check if overhead meets reasonable target based on operation type"""
         # Realistic targets based on the current enhancement architecture:
-        # - Decorator overhead includes AST analysis and ProbabilityContext setup
-        # - These are significant operations that justify higher overhead
+        # - AST analysis happens once at decoration time and is cached
+        # - Per-call cost is the injected constructs themselves
         return (
             self.overhead_percentage < 2500.0
         )  # Allow up to 25x overhead for current architecture
@@ -164,13 +165,8 @@ class TestBasicFunctionOverhead:
             perf_result.meets_target
         ), f"Overhead {perf_result.overhead_percentage:.2f}% exceeds reasonable target"
 
-        # Additional validation: overhead should be consistent and measurable
-        assert (
-            perf_result.overhead_percentage > 0
-        ), "Enhancement should have some measurable overhead"
-        assert (
-            perf_result.enhanced_time > perf_result.baseline_time
-        ), "Enhanced function should be slower"
+        # No literal assignments to inject - compiled code runs without a wrapper
+        assert enhanced_arithmetic.__kinda_compiled__
 
     def test_string_operations_overhead(self):
         """Test overhead for string operations"""
@@ -202,10 +198,13 @@ class TestBasicFunctionOverhead:
     def test_loop_operations_overhead(self):
         """Test overhead for loop operations"""
 
+        # Baseline calls the runtime constructs by hand, so the comparison
+        # measures overhead beyond the constructs themselves
         def baseline_loop(n: int) -> int:
-            total = 0
+            total = kinda_int(0)
             for i in range(n):
-                total += i * 2
+                multiplier = kinda_int(2)
+                total += i * multiplier
             return total
 
         @enhance(patterns=["kinda_int"])
@@ -223,10 +222,9 @@ class TestBasicFunctionOverhead:
             perf_result.meets_target
         ), f"Overhead {perf_result.overhead_percentage:.2f}% exceeds reasonable target"
 
-        # Additional validation: overhead should be consistent and measurable
-        assert (
-            perf_result.overhead_percentage > 0
-        ), "Enhancement should have some measurable overhead"
+        # The fuzzy multiplier is compiled in, with no per-call wrapper around it
+        assert enhanced_loop.__kinda_compiled__
+        assert enhanced_loop.__code__.co_freevars == ("kinda_int",)
 
     def test_conditional_operations_overhead(self):
         """Test overhead for conditional operations"""
@@ -235,7 +233,8 @@ class TestBasicFunctionOverhead:
             results = []
             for val in values:
                 if val > 10:
-                    results.append(val * 2)
+                    multiplier = kinda_int(2)
+                    results.append(val * multiplier)
                 else:
                     results.append(val)
             return results
@@ -261,10 +260,9 @@ class TestBasicFunctionOverhead:
             perf_result.meets_target
         ), f"Overhead {perf_result.overhead_percentage:.2f}% exceeds reasonable target"
 
-        # Additional validation: overhead should be consistent and measurable
-        assert (
-            perf_result.overhead_percentage > 0
-        ), "Enhancement should have some measurable overhead"
+        # The fuzzy multiplier is compiled in, with no per-call wrapper around it
+        assert enhanced_conditional.__kinda_compiled__
+        assert enhanced_conditional.__code__.co_freevars == ("kinda_int",)
 
 
 @pytest.mark.skipif(
@@ -415,9 +413,9 @@ class TestRealWorldScenarios:
         """Test performance for data processing scenarios"""
 
         def baseline_data_processing(data: List[Dict[str, Any]]) -> Dict[str, Any]:
-            total = 0
-            count = 0
-            max_val = 0
+            total = kinda_int(0)
+            count = kinda_int(0)
+            max_val = kinda_int(0)
 
             for item in data:
                 value = item.get("value", 0)
@@ -425,6 +423,7 @@ class TestRealWorldScenarios:
                 count += 1
                 if value > max_val:
                     max_val = value
+                    sorta_print(f"New max value: {max_val}")
 
             return {
                 "total": total,
@@ -466,10 +465,9 @@ class TestRealWorldScenarios:
             perf_result.meets_target
         ), f"Overhead {perf_result.overhead_percentage:.2f}% exceeds reasonable target"
 
-        # Additional validation: overhead should be consistent and measurable
-        assert (
-            perf_result.overhead_percentage > 0
-        ), "Enhancement should have some measurable overhead"
+        # Same constructs as the hand-written baseline, compiled in without a wrapper
+        assert enhanced_data_processing.__kinda_compiled__
+        assert set(enhanced_data_processing.__code__.co_freevars) == {"kinda_int", "sorta_print"}
 
     def test_web_request_handler_performance(self):
         """Test performance for web request handler scenarios"""
@@ -696,6 +694,10 @@ class TestScalingCharacteristics:
 
             print(f"{name} function overhead: {perf_result.overhead_percentage:.2f}%")
 
+            # Nothing to inject: the enhanced function runs the original bytecode
+            assert enhanced_func.__kinda_compiled__
+            assert enhanced_func.__code__.co_code == base_func.__code__.co_code
+
             # More complex functions should have relatively lower overhead percentage
             # because the decorator overhead becomes smaller relative to function work
             if name == "complex":
@@ -711,11 +713,6 @@ class TestScalingCharacteristics:
                     perf_result.overhead_percentage < 2500
                 ), f"Simple function overhead too high: {perf_result.overhead_percentage:.2f}%"
 
-            # Basic validation
-            assert (
-                perf_result.overhead_percentage > 0
-            ), "Enhancement should have some measurable overhead"
-
     def test_pattern_count_scaling(self):
         """Test how overhead scales with number of patterns"""
 
@@ -742,17 +739,16 @@ class TestScalingCharacteristics:
 
             print(f"{description} overhead: {perf_result.overhead_percentage:.2f}%")
 
+            # Only the print is injectable, and only when sorta_print is enabled
+            expected = ("sorta_print",) if "sorta_print" in patterns else ()
+            assert enhanced_func.__code__.co_freevars == expected
+
             # Overhead should remain reasonable even with multiple patterns
             # Pattern count overhead is currently fixed per decorator setup
             assert (
                 perf_result.overhead_percentage < 2500
             ), f"Too many patterns cause excessive overhead: {perf_result.overhead_percentage:.2f}%"
 
-            # Basic validation
-            assert (
-                perf_result.overhead_percentage > 0
-            ), "Enhancement should have some measurable overhead"
-
 
 @pytest.mark.skipif(
     any(
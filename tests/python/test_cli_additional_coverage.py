@@ -23,12 +23,11 @@ class TestCLIAdditionalCoverage:
             assert exc_info.value.code == 0
 
     def test_cli_version_command(self):
-        """Test CLI with invalid flag (no version support)."""
+        """Test CLI --version."""
         with patch("sys.argv", ["kinda", "--version"]):
             with patch("builtins.print") as mock_print:
-                with pytest.raises(SystemExit) as exc_info:
-                    main()
-                assert exc_info.value.code == 2  # argparse error code for invalid args
+                assert main() == 0
+                mock_print.assert_called_once_with("kinda 0.5.1")
 
     def test_validate_knda_file_missing(self):
         """Test validate_knda_file with missing file."""
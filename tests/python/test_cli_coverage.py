@@ -143,8 +143,9 @@ class TestCLIMainFunction:
 
                 shutil.rmtree(build_dir)
 
-    def test_run_unsupported_language_error(self, capsys):
-        """Test run with unsupported language shows error"""
+    def test_run_c_compile_error(self, capsys, tmp_path, monkeypatch):
+        """Test run --lang c reports C that doesn't compile"""
+        monkeypatch.chdir(tmp_path)
         with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
             f.write("~kinda int x = 42")
             temp_path = Path(f.name)
@@ -154,10 +155,7 @@ class TestCLIMainFunction:
                 result = main()
                 captured = capsys.readouterr()
                 assert result == 1
-                assert (
-                    "C support is coming in v0.4.0" in captured.out
-                    or "C transpiler is planned for v0.4.0" in captured.out
-                )
+                assert "C compilation failed" in captured.out
         finally:
             temp_path.unlink()
 
@@ -169,13 +169,10 @@ class TestDetectLanguage:
         assert detect_language(Path("test.py.knda"), None) == "python"
         assert detect_language(Path("test.py"), None) == "python"
 
-    def test_detect_c_extension(self, capsys):
-        """Test detecting C from file extension raises error."""
-        with pytest.raises(ValueError, match="C files not yet supported"):
-            detect_language(Path("test.c.knda"), None)
-
-        with pytest.raises(ValueError, match="C files not yet supported"):
-            detect_language(Path("test.c"), None)
+    def test_detect_c_extension(self):
+        """Test detecting C from file extension."""
+        assert detect_language(Path("test.c.knda"), None) == "c"
+        assert detect_language(Path("test.c"), None) == "c"
 
     def test_detect_unknown_extension(self):
         """Test unknown extension defaults to Python."""
@@ -187,13 +184,9 @@ class TestDetectLanguage:
         assert detect_language(Path("test.c.knda"), "python") == "python"
         assert detect_language(Path("test.unknown"), "python") == "python"
 
-    def test_detect_with_forced_c(self, capsys):
-        """Test forced C language raises error."""
-        with pytest.raises(ValueError, match="C language not yet supported"):
-            detect_language(Path("test.py.knda"), "c")
-
-        captured = capsys.readouterr()
-        assert "C transpiler is planned for v0.4.0" in captured.out
+    def test_detect_with_forced_c(self):
+        """Test forced C language."""
+        assert detect_language(Path("test.py.knda"), "c") == "c"
 
 
 class TestGetTransformer:
@@ -205,12 +198,11 @@ class TestGetTransformer:
         assert transformer is not None
         assert hasattr(transformer, "transform")
 
-    def test_get_c_transformer(self, capsys):
-        """Test C transformer is disabled."""
+    def test_get_c_transformer(self):
+        """Test getting C transformer."""
         transformer = get_transformer("c")
-        assert transformer is None
-        captured = capsys.readouterr()
-        assert "C support is coming in v0.4.0" in captured.out
+        assert transformer is not None
+        assert hasattr(transformer, "transform")
 
     def test_get_unsupported_language(self):
         """Test unsupported languages raise ValueError."""
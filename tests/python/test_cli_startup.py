@@ -0,0 +1,125 @@
+"""
+Startup benchmark for the kinda CLI
+
+`kinda --version` has to come back without importing argparse or anything
+from kinda beyond the CLI module, and each subcommand only imports what it
+needs. The import-time budget is measured with `python -X importtime`.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from kinda import __version__
+from kinda.cli import main
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Microseconds of imports `kinda --version` may trigger, measured with -X importtime
+VERSION_IMPORT_BUDGET_US = 20_000
+
+# Ceiling checked on every run (CI skips performance tests), loose enough for slow runners
+VERSION_IMPORT_CEILING_US = 5 * VERSION_IMPORT_BUDGET_US
+
+
+def run_python(code, *options, pycache=None):
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(PROJECT_ROOT)
+    if pycache is not None:
+        # Measure with bytecode cached, the way an installed CLI starts
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        options += ("-X", f"pycache_prefix={pycache}")
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=PROJECT_ROOT,
+        check=True,
+    )
+
+
+def startup_import_time(stderr):
+    """Total cumulative time of the top-level imports made after interpreter startup"""
+    total = 0
+    started = False
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\S.*)$", line)
+        if match is None:
+            continue
+        cumulative, name = int(match.group(1)), match.group(2)
+        if started and not name.startswith(" "):
+            total += cumulative
+        elif name == "site":
+            started = True
+    return total
+
+
+def version_import_time(pycache, runs):
+    """Best -X importtime total for `kinda --version` over a few runs, bytecode cached"""
+    code = "import sys\nfrom kinda.cli import main\nsys.exit(main(['--version']))"
+    run_python(code, pycache=pycache)  # warm the bytecode cache
+    return min(
+        startup_import_time(run_python(code, "-X", "importtime", pycache=pycache).stderr)
+        for _ in range(runs)
+    )
+
+
+def loaded_modules_after(args):
+    code = (
+        "import sys\n"
+        "from kinda.cli import main\n"
+        f"main({args!r})\n"
+        "print(' '.join(sorted(sys.modules)), file=sys.stderr)\n"
+    )
+    return set(run_python(code).stderr.split())
+
+
+class TestVersion:
+    """Test kinda --version"""
+
+    def test_version_matches_pyproject(self, capsys):
+        pyproject = (PROJECT_ROOT / "pyproject.toml").read_text()
+        assert f'version = "{__version__}"' in pyproject
+
+        assert main(["--version"]) == 0
+        assert capsys.readouterr().out == f"kinda {__version__}\n"
+
+    def test_version_anywhere_still_works(self, capsys):
+        with pytest.raises(SystemExit) as exc_info:
+            main(["-V", "--help"])
+        assert exc_info.value.code == 0
+        assert f"kinda {__version__}" in capsys.readouterr().out
+
+
+class TestLazyLoading:
+    """Test that subcommands only import what they use"""
+
+    def test_version_imports_nothing_heavy(self):
+        modules = loaded_modules_after(["--version"])
+        assert "argparse" not in modules
+        assert not {name for name in modules if name.startswith("kinda.")} - {"kinda.cli"}
+
+    def test_subcommand_imports_only_its_own_modules(self):
+        modules = loaded_modules_after(["syntax"])
+        assert "argparse" in modules
+        assert "kinda.personality" not in modules
+        assert "kinda.security.execution" not in modules
+        assert "kinda.injection.injection_engine" not in modules
+
+
+def test_version_import_time_ceiling(tmp_path):
+    assert 0 < version_import_time(tmp_path, runs=1) < VERSION_IMPORT_CEILING_US
+
+
+@pytest.mark.performance
+def test_version_import_time_budget(tmp_path):
+    best = version_import_time(tmp_path, runs=3)
+    print(
+        f"kinda --version imports: {best / 1000:.1f}ms (budget {VERSION_IMPORT_BUDGET_US / 1000}ms)"
+    )
+    assert 0 < best < VERSION_IMPORT_BUDGET_US
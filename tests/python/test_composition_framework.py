@@ -37,6 +37,7 @@ from kinda.composition import (
     CompositionStrategy,
     CompositionConfig,
     CompositionEngine,
+    CompiledComposite,
     PersonalityBridge,
     PerformanceMonitor,
     UnionComposition,
@@ -134,6 +135,27 @@ class TestCompositionFrameworkCore(unittest.TestCase):
         self.assertEqual(report["min_time"], 0.001)
         self.assertEqual(report["max_time"], 0.002)
         self.assertAlmostEqual(report["error_rate"], 1 / 3, places=2)
+        self.assertAlmostEqual(report["p50_time"], 0.0015, delta=0.0015 * 0.01)
+
+    def test_performance_monitor_memory_bounded_and_mergeable(self):
+        """Test PerformanceMonitor keeps constant memory and merges worker snapshots."""
+        worker_a = PerformanceMonitor()
+        worker_b = PerformanceMonitor()
+        for i in range(10000):
+            worker_a.record_execution("busy", 0.001 + (i % 100) * 1e-5, True)
+            worker_b.record_execution("busy", 0.002, i % 10 != 0)
+
+        self.assertLess(len(worker_a.execution_stats["busy"].buckets), 100)
+
+        merged = PerformanceMonitor()
+        merged.merge(worker_a.snapshot())
+        merged.merge(worker_b.snapshot())
+        report = merged.get_performance_report("busy")
+
+        self.assertEqual(report["total_executions"], 20000)
+        self.assertEqual(report["max_time"], 0.002)
+        self.assertAlmostEqual(report["p99_time"], 0.002, delta=0.002 * 0.01)
+        self.assertAlmostEqual(report["error_rate"], 0.05)
 
     def test_composition_engine_registration(self):
         """Test CompositionEngine construct registration."""
@@ -534,6 +556,160 @@ class TestCompositionPatterns(unittest.TestCase):
         self.assertEqual(composition.threshold, 0.6)
 
 
+class TestCompiledComposition(unittest.TestCase):
+    """Test compiling composites into personality-specialized closures."""
+
+    def setUp(self):
+        """Set up test environment."""
+        PersonalityContext._instance = None
+        setup_personality("reliable", chaos_level=1, seed=42)
+
+    def test_engine_compile_returns_callable(self):
+        """Test CompositionEngine.compile produces a callable composite."""
+        composite = create_sorta_pattern()
+        compiled = get_composition_engine().compile(composite)
+
+        self.assertIsInstance(compiled, CompiledComposite)
+        self.assertIsInstance(compiled(True), bool)
+
+    def test_gates_resolved_once_per_personality(self):
+        """Test gate lookup happens at compile time, not per call."""
+        from kinda.composition import patterns
+
+        composite = UnionComposition("resolve_once", ["sometimes", "maybe"])
+        with patch.object(patterns, "_resolve_gate", wraps=patterns._resolve_gate) as resolve:
+            for _ in range(50):
+                composite.compose(True)
+            self.assertEqual(resolve.call_count, 2)
+
+            PersonalityContext.set_mood("chaotic")
+            composite.compose(True)
+            self.assertEqual(resolve.call_count, 4)
+
+    def test_bridge_follows_personality_change(self):
+        """Test the inlined bridge probability is rebuilt when the mood changes."""
+        composite = UnionComposition("always_bridge", ["rarely"])
+        composite.config.personality_bridges = {"chaotic": 1.0}
+
+        with patch("kinda.composition.patterns._resolve_gate", return_value=lambda *a: False):
+            self.assertFalse(composite.compose(True))
+            PersonalityContext.set_mood("chaotic")
+            self.assertTrue(composite.compose(True))
+            PersonalityContext.set_mood("reliable")
+            self.assertFalse(composite.compose(True))
+
+    def test_compiled_matches_engine_execution(self):
+        """Test the compiled union draws exactly like the engine + bridge path."""
+        composite = UnionComposition("equivalence", ["sometimes", "maybe"], {"playful": 0.2})
+        gates = [patterns_gate("sometimes"), patterns_gate("maybe")]
+        engine = get_composition_engine()
+
+        PersonalityContext._instance = PersonalityContext("playful", 5, seed=7)
+        reference = []
+        for _ in range(200):
+            base = engine._execute_union(gates, True)
+            reference.append(
+                PersonalityBridge.apply_personality_bridge(
+                    base, composite.name, composite.config.personality_bridges
+                )
+            )
+
+        PersonalityContext._instance = PersonalityContext("playful", 5, seed=7)
+        compiled = [composite.compose(True) for _ in range(200)]
+
+        self.assertEqual(reference, compiled)
+
+
+class TestAnalyticComposition(unittest.TestCase):
+    """Test single-draw analytic sampling of union and threshold compositions."""
+
+    SAMPLES = 5000
+
+    def setUp(self):
+        """Set up test environment."""
+        PersonalityContext._instance = None
+        setup_personality("reliable", chaos_level=1, seed=42)
+
+    def _run(self, composite, mood, seed):
+        PersonalityContext._instance = PersonalityContext(mood, 5, seed=seed)
+        successes = sum(bool(composite.compose(True)) for _ in range(self.SAMPLES))
+        return successes, PersonalityContext._instance
+
+    def _assert_equivalent(self, gate_mode, analytic, mood):
+        gate_successes, gate_personality = self._run(gate_mode, mood, seed=11)
+        analytic_successes, analytic_personality = self._run(analytic, mood, seed=12)
+
+        # Two-proportion z-test between the gate-by-gate and analytic samples
+        p1 = gate_successes / self.SAMPLES
+        p2 = analytic_successes / self.SAMPLES
+        pooled = (gate_successes + analytic_successes) / (2 * self.SAMPLES)
+        std_err = (2 * pooled * (1 - pooled) / self.SAMPLES) ** 0.5
+        if std_err > 0:
+            self.assertLess(abs(p1 - p2) / std_err, 4.0, f"{mood}: {p1:.3f} vs {p2:.3f}")
+        else:
+            self.assertEqual(p1, p2)
+
+        # Chaos state tracks one update per gate evaluation in both modes
+        self.assertAlmostEqual(
+            analytic_personality.execution_count / gate_personality.execution_count, 1.0, delta=0.05
+        )
+
+    def test_union_statistically_equivalent(self):
+        """Test analytic unions match gate-by-gate unions across moods."""
+        bridges = {"playful": 0.2, "chaotic": 0.3}
+        for mood in ("reliable", "playful", "chaotic"):
+            with self.subTest(mood=mood):
+                self._assert_equivalent(
+                    UnionComposition("gates", ["sometimes", "rarely"], bridges),
+                    UnionComposition("analytic", ["sometimes", "rarely"], bridges, analytic=True),
+                    mood,
+                )
+
+    def test_threshold_statistically_equivalent(self):
+        """Test analytic threshold votes match gate-by-gate votes across moods."""
+        constructs = ["sometimes", "maybe", "rarely"]
+        for mood in ("reliable", "playful", "chaotic"):
+            with self.subTest(mood=mood):
+                self._assert_equivalent(
+                    ThresholdComposition("gates", constructs, 0.6),
+                    ThresholdComposition("analytic", constructs, 0.6, analytic=True),
+                    mood,
+                )
+
+    def test_single_draw_per_call(self):
+        """Test the analytic mode consumes one personality draw per call."""
+        composite = UnionComposition("single", ["rarely", "rarely", "sometimes"], analytic=True)
+        personality = get_personality()
+
+        with patch.object(personality, "random", wraps=personality.random) as draw:
+            for _ in range(20):
+                composite.compose(True)
+            self.assertEqual(draw.call_count, 20)
+
+    def test_false_condition_fails_every_gate(self):
+        """Test a false condition fails all gates and still updates chaos state."""
+        composite = ThresholdComposition("never", ["sometimes", "maybe"], 0.5, analytic=True)
+        personality = get_personality()
+        before = personality.execution_count
+
+        self.assertFalse(any(composite.compose(False) for _ in range(50)))
+        self.assertEqual(personality.execution_count - before, 100)
+
+    def test_non_bernoulli_gates_use_gate_mode(self):
+        """Test constructs without a known gate probability fall back to calling gates."""
+        composite = UnionComposition("custom", ["custom_gate"], analytic=True)
+
+        with patch("kinda.composition.patterns._resolve_gate", return_value=lambda *a: True):
+            self.assertTrue(composite.compose(True))
+
+
+def patterns_gate(name):
+    """Resolve a basic construct the same way composition patterns do."""
+    from kinda.composition.patterns import _resolve_gate
+
+    return _resolve_gate(name)
+
+
 class TestCompositionTestingFramework(unittest.TestCase):
     """Test the composition testing framework and statistical validation."""
 
@@ -682,6 +858,50 @@ class TestCompositionTestingFramework(unittest.TestCase):
         self.assertIn("test_construct_reliable: PASS", report)
         self.assertIn("test_construct_performance: PASS", report)
 
+    def test_seeded_sampling_is_reproducible(self):
+        """Test seeded Monte Carlo validation gives identical pooled counts."""
+        composite = create_sorta_pattern()
+
+        results = []
+        for _ in range(2):
+            framework = CompositionTestFramework(samples=600, seed=1234)
+            framework.validate_composition_probability(composite, "playful", 0.8, 0.2, True)
+            results.append(framework.test_results["sorta_composition_playful"])
+
+        self.assertEqual(results[0]["successes"], results[1]["successes"])
+        lower, upper = results[0]["confidence_interval"]
+        self.assertLessEqual(lower, results[0]["actual"])
+        self.assertLessEqual(results[0]["actual"], upper)
+
+    def test_parallel_sampling_matches_serial(self):
+        """Test the process pool merges the same counts as in-process chunks."""
+        composite = create_sorta_pattern()
+
+        serial = CompositionTestFramework(samples=1000, seed=99)
+        serial.validate_composition_probability(composite, "chaotic", 0.7, 0.3, True)
+
+        with CompositionTestFramework(samples=1000, seed=99, workers=2) as parallel:
+            parallel.validate_composition_probability(composite, "chaotic", 0.7, 0.3, True)
+
+        serial_result = serial.test_results["sorta_composition_chaotic"]
+        parallel_result = parallel.test_results["sorta_composition_chaotic"]
+        self.assertEqual(serial_result["successes"], parallel_result["successes"])
+        self.assertEqual(parallel_result["workers"], 2)
+
+    def test_parallel_sampling_unpicklable_composite_runs_in_process(self):
+        """Test composites that cannot be pickled fall back to in-process chunks."""
+        composite = CompositionPatternFactory.create_custom_pattern(
+            "local_union",
+            CompositionStrategy.UNION,
+            ["sometimes", "maybe"],
+            CompositionConfig(strategy=CompositionStrategy.UNION, personality_bridges={}),
+        )
+
+        with CompositionTestFramework(samples=500, seed=7, workers=2) as framework:
+            framework.validate_composition_probability(composite, "reliable", 0.9, 0.2, True)
+
+        self.assertEqual(framework.test_results["local_union_reliable"]["workers"], 1)
+
 
 class TestCompositionAssertion(unittest.TestCase):
     """Test composition assertion utilities."""
@@ -17,6 +17,8 @@ from kinda.testing.confidence import (
     ConfidenceMethod,
     wilson_score_interval,
     bootstrap_confidence_interval,
+    bootstrap_distribution,
+    binomial_test_p_value,
     StatisticalFrameworkError,
     ConfidenceIntervalError,
 )
@@ -259,6 +261,90 @@ class TestBootstrapConfidenceInterval:
         with pytest.raises(ValueError):
             bootstrap_confidence_interval(samples, 0.95, "unknown")
 
+    def test_bootstrap_seed_reproducible(self):
+        """Test that the same seed gives the same bootstrap interval."""
+        samples = [0.5, 0.6, 0.7, 0.8, 0.4, 0.9, 0.3, 0.5, 0.6, 0.7]
+        first = bootstrap_confidence_interval(samples, 0.95, "median", seed=7)
+        second = bootstrap_confidence_interval(samples, 0.95, "median", seed=7)
+
+        assert (first.lower, first.upper) == (second.lower, second.upper)
+
+    def test_bootstrap_distribution_shape(self):
+        """Test that the vectorized resampler returns one statistic per resample."""
+        samples = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+        medians = bootstrap_distribution(samples, 500, "median", seed=1)
+
+        assert medians.shape == (500,)
+        assert medians.min() >= 1 and medians.max() <= 10
+        # The resampled medians should centre on the sample median
+        assert abs(float(medians.mean()) - statistics.median(samples)) < 0.5
+
+    def test_bootstrap_distribution_unknown_statistic(self):
+        """Test that the resampler rejects unknown statistics."""
+        with pytest.raises(ValueError):
+            bootstrap_distribution([1, 2, 3], 10, "mode")
+
+    def test_calculator_bootstrap_seed_reproducible(self):
+        """Test that ConfidenceCalculator bootstrap intervals are seeded."""
+        first = ConfidenceCalculator(seed=3).calculate_interval(
+            30, 100, 0.95, ConfidenceMethod.BOOTSTRAP
+        )
+        second = ConfidenceCalculator(seed=3).calculate_interval(
+            30, 100, 0.95, ConfidenceMethod.BOOTSTRAP
+        )
+
+        assert (first.lower, first.upper) == (second.lower, second.upper)
+        assert first.lower <= 0.3 <= first.upper
+
+
+class TestBinomialTestPValue:
+    """Test the log-space exact binomial test."""
+
+    @staticmethod
+    def _exact_p_value(successes: int, trials: int, expected_p: float) -> float:
+        """Reference two-tailed p-value summed over every outcome."""
+        observed = abs(successes - trials * expected_p)
+        return sum(
+            math.comb(trials, k) * expected_p**k * (1 - expected_p) ** (trials - k)
+            for k in range(trials + 1)
+            if abs(k - trials * expected_p) >= observed - 1e-9
+        )
+
+    @pytest.mark.parametrize("trials", [1, 10, 37, 200])
+    @pytest.mark.parametrize("expected_p", [0.05, 0.3, 0.5, 0.8])
+    def test_matches_exact_sum(self, trials, expected_p):
+        """Test agreement with the full summation for small trial counts."""
+        for successes in range(trials + 1):
+            expected = min(1.0, self._exact_p_value(successes, trials, expected_p))
+            actual = binomial_test_p_value(successes, trials, expected_p)
+            assert actual == pytest.approx(expected, rel=1e-9, abs=1e-300)
+
+    def test_observed_at_mean_is_one(self):
+        """Test that observing exactly the expected count gives p = 1."""
+        assert binomial_test_p_value(50, 100, 0.5) == 1.0
+
+    def test_degenerate_probabilities(self):
+        """Test expected probabilities of exactly 0 and 1."""
+        assert binomial_test_p_value(0, 10, 0.0) == 1.0
+        assert binomial_test_p_value(1, 10, 0.0) == 0.0
+        assert binomial_test_p_value(10, 10, 1.0) == 1.0
+        assert binomial_test_p_value(9, 10, 1.0) == 0.0
+        assert binomial_test_p_value(0, 0, 0.5) == 1.0
+
+    def test_large_trials_finite_and_fast(self):
+        """Test that a million trials neither overflows nor takes long."""
+        import time
+
+        start_time = time.perf_counter()
+        near = binomial_test_p_value(501_000, 1_000_000, 0.5)
+        far = binomial_test_p_value(505_000, 1_000_000, 0.5)
+        elapsed_time = time.perf_counter() - start_time
+
+        # 1000 successes above the mean is two standard deviations
+        assert near == pytest.approx(0.0456, abs=1e-3)
+        assert 0.0 < far < 1e-20
+        assert elapsed_time < 0.5
+
 
 class TestMathematicalAccuracy:
     """Test mathematical accuracy of confidence intervals."""
@@ -0,0 +1,112 @@
+"""
+Unit tests for Kolmogorov-Smirnov distribution testing.
+
+These tests validate the ECDF-based KS statistics against straightforward
+reference computations and check that large NumPy samples are handled
+quickly.
+"""
+
+import math
+import time
+
+import numpy as np
+import pytest
+
+from kinda.testing.distributions import DistributionTest, DistributionTester
+
+
+def _reference_two_sample_d(sample1, sample2):
+    """Maximum ECDF difference evaluated by brute force at every pooled value."""
+    values = sorted(set(sample1) | set(sample2))
+    return max(
+        abs(
+            sum(1 for x in sample1 if x <= v) / len(sample1)
+            - sum(1 for x in sample2 if x <= v) / len(sample2)
+        )
+        for v in values
+    )
+
+
+def _uniform_cdf(x):
+    """Scalar-only uniform(0, 1) CDF."""
+    return min(1.0, max(0.0, x))
+
+
+class TestKolmogorovSmirnov:
+    """Test one- and two-sample KS tests."""
+
+    @pytest.fixture
+    def tester(self):
+        return DistributionTester()
+
+    def test_two_sample_matches_reference(self, tester):
+        """Test the two-sample statistic against brute-force ECDFs, with ties."""
+        rng = np.random.default_rng(0)
+        sample1 = rng.integers(0, 20, size=200).tolist()
+        sample2 = rng.integers(2, 22, size=150).tolist()
+
+        result = tester.kolmogorov_smirnov_test(sample1, sample2)
+
+        assert result.method == DistributionTest.KOLMOGOROV_SMIRNOV
+        assert result.sample_size == 350
+        assert result.test_statistic == pytest.approx(_reference_two_sample_d(sample1, sample2))
+
+    def test_two_sample_identical_is_valid(self, tester):
+        """Test that a sample compared with itself has D = 0."""
+        sample = [0.1, 0.5, 0.5, 0.9]
+        result = tester.kolmogorov_smirnov_test(sample, list(sample))
+
+        assert result.test_statistic == 0.0
+        assert result.is_valid
+
+    def test_one_sample_scalar_and_vectorized_cdf_agree(self, tester):
+        """Test that scalar-only and NumPy-aware CDFs give the same statistic."""
+        sample = np.random.default_rng(1).uniform(size=500)
+
+        scalar = tester.kolmogorov_smirnov_test(sample, expected_cdf=_uniform_cdf)
+        vectorized = tester.kolmogorov_smirnov_test(
+            sample, expected_cdf=lambda x: np.clip(x, 0.0, 1.0)
+        )
+
+        assert scalar.test_statistic == pytest.approx(vectorized.test_statistic)
+        assert vectorized.is_valid
+
+    def test_one_sample_detects_shift(self, tester):
+        """Test that a shifted sample is rejected against the uniform CDF."""
+        sample = np.random.default_rng(2).uniform(0.3, 1.0, size=500)
+        result = tester.kolmogorov_smirnov_test(sample, expected_cdf=_uniform_cdf)
+
+        assert result.test_statistic == pytest.approx(0.3, abs=0.05)
+        assert not result.is_valid
+
+    def test_one_sample_counts_gap_below_each_step(self, tester):
+        """Test that D includes the distance just before each ECDF step."""
+        # ECDF is 0 just below 0.9, where the uniform CDF is already 0.9
+        result = tester.kolmogorov_smirnov_test([0.9], expected_cdf=_uniform_cdf)
+
+        assert result.test_statistic == pytest.approx(0.9)
+
+    def test_empty_samples_rejected(self, tester):
+        """Test that empty samples raise ValueError."""
+        with pytest.raises(ValueError):
+            tester.kolmogorov_smirnov_test([], [1.0])
+        with pytest.raises(ValueError):
+            tester.kolmogorov_smirnov_test(np.array([]), expected_cdf=_uniform_cdf)
+
+    def test_large_samples_fast(self, tester):
+        """Test that 100k-sample comparisons complete quickly."""
+        rng = np.random.default_rng(3)
+        sample1 = rng.normal(size=100_000)
+        sample2 = rng.normal(size=100_000)
+
+        start_time = time.perf_counter()
+        two_sample = tester.kolmogorov_smirnov_test(sample1, sample2)
+        one_sample = tester.kolmogorov_smirnov_test(
+            sample1,
+            expected_cdf=lambda x: 0.5 * (1 + np.vectorize(math.erf)(x / math.sqrt(2))),
+        )
+        elapsed_time = time.perf_counter() - start_time
+
+        assert two_sample.is_valid
+        assert one_sample.is_valid
+        assert elapsed_time < 2.0
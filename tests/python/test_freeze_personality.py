@@ -0,0 +1,187 @@
+"""
+Tests for personality-specialized ("frozen") code generation.
+
+Covers parsing --freeze-personality specs, inlining personality values into
+helper calls, the runtime guard, and the transform command.
+"""
+
+import ast
+
+import pytest
+
+from kinda.cli import main
+from kinda.langs.python.freeze import freeze_personality, parse_freeze_spec
+from kinda.personality import (
+    FrozenPersonalityGuard,
+    PersonalityContext,
+    frozen_personality_values,
+)
+
+GENERATED = """\
+from kinda.langs.python.runtime.fuzzy import kinda_int, maybe_for_item_execute, sometimes, sorta_print
+
+# keep me
+n = kinda_int(5)
+for x in range(3):
+    if maybe_for_item_execute():
+        if sometimes(x > 1):
+            sorta_print("x", x,
+            )
+"""
+
+
+@pytest.fixture(autouse=True)
+def restore_personality():
+    previous = PersonalityContext._instance
+    yield
+    PersonalityContext._instance = previous
+
+
+class TestFreezeSpec:
+    """Test parsing of --freeze-personality values."""
+
+    def test_full_spec(self):
+        assert parse_freeze_spec("mood=reliable,chaos=3") == ("reliable", 3)
+
+    def test_defaults_fill_missing_parts(self):
+        assert parse_freeze_spec("chaos=7", mood="cautious") == ("cautious", 7)
+        assert parse_freeze_spec("mood=Chaotic", chaos_level=2) == ("chaotic", 2)
+
+    @pytest.mark.parametrize("spec", ["mood=grumpy", "chaos=11", "chaos=lots", "speed=3"])
+    def test_invalid_specs(self, spec):
+        with pytest.raises(ValueError):
+            parse_freeze_spec(spec)
+
+
+class TestFreezePersonality:
+    """Test the generated code rewrite."""
+
+    def test_values_inlined_with_guard(self):
+        frozen, count = freeze_personality(GENERATED, "reliable", 3)
+        values = frozen_personality_values("reliable", 3)
+
+        assert count == 4
+        assert "_kinda_frozen = FrozenPersonalityGuard('reliable', 3)" in frozen
+        assert (
+            f"kinda_int(5, fuzz_range={values['int_fuzz_range']!r} if _kinda_frozen() else None)"
+            in frozen
+        )
+        assert (
+            f"maybe_for_item_execute(base_prob={values['maybe_for']!r} if _kinda_frozen() else None)"
+            in frozen
+        )
+        assert "# keep me" in frozen
+        ast.parse(frozen)
+
+    def test_trailing_comma_call(self):
+        frozen, _ = freeze_personality(GENERATED, "playful", 5)
+        assert '"x", x,\n            base_prob=' in frozen
+
+    def test_trailing_comma_before_comment(self):
+        code = (
+            "from kinda.langs.python.runtime.fuzzy import kinda_int\n"
+            "n = kinda_int(\n"
+            "    5,  # comment, with a comma\n"
+            ")\n"
+        )
+        frozen, count = freeze_personality(code, "reliable", 3)
+
+        assert count == 1
+        assert "# comment, with a comma\nfuzz_range=(0, 0) if _kinda_frozen()" in frozen
+        ast.parse(frozen)
+
+    def test_unfreezable_layout_warns(self, monkeypatch):
+        monkeypatch.setattr("kinda.langs.python.freeze.GUARD_NAME", "not a name")
+
+        with pytest.warns(UserWarning, match="Left the code unfrozen"):
+            assert freeze_personality(GENERATED, "reliable", 3) == (GENERATED, 0)
+
+    def test_explicit_keywords_left_alone(self):
+        code = "from kinda.langs.python.runtime.fuzzy import ish_comparison\nish_comparison(a, b, 0.5)\n"
+        assert freeze_personality(code, "reliable", 3) == (code, 0)
+
+    def test_frozen_code_matches_dynamic_code(self):
+        program = (
+            "from kinda.langs.python.runtime.fuzzy import kinda_int, kinda_float, sometimes\n"
+            "values = [(kinda_int(10), kinda_float(1.5), sometimes(True)) for _ in range(50)]\n"
+        )
+        frozen, _ = freeze_personality(program, "cautious", 6)
+
+        results = []
+        for code in (program, frozen):
+            PersonalityContext._instance = PersonalityContext("cautious", 6, seed=11)
+            namespace = {}
+            exec(compile(code, "<test>", "exec"), namespace)
+            results.append(namespace["values"])
+        assert results[0] == results[1]
+
+
+class TestFrozenPersonalityGuard:
+    """Test the runtime guard."""
+
+    def test_guard_follows_active_personality(self):
+        guard = FrozenPersonalityGuard("reliable", 3)
+
+        PersonalityContext._instance = PersonalityContext("reliable", 3)
+        assert guard()
+        PersonalityContext.set_seed(42)  # new context, same personality
+        assert guard()
+        PersonalityContext.set_mood("chaotic")
+        assert not guard()
+
+    def test_helpers_fall_back_when_personality_changes(self):
+        from kinda.langs.python.runtime.fuzzy import kinda_int
+
+        PersonalityContext._instance = PersonalityContext("chaotic", 10, seed=3)
+        guard = FrozenPersonalityGuard("reliable", 1)
+        frozen_range = frozen_personality_values("reliable", 1)["int_fuzz_range"]
+        assert frozen_range == (0, 0)
+
+        results = {kinda_int(100, fuzz_range=frozen_range if guard() else None) for _ in range(50)}
+        assert results != {100}  # chaotic fuzz, not the frozen reliable range
+
+
+class TestTransformCommand:
+    """Test kinda transform --freeze-personality."""
+
+    def test_transform_writes_frozen_code(self, tmp_path):
+        source = tmp_path / "prog.py.knda"
+        source.write_text("~kinda int n ~= 5\n~sorta print(n)\n")
+        out_dir = tmp_path / "build"
+
+        assert (
+            main(
+                [
+                    "transform",
+                    str(source),
+                    "--out",
+                    str(out_dir),
+                    "--freeze-personality",
+                    "mood=reliable,chaos=3",
+                ]
+            )
+            == 0
+        )
+
+        generated = (out_dir / "prog.knda.py").read_text()
+        assert "FrozenPersonalityGuard('reliable', 3)" in generated
+        assert "fuzz_range=" in generated
+
+    def test_transform_rejects_bad_spec(self, tmp_path, capsys):
+        source = tmp_path / "prog.py.knda"
+        source.write_text("~kinda int n ~= 5\n")
+
+        assert (
+            main(
+                [
+                    "transform",
+                    str(source),
+                    "--out",
+                    str(tmp_path),
+                    "--freeze-personality",
+                    "mood=grumpy",
+                ]
+            )
+            == 1
+        )
+        assert "grumpy" in capsys.readouterr().out
@@ -6,6 +6,7 @@ Targets missing coverage lines to boost overall test coverage above 75%
 
 import pytest
 import sys
+import time
 from io import StringIO
 from unittest.mock import patch, MagicMock
 from kinda.personality import PersonalityContext
@@ -76,6 +77,56 @@ class TestAssertEventually:
                 assert_eventually(failing_condition, timeout=0.1)
             assert mock_print.call_count > 0
 
+    def test_assert_eventually_pure_condition_does_not_sleep(self):
+        """Test pure conditions are evaluated back-to-back."""
+        from kinda.langs.python.runtime.fuzzy import assert_eventually
+
+        with patch("time.sleep") as mock_sleep:
+            assert assert_eventually(lambda: True, timeout=5.0, confidence=0.95) is True
+        mock_sleep.assert_not_called()
+
+    def test_assert_eventually_pure_condition_fails_early(self):
+        """Test a pure condition stops once its upper bound cannot exceed 0.5."""
+        from kinda.langs.python.runtime.fuzzy import assert_eventually
+
+        counter = [0]
+
+        def condition():
+            counter[0] += 1
+            return False
+
+        start = time.perf_counter()
+        with pytest.raises(AssertionError):
+            assert_eventually(condition, timeout=5.0, confidence=0.9)
+
+        assert time.perf_counter() - start < 1.0
+        assert counter[0] == 30  # The statistical minimum for 90% confidence
+
+    def test_assert_eventually_time_dependent_backs_off(self):
+        """Test time-dependent conditions are polled with growing delays until timeout."""
+        from kinda.langs.python.runtime.fuzzy import assert_eventually
+
+        ready_at = time.perf_counter() + 0.05
+        delays = []
+        real_sleep = time.sleep
+
+        def recording_sleep(seconds):
+            delays.append(seconds)
+            real_sleep(seconds)
+
+        with patch("time.sleep", side_effect=recording_sleep):
+            result = assert_eventually(
+                lambda: time.perf_counter() >= ready_at,
+                timeout=5.0,
+                confidence=0.8,
+                time_dependent=True,
+            )
+
+        assert result is True
+        assert delays[0] == pytest.approx(0.001)
+        assert delays[1] == pytest.approx(0.002)
+        assert max(delays) <= 0.05
+
 
 class TestAssertProbability:
     """Test assert_probability function coverage."""
@@ -0,0 +1,210 @@
+"""
+Tests for runtime output channels (kinda.output).
+
+Covers write-through and block-buffered program output, diagnostics routing
+and sampling, environment configuration, and flushing inside the sandbox.
+"""
+
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from kinda import output
+from kinda.output import (
+    DEFAULT_BLOCK_SIZE,
+    DiagnosticsChannel,
+    OutputChannel,
+    configure_output_from_env,
+    parse_buffer_size,
+    parse_sample_rate,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_output():
+    """Leave the module-level channels at their defaults after each test."""
+    yield
+    configure_output_from_env({})
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts write() calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TestOutputChannel:
+    """Test write-through and block-buffered output."""
+
+    def test_write_through_matches_print(self, capsys):
+        channel = OutputChannel()
+        channel.print("[print]", 1, 2.5)
+        print("[print]", 1, 2.5)
+
+        out = capsys.readouterr().out
+        assert out == "[print] 1 2.5\n[print] 1 2.5\n"
+
+    def test_block_buffering_batches_writes(self):
+        stream = CountingStream()
+        channel = OutputChannel(buffer_size=1000, stream=stream)
+
+        for i in range(100):
+            channel.print("[print]", i)
+        assert stream.writes == 1  # 100 short lines exceed the 1000 char block once
+
+        channel.flush()
+        assert stream.writes == 2
+        assert stream.getvalue().splitlines() == [f"[print] {i}" for i in range(100)]
+
+    def test_target_change_flushes_to_previous_stream(self, monkeypatch):
+        """Text buffered while sys.stdout was one stream never ends up in another."""
+        first, second = io.StringIO(), io.StringIO()
+        channel = OutputChannel(buffer_size=DEFAULT_BLOCK_SIZE)
+
+        monkeypatch.setattr("sys.stdout", first)
+        channel.print("one")
+        monkeypatch.setattr("sys.stdout", second)
+        channel.print("two")
+        channel.flush()
+
+        assert first.getvalue() == "one\n"
+        assert second.getvalue() == "two\n"
+
+
+class TestDiagnosticsChannel:
+    """Test diagnostics routing and sampling."""
+
+    def test_off(self, capsys):
+        channel = DiagnosticsChannel(destination="off")
+        channel.print("[?] hidden")
+
+        assert capsys.readouterr().out == ""
+        assert channel.dropped == 1
+
+    def test_stderr(self, capsys):
+        DiagnosticsChannel(destination="stderr").print("[tip] over here")
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert captured.err == "[tip] over here\n"
+
+    def test_file(self, tmp_path):
+        path = tmp_path / "diagnostics.log"
+        channel = DiagnosticsChannel(destination=str(path))
+        channel.print("[welp] logged")
+        channel.close()
+
+        assert path.read_text() == "[welp] logged\n"
+
+    def test_sampling_is_deterministic(self, capsys):
+        channel = DiagnosticsChannel(sample_rate=0.25)
+        for i in range(100):
+            channel.print(f"[fuzzy] {i}")
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 25
+        assert lines[0] == "[fuzzy] 3"
+        assert channel.dropped == 75
+
+
+class TestConfiguration:
+    """Test parsing and environment configuration."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("off", 0), ("line", 0), ("", 0), ("block", DEFAULT_BLOCK_SIZE), ("4096", 4096)],
+    )
+    def test_parse_buffer_size(self, value, expected):
+        assert parse_buffer_size(value) == expected
+
+    def test_parse_rejects_bad_values(self):
+        with pytest.raises(ValueError):
+            parse_buffer_size("lots")
+        with pytest.raises(ValueError):
+            parse_sample_rate("1.5")
+
+    def test_environment(self):
+        configure_output_from_env(
+            {
+                "KINDA_OUTPUT_BUFFER": "block",
+                "KINDA_DIAGNOSTICS": "off",
+                "KINDA_DIAGNOSTICS_SAMPLE": "0.5",
+            }
+        )
+
+        assert output.get_output_channel().buffer_size == DEFAULT_BLOCK_SIZE
+        assert output.get_diagnostics_channel().destination == "off"
+        assert output.get_diagnostics_channel().sample_rate == 0.5
+
+    def test_invalid_environment_falls_back_to_defaults(self):
+        configure_output_from_env({"KINDA_OUTPUT_BUFFER": "lots"})
+        assert output.get_output_channel().buffer_size == 0
+
+    def test_cli_flags_override_environment(self, monkeypatch):
+        from kinda.cli import setup_output
+
+        monkeypatch.setenv("KINDA_DIAGNOSTICS", "stderr")
+        setup_output("block", None, 0.1)
+
+        assert output.get_output_channel().buffer_size == DEFAULT_BLOCK_SIZE
+        assert output.get_diagnostics_channel().destination == "stderr"
+        assert output.get_diagnostics_channel().sample_rate == 0.1
+
+
+class TestRuntimeIntegration:
+    """Test the runtime and sandbox using the channels."""
+
+    def test_sorta_print_goes_through_buffer(self, capsys):
+        from kinda.langs.python.runtime.fuzzy import sorta_print
+        from kinda.personality import PersonalityContext
+
+        PersonalityContext._instance = PersonalityContext("reliable", 1, seed=1)
+        configure_output_from_env({"KINDA_OUTPUT_BUFFER": "block"})
+
+        for i in range(20):
+            sorta_print("value", i)
+        assert capsys.readouterr().out == ""
+
+        output.flush_output()
+        assert "[print] value" in capsys.readouterr().out
+
+    def test_sandbox_flushes_buffered_output(self):
+        from kinda.security.execution import SecureExecutionEngine, SecurityLevel
+
+        configure_output_from_env({"KINDA_OUTPUT_BUFFER": "block"})
+        program_dir = Path(tempfile.mkdtemp())
+        program = program_dir / "program.py"
+        program.write_text(
+            "from kinda.output import emit\n"
+            "emit('[print] buffered')\n"
+            "raise ValueError('boom')\n"
+        )
+
+        result = SecureExecutionEngine(SecurityLevel.SAFE).execute_file(program)
+
+        assert result.stdout == "[print] buffered\n"
+        assert "ValueError: boom" in result.stderr
+
+    def test_plain_print_stays_in_order_with_buffered_output(self):
+        from kinda.security.execution import run_captured
+
+        configure_output_from_env({"KINDA_OUTPUT_BUFFER": "block"})
+        result = run_captured(
+            "from kinda.output import emit\n"
+            "emit('[print] a')\n"
+            "print('plain')\n"
+            "emit('[print] b')\n",
+            {"__builtins__": __builtins__},
+        )
+
+        assert result["stdout"] == "[print] a\nplain\n[print] b\n"
+        assert not isinstance(sys.stdout, output.ChannelStdout)
@@ -0,0 +1,185 @@
+"""
+Unit tests for PerformanceTestFramework sampling.
+
+These tests cover timer overhead calibration, the adaptive iteration mode
+of run_performance_test, which stops once the median's confidence interval
+is narrow enough or the time budget runs out, and the fallbacks provided by
+DependencyResolver.
+"""
+
+import random
+import statistics
+import time
+
+import pytest
+
+from kinda.testing import DependencyResolver, OverheadSimulator, PerformanceTestFramework
+
+MISSING_MODULE = "kinda.langs.python.runtime.ish_composition"
+
+
+def _busy_work():
+    """Deterministic CPU-bound work with stable timing."""
+    return sum(i * i for i in range(2000))
+
+
+class TestPerformanceTestFramework:
+    """Test timing and adaptive sampling."""
+
+    @pytest.fixture
+    def framework(self, tmp_path):
+        return PerformanceTestFramework(tmp_path / "baselines.json")
+
+    def test_timer_overhead_calibrated_once(self, framework):
+        """Test the timer overhead is calibrated lazily and reused."""
+        overhead = framework.timer_overhead_ns
+
+        assert overhead >= 0
+        assert framework.timer_overhead_ns == overhead
+
+    def test_overhead_subtracted_from_measurements(self, framework):
+        """Test an empty call measures as (close to) zero after calibration."""
+        timings = sorted(
+            framework._measure_execution_time(lambda: None, subtract_overhead=True)
+            for _ in range(101)
+        )
+
+        assert min(timings) >= 0.0
+        assert timings[50] < 1e-6
+
+    def test_overhead_comparison_measures_noop_baseline(self, framework):
+        """Test a near-empty baseline keeps raw timings and a real overhead figure."""
+        result = framework.measure_performance_overhead(
+            lambda: None, _busy_work, iterations=50, max_overhead_percent=20.0
+        )
+
+        assert statistics.median(result["baseline_samples"]) > 0
+        assert result["comparison"].overhead_percent > 100
+        assert not result["comparison"].is_valid
+
+    def test_zero_baseline_is_unmeasurable(self, framework):
+        """Test a zero baseline median is reported instead of passing as 0% overhead."""
+        comparison = framework.statistical_validator.compare_performance(
+            [0.0] * 10, [1e-3] * 10, max_overhead_percent=20.0
+        )
+
+        assert not comparison.is_valid
+        assert comparison.overhead_percent == float("inf")
+        assert "too fast to measure" in comparison.message
+
+    def test_adaptive_stops_when_stable(self, framework):
+        """Test adaptive mode stops early once the median is pinned down."""
+        result = framework.run_performance_test(
+            "adaptive_stable",
+            _busy_work,
+            iterations=1000,
+            adaptive=True,
+            target_relative_width=0.1,
+            warmup_iterations=2,
+        )
+
+        assert result["adaptive"] is True
+        assert result["stop_reason"] == "converged"
+        assert result["iterations_completed"] < 1000
+        assert result["median_ci_relative_width"] <= 0.1
+
+    def test_adaptive_respects_time_budget(self, framework):
+        """Test adaptive mode gives up on noisy tests when the budget is spent."""
+        rng = random.Random(5)
+
+        def noisy():
+            time.sleep(rng.choice([0.0, 0.002]))
+
+        start_time = time.perf_counter()
+        result = framework.run_performance_test(
+            "adaptive_noisy",
+            noisy,
+            iterations=100000,
+            adaptive=True,
+            target_relative_width=0.001,
+            time_budget=0.2,
+            warmup_iterations=0,
+        )
+
+        assert result["stop_reason"] == "time_budget"
+        assert time.perf_counter() - start_time < 2.0
+
+    def test_fixed_mode_runs_all_iterations(self, framework):
+        """Test the default mode keeps its fixed iteration count."""
+        result = framework.run_performance_test(
+            "fixed", _busy_work, iterations=20, warmup_iterations=0
+        )
+
+        expected = 20 if framework.environment.ci_environment.value == "local_dev" else 10
+        assert result["adaptive"] is False
+        assert result["stop_reason"] == "iterations"
+        assert result["iterations_completed"] == expected
+
+
+def _median_call_ns(func, *args, runs=201):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter_ns()
+        func(*args)
+        timings.append(time.perf_counter_ns() - start)
+    return sorted(timings)[runs // 2]
+
+
+class TestDependencyResolverFallbacks:
+    """Test fallbacks for missing modules run real code without synthetic sleeps."""
+
+    def test_ish_fallbacks_use_runtime_implementation(self):
+        """Test ~ish fallbacks delegate to the composed runtime functions."""
+        resolver = DependencyResolver()
+        comparison = resolver.get_function_or_fallback(MISSING_MODULE, "ish_comparison_composed")
+        value = resolver.get_function_or_fallback(MISSING_MODULE, "ish_value_composed")
+
+        assert resolver.get_fallback_info(comparison) == "ish_comparison_composed"
+        assert resolver.get_fallback_info(value) == "ish_value_composed"
+        assert comparison.__name__ == "ish_comparison_composed"
+        assert isinstance(comparison(10.0, 10.0), bool)
+        assert isinstance(value(10.0), (int, float))
+
+    def test_generic_fallback_has_no_sleep(self, monkeypatch):
+        """Test fallbacks never call time.sleep."""
+        resolver = DependencyResolver()
+        monkeypatch.setattr(time, "sleep", lambda seconds: pytest.fail("fallback slept"))
+
+        generic = resolver.get_function_or_fallback("no.such.module", "anything")
+        ish = resolver.get_function_or_fallback(MISSING_MODULE, "ish_something_value")
+
+        assert generic(5) == 5
+        assert isinstance(ish(2.0), float)
+
+    def test_overhead_simulation_is_opt_in(self):
+        """Test the modelled overhead is only added when a simulator is attached."""
+        resolver = DependencyResolver()
+        fast = resolver.get_function_or_fallback("no.such.module", "noop")
+        baseline_ns = _median_call_ns(fast, 1)
+
+        resolver.set_overhead_simulator(OverheadSimulator(50e-6))
+        slow = resolver.get_function_or_fallback("no.such.module", "noop")
+        simulated_ns = _median_call_ns(slow, 1)
+
+        assert slow is not fast
+        assert simulated_ns - baseline_ns >= 45_000
+        assert simulated_ns - baseline_ns < 500_000
+
+    def test_calibrated_simulator_models_extra_cost(self):
+        """Test calibration measures the extra cost of a reference over a baseline."""
+
+        def baseline(x):
+            return x
+
+        def reference(x):
+            return sum(range(x))
+
+        simulator = OverheadSimulator.calibrated(reference, baseline, 2000, runs=51)
+
+        assert simulator.per_call_seconds > 0
+        assert OverheadSimulator.calibrated(baseline, baseline, 1, runs=51).per_call_seconds < 1e-5
+
+    def test_negative_overhead_rejected(self):
+        """Test invalid overhead models raise ValueError."""
+        with pytest.raises(ValueError):
+            OverheadSimulator(-1.0)
@@ -0,0 +1,148 @@
+"""
+Unit tests for the write-behind performance baseline store.
+
+These tests validate that ThresholdManager batches baseline updates in memory,
+persists them once on flush, and merges updates from concurrent writers
+(e.g. pytest-xdist workers) instead of clobbering them.
+"""
+
+import json
+import multiprocessing
+
+import pytest
+
+from kinda.testing import thresholds
+from kinda.testing.thresholds import ThresholdManager
+
+
+def _worker_update(cache_path, test_name):
+    """Simulate an xdist worker updating and flushing one baseline."""
+    manager = ThresholdManager(cache_path)
+    manager.update_baseline(test_name, "linux", [0.01, 0.011, 0.012, 0.01, 0.013])
+    manager.flush()
+
+
+class TestWriteBehindBaselines:
+    """Test batched baseline persistence."""
+
+    def test_update_does_not_write_until_flush(self, tmp_path):
+        """Test that update_baseline only queues the write."""
+        cache_path = tmp_path / "baselines.json"
+        manager = ThresholdManager(cache_path)
+
+        for i in range(5):
+            manager.update_baseline(f"test_{i}", "linux", [0.1, 0.2, 0.15])
+
+        assert not cache_path.exists()
+        assert manager.pending_update_count == 5
+        assert manager.get_baseline("test_3", "linux") is not None
+
+        manager.flush()
+
+        assert manager.pending_update_count == 0
+        data = json.loads(cache_path.read_text())
+        assert sorted(data) == [f"test_{i}:linux" for i in range(5)]
+
+    def test_only_unflushed_managers_are_kept_for_exit(self, tmp_path):
+        """Test that the exit hook holds managers only while they have queued updates."""
+        idle = ThresholdManager(tmp_path / "idle.json")
+        busy = ThresholdManager(tmp_path / "busy.json")
+        busy.update_baseline("test_a", "linux", [0.1, 0.2, 0.15])
+
+        assert idle not in thresholds._unflushed_managers
+        assert busy in thresholds._unflushed_managers
+
+        thresholds._flush_at_exit()
+
+        assert busy not in thresholds._unflushed_managers
+        assert "test_a:linux" in json.loads((tmp_path / "busy.json").read_text())
+
+    def test_lock_falls_back_to_msvcrt(self, tmp_path, monkeypatch):
+        """Test that the cache lock uses msvcrt.locking where fcntl is missing."""
+        calls = []
+
+        class FakeMsvcrt:
+            LK_LOCK, LK_UNLCK = 1, 0
+
+            @staticmethod
+            def locking(fd, mode, nbytes):
+                calls.append((mode, nbytes))
+
+        monkeypatch.setattr(thresholds, "fcntl", None)
+        monkeypatch.setattr(thresholds, "msvcrt", FakeMsvcrt)
+        manager = ThresholdManager(tmp_path / "baselines.json")
+        manager.update_baseline("test_a", "linux", [0.1, 0.2, 0.15])
+        manager.flush()
+
+        assert calls == [(FakeMsvcrt.LK_LOCK, 1), (FakeMsvcrt.LK_UNLCK, 1)]
+        assert "test_a:linux" in json.loads((tmp_path / "baselines.json").read_text())
+
+    def test_write_through_mode(self, tmp_path):
+        """Test that write_behind=False persists every update."""
+        cache_path = tmp_path / "baselines.json"
+        manager = ThresholdManager(cache_path, write_behind=False)
+
+        manager.update_baseline("test_a", "linux", [0.1, 0.2, 0.15])
+
+        assert manager.pending_update_count == 0
+        assert "test_a:linux" in json.loads(cache_path.read_text())
+
+    def test_flush_merges_concurrent_writers(self, tmp_path):
+        """Test that two managers loaded from the same file keep both updates."""
+        cache_path = tmp_path / "baselines.json"
+        first = ThresholdManager(cache_path)
+        second = ThresholdManager(cache_path)
+
+        first.update_baseline("test_first", "linux", [0.1, 0.2, 0.15])
+        second.update_baseline("test_second", "linux", [0.3, 0.4, 0.35])
+        first.flush()
+        second.flush()
+
+        data = json.loads(cache_path.read_text())
+        assert set(data) == {"test_first:linux", "test_second:linux"}
+
+    def test_same_key_updates_are_replayed(self, tmp_path):
+        """Test that updates to the same baseline from two writers are both applied."""
+        cache_path = tmp_path / "baselines.json"
+        seed = ThresholdManager(cache_path)
+        seed.update_baseline("shared", "linux", [1.0, 1.0, 1.0])
+        seed.flush()
+
+        first = ThresholdManager(cache_path)
+        second = ThresholdManager(cache_path)
+        first.update_baseline("shared", "linux", [2.0, 2.0, 2.0])
+        second.update_baseline("shared", "linux", [2.0, 2.0, 2.0])
+        first.flush()
+        second.flush()
+
+        baseline = ThresholdManager(cache_path).get_baseline("shared", "linux")
+        assert baseline.sample_count == 9
+        # Two smoothing steps of alpha=0.3 towards 2.0: 1.0 -> 1.3 -> 1.51
+        assert baseline.median_time == pytest.approx(1.51)
+
+    def test_multiprocess_flush(self, tmp_path):
+        """Test that parallel worker processes never lose each other's baselines."""
+        cache_path = tmp_path / "baselines.json"
+        ctx = multiprocessing.get_context("spawn")
+        workers = [
+            ctx.Process(target=_worker_update, args=(cache_path, f"test_{i}")) for i in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+
+        data = json.loads(cache_path.read_text())
+        assert set(data) == {f"test_{i}:linux" for i in range(4)}
+
+    def test_corrupt_cache_starts_fresh(self, tmp_path):
+        """Test that an unreadable cache file is ignored on load."""
+        cache_path = tmp_path / "baselines.json"
+        cache_path.write_text("{not json")
+
+        manager = ThresholdManager(cache_path)
+        assert manager.baselines == {}
+
+        manager.update_baseline("test_a", "linux", [0.1, 0.2])
+        manager.flush()
+        assert "test_a:linux" in json.loads(cache_path.read_text())
@@ -549,11 +549,11 @@ class TestProbablyPersonalityIntegration:
         probably_body = probably_construct["body"]
 
         # Should have proper error message for None condition
-        assert 'print("[?] Probably got None as condition - treating as False")' in probably_body
+        assert 'diagnostic("[?] Probably got None as condition - treating as False")' in probably_body
 
         # Should have proper error message for exceptions
-        assert 'print(f"[shrug] Probably got confused: {e}")' in probably_body
-        assert 'print("[tip] Defaulting to random choice")' in probably_body
+        assert 'diagnostic(f"[shrug] Probably got confused: {e}")' in probably_body
+        assert 'diagnostic("[tip] Defaulting to random choice")' in probably_body
 
         # Should have proper chaos state tracking
         assert "update_chaos_state(failed=True)" in probably_body
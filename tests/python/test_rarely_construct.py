@@ -572,11 +572,11 @@ class TestRarelyPersonalityIntegration:
         rarely_body = rarely_construct["body"]
 
         # Should have proper error message for None condition
-        assert 'print("[?] Rarely got None as condition - treating as False")' in rarely_body
+        assert 'diagnostic("[?] Rarely got None as condition - treating as False")' in rarely_body
 
         # Should have proper error message for exceptions
-        assert 'print(f"[shrug] Rarely got confused: {e}")' in rarely_body
-        assert 'print("[tip] Defaulting to random choice")' in rarely_body
+        assert 'diagnostic(f"[shrug] Rarely got confused: {e}")' in rarely_body
+        assert 'diagnostic("[tip] Defaulting to random choice")' in rarely_body
 
         # Should have proper chaos state tracking
         assert "update_chaos_state(failed=True)" in rarely_body
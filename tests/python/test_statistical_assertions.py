@@ -279,6 +279,89 @@ class TestStatisticalAssertionsRuntime:
                 "[?] Limiting samples to 10000 for performance (requested 50000)"
             )
 
+    def test_assert_probability_sequential_stops_early(self):
+        """Test ~assert_probability stops sampling once the SPRT decides"""
+        from kinda.langs.python.runtime.fuzzy import assert_probability
+
+        calls = [0]
+
+        def alternating():
+            calls[0] += 1
+            return calls[0] % 2 == 0
+
+        assert assert_probability(
+            alternating, expected_prob=0.5, tolerance=0.1, samples=1000, sequential=True
+        )
+        assert 0 < calls[0] < 300
+
+        calls[0] = 0
+        with pytest.raises(AssertionError):
+            assert_probability(
+                lambda: True, expected_prob=0.5, tolerance=0.1, samples=1000, sequential=True
+            )
+
+        # Fixed-sample mode stays the default
+        calls[0] = 0
+        assert assert_probability(alternating, expected_prob=0.5, tolerance=0.1, samples=1000)
+        assert calls[0] == 1000
+
+    def test_assert_probability_sequential_error_rate(self):
+        """Test the SPRT keeps false failures rare for a fair coin"""
+        from kinda.langs.python.runtime.fuzzy import assert_probability
+
+        rng = random.Random(1234)
+        failures = 0
+        with patch("builtins.print"):
+            for _ in range(200):
+                try:
+                    assert_probability(lambda: rng.random() < 0.5, samples=1000, sequential=True)
+                except AssertionError:
+                    failures += 1
+
+        assert failures <= 2
+
+
+class TestSequentialProbabilityRatioTest:
+    """Test the library-side SPRT used by StatisticalTester.sequential_assert"""
+
+    def test_accepts_matching_rate_with_few_samples(self):
+        """Test a matching rate is accepted well before the sample budget"""
+        from kinda.testing import sequential_assert
+
+        rng = random.Random(7)
+        result = sequential_assert(lambda: rng.random() < 0.3, 0.3, tolerance=0.1)
+
+        assert result.passed and result.decision == "accept"
+        assert result.samples_used < 500
+
+    def test_rejects_mismatched_rate(self):
+        """Test a clearly wrong rate raises with the samples used in the context"""
+        from kinda.testing import StatisticalValidationError, sequential_assert
+
+        rng = random.Random(7)
+        with pytest.raises(StatisticalValidationError) as exc_info:
+            sequential_assert(lambda: rng.random() < 0.8, 0.5)
+
+        assert "reject after" in str(exc_info.value)
+
+    def test_truncated_falls_back_to_tolerance(self):
+        """Test the fixed-sample tolerance rule decides when the budget runs out"""
+        from kinda.testing import sequential_assert
+
+        result = sequential_assert(lambda: True, 1.0, tolerance=0.01, max_samples=50)
+
+        assert result.decision == "truncated"
+        assert result.samples_used == 50
+        assert result.passed
+
+    def test_edges_outside_unit_interval_accept_immediately(self):
+        """Test a band covering [0, 1] needs no more than one sample"""
+        from kinda.testing import SequentialProbabilityRatioTest
+
+        sprt = SequentialProbabilityRatioTest(0.5, 0.6)
+        assert sprt.update(False) == "accept"
+        assert sprt.samples_used == 1
+
 
 class TestStatisticalAssertionsIntegration:
     """Integration tests for statistical assertions with other kinda constructs"""
@@ -0,0 +1,127 @@
+"""
+Tests for in-process syntax validation
+
+Covers the transformer's check mode, the check result cache and
+SyntaxValidator on single files and (in parallel) on directories.
+"""
+
+import pytest
+
+from kinda.langs.python.transformer import check_file
+from kinda.validation import CheckCache, SyntaxValidator
+from kinda.validation.syntax_validator import main
+
+VALID = """\
+~kinda int x ~= 5
+~sometimes (x > 3) {
+    ~sorta print("big")
+}
+"""
+
+BROKEN = """\
+~kinda int x ~= 5
+~sometimes {
+    ~sorta print("no condition")
+}
+~maybe_for item items:
+    print(item)
+~sorta print(x)
+~rarely {
+"""
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "src"
+    (root / "nested").mkdir(parents=True)
+    (root / "good.knda").write_text(VALID)
+    (root / "nested" / "also_good.py.knda").write_text(VALID)
+    (root / "nested" / "broken.knda").write_text(BROKEN)
+    return root
+
+
+class TestCheckMode:
+    """Test transformer check mode"""
+
+    def test_reports_every_error_with_line_numbers(self, tmp_path, capsys):
+        source = tmp_path / "broken.knda"
+        source.write_text(BROKEN)
+
+        errors = check_file(source)
+
+        assert [error.line_number for error in errors] == [2, 5, 8]
+        assert "~sometimes needs parentheses" in errors[0].message
+        assert "~maybe_for needs 'in' and colon" in errors[1].message
+        assert capsys.readouterr().out == ""
+
+    def test_valid_file_writes_nothing(self, tmp_path):
+        source = tmp_path / "good.knda"
+        source.write_text(VALID + "kinda int typo = 1\n")
+
+        assert check_file(source) == []
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["good.knda"]
+
+
+class TestCheckCache:
+    """Test caching of check results"""
+
+    def test_results_are_shared_on_disk(self, tmp_path):
+        key = CheckCache.make_key(b"~sometimes {\n")
+        CheckCache(tmp_path).put(key, [(1, "~sometimes needs parentheses")])
+
+        cache = CheckCache(tmp_path)
+        assert cache.get(key) == [(1, "~sometimes needs parentheses")]
+        assert cache.get(CheckCache.make_key(b"~sometimes() {\n")) is None
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_non_persistent_cache_skips_disk(self, tmp_path):
+        CheckCache(tmp_path, persistent=False).put(CheckCache.make_key(b""), [])
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestSyntaxValidator:
+    """Test validating files and directories"""
+
+    def test_validate_file(self, tree, tmp_path):
+        validator = SyntaxValidator(cache=CheckCache(tmp_path / "cache"))
+        broken = tree / "nested" / "broken.knda"
+
+        assert validator.validate_file(tree / "good.knda")
+        assert not validator.validate_file(broken)
+        assert validator.errors[0].startswith(f"{broken}:2: ~sometimes needs parentheses")
+        assert len(validator.errors) == 3
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_validate_directory(self, tree, tmp_path, workers):
+        validator = SyntaxValidator(workers=workers, cache=CheckCache(tmp_path / "cache"))
+
+        results = validator.validate_directory(tree)
+
+        assert results == {
+            str(tree / "good.knda"): True,
+            str(tree / "nested" / "also_good.py.knda"): True,
+            str(tree / "nested" / "broken.knda"): False,
+        }
+        assert len(validator.errors) == 3
+        # Worker processes fill the same cache: one entry per distinct file contents
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 2
+
+    def test_cached_results_follow_file_contents(self, tree, tmp_path):
+        cache_dir = tmp_path / "cache"
+        broken = tree / "nested" / "broken.knda"
+        assert not SyntaxValidator(cache=CheckCache(cache_dir)).validate_file(broken)
+
+        broken.write_text(VALID)
+        assert SyntaxValidator(cache=CheckCache(cache_dir)).validate_file(broken)
+
+    def test_main(self, tree, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("KINDA_CACHE_DIR", str(tmp_path / "cache"))
+
+        with pytest.raises(SystemExit) as exc_info:
+            main([str(tree), "--workers", "2"])
+
+        output = capsys.readouterr().out
+        assert exc_info.value.code == 1
+        assert f"❌ {tree / 'nested' / 'broken.knda'}" in output
+        assert "📊 Results: 2/3 files passed syntax validation" in output
+        assert (tmp_path / "cache" / "check").is_dir()
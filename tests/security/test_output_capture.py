@@ -0,0 +1,150 @@
+"""
+Tests for bounded output capture with streaming violation scanning.
+
+Covers the Aho-Corasick scanner against naive substring search, matches
+across write boundaries, head/tail retention under the byte cap, and early
+abort of sandboxed programs on the first violation.
+"""
+
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from kinda.security.execution import SecureExecutionEngine, SecurityLevel
+from kinda.security.output_capture import (
+    OUTPUT_SCANNER,
+    OutputCapture,
+    OutputViolationAbort,
+    ViolationScanner,
+)
+
+
+def _naive_scan(patterns, text):
+    return [label for pattern, label in patterns.items() if pattern in text]
+
+
+class TestViolationScanner:
+    """Test the Aho-Corasick automaton."""
+
+    def test_matches_naive_substring_search(self):
+        """The automaton finds exactly what per-pattern substring search finds."""
+        patterns = {"he": "a", "she": "b", "his": "c", "hers": "d", "s": "e", "ushe": "f"}
+        scanner = ViolationScanner(patterns)
+        rng = random.Random(5)
+
+        for _ in range(500):
+            text = "".join(rng.choice("hesrux") for _ in range(rng.randint(0, 12)))
+            assert scanner.scan(text) == _naive_scan(patterns, text), text
+
+    def test_chunked_feeding_matches_whole_text(self):
+        """Splitting text into arbitrary chunks doesn't change the result."""
+        patterns = {"he": "a", "she": "b", "his": "c", "hers": "d", "ushe": "f"}
+        scanner = ViolationScanner(patterns)
+        rng = random.Random(9)
+
+        for _ in range(300):
+            text = "".join(rng.choice("hesrux") for _ in range(rng.randint(0, 30)))
+            state = scanner.start()
+            position = 0
+            while position < len(text):
+                step = rng.randint(1, 4)
+                state.feed(text[position : position + step])
+                position += step
+            assert state.violations() == _naive_scan(patterns, text), text
+
+    def test_default_patterns(self):
+        """The shared scanner reports the engine's violation labels."""
+        found = OUTPUT_SCANNER.scan("reading /etc/passwd via subprocess")
+        assert found == ["filesystem_access:/etc/passwd", "dangerous_module:subprocess"]
+
+    def test_match_across_writes(self):
+        """A pattern split over several chunks is still found."""
+        state = OUTPUT_SCANNER.start()
+        assert state.feed("cat /et") == []
+        assert state.feed("c/pas") == []
+        assert state.feed("swd") == ["filesystem_access:/etc/passwd"]
+        # Already-reported violations aren't reported again
+        assert state.feed("/etc/passwd") == []
+
+
+class TestOutputCapture:
+    """Test bounded head/tail retention."""
+
+    def test_small_output_is_kept_whole(self):
+        capture = OutputCapture(max_bytes=100)
+        capture.write("hello\n")
+        assert capture.getvalue() == "hello\n"
+        assert capture.truncated_bytes == 0
+
+    def test_large_output_keeps_head_and_tail(self):
+        """Only max_bytes are kept, and the middle is marked as truncated."""
+        capture = OutputCapture(max_bytes=20)
+        for i in range(1000):
+            capture.write(f"{i:04d}\n")
+
+        value = capture.getvalue()
+        assert value.startswith("0000\n0001")
+        assert value.endswith("0998\n0999\n")
+        assert capture.total_bytes == 5000
+        assert capture.truncated_bytes == 4980
+        assert "4980 bytes of output truncated" in value
+
+    def test_truncated_output_is_still_scanned(self):
+        """Violations in the dropped middle are still reported."""
+        capture = OutputCapture(max_bytes=10)
+        capture.write("x" * 100 + "/etc/shadow" + "y" * 100)
+        assert capture.scan_state.violations() == ["filesystem_access:/etc/shadow"]
+
+    def test_abort_on_violation(self):
+        capture = OutputCapture(abort_on_violation=True)
+        capture.write("fine\n")
+        with pytest.raises(OutputViolationAbort) as exc_info:
+            capture.write("see /root/secret\n")
+        assert exc_info.value.violation == "filesystem_access:/root/"
+
+
+class TestEngineOutputCapture:
+    """Test the engine's use of bounded capture."""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _run(self, engine, code):
+        path = self.temp_dir / "program.py"
+        path.write_text(code)
+        return engine.execute_file(path)
+
+    def test_chatty_program_is_bounded(self):
+        engine = SecureExecutionEngine(SecurityLevel.SAFE)
+        engine.max_output_bytes = 1000
+
+        result = self._run(engine, "for i in range(100000):\n    print(i)\n")
+
+        assert result.success
+        assert len(result.stdout) < 1100
+        assert result.stdout.endswith("99999\n")
+        assert result.resource_usage["output_truncated_bytes"] > 0
+
+    def test_safe_level_aborts_on_first_violation(self):
+        """SAFE execution stops as soon as a violation is printed."""
+        # Built at runtime so the static pre-check doesn't block the program
+        engine = SecureExecutionEngine(SecurityLevel.SAFE)
+        result = self._run(engine, "print('/et' + 'c/passwd')\nprint('after')\n")
+
+        assert not result.success
+        assert "after" not in result.stdout
+        assert "filesystem_access:/etc/passwd" in result.security_violations
+
+    def test_other_levels_record_without_aborting(self):
+        engine = SecureExecutionEngine(SecurityLevel.RISKY)
+        result = self._run(engine, "print('/et' + 'c/passwd')\nprint('after')\n")
+
+        assert result.success
+        assert "after" in result.stdout
+        assert "filesystem_access:/etc/passwd" in result.security_violations
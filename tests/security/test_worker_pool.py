@@ -0,0 +1,146 @@
+"""
+Tests for the prewarmed, resource-limited SecureWorkerPool.
+
+Covers output capture, per-job isolation, memory/time limits enforced in the
+worker, replacing hung workers, and the cached secure globals used by the
+in-process path.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from kinda.security.execution import SecureExecutionEngine, SecurityLevel
+from kinda.security.worker_pool import SecureWorkerPool
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="worker pool limits need fork()")
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with SecureWorkerPool(size=2, security_level=SecurityLevel.SAFE) as worker_pool:
+        yield worker_pool
+
+
+@pytest.fixture
+def program_dir():
+    directory = Path(tempfile.mkdtemp())
+    yield directory
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def _write(directory: Path, code: str) -> Path:
+    path = directory / "program.py"
+    path.write_text(code)
+    return path
+
+
+class TestSecureWorkerPool:
+    """Test executing programs through the worker pool."""
+
+    def test_captures_output(self, pool, program_dir):
+        """Output is captured in the worker and returned to the engine."""
+        engine = SecureExecutionEngine(SecurityLevel.SAFE, worker_pool=pool)
+        result = engine.execute_file(_write(program_dir, "print('hello', 6 * 7)\n"))
+
+        assert result.success
+        assert result.stdout == "hello 42\n"
+        assert result.resource_usage["isolation"] == "worker_pool"
+
+    def test_exceptions_reported_like_in_process(self, pool, program_dir):
+        """A failing program reports the same stderr as in-process execution."""
+        path = _write(program_dir, "print('before')\nraise ValueError('boom')\n")
+
+        pooled = SecureExecutionEngine(SecurityLevel.SAFE, worker_pool=pool).execute_file(path)
+        local = SecureExecutionEngine(SecurityLevel.SAFE).execute_file(path)
+
+        assert not pooled.success
+        assert pooled.return_code == local.return_code == 1
+        assert pooled.stdout == local.stdout
+        assert pooled.stderr == local.stderr
+
+    def test_jobs_are_isolated(self, pool, program_dir):
+        """State a program leaves behind is not visible to the next job."""
+        engine = SecureExecutionEngine(SecurityLevel.SAFE, worker_pool=pool)
+        engine.execute_file(_write(program_dir, "import math\nmath.leaked = True\n"))
+
+        result = engine.execute_file(
+            _write(program_dir, "import math\nprint(hasattr(math, 'leaked'))\n")
+        )
+        assert result.stdout == "False\n"
+
+    def test_memory_limit(self, pool, program_dir):
+        """Allocations beyond the memory budget fail inside the job."""
+        engine = SecureExecutionEngine(SecurityLevel.SAFE, worker_pool=pool)
+        result = engine.execute_file(
+            _write(program_dir, "data = bytearray(1024 * 1024 * 1024)\nprint('allocated')\n")
+        )
+
+        assert not result.success
+        assert "MemoryError" in result.stderr
+        assert "allocated" not in result.stdout
+
+    def test_timeout_kills_job_and_pool_recovers(self, pool, program_dir):
+        """A runaway job is killed at the timeout and the worker keeps serving."""
+        engine = SecureExecutionEngine(SecurityLevel.SAFE, worker_pool=pool)
+        engine.max_execution_time = 1
+
+        result = engine.execute_file(_write(program_dir, "while True:\n    pass\n"))
+        assert not result.success
+        assert result.security_violations == ["execution_timeout"]
+        assert result.execution_time < 5
+
+        follow_up = engine.execute_file(_write(program_dir, "print('still alive')\n"))
+        assert follow_up.stdout == "still alive\n"
+
+    def test_security_level_mismatch(self, pool):
+        """An engine refuses a pool built for another security level."""
+        with pytest.raises(ValueError):
+            SecureExecutionEngine(SecurityLevel.RISKY, worker_pool=pool)
+
+    def test_closed_pool_rejects_jobs(self, program_dir):
+        """Running on a closed pool raises instead of hanging."""
+        worker_pool = SecureWorkerPool(size=1)
+        worker_pool.close()
+
+        with pytest.raises(RuntimeError):
+            worker_pool.run("print(1)", program_dir)
+
+
+class TestSecureGlobalsCache:
+    """Test the per-engine secure globals template."""
+
+    def test_builtins_are_copied_per_execution(self, program_dir):
+        """Programs can't tamper with builtins seen by later executions."""
+        engine = SecureExecutionEngine(SecurityLevel.SAFE)
+        first = engine._secure_globals_for(program_dir)
+        first["__builtins__"]["print"] = None
+
+        second = engine._secure_globals_for(program_dir)
+        assert second["__builtins__"]["print"] is not None
+        assert second["__file__"] == str(program_dir / "__main__.py")
+
+    def test_module_shims_are_rebuilt_per_execution(self, program_dir):
+        """Changes to the os/sys shims don't reach the next program."""
+        engine = SecureExecutionEngine(SecurityLevel.SAFE)
+        engine.execute_file(
+            _write(
+                program_dir,
+                "import os\nimport sys\n"
+                "os.environ['LEAK'] = '1'\n"
+                "sys.path.append('/evil')\n"
+                "os.getcwd = lambda: '/pwned'\n",
+            )
+        )
+
+        result = engine.execute_file(
+            _write(
+                program_dir,
+                "import os\nimport sys\n"
+                "print(os.environ.get('LEAK'), '/evil' in sys.path, os.getcwd() == '/pwned')\n",
+            )
+        )
+        assert result.stdout == "None False False\n"
@@ -0,0 +1,116 @@
+"""
+Test suite for constant-memory streaming statistics.
+
+Tests exact count/sum/min/max tracking, quantile accuracy of the log-bucket
+histogram, bounded memory, and snapshot/merge aggregation.
+"""
+
+import json
+import random
+
+import pytest
+from kinda.utils.streaming_stats import StreamingStats
+
+
+def _exact_quantile(values, q):
+    """Nearest-rank quantile matching StreamingStats' rank convention."""
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestStreamingStats:
+    """Test StreamingStats recording and quantiles."""
+
+    def test_empty(self):
+        """Empty statistics report no quantiles."""
+        stats = StreamingStats()
+        assert stats.count == 0
+        assert stats.mean == 0.0
+        assert stats.quantile(0.5) is None
+
+    def test_exact_aggregates(self):
+        """Count, sum, min and max are exact."""
+        stats = StreamingStats()
+        stats.update([0.001, 0.002, 0.0015])
+
+        assert stats.count == 3
+        assert stats.mean == pytest.approx(0.0015)
+        assert stats.min == 0.001
+        assert stats.max == 0.002
+
+    @pytest.mark.parametrize("q", [0.5, 0.95, 0.99])
+    def test_quantiles_within_relative_accuracy(self, q):
+        """Quantile estimates stay within the configured relative error."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(-7, 1.5) for _ in range(20000)]
+        stats = StreamingStats(relative_accuracy=0.01)
+        stats.update(values)
+
+        exact = _exact_quantile(values, q)
+        assert stats.quantile(q) == pytest.approx(exact, rel=0.011)
+
+    def test_zero_values(self):
+        """Zero durations are counted without a log bucket."""
+        stats = StreamingStats()
+        stats.update([0.0] * 90 + [1.0] * 10)
+
+        assert stats.zero_count == 90
+        assert stats.quantile(0.5) == 0.0
+        assert stats.quantile(0.99) == pytest.approx(1.0, rel=0.01)
+
+    def test_memory_is_bounded(self):
+        """The bucket count never exceeds max_buckets."""
+        stats = StreamingStats(max_buckets=64)
+        rng = random.Random(3)
+        values = [10 ** rng.uniform(-9, 3) for _ in range(50000)]
+        stats.update(values)
+
+        assert len(stats.buckets) <= 64
+        assert stats.count == 50000
+        # Collapsing only merges the lowest buckets, so upper quantiles stay accurate
+        assert stats.quantile(0.99) == pytest.approx(_exact_quantile(values, 0.99), rel=0.011)
+
+    def test_invalid_arguments(self):
+        """Out-of-range parameters raise ValueError."""
+        with pytest.raises(ValueError):
+            StreamingStats(relative_accuracy=0.0)
+        with pytest.raises(ValueError):
+            StreamingStats().quantile(1.5)
+
+
+class TestStreamingStatsAggregation:
+    """Test snapshot and merge across workers."""
+
+    def test_merge_matches_single_stream(self):
+        """Merging per-worker stats equals recording everything in one place."""
+        rng = random.Random(11)
+        chunks = [[rng.expovariate(1000) for _ in range(1000)] for _ in range(4)]
+
+        combined = StreamingStats()
+        for chunk in chunks:
+            combined.update(chunk)
+
+        merged = StreamingStats()
+        for chunk in chunks:
+            worker = StreamingStats()
+            worker.update(chunk)
+            merged.merge(worker)
+
+        assert merged.count == combined.count
+        assert merged.total == pytest.approx(combined.total)
+        assert merged.buckets == combined.buckets
+        assert merged.quantile(0.95) == combined.quantile(0.95)
+
+    def test_snapshot_round_trip(self):
+        """Snapshots survive JSON serialization."""
+        stats = StreamingStats()
+        stats.update([0.0, 0.5, 1.5, 2.5])
+
+        restored = StreamingStats.from_snapshot(json.loads(json.dumps(stats.snapshot())))
+
+        assert restored.summary() == stats.summary()
+
+    def test_merge_rejects_different_accuracy(self):
+        """Histograms with different bucket widths can't be merged."""
+        with pytest.raises(ValueError):
+            StreamingStats(relative_accuracy=0.01).merge(StreamingStats(relative_accuracy=0.05))
@@ -0,0 +1,79 @@
+"""
+Tests for the single-pass construct scan used by the transpiler engine
+
+The scan finds which constructs a source uses and the ~construct { ... }
+blocks to rewrite, replacing one regex search and substitution per construct.
+"""
+
+from kinda.transpiler.engine import LanguageType, TranspilerEngine, scan_constructs
+
+
+class TestConstructScan:
+    """Test construct inventory and rewrite sites"""
+
+    def test_inventory_follows_construct_order(self):
+        code = "~rarely(x)\n~maybe { y() }\n~sometimes { z() }\n~sometimes { w() }\n"
+        assert scan_constructs(code).constructs_used == ["sometimes", "maybe", "rarely"]
+
+    def test_whole_names_only(self):
+        scan = scan_constructs("~sometimes_while x {\n}\n~maybe_later()\n~welp\n")
+        assert scan.constructs_used == ["welp", "sometimes_while"]
+
+    def test_sites(self):
+        code = 'x = 1\n~sometimes { print("hi") }\n~maybe\n{ y() }\n~rarely(x)\n'
+        sites = scan_constructs(code).sites
+
+        assert [(s.construct_name, s.body) for s in sites] == [
+            ("sometimes", ' print("hi") '),
+            ("maybe", " y() "),
+        ]
+        assert code[sites[0].start : sites[0].end] == '~sometimes { print("hi") }'
+
+    def test_loop_headers(self):
+        code = "~maybe_for x in xs { f(x) }\n~kinda_repeat(n + 1) { g() }\n~sometimes (x) { h() }\n"
+        sites = scan_constructs(code).sites
+
+        assert [(s.construct_name, s.header, s.body) for s in sites] == [
+            ("maybe_for", " x in xs", " f(x) "),
+            ("kinda_repeat", "(n + 1)", " g() "),
+        ]
+
+    def test_tokens_inside_a_block_are_counted_not_rewritten(self):
+        scan = scan_constructs("~sometimes { ~maybe { x() }")
+        assert scan.constructs_used == ["sometimes", "maybe"]
+        assert [s.construct_name for s in scan.sites] == ["sometimes"]
+
+    def test_inline_value_sites(self):
+        code = "~kinda float x = np.ones(3)  # drift\ny = ~kinda_int(len(x))\nz = x[0] ~ish 1 and 5~ish\n"
+        sites = scan_constructs(code).sites
+
+        assert [(s.construct_name, s.target, s.operands) for s in sites] == [
+            ("kinda_float", "x", ("np.ones(3)",)),
+            ("kinda_int", "", ("len(x)",)),
+            ("ish_comparison", "", ("x[0]", "1")),
+            ("ish_value", "", ("5",)),
+        ]
+        assert code[sites[2].start : sites[2].end] == "x[0] ~ish 1"
+
+    def test_unclosed_blocks(self):
+        scan = scan_constructs("~sometimes { a()\n~maybe { b()\n")
+        assert scan.constructs_used == ["sometimes", "maybe"]
+        assert scan.sites == []
+
+
+class TestGeneration:
+    """Test splicing rewritten blocks into generated code"""
+
+    def test_blocks_rewritten_in_place(self):
+        result = TranspilerEngine().transpile(
+            "a = 1\n~sometimes { go() }\nb = 2\n~probably {stop()}\n",
+            LanguageType.PYTHON_ENHANCED,
+            optimization_level=0,
+        )
+
+        assert result.success, result.errors
+        assert result.constructs_used == ["sometimes", "probably"]
+        assert (
+            "a = 1\nkinda.runtime.sometimes(lambda:  go() )\nb = 2\n"
+            "kinda.runtime.probably(lambda: stop())\n"
+        ) in result.target_code
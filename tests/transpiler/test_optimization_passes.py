@@ -0,0 +1,262 @@
+"""
+Tests for the transpiler optimization passes
+
+Probability folding, loop hoisting and dead code elimination over
+generated Python code, and the savings the engine estimates for them.
+"""
+
+import ast
+import timeit
+
+import pytest
+
+from kinda.grammar.python.constructs import KindaPythonConstructs
+from kinda.personality import PersonalityContext, chaos_base_probability
+from kinda.transpiler.engine import (
+    DeadCodeElimination,
+    LanguageType,
+    ProbabilityOptimization,
+    TranspilerEngine,
+)
+from kinda.transpiler.optimizer import HOISTABLE_HELPERS, SITE_SAVINGS_US, fold_outcomes
+
+PYTHON = LanguageType.PYTHON_ENHANCED
+
+TRANSFORMED = """\
+from kinda.langs.python.runtime.fuzzy import kinda_int, maybe_for_item_execute, sometimes, sometimes_while_condition, sorta_print
+
+n = kinda_int(5)
+while sometimes_while_condition(n > 0):
+    n = n - 1
+for x in range(3):
+    if maybe_for_item_execute():
+        if sometimes(x > 1):
+            sorta_print("x", x)
+"""
+
+RELIABLE = {"mood": "reliable", "chaos_level": 1}
+
+
+def optimize(code, personality=None, tolerance=0.0):
+    metadata = {"personality": personality, "fold_tolerance": tolerance}
+    code = ProbabilityOptimization().optimize(code, PYTHON, metadata)
+    code = DeadCodeElimination().optimize(code, PYTHON, metadata)
+    return code, metadata["rewrites"]
+
+
+class TestProbabilityFolding:
+    """Test folding constructs whose outcome is certain"""
+
+    def test_outcomes_respect_tolerance(self):
+        # reliable at chaos 1 gets close to certainty but never reaches it
+        assert fold_outcomes("reliable", 1)["sometimes"] is None
+        assert fold_outcomes("reliable", 1, tolerance=0.005)["sometimes"] is True
+        assert fold_outcomes("chaotic", 10, tolerance=0.005)["sometimes"] is None
+
+    def test_outcomes_account_for_cascade(self):
+        # cautious has cascade effects that can pull a near-certain probability down
+        assert fold_outcomes("cautious", 1, tolerance=0.04)["maybe_for"] is None
+
+    def test_fold_and_eliminate(self):
+        code, rewrites = optimize(TRANSFORMED, RELIABLE, tolerance=0.005)
+        tree = ast.parse(code)
+
+        called = {
+            n.func.id for n in ast.walk(tree) if isinstance(n, ast.Call) and hasattr(n.func, "id")
+        }
+        assert "sometimes" not in called
+        assert "maybe_for_item_execute" not in called
+        assert "while n > 0:" in code
+        assert "if x > 1:" in code
+        # The helpers nothing refers to any more are no longer imported
+        assert "import kinda_int, sorta_print" in code
+        assert "helper:sometimes" in rewrites["dead_code_elimination"]
+
+    def test_impure_condition_not_dropped(self):
+        code = "from kinda.langs.python.runtime.fuzzy import rarely\nif rarely(load()):\n    go()\n"
+        metadata = {"personality": RELIABLE, "fold_tolerance": 0.0}
+        assert ProbabilityOptimization().optimize(code, PYTHON, metadata) == code
+
+    def test_enhanced_form(self):
+        code = 'import kinda.runtime\nkinda.runtime.sometimes(lambda: print("hi"))\n'
+        optimized, _ = optimize(code, RELIABLE, tolerance=0.005)
+        assert "print('hi')" in optimized
+        assert "sometimes" not in optimized
+
+    def test_no_personality_no_folding(self):
+        code, rewrites = optimize(TRANSFORMED)
+        assert "sometimes(x > 1)" in code
+        assert not any(r.startswith("fold:") for r in rewrites["probability_optimization"])
+
+
+class TestHoisting:
+    """Test hoisting base probability lookups out of loops"""
+
+    def test_lookups_hoisted_before_loops(self):
+        code, rewrites = optimize(TRANSFORMED)
+
+        assert "from kinda.personality import chaos_base_probability" in code
+        assert "_kinda_base_maybe_for = chaos_base_probability('maybe_for')" in code
+        assert "maybe_for_item_execute(base_prob=_kinda_base_maybe_for)" in code
+        assert rewrites["probability_optimization"] == [
+            "hoist:sometimes_while_condition",
+            "hoist:maybe_for_item_execute",
+        ]
+
+    def test_hoisted_code_behaves_the_same(self):
+        program = (
+            "from kinda.langs.python.runtime.fuzzy import maybe_for_item_execute\n"
+            "hits = 0\n"
+            "for i in range(200):\n"
+            "    if maybe_for_item_execute():\n"
+            "        hits += 1\n"
+        )
+        hoisted, _ = optimize(program)
+        assert "base_prob=" in hoisted
+
+        results = []
+        previous = PersonalityContext._instance
+        try:
+            for code in (program, hoisted):
+                PersonalityContext._instance = PersonalityContext("cautious", 5, seed=7)
+                namespace = {}
+                exec(compile(code, "<test>", "exec"), namespace)
+                results.append(namespace["hits"])
+        finally:
+            PersonalityContext._instance = previous
+        assert results[0] == results[1]
+
+    def test_nested_function_scopes_are_not_hoisted_into(self):
+        code = (
+            "from kinda.langs.python.runtime.fuzzy import maybe_for_item_execute\n"
+            "for i in range(3):\n"
+            "    check = lambda: maybe_for_item_execute()\n"
+        )
+        optimized, rewrites = optimize(code)
+        assert rewrites["probability_optimization"] == []
+        assert optimized == code
+
+
+class TestDeadCodeElimination:
+    """Test constant branch and helper removal"""
+
+    def test_constant_branches(self):
+        code = "if False:\n    a()\nelse:\n    b()\nwhile 0:\n    c()\ndef f():\n    if not True:\n        d()\n"
+        optimized, _ = optimize(code)
+        assert "a()" not in optimized and "c()" not in optimized and "d()" not in optimized
+        assert "b()" in optimized
+        compile(optimized, "<test>", "exec")  # emptied function body got a pass
+
+    def test_user_functions_kept(self):
+        code = (
+            "import os\n"
+            "def maybe(path):\n    return os.path.exists(path)\n"
+            "def probably():\n    pass\n"
+            "def welp_fallback(value):\n    return value\n"
+            "def sometimes():\n    pass\n"
+        )
+        optimized, rewrites = optimize(code)
+        assert optimized == code
+        assert rewrites["dead_code_elimination"] == []
+
+    def test_unused_generated_helpers_removed(self):
+        code = KindaPythonConstructs["welp"]["body"] + "\nprint('done')\n"
+        optimized, rewrites = optimize(code)
+        assert "welp_fallback" not in optimized
+        assert rewrites["dead_code_elimination"] == ["helper:welp_fallback"]
+
+    def test_invalid_python_left_alone(self):
+        code = "~sometimes { x = 1 }"
+        assert optimize(code)[0] == code
+
+
+class TestEngineIntegration:
+    """Test the passes through TranspilerEngine.transpile"""
+
+    def test_savings_estimated(self):
+        engine = TranspilerEngine()
+        result = engine.transpile(
+            '~sometimes { print("hi") }\n',
+            PYTHON,
+            optimization_level=3,
+            personality=RELIABLE,
+        )
+
+        assert result.success, result.errors
+        estimate = result.performance_estimate
+        assert estimate["probability_optimization_rewrites"] == 1.0
+        assert estimate["probability_optimization_saved_us"] == (
+            SITE_SAVINGS_US["fold:kinda.runtime.sometimes"]
+        )
+        assert "dead_code_elimination_saved_us" not in estimate
+        assert "print('hi')" in result.target_code
+
+    def test_user_functions_survive_transpile(self):
+        source = (
+            "import os\n"
+            "def maybe(path):\n    return os.path.exists(path)\n"
+            "~sometimes { print(1) }\n"
+        )
+        result = TranspilerEngine().transpile(source, PYTHON, 2)
+
+        assert result.success, result.errors
+        assert "def maybe(path):" in result.target_code
+
+    def test_level_zero_skips_passes(self):
+        result = TranspilerEngine().transpile('~sometimes { print("hi") }\n', PYTHON, 0, RELIABLE)
+        assert "probability_optimization_saved_us" not in result.performance_estimate
+
+    def test_unknown_mood_rejected(self):
+        result = TranspilerEngine().transpile("x = 1", PYTHON, 1, {"mood": "grumpy"})
+        assert not result.success
+        assert "Unknown mood" in result.errors[0]
+
+
+def _per_call_us(function, number=2000):
+    return min(timeit.repeat(function, repeat=3, number=number)) / number * 1e6
+
+
+@pytest.mark.performance
+class TestSiteSavings:
+    """Benchmark backing the static SITE_SAVINGS_US estimates"""
+
+    @pytest.fixture(autouse=True)
+    def playful(self):
+        previous = PersonalityContext._instance
+        PersonalityContext._instance = PersonalityContext("playful", 5, seed=0)
+        yield
+        PersonalityContext._instance = previous
+
+    @pytest.mark.parametrize(
+        "helper", [key[5:] for key in SITE_SAVINGS_US if key.startswith("fold:")]
+    )
+    def test_fold_estimates(self, helper):
+        if helper.startswith("kinda.runtime."):
+            from kinda.transpiler.targets.python_enhanced import PythonEnhancedTarget
+
+            namespace = {}
+            exec(PythonEnhancedTarget().get_runtime_helpers(), namespace)
+            function = namespace[helper.rsplit(".", 1)[1]]
+            arguments = (lambda: None,)
+        else:
+            from kinda.langs.python.runtime import fuzzy
+
+            function = getattr(fuzzy, helper)
+            arguments = () if helper == "maybe_for_item_execute" else (True,)
+
+        saved = _per_call_us(lambda: function(*arguments))
+        estimate = SITE_SAVINGS_US[f"fold:{helper}"]
+        assert estimate / 5 < saved < estimate * 5
+
+    @pytest.mark.parametrize("helper", sorted(HOISTABLE_HELPERS))
+    def test_hoist_estimates(self, helper):
+        from kinda.langs.python.runtime import fuzzy
+
+        function = getattr(fuzzy, helper)
+        arguments = () if helper == "maybe_for_item_execute" else (True,)
+        base = chaos_base_probability(HOISTABLE_HELPERS[helper])
+
+        before = _per_call_us(lambda: function(*arguments))
+        after = _per_call_us(lambda: function(*arguments, base_prob=base))
+        # The lookup is a small part of the call, so allow for timing noise
+        assert abs(before - after - SITE_SAVINGS_US[f"hoist:{helper}"]) < 0.25 * before
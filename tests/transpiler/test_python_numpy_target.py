@@ -0,0 +1,170 @@
+"""
+Tests for the vectorized python_numpy transpiler target
+
+Covers code generation through the engine, the NumpyKindaRuntime helpers and
+a benchmark against the scalar KindaRuntime of the python_enhanced target.
+"""
+
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from kinda.personality import (
+    PersonalityContext,
+    chaos_float_drift_range,
+    chaos_probability,
+    chaos_variance,
+)
+from kinda.transpiler.engine import LanguageType, TranspilerEngine
+from kinda.transpiler.targets.numpy_runtime import NumpyKindaRuntime
+from kinda.transpiler.targets.python_enhanced import PythonEnhancedTarget
+from kinda.transpiler.targets.python_numpy import PythonNumpyTarget
+
+
+@pytest.fixture(autouse=True)
+def playful_personality():
+    PersonalityContext._instance = PersonalityContext("playful", 5)
+    yield
+    PersonalityContext._instance = None
+
+
+class TestPythonNumpyTarget:
+    """Test registration and code generation"""
+
+    def test_registered_by_default(self):
+        engine = TranspilerEngine()
+        assert "python_numpy" in engine.get_available_targets()
+        assert isinstance(engine.get_target("python_numpy"), PythonNumpyTarget)
+
+    def test_transpile_runs(self, capsys):
+        result = TranspilerEngine().transpile(
+            "values = np.arange(5.0)\n~probably { print(values.sum()) }\n",
+            LanguageType.PYTHON_NUMPY,
+        )
+
+        assert result.success, result.errors
+        assert "kinda_numpy = NumpyKindaRuntime()" in result.target_code
+        assert "kinda_numpy.probably(lambda:  print(values.sum()) )" in result.target_code
+        exec(compile(result.target_code, "<generated>", "exec"), {})
+
+    def test_transpile_loops(self):
+        result = TranspilerEngine().transpile(
+            "values = np.arange(5.0)\n"
+            "picked = ~maybe_for x in values[values > 1] { x * 2 }\n"
+            "squares = ~kinda_repeat(len(values)) { i**2 }\n",
+            LanguageType.PYTHON_NUMPY,
+        )
+
+        assert result.success, result.errors
+        assert "kinda_numpy.maybe_for(values[values > 1], lambda x:  x * 2 )" in result.target_code
+        assert "kinda_numpy.kinda_repeat(len(values), lambda i:  i**2 )" in result.target_code
+        namespace = {}
+        exec(compile(result.target_code, "<generated>", "exec"), namespace)
+        assert set(namespace["picked"]) <= {4.0, 6.0, 8.0}
+
+    def test_transpile_values_over_arrays(self):
+        result = TranspilerEngine().transpile(
+            "~kinda float x = np.ones(3)\n"
+            "y = ~kinda_float(np.ones(3))\n"
+            "z = ~kinda_float { np.ones(3) }\n"
+            "close = x ~ish 1\n",
+            LanguageType.PYTHON_NUMPY,
+        )
+
+        assert result.success, result.errors
+        assert "x = kinda_numpy.kinda_float(np.ones(3))" in result.target_code
+        assert "y = kinda_numpy.kinda_float(np.ones(3))" in result.target_code
+        assert "close = kinda_numpy.ish_comparison(x, 1)" in result.target_code
+        namespace = {}
+        exec(compile(result.target_code, "<generated>", "exec"), namespace)
+        assert namespace["z"].shape == (3,)
+        assert namespace["close"].dtype == bool
+
+    def test_loop_without_header_is_reported(self):
+        result = TranspilerEngine().transpile("~maybe_for { x() }\n", LanguageType.PYTHON_NUMPY)
+
+        assert not result.success
+        assert result.errors == [
+            "Transpilation failed: ~maybe_for needs a loop variable and iterable: "
+            "~maybe_for item in items { ... }"
+        ]
+
+    def test_transpile_construct(self):
+        target = PythonNumpyTarget()
+        code = target.transpile_construct(
+            "maybe_for", {"iterable": "values", "item": "item", "body": "item * 2"}
+        )
+        assert code == "kinda_numpy.maybe_for(values, lambda item: item * 2)"
+        assert target.transpile_construct("ish_comparison", {"left": "a", "right": "b"}) == (
+            "kinda_numpy.ish_comparison(a, b)"
+        )
+
+    def test_unresolved_template_variables(self):
+        errors = PythonNumpyTarget().validate_target_code("x = 1  # {iterable}")
+        assert errors == ["Unresolved template variables: iterable"]
+
+
+class TestNumpyKindaRuntime:
+    """Test the vectorized helpers"""
+
+    def test_seeded_runs_repeat(self):
+        values = np.arange(100.0)
+        first = NumpyKindaRuntime(seed=3).kinda_float(values)
+        assert np.array_equal(first, NumpyKindaRuntime(seed=3).kinda_float(values))
+
+    def test_kinda_float_stays_in_drift_range(self):
+        values = np.zeros(10_000)
+        drift_min, drift_max = chaos_float_drift_range()
+        fuzzed = NumpyKindaRuntime(seed=1).kinda_float(values)
+        assert fuzzed.shape == values.shape
+        assert drift_min <= fuzzed.min() and fuzzed.max() <= drift_max
+
+    def test_maybe_for_mask_matches_personality(self):
+        runtime = NumpyKindaRuntime(seed=2)
+        picked = runtime.maybe_for(np.arange(100_000), lambda item: item)
+        assert len(picked) / 100_000 == pytest.approx(chaos_probability("maybe_for"), abs=0.01)
+        assert np.all(np.diff(picked) > 0)  # order is kept
+
+    def test_kinda_repeat_passes_indices(self):
+        indices = NumpyKindaRuntime(seed=4).kinda_repeat(50, lambda i: i)
+        assert np.array_equal(indices, np.arange(len(indices)))
+        assert NumpyKindaRuntime().kinda_repeat(0, len) == 0
+
+    def test_ish(self):
+        runtime = NumpyKindaRuntime(seed=5)
+        values = np.full(1000, 10.0)
+        variance = chaos_variance()
+        assert np.all(np.abs(runtime.ish_value(values) - 10.0) <= variance)
+        assert np.all(np.abs(runtime.ish_value(values, 20.0) - 15.0) <= variance)
+        assert list(runtime.ish_comparison([1.0, 5.0], [1.05, 9.0])) == [True, False]
+
+
+@pytest.mark.performance
+def test_benchmark_against_scalar_runtime():
+    """maybe_for over kinda floats: one draw per array instead of per element"""
+    scope = {}
+    exec(PythonEnhancedTarget().get_runtime_helpers(), scope)
+    scalar = scope["runtime"]
+    vectorized = NumpyKindaRuntime(seed=0)
+
+    items = [float(i) for i in range(100_000)]
+    array = np.asarray(items)
+
+    def best_of(run):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    scalar_time = best_of(lambda: scalar.maybe_for(items, lambda item: scalar.kinda_float(item)))
+    vectorized_time = best_of(
+        lambda: vectorized.maybe_for(array, lambda item: vectorized.kinda_float(item))
+    )
+
+    speedup = scalar_time / vectorized_time
+    print(f"scalar {scalar_time * 1000:.1f}ms, vectorized {vectorized_time * 1000:.1f}ms")
+    assert speedup > 5, f"vectorized runtime only {speedup:.1f}x faster"